@@ -407,7 +407,7 @@ def calc(params: CalcParams):
         )
         result = calculate_cheapest_costs(
             params_dict,
-            pricing=resolved_catalogs.detached_pricing(),
+            pricing=resolved_catalogs.pricing,
             pricing_catalog_context=resolved_catalogs.context,
             optimization_profile_id=optimization_profile_id,
         )
@@ -7,12 +7,14 @@ force-refreshed when needed. The data is used by the calculation engine to
 determine optimal cloud provider distribution.
 """
 import asyncio
+from datetime import datetime
+import json
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from starlette.requests import Request
@@ -25,6 +27,14 @@ from backend.pricing_catalog_models import (
     canonicalize_pricing_region,
 )
 from backend.secret_redaction import credential_strings, redact_secret_like_text
+from backend.pricing_batch_refresh import (
+    MAX_BATCH_TARGETS,
+    PricingBatchRefreshJob,
+    PricingRefreshTarget,
+    normalize_refresh_targets,
+)
+from backend.pricing_catalog_diff import field_delta_http_dict
+from backend.pricing_history_index import PRICE_HISTORY_SCHEMA_VERSION
 from backend.pricing_catalog_refresh_service import PricingCatalogRefreshService
 from backend.pricing_catalog_repository import (
     PricingCatalogNotFoundError,
@@ -39,6 +49,7 @@ from backend.aws_twinmaker_pricing_plan import AwsTwinMakerPricingPlanError
 from backend.fetch_data.cloud_price_fetcher_aws import (
     TwinMakerPricingCatalogError,
 )
+from backend.fetch_data.cloud_price_fetcher_azure import AzureRetailPricingFetchError
 from backend.sse_utils import (
     PricingOperationFilter,
     ThreadSafeSseHandler,
@@ -359,6 +370,13 @@ def fetch_pricing_azure(
             message=str(e),
             fix_suggestion="Wait for the active regional refresh to finish.",
         ) from e
+    except AzureRetailPricingFetchError as e:
+        raise _pricing_catalog_http_error(
+            status_code=502,
+            error_code=e.code,
+            message=e.public_message,
+            fix_suggestion="Retry after the Azure Retail Prices API is reachable again.",
+        ) from e
     except HTTPException:
         raise
     except Exception as e:
@@ -538,11 +556,13 @@ def get_published_pricing_catalog(provider: str, pricing_region: str):
             pricing_region,
             require_fresh=False,
         )
+        repository = get_pricing_catalog_repository()
         return {
             "reference": snapshot.reference.to_http_dict(),
-            "isFresh": not get_pricing_catalog_repository().is_stale(
+            "isFresh": not repository.is_stale(snapshot.reference),
+            "lastVerifiedAt": repository.last_verified_at(
                 snapshot.reference
-            ),
+            ).isoformat().replace("+00:00", "Z"),
         }
     except PricingCatalogNotFoundError as exc:
         raise _pricing_catalog_http_error(
@@ -626,6 +646,116 @@ def get_exact_pricing_catalog_snapshot(
     }
 
 
+@router.get(
+    "/pricing/catalogs/{provider}/{pricing_region}/snapshots/{snapshot_id}/delta",
+    operation_id="getPricingCatalogSnapshotDelta",
+    summary="Return the field-level delta recorded for one refresh snapshot",
+    description=(
+        "Returns the priced fields that were added, removed, or changed relative "
+        "to the snapshot that was published when the refresh ran. Review-required "
+        "candidates are included so reviewers only inspect what changed."
+    ),
+    responses={
+        200: {"description": "Field-level delta"},
+        400: ERROR_RESPONSES[400],
+        404: ERROR_RESPONSES[404],
+    },
+)
+def get_pricing_catalog_snapshot_delta(
+    provider: str,
+    pricing_region: str,
+    snapshot_id: str,
+):
+    _validate_provider(provider)
+    pricing_region = _validate_pricing_region(provider, pricing_region)
+    try:
+        delta = get_pricing_catalog_repository().resolve_delta(
+            provider,
+            pricing_region,
+            snapshot_id,
+        )
+    except PricingCatalogNotFoundError as exc:
+        raise _pricing_catalog_http_error(
+            status_code=404,
+            error_code=exc.code,
+            message=str(exc),
+            fix_suggestion=(
+                "Use a snapshot ID produced by a refresh that replaced an "
+                "earlier published snapshot."
+            ),
+        ) from exc
+    except (PricingCatalogTamperedError, PricingCatalogStorageError) as exc:
+        logger.error("Pricing catalog delta lookup failed: %s", exc.code)
+        raise _pricing_catalog_http_error(
+            status_code=500,
+            error_code=exc.code,
+            message="Pricing catalog storage failed integrity validation.",
+            fix_suggestion="Restore the catalog volume from a verified baseline or backup.",
+        ) from exc
+    return field_delta_http_dict(delta)
+
+
+@router.get(
+    "/pricing/catalogs/{provider}/{pricing_region}/history",
+    operation_id="getPricingCatalogFieldHistory",
+    summary="Return one priced field's values across published snapshots",
+    description=(
+        "Reads the derived price-history index for one provider region and "
+        "returns the requested dotted field path (for example "
+        "`lambda.durationPrice`) ordered by fetch time. The index is rebuilt "
+        "from verified snapshots when it is missing."
+    ),
+    responses={
+        200: {"description": "Field time series"},
+        400: ERROR_RESPONSES[400],
+    },
+)
+def get_pricing_catalog_field_history(
+    provider: str,
+    pricing_region: str,
+    field: str = Query(..., min_length=1, max_length=256),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    changes_only: bool = Query(default=False, alias="changesOnly"),
+):
+    _validate_provider(provider)
+    pricing_region = _validate_pricing_region(provider, pricing_region)
+    if any(
+        value is not None and value.tzinfo is None for value in (since, until)
+    ):
+        raise _pricing_catalog_http_error(
+            status_code=400,
+            error_code="INVALID_HISTORY_WINDOW",
+            message="History window timestamps must include a timezone.",
+            fix_suggestion="Send since/until as ISO 8601 timestamps ending in Z.",
+        )
+    try:
+        points = get_pricing_catalog_repository().price_history(
+            provider,
+            pricing_region,
+            field,
+            since=since,
+            until=until,
+            changes_only=changes_only,
+        )
+    except (PricingCatalogTamperedError, PricingCatalogStorageError) as exc:
+        logger.error("Pricing catalog history lookup failed: %s", exc.code)
+        raise _pricing_catalog_http_error(
+            status_code=500,
+            error_code=exc.code,
+            message="Pricing catalog storage failed integrity validation.",
+            fix_suggestion="Restore the catalog volume from a verified baseline or backup.",
+        ) from exc
+    return {
+        "schemaVersion": PRICE_HISTORY_SCHEMA_VERSION,
+        "provider": provider,
+        "pricingRegion": pricing_region,
+        "field": field,
+        "pointCount": len(points),
+        "points": points,
+    }
+
+
 def _resolve_exact_pricing_catalog_snapshot(
     provider: str,
     pricing_region: str,
@@ -1013,3 +1143,174 @@ async def stream_fetch_pricing(
             "X-Accel-Buffering": "no"  # Disable nginx buffering
         }
     )
+
+
+# --------------------------------------------------
+# Multi-region batch refresh (SSE)
+# --------------------------------------------------
+
+
+class PricingRefreshTargetRequest(BaseModel):
+    """One provider-region pair in a batch refresh."""
+    model_config = ConfigDict(extra="forbid")
+
+    provider: Literal["aws", "azure", "gcp"]
+    pricing_region: str
+
+
+class BatchPricingRefreshRequest(BaseModel):
+    """Targets and shared credentials for a multi-region refresh job."""
+    model_config = ConfigDict(extra="forbid")
+
+    targets: List[PricingRefreshTargetRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_TARGETS,
+    )
+    credentials: CredentialRequest = Field(default_factory=CredentialRequest)
+
+
+def _refresh_batch_target(
+    target: PricingRefreshTarget,
+    credentials: CredentialRequest,
+) -> dict:
+    """Refresh one batch target with its region bound into the credentials."""
+    if target.provider == "azure":
+        return calculate_up_to_date_pricing(
+            "azure",
+            False,
+            pricing_region=target.pricing_region,
+        )
+
+    from backend.fetch_data.calculate_up_to_date_pricing import (
+        calculate_up_to_date_pricing_with_credentials
+    )
+
+    region_field = "aws_region" if target.provider == "aws" else "gcp_region"
+    target_credentials = credentials.model_dump()
+    target_credentials[region_field] = target.pricing_region
+    return calculate_up_to_date_pricing_with_credentials(
+        target.provider,
+        target_credentials,
+        False,
+    )
+
+
+def _batch_progress_message(event: dict) -> str:
+    label = f"{event['provider'].upper()} {event['pricingRegion']}"
+    position = f"[{event['index']}/{event['total']}]"
+    status = event["status"]
+    if status == "started":
+        return f"▶️ {position} {label}: refresh started"
+    duration = event.get("durationMs", 0) / 1000
+    icon = {"published": "✅", "review_required": "📝", "in_progress": "⏸️"}.get(
+        status,
+        "❌",
+    )
+    return f"{icon} {position} {label}: {status} in {duration:.1f}s"
+
+
+@router.post(
+    "/stream/fetch_pricing_batch",
+    operation_id="streamFetchPricingBatch",
+    summary="SSE stream for a multi-region batch pricing refresh",
+    description=(
+        "**Purpose:** Refresh many provider-region catalogs in one job via Server-Sent Events.\n\n"
+        "**Behavior:**\n"
+        "- Regions of the same provider run concurrently up to a per-provider limit\n"
+        "- Each provider-region still holds its own refresh lock; a region that is "
+        "already refreshing is reported as `in_progress` without failing the batch\n"
+        "- Region-independent raw catalog downloads are shared across regions\n"
+        "- Per-target start, outcome, and timing are streamed as `log` events; the "
+        "`complete` event carries the JSON batch summary"
+    ),
+    responses={
+        200: {"description": "SSE stream of log events"},
+        400: ERROR_RESPONSES[400],
+    }
+)
+async def stream_fetch_pricing_batch(
+    request: Request,
+    batch: BatchPricingRefreshRequest = Body(...),
+):
+    """SSE endpoint that runs a batch refresh and streams per-target progress."""
+    try:
+        targets = normalize_refresh_targets(
+            (target.provider, target.pricing_region) for target in batch.targets
+        )
+    except (PricingCatalogContractError, ValueError) as exc:
+        return StreamingResponse(
+            iter([emit_sse(f"Invalid batch pricing refresh: {exc}", "error")]),
+            media_type="text/event-stream"
+        )
+
+    async def event_generator():
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=500)
+        operation_id = uuid4().hex
+        handler = ThreadSafeSseHandler(queue, loop)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.setLevel(logging.INFO)
+        handler.addFilter(PricingOperationFilter(operation_id))
+        logger.addHandler(handler)
+
+        def on_progress(event: dict) -> None:
+            logger.info(_batch_progress_message(event))
+
+        job = PricingBatchRefreshJob(
+            lambda target: _refresh_batch_target(target, batch.credentials)
+        )
+
+        try:
+            yield emit_sse(
+                f"Starting batch pricing refresh for {len(targets)} provider regions..."
+            )
+
+            def run_batch():
+                token = pricing_operation_id.set(operation_id)
+                try:
+                    return job.run(targets, on_progress)
+                finally:
+                    pricing_operation_id.reset(token)
+
+            task = loop.run_in_executor(None, run_batch)
+
+            while not task.done():
+                if await request.is_disconnected():
+                    task.cancel()
+                    return
+                try:
+                    msg = await asyncio.wait_for(queue.get(), timeout=10.0)
+                    yield emit_sse(msg)
+                except asyncio.TimeoutError:
+                    yield emit_sse("⏳", "heartbeat")
+
+            while not queue.empty():
+                try:
+                    yield emit_sse(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            summary = await task
+            summary["targets"] = [
+                {key: value for key, value in target.items() if key != "result"}
+                for target in summary["targets"]
+            ]
+            yield emit_sse(json.dumps(summary), "complete")
+        except Exception as e:
+            logger.error("Batch pricing stream failed (%s)", type(e).__name__)
+            yield emit_sse(
+                "❌ Batch pricing refresh failed. Check Optimizer logs, then retry.",
+                "error",
+            )
+        finally:
+            logger.removeHandler(handler)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
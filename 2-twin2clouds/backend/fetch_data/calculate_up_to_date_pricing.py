@@ -10,7 +10,10 @@ from backend.aws_twinmaker_pricing_plan import (
 )
 from backend.logger import logger
 from backend.fetch_data.cloud_price_fetcher_aws import STATIC_DEFAULTS
-from backend.fetch_data.cloud_price_fetcher_azure import STATIC_DEFAULTS_AZURE
+from backend.fetch_data.cloud_price_fetcher_azure import (
+    STATIC_DEFAULTS_AZURE,
+    AzureRetailPricingFetchError,
+)
 from backend.fetch_data.cloud_price_fetcher_google import (
     GCPPricingCatalogAccessError,
     STATIC_DEFAULTS_GCP,
@@ -581,7 +584,7 @@ def fetch_azure_data(azure_credentials: dict, service_mapping: dict, region_map:
                 debug=additional_debug,
                 service_mapping=service_mapping
             )
-        except ValueError as e:
+        except (ValueError, AzureRetailPricingFetchError) as e:
             logger.error(e)
             raise
         except Exception as e:
@@ -4,6 +4,7 @@ from typing import Dict, Any, Optional, List, Callable
 
 from backend.logger import logger
 import backend.config_loader as config_loader
+from backend.pricing_cache import cached_raw_catalog
 from backend.aws_pricing_evidence import build_aws_intent_evidence
 from backend.fetch_data.fetch_evidence import (
     FieldMatchEvidence,
@@ -202,7 +203,7 @@ def _fetch_api_products(
     if extra_filters:
         filters.extend(extra_filters)
 
-    try:
+    def load_products() -> List[str]:
         paginator = pricing_client.get_paginator('get_products')
         page_iterator = paginator.paginate(
             ServiceCode=service_code, 
@@ -215,6 +216,15 @@ def _fetch_api_products(
             all_products.extend(page.get("PriceList", []))
             
         return all_products
+
+    try:
+        # Location-free queries are shared across regions in a batch refresh.
+        return list(
+            cached_raw_catalog(
+                ("aws", service_code, json.dumps(filters, sort_keys=True)),
+                load_products,
+            )
+        )
     except Exception as e:
         if fail_closed:
             logger.warning(
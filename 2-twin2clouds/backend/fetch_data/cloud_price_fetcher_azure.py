@@ -4,6 +4,7 @@ from typing import Dict, Any, Iterable, List, Optional
 import requests
 
 from backend.logger import logger
+from backend.pricing_cache import cached_raw_catalog
 from backend.azure_pricing_evidence import build_azure_intent_evidence
 from backend.pricing_intent_registry import MATCHED
 from backend.transfer_catalog import (
@@ -24,6 +25,13 @@ from backend.fetch_data.fetch_evidence import (
 RETAIL_API_BASE = "https://prices.azure.com/api/retail/prices"
 HTTP_TIMEOUT = 12
 
+
+class AzureRetailPricingFetchError(RuntimeError):
+    """A Retail Prices API read failed, so its rows would be incomplete."""
+
+    code = "AZURE_RETAIL_CATALOG_FETCH_FAILED"
+    public_message = "Azure retail catalog pricing is temporarily unavailable."
+
 REGION_FALLBACK = {
     "westeurope": ["northeurope", "francecentral", "italynorth", "germanywestcentral"],
     "northeurope": ["westeurope", "swedencentral", "uksouth"],
@@ -134,7 +142,12 @@ REGISTRY_BACKED_AZURE_FIELDS = {
 # -----------------------------------------------------------------------------
 
 def _retail_query_items(params: Dict[str, str]) -> Iterable[Dict[str, Any]]:
-    """Yields all items from the Azure Retail API for the given params."""
+    """Yields all items from the Azure Retail API for the given params.
+
+    Raises:
+        AzureRetailPricingFetchError: If any page cannot be read; a partial
+            row list would otherwise be priced (and shared) as complete.
+    """
     next_link = RETAIL_API_BASE
     first = True
     while next_link:
@@ -142,15 +155,28 @@ def _retail_query_items(params: Dict[str, str]) -> Iterable[Dict[str, Any]]:
             resp = requests.get(next_link, params=params if first else None, timeout=HTTP_TIMEOUT)
             if resp.status_code != 200:
                 logger.warning(f"Azure Retail API {resp.status_code}: {resp.text[:200]}")
-                return
+                raise AzureRetailPricingFetchError(
+                    f"Azure Retail API returned {resp.status_code}"
+                )
             data = resp.json()
-            for item in data.get("Items", []):
-                yield item
-            next_link = data.get("NextPageLink")
-            first = False
+        except AzureRetailPricingFetchError:
+            raise
         except Exception as e:
             logger.error(f"Error querying Azure Retail API: {e}")
-            return
+            raise AzureRetailPricingFetchError("Azure Retail API request failed") from e
+        for item in data.get("Items", []):
+            yield item
+        next_link = data.get("NextPageLink")
+        first = False
+
+def _retail_rows(odata_filter: str) -> List[Dict[str, Any]]:
+    """Query one filter, sharing fallback-region and global rows in a batch refresh."""
+    return list(
+        cached_raw_catalog(
+            ("azure", odata_filter),
+            lambda: list(_retail_query_items({"$filter": odata_filter})),
+        )
+    )
 
 def _fetch_rows_with_fallback(region: str, service_names: List[str], debug: bool = False) -> List[Dict[str, Any]]:
     """Fetch pricing rows, trying the primary region then fallbacks."""
@@ -164,7 +190,7 @@ def _fetch_rows_with_fallback(region: str, service_names: List[str], debug: bool
         service_filter = " or ".join([f"serviceName eq '{s}'" for s in service_names])
         odata_filter = f"armRegionName eq '{r}' and ({service_filter})"
         
-        rows = list(_retail_query_items({"$filter": odata_filter}))
+        rows = _retail_rows(odata_filter)
         if rows:
             if r != region and debug:
                 logger.debug(f"   ℹ️ Used fallback region '{r}' for {service_names}")
@@ -172,7 +198,7 @@ def _fetch_rows_with_fallback(region: str, service_names: List[str], debug: bool
 
     # 2. Last resort: Try without region filter (global services)
     service_filter = " or ".join([f"serviceName eq '{s}'" for s in service_names])
-    rows = list(_retail_query_items({"$filter": service_filter}))
+    rows = _retail_rows(service_filter)
     if rows:
         return rows
         
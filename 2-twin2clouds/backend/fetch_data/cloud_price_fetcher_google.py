@@ -1,6 +1,7 @@
 from typing import Any, Dict, List
 from google.cloud import billing_v1
 from backend.logger import logger
+from backend.pricing_cache import cached_raw_catalog
 from backend.fetch_data.fetch_evidence import (
     FieldMatchEvidence,
     MatchStatus,
@@ -517,13 +518,20 @@ def fetch_gcp_price(client: billing_v1.CloudCatalogClient, service_name: str, re
     service_id = None
     service_display_name = None
     try:
-        # List all services (cached ideally, but for now we fetch)
-        # Note: This list is large, in production we might want to cache this map.
-        request = billing_v1.ListServicesRequest()
-        for service in client.list_services(request=request):
-            if service.display_name == config["service_display_name"]:
-                service_id = service.service_id
-                service_display_name = service.display_name
+        # The service list is region-independent and shared within a batch refresh.
+        services = cached_raw_catalog(
+            ("gcp", "services"),
+            lambda: [
+                (service.service_id, service.display_name)
+                for service in client.list_services(
+                    request=billing_v1.ListServicesRequest()
+                )
+            ],
+        )
+        for candidate_id, candidate_display_name in services:
+            if candidate_display_name == config["service_display_name"]:
+                service_id = candidate_id
+                service_display_name = candidate_display_name
                 break
     except Exception as e:
         message = redact_gcp_error(e)
@@ -540,8 +548,19 @@ def fetch_gcp_price(client: billing_v1.CloudCatalogClient, service_name: str, re
 
     # 4. List SKUs for Service
     try:
-        request = billing_v1.ListSkusRequest(parent=f"services/{service_id}")
-        sku_list = list(client.list_skus(request=request))
+        # SKUs carry their own service regions, so every region reuses one listing.
+        sku_list = list(
+            cached_raw_catalog(
+                ("gcp", "skus", service_id),
+                lambda: list(
+                    client.list_skus(
+                        request=billing_v1.ListSkusRequest(
+                            parent=f"services/{service_id}"
+                        )
+                    )
+                ),
+            )
+        )
     except Exception as e:
         message = redact_gcp_error(e)
         logger.error(f"Error listing SKUs for {service_name}: {message}")
@@ -0,0 +1,93 @@
+"""Read-only pricing trees shared between catalog readers without copying."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, NoReturn
+
+
+class PricingMutationError(TypeError):
+    """Raised when code tries to modify a shared read-only pricing tree."""
+
+
+def _reject_mutation(*args: Any, **kwargs: Any) -> NoReturn:
+    del args, kwargs
+    raise PricingMutationError(
+        "Resolved pricing is read-only; use thaw_pricing() for a mutable copy"
+    )
+
+
+class FrozenPricingDict(dict):
+    """A ``dict`` that rejects mutation but still serializes and compares as one."""
+
+    __slots__ = ()
+
+    __setitem__ = _reject_mutation
+    __delitem__ = _reject_mutation
+    __ior__ = _reject_mutation
+    clear = _reject_mutation
+    pop = _reject_mutation
+    popitem = _reject_mutation
+    setdefault = _reject_mutation
+    update = _reject_mutation
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (thaw_pricing(self),))
+
+
+class FrozenPricingList(list):
+    """A ``list`` that rejects mutation but still serializes and compares as one."""
+
+    __slots__ = ()
+
+    __setitem__ = _reject_mutation
+    __delitem__ = _reject_mutation
+    __iadd__ = _reject_mutation
+    __imul__ = _reject_mutation
+    append = _reject_mutation
+    clear = _reject_mutation
+    extend = _reject_mutation
+    insert = _reject_mutation
+    pop = _reject_mutation
+    remove = _reject_mutation
+    reverse = _reject_mutation
+    sort = _reject_mutation
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (thaw_pricing(self),))
+
+
+def freeze_pricing(value: Any) -> Any:
+    """Return a read-only tree for JSON-like pricing data."""
+
+    if isinstance(value, (FrozenPricingDict, FrozenPricingList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenPricingDict(
+            (key, freeze_pricing(child)) for key, child in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return FrozenPricingList(freeze_pricing(child) for child in value)
+    return value
+
+
+def thaw_pricing(value: Any) -> Any:
+    """Return a plain, mutable deep copy of a pricing tree."""
+
+    if isinstance(value, dict):
+        return {key: thaw_pricing(child) for key, child in value.items()}
+    if isinstance(value, list):
+        return [thaw_pricing(child) for child in value]
+    return value
@@ -0,0 +1,201 @@
+"""Run many provider-region pricing refreshes as one bounded job."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import contextvars
+from dataclasses import dataclass
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+from backend.logger import logger
+from backend.pricing_cache import SharedRawCatalogCache, shared_raw_catalogs
+from backend.pricing_catalog_models import Provider, canonicalize_pricing_region
+from backend.pricing_catalog_repository import PricingCatalogRefreshInProgressError
+
+
+PRICING_BATCH_RESULT_SCHEMA_VERSION = "pricing-catalog-batch-refresh-result.v1"
+DEFAULT_PROVIDER_CONCURRENCY: dict[str, int] = {"aws": 2, "azure": 4, "gcp": 2}
+MAX_BATCH_TARGETS = 32
+
+
+@dataclass(frozen=True)
+class PricingRefreshTarget:
+    """One canonical provider-region pair to refresh."""
+
+    provider: Provider
+    pricing_region: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.provider.upper()} {self.pricing_region}"
+
+
+def normalize_refresh_targets(
+    targets: Iterable[tuple[str, str] | PricingRefreshTarget],
+) -> tuple[PricingRefreshTarget, ...]:
+    """Canonicalize and de-duplicate targets while preserving request order."""
+
+    normalized: list[PricingRefreshTarget] = []
+    seen: set[PricingRefreshTarget] = set()
+    for item in targets:
+        provider, region = (
+            (item.provider, item.pricing_region)
+            if isinstance(item, PricingRefreshTarget)
+            else item
+        )
+        target = PricingRefreshTarget(
+            provider=provider,
+            pricing_region=canonicalize_pricing_region(provider, region),
+        )
+        if target not in seen:
+            seen.add(target)
+            normalized.append(target)
+    if not normalized:
+        raise ValueError("A batch pricing refresh needs at least one target")
+    if len(normalized) > MAX_BATCH_TARGETS:
+        raise ValueError(
+            f"A batch pricing refresh accepts at most {MAX_BATCH_TARGETS} targets"
+        )
+    return tuple(normalized)
+
+
+class PricingBatchRefreshJob:
+    """Fan provider-region refreshes out under per-provider concurrency limits.
+
+    Each target runs through ``refresh_target``, which is expected to hold
+    ``PricingCatalogRepository.refresh_guard`` for its own provider-region, so
+    regions of one provider refresh side by side while a duplicate region is
+    reported as in progress instead of failing the batch. All targets share one
+    ``SharedRawCatalogCache`` so region-independent raw catalog reads are
+    downloaded once per job.
+    """
+
+    def __init__(
+        self,
+        refresh_target: Callable[[PricingRefreshTarget], dict[str, Any]],
+        *,
+        provider_concurrency: Mapping[str, int] | None = None,
+        raw_catalog_cache: SharedRawCatalogCache | None = None,
+    ) -> None:
+        limits = dict(DEFAULT_PROVIDER_CONCURRENCY)
+        limits.update(provider_concurrency or {})
+        if any(limit <= 0 for limit in limits.values()):
+            raise ValueError("Provider concurrency limits must be positive")
+        self.refresh_target = refresh_target
+        self.provider_concurrency = limits
+        self.raw_catalog_cache = raw_catalog_cache or SharedRawCatalogCache()
+
+    def run(
+        self,
+        targets: Iterable[tuple[str, str] | PricingRefreshTarget],
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Refresh every target and return a per-target summary."""
+
+        normalized = normalize_refresh_targets(targets)
+        total = len(normalized)
+        providers = sorted({target.provider for target in normalized})
+        started = time.perf_counter()
+        with shared_raw_catalogs(self.raw_catalog_cache), ExitStack() as stack:
+            # One pool per provider keeps a slow provider from starving others.
+            executors = {
+                provider: stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=self.provider_concurrency[provider],
+                        thread_name_prefix=f"pricing-batch-{provider}",
+                    )
+                )
+                for provider in providers
+            }
+            futures = [
+                executors[target.provider].submit(
+                    contextvars.copy_context().run,
+                    self._refresh_one,
+                    target,
+                    index,
+                    total,
+                    on_progress,
+                )
+                for index, target in enumerate(normalized, start=1)
+            ]
+            results = [future.result() for future in futures]
+
+        counts: dict[str, int] = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return {
+            "schemaVersion": PRICING_BATCH_RESULT_SCHEMA_VERSION,
+            "targetCount": total,
+            "statusCounts": counts,
+            "durationMs": _elapsed_ms(started),
+            "rawCatalogCache": self.raw_catalog_cache.stats(),
+            "targets": results,
+        }
+
+    def _refresh_one(
+        self,
+        target: PricingRefreshTarget,
+        index: int,
+        total: int,
+        on_progress: Callable[[dict[str, Any]], None] | None,
+    ) -> dict[str, Any]:
+        started = time.perf_counter()
+        _notify(on_progress, _progress(target, index, total, "started"))
+        result: dict[str, Any] | None = None
+        error_code: str | None = None
+        try:
+            result = self.refresh_target(target)
+            status = str(result.get("status", "published"))
+        except PricingCatalogRefreshInProgressError as exc:
+            status = "in_progress"
+            error_code = exc.code
+        except Exception as exc:
+            logger.error(
+                "Batch pricing refresh failed for %s (%s)",
+                target.label,
+                type(exc).__name__,
+            )
+            status = "failed"
+            code = getattr(exc, "code", None)
+            error_code = code if isinstance(code, str) else "PRICING_REFRESH_FAILED"
+        outcome = {
+            **_progress(target, index, total, status),
+            "durationMs": _elapsed_ms(started),
+            "errorCode": error_code,
+            "result": result,
+        }
+        _notify(on_progress, {k: v for k, v in outcome.items() if k != "result"})
+        return outcome
+
+
+def _progress(
+    target: PricingRefreshTarget,
+    index: int,
+    total: int,
+    status: str,
+) -> dict[str, Any]:
+    return {
+        "provider": target.provider,
+        "pricingRegion": target.pricing_region,
+        "index": index,
+        "total": total,
+        "status": status,
+    }
+
+
+def _notify(
+    on_progress: Callable[[dict[str, Any]], None] | None,
+    event: dict[str, Any],
+) -> None:
+    if on_progress is None:
+        return
+    try:
+        on_progress(event)
+    except Exception:
+        logger.debug("Batch pricing progress callback failed", exc_info=True)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int(round((time.perf_counter() - started) * 1000))
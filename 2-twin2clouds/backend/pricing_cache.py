@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from functools import wraps
 import json
 import os
@@ -52,6 +54,87 @@ def serialized_provider_refresh(function: Callable[..., _T]) -> Callable[..., _T
     return wrapper
 
 
+@dataclass(frozen=True)
+class _FailedLoad:
+    error: Exception
+
+
+class SharedRawCatalogCache:
+    """Single-flight memo of raw provider catalog reads for one refresh job.
+
+    Raw catalog reads (Price List pages, Retail Prices pages, Cloud Billing
+    SKU listings) are keyed by their exact query, so regions of the same
+    provider share any query that does not depend on the region while
+    region-filtered queries stay distinct. A failed read is remembered too:
+    every region sharing the query fails with it instead of retrying a
+    throttled API or pricing from partial rows.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Any, ...], Any] = {}
+        self._key_locks: dict[tuple[Any, ...], threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: tuple[Any, ...], loader: Callable[[], _T]) -> _T:
+        with self._guard:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        with lock:
+            with self._guard:
+                if key in self._entries:
+                    self.hits += 1
+                    entry = self._entries[key]
+                    if isinstance(entry, _FailedLoad):
+                        raise entry.error
+                    return entry
+            try:
+                value = loader()
+            except Exception as exc:
+                with self._guard:
+                    self._entries[key] = _FailedLoad(exc)
+                    self.misses += 1
+                raise
+            with self._guard:
+                self._entries[key] = value
+                self.misses += 1
+            return value
+
+    def stats(self) -> dict[str, int]:
+        with self._guard:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_shared_raw_catalogs: ContextVar[SharedRawCatalogCache | None] = ContextVar(
+    "shared_raw_catalogs",
+    default=None,
+)
+
+
+@contextmanager
+def shared_raw_catalogs(cache: SharedRawCatalogCache) -> Iterator[SharedRawCatalogCache]:
+    """Route raw catalog reads in this context through one shared cache."""
+
+    token = _shared_raw_catalogs.set(cache)
+    try:
+        yield cache
+    finally:
+        _shared_raw_catalogs.reset(token)
+
+
+def cached_raw_catalog(key: tuple[Any, ...], loader: Callable[[], _T]) -> _T:
+    """Load a raw catalog read, reusing it when a shared cache is active."""
+
+    cache = _shared_raw_catalogs.get()
+    if cache is None:
+        return loader()
+    return cache.get_or_load(key, loader)
+
+
 def write_json_atomically(target: Path, payload: dict[str, Any]) -> None:
     """Publish JSON via fsync and atomic same-directory replacement."""
 
@@ -0,0 +1,96 @@
+"""Field-level comparison of normalized provider pricing payloads."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from backend.pricing_catalog_models import PricingCatalogReference
+
+
+PRICING_FIELD_DELTA_SCHEMA_VERSION = "pricing-catalog-field-delta.v1"
+_MISSING = object()
+
+
+def comparable_pricing_fields(pricing: dict[str, Any]) -> dict[str, Any]:
+    """Flatten priced fields to dotted paths, ignoring ``__dunder__`` metadata.
+
+    Schema, quality, and evidence blocks carry fetch timestamps and raw rows
+    that change on every refresh, so they never count as pricing changes.
+    Lists such as tier tables are compared as whole values.
+    """
+
+    fields: dict[str, Any] = {}
+    _flatten(pricing, (), fields)
+    return fields
+
+
+def diff_pricing_fields(
+    previous: dict[str, Any],
+    current: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Return sorted added, removed, and changed priced fields."""
+
+    before = comparable_pricing_fields(previous)
+    after = comparable_pricing_fields(current)
+    changes: list[dict[str, Any]] = []
+    for path in sorted(before.keys() | after.keys()):
+        old = before.get(path, _MISSING)
+        new = after.get(path, _MISSING)
+        if old is _MISSING:
+            changes.append({"path": path, "change": "added", "current": new})
+        elif new is _MISSING:
+            changes.append({"path": path, "change": "removed", "previous": old})
+        elif not _same_value(old, new):
+            changes.append(
+                {
+                    "path": path,
+                    "change": "changed",
+                    "previous": old,
+                    "current": new,
+                }
+            )
+    return changes
+
+
+def build_field_delta(
+    base_reference: PricingCatalogReference,
+    changes: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Describe a candidate relative to the snapshot it would replace."""
+
+    return {
+        "schema_version": PRICING_FIELD_DELTA_SCHEMA_VERSION,
+        "base_snapshot_id": base_reference.snapshot_id,
+        "base_content_digest": base_reference.content_digest,
+        "change_count": len(changes),
+        "changes": changes,
+    }
+
+
+def field_delta_http_dict(delta: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "schemaVersion": delta["schema_version"],
+        "baseSnapshotId": delta["base_snapshot_id"],
+        "baseContentDigest": delta["base_content_digest"],
+        "changeCount": delta["change_count"],
+        "changes": delta["changes"],
+    }
+
+
+def _flatten(value: Any, path: tuple[str, ...], fields: dict[str, Any]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            key = str(key)
+            if key.startswith("__") and key.endswith("__"):
+                continue
+            _flatten(child, (*path, key), fields)
+        return
+    fields[".".join(path)] = value
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    if isinstance(old, bool) or isinstance(new, bool):
+        return old is new
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+        return float(old) == float(new)
+    return old == new
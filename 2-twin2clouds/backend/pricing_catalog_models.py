@@ -20,6 +20,7 @@ from pydantic import (
     model_validator,
 )
 
+from backend.frozen_pricing import FrozenPricingDict, freeze_pricing
 from backend.pricing_schema import canonical_pricing_snapshot_digest
 
 
@@ -27,6 +28,7 @@ CATALOG_SNAPSHOT_SCHEMA_VERSION = "pricing-catalog-snapshot.v2"
 CATALOG_REFERENCE_SCHEMA_VERSION = "pricing-catalog-reference.v1"
 CATALOG_CONTEXT_SCHEMA_VERSION = "provider-pricing-catalog-context.v1"
 CATALOG_BASELINE_SCHEMA_VERSION = "pricing-catalog-baseline.v1"
+CATALOG_FRESHNESS_SCHEMA_VERSION = "pricing-catalog-freshness.v1"
 
 Provider = Literal["aws", "azure", "gcp"]
 CatalogSource = Literal[
@@ -197,15 +199,64 @@ class PricingCatalogSnapshot(BaseModel):
             raise ValueError("pricing content does not match content_digest")
         return self
 
-    def detached_copy(self) -> "PricingCatalogSnapshot":
-        return PricingCatalogSnapshot.model_validate(
-            deepcopy(self.model_dump(mode="json"))
+    def read_only_view(self) -> "PricingCatalogSnapshot":
+        """Return this verified snapshot with a shared, read-only pricing tree."""
+
+        if isinstance(self.pricing, FrozenPricingDict):
+            return self
+        return PricingCatalogSnapshot.model_construct(
+            schema_version=self.schema_version,
+            reference=self.reference,
+            pricing=freeze_pricing(self.pricing),
         )
 
     def to_storage_dict(self) -> dict[str, Any]:
         return deepcopy(self.model_dump(mode="json"))
 
 
+class PricingCatalogFreshness(BaseModel):
+    """Latest provider observation that confirmed an unchanged snapshot."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    schema_version: Literal["pricing-catalog-freshness.v1"] = (
+        CATALOG_FRESHNESS_SCHEMA_VERSION
+    )
+    snapshot_id: str
+    content_digest: str
+    verified_at: datetime
+
+    @field_validator("snapshot_id")
+    @classmethod
+    def validate_snapshot_id(cls, value: str) -> str:
+        if not _SNAPSHOT_ID_PATTERN.fullmatch(value):
+            raise ValueError("snapshot_id must use the pcs_<sha256> format")
+        return value
+
+    @field_validator("content_digest")
+    @classmethod
+    def validate_content_digest(cls, value: str) -> str:
+        if not _DIGEST_PATTERN.fullmatch(value):
+            raise ValueError("content_digest must be a lowercase SHA-256 digest")
+        return value
+
+    @field_validator("verified_at")
+    @classmethod
+    def validate_verified_at(cls, value: datetime) -> datetime:
+        if value.tzinfo is None or value.utcoffset() is None:
+            raise ValueError("verified_at must be timezone-aware")
+        return value.astimezone(timezone.utc)
+
+    def applies_to(self, reference: "PricingCatalogReference") -> bool:
+        return (
+            self.snapshot_id == reference.snapshot_id
+            and self.content_digest == reference.content_digest
+        )
+
+    def to_storage_dict(self) -> dict[str, Any]:
+        return self.model_dump(mode="json")
+
+
 class PricingCatalogContext(BaseModel):
     """Exact three-provider pricing context required by a calculation."""
 
@@ -5,7 +5,16 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from backend.pricing_catalog_models import Provider, canonicalize_pricing_region
+from backend.pricing_catalog_diff import (
+    build_field_delta,
+    diff_pricing_fields,
+    field_delta_http_dict,
+)
+from backend.pricing_catalog_models import (
+    PricingCatalogSnapshot,
+    Provider,
+    canonicalize_pricing_region,
+)
 from backend.pricing_catalog_repository import (
     PricingCatalogNotFoundError,
     PricingCatalogRepository,
@@ -48,44 +57,58 @@ class PricingCatalogRefreshService:
             validation["status"] == "valid"
             and not validation.get("review_required", False)
         )
+        provider_schema_version = (
+            (pricing.get("__schema__") or {}).get("schema_version")
+            or PRICING_SCHEMA_VERSION
+        )
+        contract_version = (
+            (pricing.get("__schema__") or {}).get("contract_version")
+            or PRICING_CONTRACT_VERSION
+        )
+        registry_version = self.registry_service.get_registry_version()
+        mapping_versions = self._mapping_versions(provider)
+
+        published = self._published_snapshot(provider, canonical_region)
+        delta = None
+        if published is not None:
+            changes = diff_pricing_fields(published.pricing, pricing)
+            # Only a publishable fetch may vouch for the published snapshot;
+            # a fetch that failed review must not make stale prices look fresh.
+            if publishable and not changes and _same_catalog_versions(
+                published,
+                provider_schema_version=provider_schema_version,
+                contract_version=contract_version,
+                registry_version=registry_version,
+                mapping_versions=mapping_versions,
+            ):
+                return self._unchanged_result(
+                    published,
+                    fetched_at,
+                    validation,
+                    account_pricing_context,
+                )
+            delta = build_field_delta(published.reference, changes)
+
         snapshot = self.repository.store_candidate(
             provider=provider,
             pricing_region=canonical_region,
             pricing=pricing,
-            provider_schema_version=(
-                (pricing.get("__schema__") or {}).get("schema_version")
-                or PRICING_SCHEMA_VERSION
-            ),
-            contract_version=(
-                (pricing.get("__schema__") or {}).get("contract_version")
-                or PRICING_CONTRACT_VERSION
-            ),
-            registry_version=self.registry_service.get_registry_version(),
-            mapping_versions=self._mapping_versions(provider),
+            provider_schema_version=provider_schema_version,
+            contract_version=contract_version,
+            registry_version=registry_version,
+            mapping_versions=mapping_versions,
             fetched_at=fetched_at,
             source="provider_api",
             review_status="reviewed" if publishable else "review_required",
             calculation_source="fresh",
         )
+        if delta is not None:
+            self.repository.store_delta(snapshot.reference, delta)
         active_reference = None
         if publishable:
             active_reference = self.repository.publish(snapshot.reference)
-        else:
-            try:
-                active_reference = self.repository.resolve_published(
-                    provider,
-                    canonical_region,
-                    require_fresh=False,
-                ).reference
-            except PricingCatalogNotFoundError:
-                active_reference = None
-
-        account_context = None
-        if account_pricing_context is not None and active_reference is not None:
-            account_context = dict(account_pricing_context)
-            account_context["catalog_snapshot_digest"] = (
-                active_reference.content_digest
-            )
+        elif published is not None:
+            active_reference = published.reference
 
         return {
             "schemaVersion": PRICING_REFRESH_RESULT_SCHEMA_VERSION,
@@ -100,9 +123,57 @@ class PricingCatalogRefreshService:
                 else None
             ),
             "publicationSummary": _publication_summary(validation),
-            "accountPricingContext": account_context,
+            "fieldDelta": (
+                field_delta_http_dict(delta) if delta is not None else None
+            ),
+            "accountPricingContext": _bound_account_context(
+                account_pricing_context,
+                active_reference,
+            ),
+        }
+
+    def _unchanged_result(
+        self,
+        published: PricingCatalogSnapshot,
+        fetched_at: datetime,
+        validation: dict[str, Any],
+        account_pricing_context: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Confirm the published snapshot instead of storing a duplicate."""
+
+        reference = published.reference
+        verified_at = self.repository.record_freshness(reference, fetched_at)
+        return {
+            "schemaVersion": PRICING_REFRESH_RESULT_SCHEMA_VERSION,
+            "provider": reference.provider,
+            "pricingRegion": reference.pricing_region,
+            "status": "unchanged",
+            "reviewRequired": False,
+            "candidateReference": None,
+            "activeCalculationReference": reference.to_http_dict(),
+            "publicationSummary": _publication_summary(validation),
+            "fieldDelta": field_delta_http_dict(build_field_delta(reference, [])),
+            "verifiedAt": verified_at.isoformat().replace("+00:00", "Z"),
+            "accountPricingContext": _bound_account_context(
+                account_pricing_context,
+                reference,
+            ),
         }
 
+    def _published_snapshot(
+        self,
+        provider: Provider,
+        pricing_region: str,
+    ) -> PricingCatalogSnapshot | None:
+        try:
+            return self.repository.resolve_published(
+                provider,
+                pricing_region,
+                require_fresh=False,
+            )
+        except PricingCatalogNotFoundError:
+            return None
+
     def cached_result(
         self,
         provider: Provider,
@@ -178,6 +249,37 @@ def _validate_provider_identity(
         raise ValueError("Provider pricing metadata does not match the refresh region")
 
 
+def _same_catalog_versions(
+    published: PricingCatalogSnapshot,
+    *,
+    provider_schema_version: str,
+    contract_version: str,
+    registry_version: str,
+    mapping_versions: tuple[str, ...],
+) -> bool:
+    """Only live observations under identical contracts can be re-confirmed."""
+
+    reference = published.reference
+    return (
+        reference.source == "provider_api"
+        and reference.provider_schema_version == provider_schema_version
+        and reference.contract_version == contract_version
+        and reference.registry_version == registry_version
+        and reference.mapping_versions == mapping_versions
+    )
+
+
+def _bound_account_context(
+    account_pricing_context: dict[str, Any] | None,
+    active_reference: Any,
+) -> dict[str, Any] | None:
+    if account_pricing_context is None or active_reference is None:
+        return None
+    account_context = dict(account_pricing_context)
+    account_context["catalog_snapshot_digest"] = active_reference.content_digest
+    return account_context
+
+
 def _publication_summary(validation: dict[str, Any]) -> dict[str, Any]:
     return {
         "validationStatus": validation.get("status", "error"),
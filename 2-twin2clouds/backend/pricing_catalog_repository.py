@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -21,6 +22,7 @@ from pydantic import ValidationError
 
 from backend.pricing_catalog_models import (
     PricingCatalogBaselineManifest,
+    PricingCatalogFreshness,
     PricingCatalogReference,
     PricingCatalogSnapshot,
     Provider,
@@ -28,10 +30,19 @@ from backend.pricing_catalog_models import (
     canonical_json_bytes,
     canonicalize_pricing_region,
 )
+from backend.pricing_history_index import (
+    PriceHistoryColumns,
+    PriceHistoryIndexError,
+    decode_price_history_rows,
+    encode_price_history_rows,
+    price_history_row,
+)
 
 
 DEFAULT_MAX_SNAPSHOT_BYTES = 8 * 1024 * 1024
 DEFAULT_MAX_AGE_DAYS = 7
+DEFAULT_SNAPSHOT_CACHE_SIZE = 64
+PRICE_HISTORY_MAX_BYTES_FACTOR = 16
 DEFAULT_BASELINE_ROOT = (
     Path(__file__).resolve().parents[1] / "json" / "pricing_catalog_baselines"
 )
@@ -98,6 +109,7 @@ class PricingCatalogRepository:
         baseline_root: Path,
         max_snapshot_bytes: int = DEFAULT_MAX_SNAPSHOT_BYTES,
         max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+        snapshot_cache_size: int = DEFAULT_SNAPSHOT_CACHE_SIZE,
     ) -> None:
         self.runtime_root = _normalize_root(runtime_root)
         self.baseline_root = _normalize_root(baseline_root)
@@ -107,6 +119,21 @@ class PricingCatalogRepository:
             raise ValueError("max_age_days must be positive")
         self.max_snapshot_bytes = max_snapshot_bytes
         self.max_age = timedelta(days=max_age_days)
+        if snapshot_cache_size < 0:
+            raise ValueError("snapshot_cache_size must not be negative")
+        self.snapshot_cache_size = snapshot_cache_size
+        # Verified read-only snapshots keyed by identity, valid while the
+        # backing file keeps the same (device, inode, mtime, size).
+        self._verified_snapshots: OrderedDict[
+            tuple[str, str, str, str],
+            tuple[tuple[int, int, int, int], PricingCatalogSnapshot],
+        ] = OrderedDict()
+        self._verified_snapshots_guard = threading.Lock()
+        self._price_history: dict[
+            tuple[str, str],
+            tuple[tuple[int, int, int, int], PriceHistoryColumns],
+        ] = {}
+        self._price_history_guard = threading.Lock()
         self._thread_locks: dict[tuple[str, str], threading.Lock] = {}
         self._thread_locks_guard = threading.Lock()
 
@@ -277,7 +304,7 @@ class PricingCatalogRepository:
         )
         target = self._snapshot_path(self.runtime_root, reference)
         self._write_immutable(target, snapshot.to_storage_dict())
-        return snapshot.detached_copy()
+        return snapshot.read_only_view()
 
     def publish(
         self,
@@ -293,13 +320,14 @@ class PricingCatalogRepository:
             raise PricingCatalogUnreviewedError(
                 "Candidate pricing cannot become an active calculation catalog"
             )
-        self.resolve_exact(reference, require_fresh=False)
+        snapshot = self.resolve_exact(reference, require_fresh=False)
         target = self._pointer_path(
             self.runtime_root,
             reference.provider,
             reference.pricing_region,
         )
         self._write_json_atomically(target, reference.to_storage_dict())
+        self._record_price_history(snapshot)
         return reference
 
     def resolve_exact(
@@ -319,15 +347,45 @@ class PricingCatalogRepository:
             raise PricingCatalogUnreviewedError(
                 "Unpublished pricing cannot be used for calculation"
             )
+        snapshot = self._verified_snapshot(reference)
+        if require_fresh and self.is_stale(reference, now=now):
+            raise PricingCatalogStaleError("Pricing catalog snapshot is stale")
+        return snapshot
+
+    def _verified_snapshot(
+        self,
+        reference: PricingCatalogReference,
+    ) -> PricingCatalogSnapshot:
+        """Return a shared read-only snapshot, re-verifying changed files."""
+
         path = self._snapshot_path(self.runtime_root, reference)
-        payload = self._read_json(
+        key = (
+            reference.provider,
+            reference.pricing_region,
+            reference.snapshot_id,
+            reference.content_digest,
+        )
+        if self.snapshot_cache_size:
+            self._assert_descendant(path)
+            identity = _file_identity(path)
+            with self._verified_snapshots_guard:
+                cached = self._verified_snapshots.get(key)
+                if cached is not None and identity is not None and cached[0] == identity:
+                    self._verified_snapshots.move_to_end(key)
+                    return cached[1]
+
+        payload, identity = self._read_json_with_identity(
             path,
             not_found_message="Exact pricing catalog snapshot is missing",
         )
-        snapshot = self._parse_snapshot(payload, reference)
-        if require_fresh and self.is_stale(reference, now=now):
-            raise PricingCatalogStaleError("Pricing catalog snapshot is stale")
-        return snapshot.detached_copy()
+        snapshot = self._parse_snapshot(payload, reference).read_only_view()
+        if self.snapshot_cache_size:
+            with self._verified_snapshots_guard:
+                self._verified_snapshots[key] = (identity, snapshot)
+                self._verified_snapshots.move_to_end(key)
+                while len(self._verified_snapshots) > self.snapshot_cache_size:
+                    self._verified_snapshots.popitem(last=False)
+        return snapshot
 
     def resolve_published(
         self,
@@ -437,7 +495,225 @@ class PricingCatalogRepository:
         current = now or datetime.now(timezone.utc)
         if current.tzinfo is None or current.utcoffset() is None:
             raise ValueError("now must be timezone-aware")
-        return current.astimezone(timezone.utc) - reference.fetched_at > self.max_age
+        return (
+            current.astimezone(timezone.utc) - self.last_verified_at(reference)
+            > self.max_age
+        )
+
+    def last_verified_at(self, reference: PricingCatalogReference) -> datetime:
+        """Return when provider data last matched this exact snapshot."""
+
+        freshness = self._read_freshness(reference.provider, reference.pricing_region)
+        if freshness is None or not freshness.applies_to(reference):
+            return reference.fetched_at
+        return max(reference.fetched_at, freshness.verified_at)
+
+    def record_freshness(
+        self,
+        reference: PricingCatalogReference,
+        verified_at: datetime,
+    ) -> datetime:
+        """Mark the published snapshot as re-confirmed without a new snapshot."""
+
+        published = self.resolve_published(
+            reference.provider,
+            reference.pricing_region,
+            require_fresh=False,
+        ).reference
+        if published != reference:
+            raise PricingCatalogRegionMismatchError(
+                "Freshness can only be recorded for the published snapshot"
+            )
+        effective = max(self.last_verified_at(reference), verified_at)
+        freshness = PricingCatalogFreshness(
+            snapshot_id=reference.snapshot_id,
+            content_digest=reference.content_digest,
+            verified_at=effective,
+        )
+        self._write_json_atomically(
+            self._freshness_path(reference.provider, reference.pricing_region),
+            freshness.to_storage_dict(),
+        )
+        return freshness.verified_at
+
+    def store_delta(
+        self,
+        reference: PricingCatalogReference,
+        delta: dict[str, Any],
+    ) -> None:
+        """Store the immutable field delta that explains one candidate."""
+
+        self._write_immutable(
+            self._delta_path(
+                reference.provider,
+                reference.pricing_region,
+                reference.snapshot_id,
+            ),
+            delta,
+        )
+
+    def resolve_delta(
+        self,
+        provider: Provider,
+        pricing_region: str,
+        snapshot_id: str,
+    ) -> dict[str, Any]:
+        """Read the field delta stored for one published or candidate snapshot."""
+
+        if not isinstance(snapshot_id, str) or not _SNAPSHOT_ID_PATTERN.fullmatch(
+            snapshot_id
+        ):
+            raise PricingCatalogNotFoundError(
+                "Pricing catalog snapshot identity is invalid"
+            )
+        return self._read_json(
+            self._delta_path(provider, pricing_region, snapshot_id),
+            not_found_message="Pricing catalog field delta is missing",
+        )
+
+    def price_history(
+        self,
+        provider: Provider,
+        pricing_region: str,
+        field_path: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        changes_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Return one priced field's values across published snapshots."""
+
+        canonical_region = canonicalize_pricing_region(provider, pricing_region)
+        with self._price_history_guard:
+            columns = self._load_price_history(provider, canonical_region)
+        return columns.series(
+            field_path,
+            since=since,
+            until=until,
+            changes_only=changes_only,
+        )
+
+    def rebuild_price_history(
+        self,
+        provider: Provider,
+        pricing_region: str,
+    ) -> int:
+        """Regenerate the derived history index from verified snapshots."""
+
+        canonical_region = canonicalize_pricing_region(provider, pricing_region)
+        with self._price_history_guard:
+            return len(self._rebuild_price_history(provider, canonical_region))
+
+    def _record_price_history(self, snapshot: PricingCatalogSnapshot) -> None:
+        reference = snapshot.reference
+        key = (reference.provider, reference.pricing_region)
+        with self._price_history_guard:
+            try:
+                columns = self._load_price_history(*key)
+                if reference.snapshot_id in columns:
+                    return
+                self._append_price_history_row(
+                    self._price_history_path(*key),
+                    price_history_row(snapshot),
+                )
+            except PricingCatalogRepositoryError:
+                # The index is derived; drop it so the next query rebuilds it.
+                self._price_history.pop(key, None)
+                self._price_history_path(*key).unlink(missing_ok=True)
+
+    def _load_price_history(
+        self,
+        provider: Provider,
+        pricing_region: str,
+    ) -> PriceHistoryColumns:
+        key = (provider, pricing_region)
+        path = self._price_history_path(provider, pricing_region)
+        self._assert_descendant(path)
+        identity = _file_identity(path)
+        cached = self._price_history.get(key)
+        if cached is not None and identity is not None and cached[0] == identity:
+            return cached[1]
+        if identity is None:
+            return self._rebuild_price_history(provider, pricing_region)
+        try:
+            columns = PriceHistoryColumns(
+                decode_price_history_rows(
+                    self._read_raw_bytes(path, limit=self._price_history_limit)
+                )
+            )
+        except (PriceHistoryIndexError, PricingCatalogTamperedError):
+            return self._rebuild_price_history(provider, pricing_region)
+        self._price_history[key] = (identity, columns)
+        return columns
+
+    def _rebuild_price_history(
+        self,
+        provider: Provider,
+        pricing_region: str,
+    ) -> PriceHistoryColumns:
+        snapshots_root = (
+            self._region_root(self.runtime_root, provider, pricing_region)
+            / "snapshots"
+        )
+        rows = []
+        candidates = sorted(snapshots_root.glob("pcs_*.json")) if (
+            snapshots_root.is_dir()
+        ) else []
+        for candidate in candidates:
+            try:
+                snapshot = self.resolve_snapshot(
+                    provider,
+                    pricing_region,
+                    candidate.stem,
+                )
+            except (PricingCatalogNotFoundError, PricingCatalogUnreviewedError):
+                continue
+            rows.append(price_history_row(snapshot))
+        path = self._price_history_path(provider, pricing_region)
+        self._write_bytes_atomically(path, encode_price_history_rows(rows))
+        columns = PriceHistoryColumns(rows)
+        identity = _file_identity(path)
+        if identity is not None:
+            self._price_history[(provider, pricing_region)] = (identity, columns)
+        return columns
+
+    def _append_price_history_row(self, path: Path, row: dict[str, Any]) -> None:
+        self._assert_descendant(path)
+        encoded = encode_price_history_rows([row])
+        flags = os.O_WRONLY | os.O_APPEND | getattr(os, "O_NOFOLLOW", 0)
+        try:
+            descriptor = os.open(path, flags)
+            with os.fdopen(descriptor, "ab") as handle:
+                handle.write(encoded)
+                handle.flush()
+                os.fsync(handle.fileno())
+        except OSError as exc:
+            raise PricingCatalogStorageError(
+                "Pricing catalog storage is unavailable"
+            ) from exc
+
+    @property
+    def _price_history_limit(self) -> int:
+        return self.max_snapshot_bytes * PRICE_HISTORY_MAX_BYTES_FACTOR
+
+    def _read_freshness(
+        self,
+        provider: Provider,
+        pricing_region: str,
+    ) -> PricingCatalogFreshness | None:
+        try:
+            payload = self._read_json(
+                self._freshness_path(provider, pricing_region),
+                not_found_message="Pricing catalog freshness record is missing",
+            )
+        except PricingCatalogNotFoundError:
+            return None
+        try:
+            return PricingCatalogFreshness.model_validate(payload)
+        except ValidationError as exc:
+            raise PricingCatalogTamperedError(
+                "Pricing catalog freshness record is invalid"
+            ) from exc
 
     @contextmanager
     def refresh_guard(
@@ -526,6 +802,17 @@ class PricingCatalogRepository:
         *,
         not_found_message: str,
     ) -> dict[str, Any]:
+        return self._read_json_with_identity(
+            path,
+            not_found_message=not_found_message,
+        )[0]
+
+    def _read_json_with_identity(
+        self,
+        path: Path,
+        *,
+        not_found_message: str,
+    ) -> tuple[dict[str, Any], tuple[int, int, int, int]]:
         self._assert_descendant(path)
         try:
             descriptor = os.open(
@@ -548,6 +835,7 @@ class PricingCatalogRepository:
                 raise PricingCatalogTamperedError(
                     "Pricing catalog document exceeds the size limit"
                 )
+            identity = _stat_identity(metadata)
             with os.fdopen(descriptor, "r", encoding="utf-8") as handle:
                 descriptor = -1
                 payload = json.load(handle)
@@ -562,7 +850,7 @@ class PricingCatalogRepository:
             raise PricingCatalogTamperedError(
                 "Pricing catalog document must be a JSON object"
             )
-        return payload
+        return payload, identity
 
     def _write_immutable(self, target: Path, payload: dict[str, Any]) -> None:
         self._assert_descendant(target)
@@ -599,9 +887,11 @@ class PricingCatalogRepository:
             ) from exc
 
     def _write_json_atomically(self, target: Path, payload: dict[str, Any]) -> None:
+        self._write_bytes_atomically(target, canonical_json_bytes(payload))
+
+    def _write_bytes_atomically(self, target: Path, encoded: bytes) -> None:
         self._assert_descendant(target)
         target.parent.mkdir(parents=True, exist_ok=True)
-        encoded = canonical_json_bytes(payload)
         descriptor, temporary_name = tempfile.mkstemp(
             prefix=f".{target.name}.",
             suffix=".tmp",
@@ -622,7 +912,8 @@ class PricingCatalogRepository:
         finally:
             temporary.unlink(missing_ok=True)
 
-    def _read_raw_bytes(self, path: Path) -> bytes:
+    def _read_raw_bytes(self, path: Path, *, limit: int | None = None) -> bytes:
+        limit = self.max_snapshot_bytes if limit is None else limit
         try:
             descriptor = os.open(
                 path,
@@ -633,13 +924,13 @@ class PricingCatalogRepository:
                 raise PricingCatalogTamperedError(
                     "Pricing catalog path is not a regular file"
                 )
-            if metadata.st_size > self.max_snapshot_bytes:
+            if metadata.st_size > limit:
                 raise PricingCatalogTamperedError(
                     "Pricing catalog document exceeds the size limit"
                 )
             with os.fdopen(descriptor, "rb") as handle:
                 descriptor = -1
-                return handle.read(self.max_snapshot_bytes + 1)
+                return handle.read(limit + 1)
         except OSError as exc:
             raise PricingCatalogStorageError(
                 "Pricing catalog storage is unavailable"
@@ -663,6 +954,30 @@ class PricingCatalogRepository:
             / f"{reference.snapshot_id}.json"
         )
 
+    def _freshness_path(self, provider: Provider, pricing_region: str) -> Path:
+        return self._region_root(self.runtime_root, provider, pricing_region) / (
+            "freshness.json"
+        )
+
+    def _delta_path(
+        self,
+        provider: Provider,
+        pricing_region: str,
+        snapshot_id: str,
+    ) -> Path:
+        return (
+            self._region_root(self.runtime_root, provider, pricing_region)
+            / "deltas"
+            / f"{snapshot_id}.json"
+        )
+
+    def _price_history_path(self, provider: Provider, pricing_region: str) -> Path:
+        return (
+            self._region_root(self.runtime_root, provider, pricing_region)
+            / "history"
+            / "price-history.jsonl"
+        )
+
     def _pointer_path(
         self,
         root: Path,
@@ -751,6 +1066,25 @@ def _reject_secret_keys(payload: Any, path: str = "$") -> None:
             _reject_secret_keys(value, f"{path}[{index}]")
 
 
+def _stat_identity(metadata: os.stat_result) -> tuple[int, int, int, int]:
+    return (
+        metadata.st_dev,
+        metadata.st_ino,
+        metadata.st_mtime_ns,
+        metadata.st_size,
+    )
+
+
+def _file_identity(path: Path) -> tuple[int, int, int, int] | None:
+    try:
+        metadata = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return None
+    if not stat.S_ISREG(metadata.st_mode):
+        return None
+    return _stat_identity(metadata)
+
+
 def _fsync_directory(path: Path) -> None:
     flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
     try:
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
-from types import MappingProxyType
 from typing import Any, Mapping
 
+from backend.frozen_pricing import FrozenPricingDict
 from backend.pricing_catalog_models import (
     PricingCatalogContext,
     PricingCatalogSnapshot,
@@ -17,14 +16,16 @@ from backend.pricing_schema import strip_pricing_metadata
 
 @dataclass(frozen=True)
 class ResolvedPricingCatalogs:
-    """Detached calculation pricing and the exact references that produced it."""
+    """Read-only calculation pricing and the exact references that produced it.
+
+    ``pricing`` shares the repository's verified snapshot trees, so every
+    calculation reads the same objects and any write raises
+    ``PricingMutationError``.
+    """
 
     pricing: Mapping[str, Any]
     context: PricingCatalogContext
 
-    def detached_pricing(self) -> dict[str, Any]:
-        return deepcopy(dict(self.pricing))
-
 
 class PricingCatalogResolver:
     """Fail-closed exact-reference resolver used by the calculation boundary."""
@@ -46,14 +47,14 @@ class PricingCatalogResolver:
             )
 
         combined = {
-            provider: strip_pricing_metadata(snapshot.pricing)
+            provider: FrozenPricingDict(strip_pricing_metadata(snapshot.pricing))
             for provider, snapshot in snapshots.items()
         }
-        combined["__aws_schema__"] = deepcopy(
-            snapshots["aws"].pricing.get("__schema__") or {}
+        combined["__aws_schema__"] = (
+            snapshots["aws"].pricing.get("__schema__") or FrozenPricingDict()
         )
         return ResolvedPricingCatalogs(
-            pricing=MappingProxyType(combined),
+            pricing=FrozenPricingDict(combined),
             context=PricingCatalogContext.model_validate(
                 {
                     "catalogs": {
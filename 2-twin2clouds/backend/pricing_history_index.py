@@ -0,0 +1,148 @@
+"""Derived per-field price history across immutable catalog snapshots."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+import json
+from typing import Any, Iterable
+
+from backend.pricing_catalog_diff import comparable_pricing_fields
+from backend.pricing_catalog_models import PricingCatalogSnapshot
+
+
+PRICE_HISTORY_SCHEMA_VERSION = "pricing-catalog-price-history.v1"
+
+
+class PriceHistoryIndexError(ValueError):
+    """Raised when a stored history row cannot be decoded."""
+
+
+def price_history_row(snapshot: PricingCatalogSnapshot) -> dict[str, Any]:
+    """Return the append-only history row for one published snapshot."""
+
+    return {
+        "schema_version": PRICE_HISTORY_SCHEMA_VERSION,
+        "snapshot_id": snapshot.reference.snapshot_id,
+        "fetched_at": _utc_iso(snapshot.reference.fetched_at),
+        "fields": comparable_pricing_fields(snapshot.pricing),
+    }
+
+
+def encode_price_history_rows(rows: Iterable[dict[str, Any]]) -> bytes:
+    return b"".join(
+        json.dumps(
+            row,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=True,
+            allow_nan=False,
+        ).encode("utf-8")
+        + b"\n"
+        for row in rows
+    )
+
+
+def decode_price_history_rows(data: bytes) -> list[dict[str, Any]]:
+    rows = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise PriceHistoryIndexError("Price history row is not JSON") from exc
+        if (
+            not isinstance(row, dict)
+            or row.get("schema_version") != PRICE_HISTORY_SCHEMA_VERSION
+            or not isinstance(row.get("snapshot_id"), str)
+            or not isinstance(row.get("fetched_at"), str)
+            or not isinstance(row.get("fields"), dict)
+        ):
+            raise PriceHistoryIndexError("Price history row is invalid")
+        rows.append(row)
+    return rows
+
+
+class PriceHistoryColumns:
+    """Column-per-field view of one provider-region history file.
+
+    Rows are ordered by ``fetched_at`` once on load; each field path then maps
+    to the row positions and values where it appears, so a series lookup is a
+    dictionary hit plus two bisections instead of a scan over every snapshot.
+    """
+
+    __slots__ = ("snapshot_ids", "fetched_at", "columns")
+
+    def __init__(self, rows: Iterable[dict[str, Any]]) -> None:
+        unique: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            unique.setdefault(row["snapshot_id"], row)
+        ordered = sorted(
+            unique.values(),
+            key=lambda row: (_parse_utc(row["fetched_at"]), row["snapshot_id"]),
+        )
+        self.snapshot_ids: list[str] = [row["snapshot_id"] for row in ordered]
+        self.fetched_at: list[datetime] = [
+            _parse_utc(row["fetched_at"]) for row in ordered
+        ]
+        self.columns: dict[str, tuple[list[int], list[Any]]] = {}
+        for position, row in enumerate(ordered):
+            for path, value in row["fields"].items():
+                positions, values = self.columns.setdefault(path, ([], []))
+                positions.append(position)
+                values.append(value)
+
+    def __contains__(self, snapshot_id: object) -> bool:
+        return snapshot_id in self.snapshot_ids
+
+    def __len__(self) -> int:
+        return len(self.snapshot_ids)
+
+    def series(
+        self,
+        field_path: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        changes_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Return ``fetched_at``-ordered points for one dotted field path."""
+
+        positions, values = self.columns.get(field_path, ([], []))
+        first = (
+            bisect_left(positions, bisect_left(self.fetched_at, since))
+            if since is not None
+            else 0
+        )
+        last = (
+            bisect_right(positions, bisect_right(self.fetched_at, until) - 1)
+            if until is not None
+            else len(positions)
+        )
+        points: list[dict[str, Any]] = []
+        for position, value in zip(positions[first:last], values[first:last]):
+            if changes_only and points and points[-1]["value"] == value:
+                continue
+            points.append(
+                {
+                    "snapshotId": self.snapshot_ids[position],
+                    "fetchedAt": _utc_iso(self.fetched_at[position]),
+                    "value": value,
+                }
+            )
+        return points
+
+
+def _parse_utc(value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise PriceHistoryIndexError("Price history timestamp is invalid") from exc
+    if parsed.tzinfo is None:
+        raise PriceHistoryIndexError("Price history timestamp is invalid")
+    return parsed.astimezone(timezone.utc)
+
+
+def _utc_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -76,3 +76,32 @@ def test_catalog_api_rejects_malformed_snapshot_identity_as_not_found():
     )
 
     assert response.status_code == 404
+
+
+def test_catalog_api_returns_field_history_for_published_snapshots():
+    reference = get_pricing_catalog_repository().resolve_baseline(
+        "azure",
+        require_fresh=False,
+    ).reference
+
+    response = client.get(
+        "/pricing/catalogs/azure/westeurope/history",
+        params={"field": "azureDigitalTwins.pricePerMessage"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["schemaVersion"] == "pricing-catalog-price-history.v1"
+    assert body["field"] == "azureDigitalTwins.pricePerMessage"
+    assert reference.snapshot_id in {
+        point["snapshotId"] for point in body["points"]
+    }
+
+    naive = client.get(
+        "/pricing/catalogs/azure/westeurope/history",
+        params={
+            "field": "azureDigitalTwins.pricePerMessage",
+            "since": "2026-01-01T00:00:00",
+        },
+    )
+    assert naive.status_code == 400
@@ -701,6 +701,47 @@ class TestEngineIntegration:
             for component_id in runtime_components
         )
 
+    def test_calculators_read_pricing_without_mutating_it(
+        self,
+        sample_params,
+        sample_pricing,
+    ):
+        """Resolved catalogs are shared read-only trees; any write must raise."""
+        from backend.calculation_v2.engine import (
+            calculate_aws_costs,
+            calculate_azure_costs,
+            calculate_cheapest_costs,
+            calculate_gcp_costs,
+        )
+        from backend.frozen_pricing import freeze_pricing
+
+        context = pricing_catalog_context_for(sample_pricing)
+        frozen = freeze_pricing(sample_pricing)
+
+        for calculate in (
+            calculate_aws_costs,
+            calculate_azure_costs,
+            calculate_gcp_costs,
+        ):
+            shared = calculate(sample_params, frozen)
+            plain = calculate(sample_params, sample_pricing)
+            for layer in ("L1", "L2", "L3_hot", "L3_cool", "L3_archive", "L4", "L5"):
+                assert shared[layer]["cost"] == plain[layer]["cost"]
+        result = calculate_cheapest_costs(
+            sample_params,
+            frozen,
+            pricing_catalog_context=context,
+        )
+        expected = calculate_cheapest_costs(
+            sample_params,
+            sample_pricing,
+            pricing_catalog_context=context,
+        )
+
+        assert frozen == sample_pricing
+        assert result["cheapestPath"] == expected["cheapestPath"]
+        assert result["totalCost"] == expected["totalCost"]
+
     def test_currency_conversion_does_not_change_deployment_specification(
         self,
         sample_params,
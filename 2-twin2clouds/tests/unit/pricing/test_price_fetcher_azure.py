@@ -1,5 +1,10 @@
 from unittest.mock import patch
+
+import pytest
+
 from backend.fetch_data.cloud_price_fetcher_azure import (
+    AzureRetailPricingFetchError,
+    _retail_query_items,
     fetch_azure_price,
     _find_best_match,
     _find_best_match_with_evidence,
@@ -310,3 +315,17 @@ def test_fetch_azure_price_api_error(mock_query):
     result = fetch_azure_price("functions", "westeurope", region_map, service_mapping, debug=False)
     
     assert result == {}
+
+
+@patch('backend.fetch_data.cloud_price_fetcher_azure.requests.get')
+def test_retail_query_fails_instead_of_returning_partial_rows(mock_get):
+    first_page = mock_get.return_value
+    first_page.status_code = 200
+    first_page.json.return_value = {"Items": [{"meterName": "a"}], "NextPageLink": "next"}
+    throttled = type(first_page)()
+    throttled.status_code = 429
+    throttled.text = "Too Many Requests"
+    mock_get.side_effect = [first_page, throttled]
+
+    with pytest.raises(AzureRetailPricingFetchError, match="429"):
+        list(_retail_query_items({"$filter": "serviceName eq 'Functions'"}))
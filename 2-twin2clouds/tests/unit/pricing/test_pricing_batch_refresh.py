@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+
+from backend.pricing_batch_refresh import (
+    PricingBatchRefreshJob,
+    PricingRefreshTarget,
+    normalize_refresh_targets,
+)
+from backend.pricing_cache import cached_raw_catalog
+from backend.pricing_catalog_models import PricingCatalogContractError
+from backend.pricing_catalog_repository import PricingCatalogRefreshInProgressError
+
+
+def test_targets_are_canonicalized_and_deduplicated_in_order():
+    targets = normalize_refresh_targets(
+        [("gcp", "europe-west1"), ("aws", "EU-Central-1"), ("aws", "eu-central-1")]
+    )
+    assert targets == (
+        PricingRefreshTarget("gcp", "europe-west1"),
+        PricingRefreshTarget("aws", "eu-central-1"),
+    )
+
+
+def test_targets_reject_unknown_providers_and_empty_batches():
+    with pytest.raises(PricingCatalogContractError):
+        normalize_refresh_targets([("oracle", "eu-frankfurt-1")])
+    with pytest.raises(ValueError, match="at least one"):
+        normalize_refresh_targets([])
+
+
+def test_per_provider_concurrency_limit_is_respected():
+    active = {"aws": 0, "azure": 0}
+    peak = {"aws": 0, "azure": 0}
+    guard = threading.Lock()
+
+    def refresh(target):
+        with guard:
+            active[target.provider] += 1
+            peak[target.provider] = max(peak[target.provider], active[target.provider])
+        time.sleep(0.05)
+        with guard:
+            active[target.provider] -= 1
+        return {"status": "published"}
+
+    job = PricingBatchRefreshJob(
+        refresh,
+        provider_concurrency={"aws": 1, "azure": 3},
+    )
+    summary = job.run(
+        [("aws", "eu-central-1"), ("aws", "us-east-1"), ("aws", "eu-west-1")]
+        + [("azure", region) for region in ("westeurope", "northeurope", "uksouth")]
+    )
+
+    assert peak == {"aws": 1, "azure": 3}
+    assert summary["statusCounts"] == {"published": 6}
+
+
+def test_failures_and_locked_regions_do_not_abort_the_batch():
+    def refresh(target):
+        if target.pricing_region == "northeurope":
+            raise PricingCatalogRefreshInProgressError("busy")
+        if target.pricing_region == "uksouth":
+            raise RuntimeError("provider outage")
+        return {"status": "review_required"}
+
+    events = []
+    summary = PricingBatchRefreshJob(refresh).run(
+        [("azure", "westeurope"), ("azure", "northeurope"), ("azure", "uksouth")],
+        events.append,
+    )
+
+    statuses = {
+        target["pricingRegion"]: target["status"] for target in summary["targets"]
+    }
+    assert statuses == {
+        "westeurope": "review_required",
+        "northeurope": "in_progress",
+        "uksouth": "failed",
+    }
+    finished = [event for event in events if event["status"] != "started"]
+    assert len(finished) == 3
+    assert all("durationMs" in event and "result" not in event for event in finished)
+
+
+def test_raw_catalog_downloads_are_shared_across_regions_of_a_provider():
+    downloads = []
+
+    def refresh(target):
+        cached_raw_catalog(
+            ("gcp", "skus", "compute"),
+            lambda: downloads.append(target.pricing_region) or ["sku"],
+        )
+        return {"status": "published"}
+
+    summary = PricingBatchRefreshJob(refresh).run(
+        [("gcp", "europe-west1"), ("gcp", "us-central1"), ("gcp", "asia-east1")]
+    )
+
+    assert len(downloads) == 1
+    assert summary["rawCatalogCache"]["hits"] == 2
+
+
+def test_failed_raw_catalog_reads_fail_every_region_that_shares_them():
+    downloads = []
+
+    class Throttled(RuntimeError):
+        code = "AZURE_RETAIL_CATALOG_FETCH_FAILED"
+
+    def load(region):
+        downloads.append(region)
+        raise Throttled("429")
+
+    def refresh(target):
+        cached_raw_catalog(("azure", "global"), lambda: load(target.pricing_region))
+        return {"status": "published"}
+
+    summary = PricingBatchRefreshJob(refresh).run(
+        [("azure", "westeurope"), ("azure", "northeurope")]
+    )
+
+    assert len(downloads) == 1
+    assert [target["status"] for target in summary["targets"]] == ["failed", "failed"]
+    assert {target["errorCode"] for target in summary["targets"]} == {
+        "AZURE_RETAIL_CATALOG_FETCH_FAILED"
+    }
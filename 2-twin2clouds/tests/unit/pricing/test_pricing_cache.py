@@ -4,7 +4,10 @@ import pytest
 
 from backend.pricing_cache import (
     PricingRefreshInProgressError,
+    SharedRawCatalogCache,
+    cached_raw_catalog,
     provider_refresh_guard,
+    shared_raw_catalogs,
     write_json_atomically,
 )
 
@@ -33,3 +36,27 @@ def test_atomic_json_publication_replaces_complete_document(tmp_path):
         "price": 0.42,
     }
     assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_shared_raw_catalog_loads_each_query_once():
+    cache = SharedRawCatalogCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ["row"]
+
+    with shared_raw_catalogs(cache):
+        assert cached_raw_catalog(("gcp", "skus", "svc"), loader) == ["row"]
+        assert cached_raw_catalog(("gcp", "skus", "svc"), loader) == ["row"]
+        cached_raw_catalog(("gcp", "skus", "other"), loader)
+
+    assert len(calls) == 2
+    assert cache.stats() == {"entries": 2, "hits": 1, "misses": 2}
+
+
+def test_raw_catalog_reads_are_uncached_outside_a_shared_context():
+    calls = []
+    cached_raw_catalog(("azure", "filter"), lambda: calls.append(1))
+    cached_raw_catalog(("azure", "filter"), lambda: calls.append(1))
+    assert len(calls) == 2
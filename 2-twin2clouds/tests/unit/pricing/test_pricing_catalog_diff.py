@@ -0,0 +1,29 @@
+from backend.pricing_catalog_diff import comparable_pricing_fields, diff_pricing_fields
+
+
+def test_metadata_blocks_are_not_priced_fields():
+    fields = comparable_pricing_fields(
+        {
+            "__schema__": {"generated_at": "2026-01-01T00:00:00Z"},
+            "lambda": {"requestPrice": 0.2, "__evidence__": {"fetched_at": "x"}},
+            "transfer": {"tiers": [{"price": 0.09}]},
+        }
+    )
+
+    assert fields == {
+        "lambda.requestPrice": 0.2,
+        "transfer.tiers": [{"price": 0.09}],
+    }
+
+
+def test_diff_reports_added_removed_and_changed_paths_in_order():
+    changes = diff_pricing_fields(
+        {"a": {"x": 1, "y": 2.0}, "b": {"z": True}},
+        {"a": {"x": 1.0, "y": 2.5}, "c": {"w": "new"}},
+    )
+
+    assert changes == [
+        {"path": "a.y", "change": "changed", "previous": 2.0, "current": 2.5},
+        {"path": "b.z", "change": "removed", "previous": True},
+        {"path": "c.w", "change": "added", "current": "new"},
+    ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from copy import deepcopy
+from datetime import datetime, timezone
 from pathlib import Path
 import shutil
 
@@ -178,3 +180,149 @@ def test_refresh_rejects_missing_or_mismatched_provider_identity(tmp_path):
             pricing_region="westeurope",
             pricing=wrong_region,
         )
+
+
+def _observed_azure_pricing(repository, generated_at: str) -> dict:
+    pricing = deepcopy(
+        repository.resolve_baseline("azure", require_fresh=False).pricing
+    )
+    pricing["__schema__"]["generated_at"] = generated_at
+    return pricing
+
+
+def test_unchanged_refresh_only_bumps_freshness(tmp_path):
+    repository = _repository(tmp_path)
+    service = PricingCatalogRefreshService(
+        repository,
+        PricingRegistryService(PROJECT_ROOT / "pricing_registry"),
+    )
+    first = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_observed_azure_pricing(repository, "2026-01-01T00:00:00+00:00"),
+    )
+    snapshots = repository.runtime_root / "azure" / "westeurope" / "snapshots"
+    snapshot_count = len(list(snapshots.glob("*.json")))
+
+    second = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_observed_azure_pricing(repository, "2026-01-20T00:00:00+00:00"),
+    )
+
+    assert second["status"] == "unchanged"
+    assert second["candidateReference"] is None
+    assert second["fieldDelta"]["changeCount"] == 0
+    assert second["activeCalculationReference"] == first["candidateReference"]
+    assert len(list(snapshots.glob("*.json"))) == snapshot_count
+    reference = PricingCatalogReference.model_validate(
+        second["activeCalculationReference"]
+    )
+    assert repository.last_verified_at(reference) == datetime(
+        2026, 1, 20, tzinfo=timezone.utc
+    )
+    assert not repository.is_stale(
+        reference,
+        now=datetime(2026, 1, 25, tzinfo=timezone.utc),
+    )
+
+
+def test_unpublishable_unchanged_refresh_does_not_bump_freshness(tmp_path):
+    repository = _repository(tmp_path)
+    service = PricingCatalogRefreshService(
+        repository,
+        PricingRegistryService(PROJECT_ROOT / "pricing_registry"),
+    )
+    first = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_observed_azure_pricing(repository, "2026-01-01T00:00:00+00:00"),
+    )
+    reference = PricingCatalogReference.model_validate(first["candidateReference"])
+    unpublishable = _observed_azure_pricing(repository, "2026-01-20T00:00:00+00:00")
+    unpublishable["__quality__"]["fallback_fields"] = ["functions.requestPrice"]
+
+    result = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=unpublishable,
+    )
+
+    assert result["status"] == "review_required"
+    assert result["fieldDelta"]["changeCount"] == 0
+    assert result["activeCalculationReference"] == first["candidateReference"]
+    published = repository.resolve_published(
+        "azure",
+        "westeurope",
+        require_fresh=False,
+    )
+    assert published.reference.fetched_at == reference.fetched_at
+    assert repository.last_verified_at(reference) == datetime(
+        2026, 1, 1, tzinfo=timezone.utc
+    )
+    assert repository.is_stale(
+        reference,
+        now=datetime(2026, 1, 25, tzinfo=timezone.utc),
+    )
+
+
+def test_changed_refresh_records_compact_field_delta(tmp_path):
+    repository = _repository(tmp_path)
+    service = PricingCatalogRefreshService(
+        repository,
+        PricingRegistryService(PROJECT_ROOT / "pricing_registry"),
+    )
+    first = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_observed_azure_pricing(repository, "2026-01-01T00:00:00+00:00"),
+    )
+    changed = _observed_azure_pricing(repository, "2026-01-02T00:00:00+00:00")
+    service_key = next(
+        key
+        for key, value in changed.items()
+        if not key.startswith("__")
+        and isinstance(value, dict)
+        and any(isinstance(item, float) for item in value.values())
+    )
+    field = next(
+        key
+        for key, value in changed[service_key].items()
+        if isinstance(value, float)
+    )
+    changed[service_key][field] = changed[service_key][field] * 2 + 0.01
+
+    result = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=changed,
+    )
+
+    delta = result["fieldDelta"]
+    assert delta["baseSnapshotId"] == first["candidateReference"]["snapshotId"]
+    assert delta["changeCount"] == 1
+    assert delta["changes"][0]["path"] == f"{service_key}.{field}"
+    assert delta["changes"][0]["change"] == "changed"
+    stored = repository.resolve_delta(
+        "azure",
+        "westeurope",
+        result["candidateReference"]["snapshotId"],
+    )
+    assert stored["change_count"] == 1
+
+
+def test_refresh_over_reviewed_baseline_never_counts_as_unchanged(tmp_path):
+    repository = _repository(tmp_path)
+    service = PricingCatalogRefreshService(
+        repository,
+        PricingRegistryService(PROJECT_ROOT / "pricing_registry"),
+    )
+
+    result = service.persist_refresh(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_observed_azure_pricing(repository, "2026-01-01T00:00:00+00:00"),
+    )
+
+    assert result["status"] == "published"
+    assert result["fieldDelta"]["changeCount"] == 0
@@ -9,6 +9,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+from backend.frozen_pricing import PricingMutationError, thaw_pricing
 from backend.pricing_catalog_models import (
     PricingCatalogBaselineManifest,
     PricingCatalogContext,
@@ -222,7 +223,7 @@ def test_region_canonicalization_and_path_input_rejection():
         canonicalize_pricing_region("aws", "westeurope")
 
 
-def test_initialization_is_idempotent_and_resolves_detached_baselines(repository):
+def test_initialization_is_idempotent_and_resolves_read_only_baselines(repository):
     first = repository.initialize_from_baseline()
     second = repository.initialize_from_baseline()
 
@@ -231,12 +232,86 @@ def test_initialization_is_idempotent_and_resolves_detached_baselines(repository
         "azure",
         now=FETCHED_AT + timedelta(days=1),
     )
-    snapshot.pricing["service"]["price"] = 99
+    with pytest.raises(PricingMutationError):
+        snapshot.pricing["service"]["price"] = 99
+    with pytest.raises(PricingMutationError):
+        snapshot.pricing["__quality__"]["fallback_fields"].append("service.price")
+    editable = thaw_pricing(snapshot.pricing)
+    editable["service"]["price"] = 99
     reread = repository.resolve_baseline(
         "azure",
         now=FETCHED_AT + timedelta(days=1),
     )
     assert reread.pricing["service"]["price"] == 0.25
+    assert json.loads(json.dumps(reread.pricing)) == _pricing("azure")
+
+
+def test_exact_resolution_reuses_verified_snapshot(repository, monkeypatch):
+    manifest = repository.initialize_from_baseline()
+    reference = manifest.catalogs["aws"]
+    first = repository.resolve_exact(reference, require_fresh=False)
+
+    def unexpected_read(*args, **kwargs):
+        raise AssertionError("cached snapshot was re-read")
+
+    monkeypatch.setattr(repository, "_read_json_with_identity", unexpected_read)
+    second = repository.resolve_exact(reference, require_fresh=False)
+
+    assert second is first
+
+
+def test_snapshot_cache_reverifies_replaced_file(repository):
+    manifest = repository.initialize_from_baseline()
+    reference = manifest.catalogs["azure"]
+    repository.resolve_exact(reference, require_fresh=False)
+    target = (
+        repository.runtime_root
+        / "azure"
+        / "westeurope"
+        / "snapshots"
+        / f"{reference.snapshot_id}.json"
+    )
+    payload = json.loads(target.read_text(encoding="utf-8"))
+    payload["pricing"]["service"]["price"] = 0.26
+    replacement = target.with_suffix(".tmp")
+    replacement.write_text(json.dumps(payload), encoding="utf-8")
+    replacement.replace(target)
+
+    with pytest.raises(PricingCatalogTamperedError, match="invalid"):
+        repository.resolve_exact(reference, require_fresh=False)
+
+
+def test_snapshot_cache_is_bounded_and_can_be_disabled(tmp_path):
+    baseline_root = tmp_path / "baseline"
+    _write_baselines(baseline_root)
+    bounded = PricingCatalogRepository(
+        runtime_root=tmp_path / "bounded",
+        baseline_root=baseline_root,
+        snapshot_cache_size=1,
+    )
+    manifest = bounded.initialize_from_baseline()
+    for reference in manifest.catalogs.values():
+        bounded.resolve_exact(reference, require_fresh=False)
+    assert len(bounded._verified_snapshots) == 1
+
+    uncached = PricingCatalogRepository(
+        runtime_root=tmp_path / "uncached",
+        baseline_root=baseline_root,
+        snapshot_cache_size=0,
+    )
+    manifest = uncached.initialize_from_baseline()
+    reference = manifest.catalogs["gcp"]
+    first = uncached.resolve_exact(reference, require_fresh=False)
+    second = uncached.resolve_exact(reference, require_fresh=False)
+    assert first is not second
+    assert first.pricing == second.pricing
+    assert not uncached._verified_snapshots
+    with pytest.raises(ValueError, match="snapshot_cache_size"):
+        PricingCatalogRepository(
+            runtime_root=tmp_path / "invalid",
+            baseline_root=baseline_root,
+            snapshot_cache_size=-1,
+        )
 
 
 def test_initialization_preserves_newer_runtime_pointer(repository):
@@ -688,3 +763,118 @@ def test_default_repository_uses_configured_roots(monkeypatch, tmp_path):
         repository.verify_readiness()
     finally:
         get_pricing_catalog_repository.cache_clear()
+
+
+def _publish_azure_price(repository, value: float, fetched_at: datetime):
+    snapshot = repository.store_candidate(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_pricing("azure", value),
+        provider_schema_version="pricing-provider-schema.v1",
+        contract_version="2026.07.17",
+        registry_version="2026.07.17",
+        mapping_versions=("2026.07.17",),
+        fetched_at=fetched_at,
+        source="provider_api",
+        review_status="reviewed",
+        calculation_source="fresh",
+    )
+    return repository.publish(snapshot.reference)
+
+
+def test_price_history_is_appended_on_publish(repository):
+    manifest = repository.initialize_from_baseline()
+    first = _publish_azure_price(repository, 0.3, FETCHED_AT + timedelta(days=1))
+    second = _publish_azure_price(repository, 0.3, FETCHED_AT + timedelta(days=2))
+    third = _publish_azure_price(repository, 0.2, FETCHED_AT + timedelta(days=3))
+    repository.publish(second)
+
+    points = repository.price_history("azure", "westeurope", "service.price")
+
+    assert [point["snapshotId"] for point in points] == [
+        manifest.catalogs["azure"].snapshot_id,
+        first.snapshot_id,
+        second.snapshot_id,
+        third.snapshot_id,
+    ]
+    assert [point["value"] for point in points] == [0.25, 0.3, 0.3, 0.2]
+    assert points[1]["fetchedAt"] == "2026-07-18T12:00:00Z"
+    history = (
+        repository.runtime_root
+        / "azure"
+        / "westeurope"
+        / "history"
+        / "price-history.jsonl"
+    )
+    assert len(history.read_bytes().splitlines()) == 4
+    assert repository.price_history("aws", "eu-central-1", "service.price") == [
+        {
+            "snapshotId": manifest.catalogs["aws"].snapshot_id,
+            "fetchedAt": "2026-07-17T12:00:00Z",
+            "value": 0.25,
+        }
+    ]
+
+
+def test_price_history_window_and_change_collapse(repository):
+    repository.initialize_from_baseline()
+    for day, value in ((1, 0.3), (2, 0.3), (3, 0.2)):
+        _publish_azure_price(repository, value, FETCHED_AT + timedelta(days=day))
+
+    windowed = repository.price_history(
+        "azure",
+        "westeurope",
+        "service.price",
+        since=FETCHED_AT + timedelta(days=1),
+        until=FETCHED_AT + timedelta(days=2),
+    )
+    changes = repository.price_history(
+        "azure",
+        "westeurope",
+        "service.price",
+        changes_only=True,
+    )
+
+    assert [point["value"] for point in windowed] == [0.3, 0.3]
+    assert [point["value"] for point in changes] == [0.25, 0.3, 0.2]
+    assert repository.price_history("azure", "westeurope", "service.unknown") == []
+    assert repository.price_history("azure", "westeurope", "__quality__") == []
+
+
+def test_price_history_is_rebuilt_from_snapshots(repository):
+    repository.initialize_from_baseline()
+    _publish_azure_price(repository, 0.3, FETCHED_AT + timedelta(days=1))
+    candidate = repository.store_candidate(
+        provider="azure",
+        pricing_region="westeurope",
+        pricing=_pricing("azure", 9.0),
+        provider_schema_version="pricing-provider-schema.v1",
+        contract_version="2026.07.17",
+        registry_version="2026.07.17",
+        mapping_versions=("2026.07.17",),
+        fetched_at=FETCHED_AT + timedelta(days=2),
+        source="provider_api",
+        review_status="review_required",
+        calculation_source="fresh",
+    )
+    history = (
+        repository.runtime_root
+        / "azure"
+        / "westeurope"
+        / "history"
+        / "price-history.jsonl"
+    )
+    expected = repository.price_history("azure", "westeurope", "service.price")
+
+    history.unlink()
+    assert repository.price_history("azure", "westeurope", "service.price") == (
+        expected
+    )
+    history.write_text('{"truncated":', encoding="utf-8")
+    assert repository.price_history("azure", "westeurope", "service.price") == (
+        expected
+    )
+    assert repository.rebuild_price_history("azure", "westeurope") == 2
+    assert candidate.reference.snapshot_id not in history.read_text(
+        encoding="utf-8"
+    )
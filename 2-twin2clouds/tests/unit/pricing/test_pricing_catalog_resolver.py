@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from backend.frozen_pricing import PricingMutationError
 from backend.pricing_catalog_models import (
     PricingCatalogBaselineManifest,
     PricingCatalogContext,
@@ -84,7 +85,7 @@ def _seed_repository(tmp_path: Path) -> tuple[
     return repository, PricingCatalogContext(catalogs=references)
 
 
-def test_resolver_returns_exact_detached_three_provider_pricing(tmp_path):
+def test_resolver_returns_exact_read_only_three_provider_pricing(tmp_path):
     repository, context = _seed_repository(tmp_path)
     resolved = PricingCatalogResolver(repository).resolve_context(context)
 
@@ -96,10 +97,15 @@ def test_resolver_returns_exact_detached_three_provider_pricing(tmp_path):
         "__aws_schema__",
     }
     assert resolved.pricing["azure"]["service"]["price"] == 0.25
-    detached = resolved.detached_pricing()
-    detached["azure"]["service"]["price"] = 99
+    with pytest.raises(PricingMutationError):
+        resolved.pricing["azure"]["service"]["price"] = 99
+    with pytest.raises(PricingMutationError):
+        resolved.pricing["__aws_schema__"]["provider"] = "gcp"
     assert resolved.pricing["azure"]["service"]["price"] == 0.25
 
+    again = PricingCatalogResolver(repository).resolve_context(context)
+    assert again.pricing["azure"]["service"] is resolved.pricing["azure"]["service"]
+
 
 def test_resolver_resolves_all_snapshots_before_returning(tmp_path):
     repository, context = _seed_repository(tmp_path)
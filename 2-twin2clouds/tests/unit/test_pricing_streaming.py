@@ -202,3 +202,62 @@ class TestThreadSafeSseHandler:
             assert not operation_filter.filter(record)
         finally:
             pricing_operation_id.reset(token)
+
+
+class TestStreamFetchPricingBatch:
+    """Tests for the multi-region batch refresh stream."""
+
+    def test_batch_stream_reports_each_target_and_summary(self):
+        with patch('api.pricing.calculate_up_to_date_pricing') as mock_fetch:
+            mock_fetch.return_value = {"status": "published"}
+
+            with client.stream(
+                "POST",
+                "/stream/fetch_pricing_batch",
+                json={
+                    "targets": [
+                        {"provider": "azure", "pricing_region": "westeurope"},
+                        {"provider": "azure", "pricing_region": "northeurope"},
+                    ]
+                },
+            ) as response:
+                event_str = "\n".join(response.iter_lines())
+
+        assert mock_fetch.call_count == 2
+        assert "AZURE westeurope: published" in event_str
+        assert "AZURE northeurope: published" in event_str
+        assert "event: complete" in event_str
+        assert "statusCounts" in event_str
+
+    def test_batch_stream_binds_each_region_into_credentials(self):
+        with patch(
+            'backend.fetch_data.calculate_up_to_date_pricing.'
+            'calculate_up_to_date_pricing_with_credentials'
+        ) as mock_fetch:
+            mock_fetch.return_value = {"status": "published"}
+
+            with client.stream(
+                "POST",
+                "/stream/fetch_pricing_batch",
+                json={
+                    "targets": [
+                        {"provider": "gcp", "pricing_region": "europe-west1"},
+                        {"provider": "gcp", "pricing_region": "us-central1"},
+                    ],
+                    "credentials": {"gcp_service_account_json": "{}"},
+                },
+            ) as response:
+                list(response.iter_lines())
+
+        regions = sorted(call.args[1]["gcp_region"] for call in mock_fetch.call_args_list)
+        assert regions == ["europe-west1", "us-central1"]
+
+    def test_batch_stream_rejects_invalid_regions(self):
+        with client.stream(
+            "POST",
+            "/stream/fetch_pricing_batch",
+            json={"targets": [{"provider": "aws", "pricing_region": "westeurope"}]},
+        ) as response:
+            event_str = "\n".join(response.iter_lines())
+
+        assert "event: error" in event_str
@@ -5,6 +5,8 @@ All deployment is now handled by TerraformDeployerStrategy.
 This module provides REST API endpoints for infrastructure operations.
 """
 
+import asyncio
+from contextlib import aclosing
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Annotated, Optional
@@ -24,8 +26,10 @@ from src.core.deployment_errors import (
     client_error_payload,
 )
 from src.core.observability import OperationContext, operation_step
+from src.core.operation_scheduler import get_operation_scheduler
 from src.core.project_storage import get_project_storage
 from src.core.config_loader import ProjectConfigLoader
+from src.status.engine import invalidate_project_status
 from src.api.operation_context import operation_project_path
 from src.validation.directory_validator import validate_project_directory
 from logger import logger
@@ -37,6 +41,21 @@ from src.core.factory import create_context
 router = APIRouter(prefix="/infrastructure")
 
 
+async def _run_in_worker(func, /, *args, **kwargs):
+    """
+    Run blocking deployer work in a worker thread.
+
+    The work is shielded: if the request is cancelled, the caller still waits
+    for the thread so its scheduler slot and package scope outlive Terraform.
+    """
+    work = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+    try:
+        return await asyncio.shield(work)
+    except asyncio.CancelledError:
+        await asyncio.wait({work})
+        raise
+
+
 def _prepare_deployment_context(
     project_name: str,
     provider: str,
@@ -158,17 +177,22 @@ def check_cooldown(
         500: {"description": "Deployment failed"},
     },
 )
-def deploy_all(
+async def deploy_all(
     operation_token: Annotated[str, Header(alias="X-Operation-Package", min_length=1)],
     provider: str = Query("aws", description="Cloud provider: aws, azure, or google"),
     project_name: str = Query("template", description="Name of the project context"),
+    incremental: bool = Query(
+        False,
+        description="Apply only resources whose tfvars or packages changed since the last apply",
+    ),
 ):
     """
     Deploys the full digital twin environment using Terraform.
 
     **Deployment process:**
     1. Validates project structure and configuration
-    2. Runs `terraform init` (if needed) and `terraform apply`
+    2. Runs `terraform init` (if needed) and `terraform apply`; with
+       `incremental=true` only resources whose inputs changed are applied
     3. Deploys all configured layers based on config_providers.json
 
     **Layers deployed:**
@@ -188,7 +212,8 @@ def deploy_all(
     try:
         with operation_project_path(project_name, operation_token) as project_path:
             with operation_step(logger, operation_context, "request_prepare"):
-                request, context = _prepare_deployment_context(
+                request, context = await asyncio.to_thread(
+                    _prepare_deployment_context,
                     project_name,
                     provider,
                     "deploy",
@@ -197,11 +222,19 @@ def deploy_all(
                 )
             operation_context = operation_context.with_provider(request.provider)
 
-            outputs = core_deployer.deploy_all(
-                context,
-                request.provider,
-                operation_context=operation_context,
-            )
+            async with get_operation_scheduler().admit_async(
+                request.project_name, "deploy", operation_context.operation_id
+            ):
+                try:
+                    outputs = await _run_in_worker(
+                        core_deployer.deploy_all,
+                        context,
+                        request.provider,
+                        operation_context=operation_context,
+                        incremental=incremental,
+                    )
+                finally:
+                    invalidate_project_status(request.project_name)
 
         return DeploymentResult(
             project_name=request.project_name,
@@ -235,7 +268,7 @@ def deploy_all(
         500: {"description": "Destruction failed - may need force cleanup"},
     },
 )
-def destroy_all(
+async def destroy_all(
     operation_token: Annotated[str, Header(alias="X-Operation-Package", min_length=1)],
     provider: str = Query("aws", description="Cloud provider: aws, azure, or google"),
     project_name: str = Query("template", description="Name of the project context"),
@@ -260,7 +293,8 @@ def destroy_all(
     try:
         with operation_project_path(project_name, operation_token) as project_path:
             with operation_step(logger, operation_context, "request_prepare"):
-                request, context = _prepare_deployment_context(
+                request, context = await asyncio.to_thread(
+                    _prepare_deployment_context,
                     project_name,
                     provider,
                     "destroy",
@@ -269,11 +303,18 @@ def destroy_all(
                 )
             operation_context = operation_context.with_provider(request.provider)
 
-            core_deployer.destroy_all(
-                context,
-                request.provider,
-                operation_context=operation_context,
-            )
+            async with get_operation_scheduler().admit_async(
+                request.project_name, "destroy", operation_context.operation_id
+            ):
+                try:
+                    await _run_in_worker(
+                        core_deployer.destroy_all,
+                        context,
+                        request.provider,
+                        operation_context=operation_context,
+                    )
+                finally:
+                    invalidate_project_status(request.project_name)
 
         return DestroyResult(
             project_name=request.project_name,
@@ -314,6 +355,10 @@ async def deploy_stream(
     operation_token: Annotated[str, Header(alias="X-Operation-Package", min_length=1)],
     provider: str = Query("aws", description="Cloud provider: aws, azure, or google"),
     project_name: str = Query("template", description="Name of the project context"),
+    incremental: bool = Query(
+        False,
+        description="Apply only resources whose tfvars or packages changed since the last apply",
+    ),
 ):
     """
     Deploy with Server-Sent Events streaming.
@@ -343,17 +388,32 @@ async def deploy_stream(
 
         async def generate():
             scope_closed = False
+            scheduler = get_operation_scheduler()
+            ticket = scheduler.submit(
+                request.project_name, "deploy", stream_context.operation_id
+            )
             try:
-                async for line in core_deployer.deploy_all_stream(
-                    context,
-                    output_sink=stream_outputs,
-                    operation_context=stream_context,
-                ):
-                    yield DeploymentStreamEvent.log(
+                async for status in scheduler.wait_async(ticket):
+                    yield DeploymentStreamEvent.queued(
                         DeploymentOperation.deploy,
-                        line,
+                        status,
                         operation_id=stream_context.operation_id,
                     ).to_sse()
+                async with aclosing(
+                    core_deployer.deploy_all_stream(
+                        context,
+                        output_sink=stream_outputs,
+                        operation_context=stream_context,
+                        incremental=incremental,
+                    )
+                ) as lines:
+                    async for line in lines:
+                        ticket.raise_if_cancelled()
+                        yield DeploymentStreamEvent.log(
+                            DeploymentOperation.deploy,
+                            line,
+                            operation_id=stream_context.operation_id,
+                        ).to_sse()
                 try:
                     package_scope.__exit__(None, None, None)
                 finally:
@@ -379,6 +439,9 @@ async def deploy_stream(
                     error_code=detail["error_code"],
                     operation_id=operation_context.operation_id,
                 ).to_sse()
+            finally:
+                scheduler.release(ticket)
+                invalidate_project_status(request.project_name)
 
         return StreamingResponse(
             generate(),
@@ -453,16 +516,30 @@ async def destroy_stream(
 
         async def generate():
             scope_closed = False
+            scheduler = get_operation_scheduler()
+            ticket = scheduler.submit(
+                request.project_name, "destroy", stream_context.operation_id
+            )
             try:
-                async for line in core_deployer.destroy_all_stream(
-                    context,
-                    operation_context=stream_context,
-                ):
-                    yield DeploymentStreamEvent.log(
+                async for status in scheduler.wait_async(ticket):
+                    yield DeploymentStreamEvent.queued(
                         DeploymentOperation.destroy,
-                        line,
+                        status,
                         operation_id=stream_context.operation_id,
                     ).to_sse()
+                async with aclosing(
+                    core_deployer.destroy_all_stream(
+                        context,
+                        operation_context=stream_context,
+                    )
+                ) as lines:
+                    async for line in lines:
+                        ticket.raise_if_cancelled()
+                        yield DeploymentStreamEvent.log(
+                            DeploymentOperation.destroy,
+                            line,
+                            operation_id=stream_context.operation_id,
+                        ).to_sse()
                 try:
                     package_scope.__exit__(None, None, None)
                 finally:
@@ -486,6 +563,9 @@ async def destroy_stream(
                     error_code=detail["error_code"],
                     operation_id=operation_context.operation_id,
                 ).to_sse()
+            finally:
+                scheduler.release(ticket)
+                invalidate_project_status(request.project_name)
 
         return StreamingResponse(
             generate(),
@@ -517,3 +597,50 @@ async def destroy_stream(
         )
         detail = client_error_payload(e, operation_context)
         raise HTTPException(status_code=detail["http_status"], detail=detail)
+
+
+# --------- Operation Queue ----------
+@router.get(
+    "/operations",
+    tags=["Infrastructure"],
+    summary="List running and queued deploy/destroy operations",
+    responses={200: {"description": "Scheduler snapshot returned"}},
+)
+def list_operations():
+    """
+    Returns the operations currently holding a run slot and those waiting
+    for one, with each queued operation's position and estimated start.
+
+    **Zero cloud costs:** Reads in-memory scheduler state only.
+    """
+    return get_operation_scheduler().snapshot()
+
+
+@router.post(
+    "/operations/{operation_id}/cancel",
+    tags=["Infrastructure"],
+    summary="Cancel a queued or running deploy/destroy operation",
+    responses={
+        200: {"description": "Cancellation accepted"},
+        404: {"description": "No such operation for this project"},
+    },
+)
+def cancel_operation(
+    operation_id: str,
+    project_name: str = Query(..., description="Name of the project that owns the operation"),
+):
+    """
+    Cancels a deploy or destroy operation.
+
+    A queued operation leaves the queue immediately and its stream ends with an
+    `OPERATION_CANCELLED` error. A running streaming operation stops at its next
+    log line, interrupting Terraform so it can persist state. A running
+    non-streaming operation is only flagged and finishes its current call.
+    """
+    state = get_operation_scheduler().cancel(operation_id, project_name)
+    if state is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No queued or running operation '{operation_id}' for project '{project_name}'",
+        )
+    return {"operation_id": operation_id, "project_name": project_name, "state": state}
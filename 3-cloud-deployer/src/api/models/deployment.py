@@ -9,6 +9,7 @@ from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
+from src.core.operation_scheduler import QueueStatus
 from src.api.deployment_trace import (
     DeploymentErrorCategory,
     classify_deployment_error,
@@ -75,6 +76,9 @@ class DeploymentStreamEvent(BaseModel):
     error_code: str | None = None
     operation_id: str | None = None
     error_category: DeploymentErrorCategory | None = None
+    queue_position: int | None = None
+    queue_length: int | None = None
+    eta_seconds: int | None = None
 
     @classmethod
     def log(
@@ -90,6 +94,24 @@ class DeploymentStreamEvent(BaseModel):
             operation_id=operation_id,
         )
 
+    @classmethod
+    def queued(
+        cls,
+        operation: DeploymentOperation,
+        status: QueueStatus,
+        operation_id: str | None = None,
+    ) -> "DeploymentStreamEvent":
+        """A log event describing where the operation waits in the scheduler queue."""
+        return cls(
+            event=DeploymentEventType.log,
+            operation=operation,
+            message=status.describe(),
+            operation_id=operation_id,
+            queue_position=status.position,
+            queue_length=status.queue_length,
+            eta_seconds=status.eta_seconds,
+        )
+
     @classmethod
     def complete(
         cls,
@@ -0,0 +1,21 @@
+"""Typed contracts for delta project package synchronization."""
+
+from pydantic import BaseModel, Field
+
+
+class ProjectSyncFile(BaseModel):
+    path: str = Field(..., description="Path of the file inside the project package")
+    sha256: str = Field(..., description="Hex SHA-256 of the file content")
+    size: int = Field(..., ge=0, description="File size in bytes")
+
+
+class ProjectSyncManifest(BaseModel):
+    files: list[ProjectSyncFile]
+
+
+class ProjectSyncPlan(BaseModel):
+    project_name: str
+    missing: list[str] = Field(
+        ...,
+        description="Digests the Deployer does not store; upload these files",
+    )
@@ -12,7 +12,7 @@ credentials.
 - Projects can be imported/exported as ZIP files
 """
 
-from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Path, Request
+from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Form, Path, Request
 import json
 import file_manager
 import src.validator as validator
@@ -29,7 +29,14 @@ from src.api.functions import clear_all_function_metadata
 from src.api.error_models import ERROR_RESPONSES
 from src.api.error_handling import internal_server_error, safe_error_detail
 from src.api.upload_limits import read_upload_bounded
+from src.api.models.project_sync import ProjectSyncManifest, ProjectSyncPlan
 from src.project_archive.policy import MAX_COMPRESSED_ARCHIVE_BYTES
+from src.project_archive.delta_sync import (
+    MissingProjectBlobs,
+    assemble_project_archive,
+    missing_digests,
+    parse_manifest,
+)
 from src.operation_packages import (
     OperationPackageInUseError,
     get_operation_package_store,
@@ -54,7 +61,7 @@ MAX_SIMULATOR_PAYLOAD_UPLOAD_BYTES = 10 * 1024 * 1024
         "**Purpose:** Returns all available projects for the project selector UI.\n\n"
         "**Response includes:**\n"
         "- Project names and descriptions\n"
-        "- Version counts (saved ZIP snapshots)\n"
+        "- Version counts (archived project versions)\n"
         "- Currently active project name"
     ),
     responses={
@@ -174,19 +181,118 @@ async def stage_operation_package(
 ):
     """Persist a secret-free project definition and stage secrets for one operation."""
     check_template_protection(project_name, "stage an operation package for")
+    content = await read_upload_bounded(
+        file,
+        max_bytes=MAX_COMPRESSED_ARCHIVE_BYTES,
+    )
+    return _stage_operation_archive(project_name, content)
+
+
+@router.post(
+    "/projects/{project_name}/operation-package/plan",
+    operation_id="planDeploymentOperationPackageSync",
+    tags=["Projects"],
+    summary="List the package files the Deployer needs for a delta upload",
+    description=(
+        "**Purpose:** First step of a delta package upload.\n\n"
+        "Send the manifest (path, SHA-256, size) of the complete generated package. "
+        "The response lists the digests the Deployer does not store yet. Upload only "
+        "those files with `POST /projects/{project_name}/operation-package/delta`."
+    ),
+    response_model=ProjectSyncPlan,
+    responses={
+        400: ERROR_RESPONSES[400],
+        500: ERROR_RESPONSES[500],
+    },
+)
+def plan_operation_package_sync(
+    manifest: ProjectSyncManifest,
+    project_name: str = Path(..., description="Project name"),
+):
+    """Return the manifest digests that must be uploaded."""
+    check_template_protection(project_name, "stage an operation package for")
+    try:
+        entries = parse_manifest(file.model_dump() for file in manifest.files)
+        store = get_project_storage().version_store(project_name)
+        return ProjectSyncPlan(
+            project_name=project_name,
+            missing=missing_digests(store, entries),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=safe_error_detail(exc)) from exc
+    except Exception as exc:
+        raise internal_server_error("Plan operation package sync", exc) from exc
+
+
+@router.post(
+    "/projects/{project_name}/operation-package/delta",
+    operation_id="stageDeploymentOperationPackageDelta",
+    tags=["Projects"],
+    summary="Stage an operation package from a delta upload",
+    description=(
+        "**Purpose:** Second step of a delta package upload.\n\n"
+        "`manifest` is the same JSON manifest sent to the plan endpoint. `file` is a "
+        "ZIP holding only the files whose digests were reported missing. The "
+        "Deployer rebuilds the complete package from its version store, then "
+        "validates and stages it exactly like `POST "
+        "/projects/{project_name}/operation-package`. Returns 409 with error code "
+        "`PACKAGE_CONTENT_MISSING` if stored content disappeared since planning; plan "
+        "again or upload the full package."
+    ),
+    responses={
+        200: {"description": "Operation package staged"},
+        400: ERROR_RESPONSES[400],
+        409: {"description": "Stored package content is no longer available"},
+        413: ERROR_RESPONSES[413],
+        500: ERROR_RESPONSES[500],
+    },
+)
+async def stage_operation_package_delta(
+    project_name: str,
+    manifest: str = Form(..., description="JSON sync manifest of the full package"),
+    file: UploadFile = File(..., description="ZIP of the missing package files"),
+):
+    """Rebuild the full package from stored blobs plus the delta, then stage it."""
+    check_template_protection(project_name, "stage an operation package for")
+    delta = await read_upload_bounded(
+        file,
+        max_bytes=MAX_COMPRESSED_ARCHIVE_BYTES,
+    )
+    try:
+        entries = parse_manifest(
+            ProjectSyncManifest.model_validate_json(manifest).model_dump()["files"]
+        )
+        store = get_project_storage().version_store(project_name)
+        content = assemble_project_archive(store, entries, delta)
+    except MissingProjectBlobs as exc:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "error_code": exc.error_code,
+                "message": str(exc),
+                "http_status": 409,
+            },
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=safe_error_detail(exc)) from exc
+    except Exception as exc:
+        raise internal_server_error("Assemble operation package", exc) from exc
+    return _stage_operation_archive(project_name, content)
+
+
+def _stage_operation_archive(project_name: str, content: bytes) -> dict:
     store = get_operation_package_store()
     staged = None
     try:
-        content = await read_upload_bounded(
-            file,
-            max_bytes=MAX_COMPRESSED_ARCHIVE_BYTES,
-        )
-        staged = store.stage(project_name, content)
-        if get_project_storage().exists(project_name):
-            result = file_manager.update_project_from_zip(project_name, content)
-            clear_all_function_metadata(project_name)
-        else:
-            result = file_manager.create_project_from_zip(project_name, content)
+        # Staging and the project definition share one ingestion, so every
+        # member is decompressed once.
+        with file_manager.ingest_project_archive(content) as archive:
+            staged = store.stage(project_name, archive)
+            if get_project_storage().exists(project_name):
+                result = file_manager.update_project_from_zip(project_name, archive)
+                clear_all_function_metadata(project_name)
+            else:
+                result = file_manager.create_project_from_zip(project_name, archive)
         return {
             "project_name": project_name,
             "operation_token": staged.token,
@@ -536,6 +642,89 @@ async def export_project(
         raise internal_server_error("Export project", exc) from exc
 
 
+@router.get(
+    "/projects/{project_name}/versions",
+    operation_id="listProjectVersions",
+    tags=["Projects"],
+    summary="List archived project versions",
+    description=(
+        "**Purpose:** Version history of a project, oldest first.\n\n"
+        "**Returns:** version name, file count, and total size per version. "
+        "Read from the small per-version manifests; no archive is opened."
+    ),
+    responses={
+        200: {"description": "Project versions"},
+        404: ERROR_RESPONSES[404],
+        500: ERROR_RESPONSES[500],
+    },
+)
+def list_project_versions(
+    project_name: str = Path(..., description="Project name"),
+):
+    """List the redacted versions archived on each upload."""
+    storage = get_project_storage()
+    try:
+        if not storage.exists(project_name):
+            raise HTTPException(
+                status_code=404, detail=f"Project '{project_name}' not found"
+            )
+        return {
+            "project_name": project_name,
+            "versions": storage.list_versions(project_name),
+        }
+    except HTTPException:
+        raise
+    except ProjectStorageError as e:
+        raise HTTPException(status_code=400, detail=safe_error_detail(e))
+    except Exception as exc:
+        raise internal_server_error("List project versions", exc) from exc
+
+
+@router.get(
+    "/projects/{project_name}/versions/{version}/export",
+    operation_id="exportProjectVersionZip",
+    tags=["Projects"],
+    summary="Export an archived project version as zip",
+    description=(
+        "**Purpose:** Download one archived, redacted project version.\n\n"
+        "**Contents:** The non-secret project files of that upload. The ZIP is "
+        "assembled on demand from the deduplicated version store."
+    ),
+    responses={
+        200: {"description": "Project version zip file"},
+        404: ERROR_RESPONSES[404],
+        500: ERROR_RESPONSES[500],
+    },
+)
+async def export_project_version(
+    project_name: str = Path(..., description="Project name"),
+    version: str = Path(..., description="Version name from the version list"),
+):
+    """Export one archived project version as a downloadable ZIP file."""
+    from fastapi.responses import StreamingResponse
+
+    storage = get_project_storage()
+    try:
+        if not storage.exists(project_name):
+            raise HTTPException(
+                status_code=404, detail=f"Project '{project_name}' not found"
+            )
+        zip_buffer = storage.export_version(project_name, version)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=safe_error_detail(e))
+    except Exception as exc:
+        raise internal_server_error("Export project version", exc) from exc
+
+    filename = f"{project_name}_{version}.zip"
+    return StreamingResponse(
+        zip_buffer,
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get(
     "/projects/{project_name}/summary",
     operation_id="getProjectSummary",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Annotated
 
 from fastapi import APIRouter, Header, HTTPException, Query
@@ -10,6 +11,7 @@ from src.api.error_handling import internal_server_error
 from src.api.error_models import ERROR_RESPONSES
 from src.core.paths import resolve_project_context_path
 from src.core.config_loader import normalize_provider_name
+from src.status.engine import ProbeBatch, timeout_message
 from src.status.metadata import check_function_artifacts
 from src.status.sdk import check_sdk_managed
 from src.status.terraform import check_terraform_drift, check_terraform_state
@@ -57,12 +59,26 @@ def check_endpoint(
 ):
     normalized_provider = _validate_request(project_name, provider)
     try:
+        local = ProbeBatch(
+            {
+                "infrastructure": functools.partial(check_terraform_state, project_name),
+                "user_functions": functools.partial(check_function_artifacts, project_name),
+            }
+        )
+        sdk_managed = check_sdk_managed(project_name, normalized_provider)
+        evidence = local.results(
+            lambda name: {
+                "status": "error",
+                "error": timeout_message(local.timeout),
+                **({"functions": {}} if name == "user_functions" else {}),
+            }
+        )
         result = {
             "project": project_name,
             "provider": normalized_provider,
-            "infrastructure": check_terraform_state(project_name),
-            "user_functions": check_function_artifacts(project_name),
-            "sdk_managed": check_sdk_managed(project_name, normalized_provider),
+            "infrastructure": evidence["infrastructure"],
+            "user_functions": evidence["user_functions"],
+            "sdk_managed": sdk_managed,
         }
         if detailed:
             if operation_token is None:
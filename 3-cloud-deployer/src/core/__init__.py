@@ -32,6 +32,7 @@ from .paths import DeploymentPaths, resolve_deployment_paths
 from .observability import OperationContext, operation_step, redact_sensitive
 from .workspace import (
     EphemeralWorkspace,
+    WorkspaceMaterialization,
     create_ephemeral_workspace,
     deployment_workspace,
     ephemeral_workspace,
@@ -50,6 +51,7 @@ __all__ = [
     "EphemeralWorkspace",
     "OperationContext",
     "ProjectConfig",
+    "WorkspaceMaterialization",
     "create_ephemeral_workspace",
     "deployment_workspace",
     "ephemeral_workspace",
@@ -16,6 +16,7 @@ class DeploymentErrorCode(str, Enum):
     destruction_error = "DESTRUCTION_ERROR"
     terraform_error = "TERRAFORM_ERROR"
     workspace_sync_error = "WORKSPACE_SYNC_ERROR"
+    operation_cancelled = "OPERATION_CANCELLED"
     unexpected_error = "UNEXPECTED_ERROR"
 
 
@@ -45,6 +46,17 @@ class WorkspaceSyncError(DeploymentBoundaryError):
         )
 
 
+class OperationCancelled(DeploymentBoundaryError):
+    """Raised when a queued or running operation is cancelled by a client."""
+
+    def __init__(self, message: str = "Operation cancelled"):
+        super().__init__(
+            message,
+            code=DeploymentErrorCode.operation_cancelled,
+            status_code=409,
+        )
+
+
 def classify_deployment_error(error: Exception, operation: str) -> tuple[DeploymentErrorCode, int]:
     """Return a stable error code and HTTP status for a deployment exception."""
     if isinstance(error, DeploymentBoundaryError):
@@ -96,4 +108,6 @@ def _client_message(error: Exception, code: DeploymentErrorCode) -> str:
         return "Destruction operation failed. Check server logs."
     if code == DeploymentErrorCode.deployment_error:
         return "Deployment operation failed. Check server logs."
+    if code == DeploymentErrorCode.operation_cancelled:
+        return str(error)
     return "Unexpected deployment error. Check server logs."
@@ -1,12 +1,57 @@
 """Deterministic and traversal-safe ZIP archive primitives."""
 
+from collections import OrderedDict
 from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import sys
+import threading
+from typing import Iterable
 import zipfile
+import zlib
 from pathlib import Path, PurePosixPath
 from uuid import uuid4
 
 _CANONICAL_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
 _CANONICAL_FILE_MODE = 0o644
+_COMPRESSED_PAYLOAD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Raw appends drive private ZipFile state. Its layout is verified for these
+# CPython versions (see test_package_builder_security); other interpreters,
+# or any release that drops one of the attributes, take the public
+# ``writestr`` path, which produces the same bytes more slowly.
+_RAW_APPEND_PYTHON_VERSIONS = ((3, 10), (3, 13))
+_RAW_APPEND_ARCHIVE_ATTRIBUTES = ("_seekable", "_lock", "_writing", "_didModify", "start_dir")
+_RAW_APPEND_ARCHIVE_METHODS = ("_writecheck",)
+
+
+@dataclass(frozen=True)
+class PrecompressedZipMember:
+    """A canonical ZIP member whose DEFLATE stream and CRC are already known."""
+
+    name: str
+    content: bytes
+    crc: int
+    compressed: bytes
+
+
+_compressed_payloads: "OrderedDict[bytes, tuple[int, bytes]]" = OrderedDict()
+_compressed_payload_bytes = 0
+_compressed_payloads_lock = threading.Lock()
+
+
+def _member_name(archive_name: str | Path) -> str:
+    normalized = PurePosixPath(str(archive_name).replace("\\", "/"))
+    if normalized.is_absolute() or ".." in normalized.parts or not normalized.parts:
+        raise ValueError(f"Unsafe ZIP member path: {archive_name}")
+    return normalized.as_posix()
+
+
+def _canonical_info(member_name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(member_name, date_time=_CANONICAL_TIMESTAMP)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3
+    info.external_attr = (_CANONICAL_FILE_MODE & 0xFFFF) << 16
+    return info
 
 
 def write_zip_bytes(
@@ -15,19 +60,12 @@ def write_zip_bytes(
     content: str | bytes,
 ) -> None:
     """Write one normalized ZIP member with stable metadata and no duplicates."""
-    normalized = PurePosixPath(str(archive_name).replace("\\", "/"))
-    if normalized.is_absolute() or ".." in normalized.parts or not normalized.parts:
-        raise ValueError(f"Unsafe ZIP member path: {archive_name}")
-    member_name = normalized.as_posix()
+    member_name = _member_name(archive_name)
     if member_name in archive.NameToInfo:
         raise ValueError(f"Duplicate ZIP member path: {member_name}")
 
     payload = content.encode("utf-8") if isinstance(content, str) else content
-    info = zipfile.ZipInfo(member_name, date_time=_CANONICAL_TIMESTAMP)
-    info.compress_type = zipfile.ZIP_DEFLATED
-    info.create_system = 3
-    info.external_attr = (_CANONICAL_FILE_MODE & 0xFFFF) << 16
-    archive.writestr(info, payload)
+    archive.writestr(_canonical_info(member_name), payload)
 
 
 def write_zip_file(
@@ -41,6 +79,122 @@ def write_zip_file(
     write_zip_bytes(archive, archive_name, source_path.read_bytes())
 
 
+def _deflate(content: bytes) -> tuple[int, bytes]:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return zlib.crc32(content) & 0xFFFFFFFF, compressor.compress(content) + compressor.flush()
+
+
+def compress_zip_member(
+    archive_name: str | Path,
+    content: bytes,
+) -> PrecompressedZipMember:
+    """Compress one member exactly as ``write_zip_bytes`` would, without caching.
+
+    Use this for one-off content (uploads, new version blobs) that would only
+    push shared build members out of the ``precompress_zip_member`` cache.
+    """
+    crc, compressed = _deflate(content)
+    return PrecompressedZipMember(_member_name(archive_name), content, crc, compressed)
+
+
+def precompress_zip_member(
+    archive_name: str | Path,
+    content: bytes,
+) -> PrecompressedZipMember:
+    """Compress one member exactly as ``write_zip_bytes`` would, once per digest.
+
+    The DEFLATE stream depends only on the payload, so compressed bytes and
+    CRC are memoized by content digest in a small process-wide LRU and shared
+    by every archive that embeds the same file.
+    """
+    global _compressed_payload_bytes
+    member_name = _member_name(archive_name)
+    digest = hashlib.sha256(content).digest()
+    with _compressed_payloads_lock:
+        cached = _compressed_payloads.get(digest)
+        if cached is not None:
+            _compressed_payloads.move_to_end(digest)
+    if cached is None:
+        cached = _deflate(content)
+        with _compressed_payloads_lock:
+            if digest not in _compressed_payloads:
+                _compressed_payloads[digest] = cached
+                _compressed_payload_bytes += len(cached[1])
+            while _compressed_payload_bytes > _COMPRESSED_PAYLOAD_CACHE_MAX_BYTES:
+                _, (_, evicted) = _compressed_payloads.popitem(last=False)
+                _compressed_payload_bytes -= len(evicted)
+    crc, compressed = cached
+    return PrecompressedZipMember(member_name, content, crc, compressed)
+
+
+def precompressed_tree_members(
+    source_dir: Path,
+    archive_prefix: str | Path,
+    files: Iterable[Path],
+) -> tuple[PrecompressedZipMember, ...]:
+    """Precompress ``files`` of one shared tree, keeping the caller's order."""
+    members = []
+    for file_path in files:
+        if file_path.is_symlink() or not file_path.is_file():
+            raise ValueError(f"Unsafe or missing ZIP source file: {file_path}")
+        arcname = PurePosixPath(str(archive_prefix).replace("\\", "/")) / (
+            file_path.relative_to(source_dir).as_posix()
+        )
+        members.append(precompress_zip_member(arcname, file_path.read_bytes()))
+    return tuple(members)
+
+
+def raw_append_supported(archive: zipfile.ZipFile) -> bool:
+    """Return whether ``archive`` can take precompressed members by raw copy."""
+    oldest, newest = _RAW_APPEND_PYTHON_VERSIONS
+    return (
+        oldest <= sys.version_info[:2] <= newest
+        and archive.mode == "w"
+        and all(hasattr(archive, name) for name in _RAW_APPEND_ARCHIVE_ATTRIBUTES)
+        and all(callable(getattr(archive, name, None)) for name in _RAW_APPEND_ARCHIVE_METHODS)
+        and callable(getattr(zipfile.ZipInfo, "FileHeader", None))
+        and archive._seekable
+    )
+
+
+def write_precompressed_members(
+    archive: zipfile.ZipFile,
+    members: Iterable[PrecompressedZipMember],
+) -> None:
+    """Append pre-compressed members by raw copy, byte-identical to ``writestr``.
+
+    The local header and central directory entry are the ones ``writestr``
+    produces for the same canonical ``ZipInfo``; only the DEFLATE pass is
+    skipped. Archives that cannot take a raw append (non-seekable streams,
+    ZIP64-sized members, interpreters outside ``raw_append_supported``) fall
+    back to a normal write.
+    """
+    raw_append = raw_append_supported(archive)
+    for member in members:
+        if member.name in archive.NameToInfo:
+            raise ValueError(f"Duplicate ZIP member path: {member.name}")
+        info = _canonical_info(member.name)
+        info.file_size = len(member.content)
+        if not raw_append or info.file_size * 1.05 > zipfile.ZIP64_LIMIT:
+            archive.writestr(info, member.content)
+            continue
+        with archive._lock:
+            if archive._writing:
+                raise ValueError("Can't write to the ZIP file while a member is open")
+            info.flag_bits = 0x00
+            info.CRC = member.crc
+            info.compress_size = len(member.compressed)
+            archive.fp.seek(archive.start_dir)
+            info.header_offset = archive.fp.tell()
+            archive._writecheck(info)
+            archive._didModify = True
+            archive.fp.write(info.FileHeader(False))
+            archive.fp.write(member.compressed)
+            archive.start_dir = archive.fp.tell()
+            archive.filelist.append(info)
+            archive.NameToInfo[info.filename] = info
+
+
 def atomic_write_bytes(target_path: Path, content: bytes) -> None:
     """Replace a generated artifact only after its complete content is durable."""
     temporary_path = target_path.with_suffix(
@@ -0,0 +1,317 @@
+"""
+Admission control for deploy and destroy operations.
+
+Every deploy or destroy starts Terraform, cloud SDK clients, and package
+builds. When many twins redeploy at once, running them all concurrently
+exhausts the container's CPU and memory, and two operations on the same
+project race on its state. The scheduler admits operations in arrival order
+into a bounded number of running slots:
+
+- at most ``DEPLOYER_MAX_CONCURRENT_OPERATIONS`` run at a time (default 2)
+- at most one operation per project runs at a time
+- a queued operation for a busy project does not hold back other projects
+
+Operations are never rejected for capacity; they wait in the queue. Waiters
+can observe their queue position and an estimated start time derived from
+recent operation durations, and any queued or running operation can be
+cancelled by its operation id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+import heapq
+import os
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterator
+
+from src.core.deployment_errors import OperationCancelled
+
+DEFAULT_MAX_CONCURRENT_OPERATIONS = 2
+# Used for ETAs until an operation type has finished at least once.
+DEFAULT_OPERATION_SECONDS = {"deploy": 600.0, "destroy": 420.0}
+_DURATION_SMOOTHING = 0.3
+_STATUS_REFRESH_SECONDS = 15.0
+
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = "finished"
+CANCELLED = "cancelled"
+
+
+def default_max_concurrent_operations() -> int:
+    configured = os.environ.get("DEPLOYER_MAX_CONCURRENT_OPERATIONS")
+    if configured:
+        limit = int(configured)
+        if limit <= 0:
+            raise ValueError("DEPLOYER_MAX_CONCURRENT_OPERATIONS must be positive")
+        return limit
+    return DEFAULT_MAX_CONCURRENT_OPERATIONS
+
+
+@dataclass(eq=False)
+class OperationTicket:
+    """One submitted operation and its place in the scheduler."""
+
+    operation_id: str
+    project_name: str
+    operation: str
+    enqueued_at: float
+    state: str = QUEUED
+    started_at: float | None = None
+    cancel_requested: bool = field(default=False)
+
+    def raise_if_cancelled(self) -> None:
+        """Stop a running operation between steps once cancellation was requested."""
+        if self.cancel_requested:
+            raise OperationCancelled(f"Operation {self.operation_id} was cancelled")
+
+
+@dataclass(frozen=True)
+class QueueStatus:
+    """Where a queued operation stands: 1-based position and estimated wait."""
+
+    position: int
+    queue_length: int
+    running: int
+    eta_seconds: int
+
+    def describe(self) -> str:
+        minutes = max(1, round(self.eta_seconds / 60))
+        return (
+            f"Queued: position {self.position} of {self.queue_length}, "
+            f"{self.running} operation(s) running, estimated start in ~{minutes} min"
+        )
+
+
+class OperationScheduler:
+    """Thread-safe FIFO scheduler shared by the sync and streaming routes."""
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrent = max_concurrent or default_max_concurrent_operations()
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._queue: list[OperationTicket] = []
+        self._running: dict[str, OperationTicket] = {}
+        self._durations = dict(DEFAULT_OPERATION_SECONDS)
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def submit(self, project_name: str, operation: str, operation_id: str) -> OperationTicket:
+        """Queue an operation; it starts running as soon as it is admissible."""
+        ticket = OperationTicket(
+            operation_id=operation_id,
+            project_name=project_name,
+            operation=operation,
+            enqueued_at=self._clock(),
+        )
+        with self._condition:
+            self._queue.append(ticket)
+            self._admit_locked()
+        return ticket
+
+    def wait(self, ticket: OperationTicket) -> None:
+        """Block until ``ticket`` runs; raise ``OperationCancelled`` if cancelled first."""
+        with self._condition:
+            while ticket.state == QUEUED:
+                self._condition.wait()
+            if ticket.state == CANCELLED:
+                raise OperationCancelled(f"Operation {ticket.operation_id} was cancelled")
+
+    async def wait_async(self, ticket: OperationTicket) -> AsyncIterator[QueueStatus]:
+        """
+        Wait for ``ticket`` to run without blocking the event loop.
+
+        Yields a ``QueueStatus`` whenever the position changes, and
+        periodically while it does not so streams can refresh their ETA.
+        Returns once the ticket runs; raises ``OperationCancelled`` if it is
+        cancelled while queued.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            self._async_waiters.add(waiter)
+        try:
+            last_position = None
+            while True:
+                waiter[1].clear()
+                with self._condition:
+                    state = ticket.state
+                    status = self._status_locked(ticket) if state == QUEUED else None
+                if state == RUNNING:
+                    return
+                if state != QUEUED:
+                    raise OperationCancelled(f"Operation {ticket.operation_id} was cancelled")
+                if status.position != last_position:
+                    last_position = status.position
+                    yield status
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout=_STATUS_REFRESH_SECONDS)
+                except asyncio.TimeoutError:
+                    last_position = None
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+
+    def release(self, ticket: OperationTicket) -> None:
+        """Free the ticket's slot, or drop it from the queue if it never ran."""
+        with self._condition:
+            if ticket.state == RUNNING:
+                self._running.pop(ticket.operation_id, None)
+                duration = self._clock() - (ticket.started_at or ticket.enqueued_at)
+                previous = self._durations.get(ticket.operation, duration)
+                self._durations[ticket.operation] = (
+                    _DURATION_SMOOTHING * duration + (1 - _DURATION_SMOOTHING) * previous
+                )
+                ticket.state = FINISHED
+            elif ticket.state == QUEUED:
+                self._queue.remove(ticket)
+                ticket.state = CANCELLED
+            self._admit_locked()
+
+    def cancel(self, operation_id: str, project_name: str | None = None) -> str | None:
+        """
+        Cancel a queued or running operation.
+
+        Queued operations leave the queue immediately. Running operations are
+        flagged and stop at their next cancellation check. Returns the ticket
+        state after the request, or ``None`` if no such operation is known
+        (for ``project_name``, when given).
+        """
+        with self._condition:
+            ticket = self._find_locked(operation_id)
+            if ticket is None or (project_name and ticket.project_name != project_name):
+                return None
+            ticket.cancel_requested = True
+            if ticket.state == QUEUED:
+                self._queue.remove(ticket)
+                ticket.state = CANCELLED
+                self._admit_locked()
+            return ticket.state
+
+    def status(self, ticket: OperationTicket) -> QueueStatus | None:
+        with self._condition:
+            return self._status_locked(ticket) if ticket.state == QUEUED else None
+
+    def snapshot(self) -> dict:
+        """Running and queued operations in a JSON-ready form."""
+        with self._condition:
+            now = self._clock()
+            return {
+                "max_concurrent": self.max_concurrent,
+                "running": [
+                    {
+                        "operation_id": ticket.operation_id,
+                        "project_name": ticket.project_name,
+                        "operation": ticket.operation,
+                        "running_seconds": int(now - (ticket.started_at or now)),
+                        "cancel_requested": ticket.cancel_requested,
+                    }
+                    for ticket in self._running.values()
+                ],
+                "queued": [
+                    {
+                        "operation_id": ticket.operation_id,
+                        "project_name": ticket.project_name,
+                        "operation": ticket.operation,
+                        "position": status.position,
+                        "eta_seconds": status.eta_seconds,
+                    }
+                    for ticket in self._queue
+                    for status in (self._status_locked(ticket),)
+                ],
+            }
+
+    @contextmanager
+    def admit(self, project_name: str, operation: str, operation_id: str) -> Iterator[OperationTicket]:
+        """Run the block once admitted; the slot is released when it exits."""
+        ticket = self.submit(project_name, operation, operation_id)
+        try:
+            self.wait(ticket)
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    @asynccontextmanager
+    async def admit_async(
+        self, project_name: str, operation: str, operation_id: str
+    ) -> AsyncIterator[OperationTicket]:
+        """Like ``admit``, but queues on the event loop instead of a thread."""
+        ticket = self.submit(project_name, operation, operation_id)
+        try:
+            async with aclosing(self.wait_async(ticket)) as statuses:
+                async for _status in statuses:
+                    pass
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _find_locked(self, operation_id: str) -> OperationTicket | None:
+        if operation_id in self._running:
+            return self._running[operation_id]
+        return next((t for t in self._queue if t.operation_id == operation_id), None)
+
+    def _admit_locked(self) -> None:
+        busy_projects = {ticket.project_name for ticket in self._running.values()}
+        for ticket in list(self._queue):
+            if len(self._running) >= self.max_concurrent:
+                break
+            if ticket.project_name in busy_projects:
+                continue
+            self._queue.remove(ticket)
+            ticket.state = RUNNING
+            ticket.started_at = self._clock()
+            self._running[ticket.operation_id] = ticket
+            busy_projects.add(ticket.project_name)
+        self._condition.notify_all()
+        for loop, event in list(self._async_waiters):
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # loop already closed
+                self._async_waiters.discard((loop, event))
+
+    def _status_locked(self, ticket: OperationTicket) -> QueueStatus:
+        """
+        Estimate when ``ticket`` starts by replaying the queue ahead of it
+        against the running slots, using smoothed durations per operation type.
+        """
+        now = self._clock()
+        free_at = [
+            max(0.0, self._duration(running.operation) - (now - (running.started_at or now)))
+            for running in self._running.values()
+        ]
+        free_at.extend(0.0 for _ in range(self.max_concurrent - len(free_at)))
+        heapq.heapify(free_at)
+        position = self._queue.index(ticket) + 1
+        eta = 0.0
+        for ahead in self._queue[:position]:
+            eta = heapq.heappop(free_at)
+            heapq.heappush(free_at, eta + self._duration(ahead.operation))
+        return QueueStatus(
+            position=position,
+            queue_length=len(self._queue),
+            running=len(self._running),
+            eta_seconds=int(round(eta)),
+        )
+
+    def _duration(self, operation: str) -> float:
+        return self._durations.get(operation, DEFAULT_OPERATION_SECONDS["deploy"])
+
+
+_scheduler: OperationScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_operation_scheduler() -> OperationScheduler:
+    """Return the process-wide scheduler shared by all deployment routes."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = OperationScheduler()
+        return _scheduler
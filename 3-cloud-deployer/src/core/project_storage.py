@@ -1,6 +1,7 @@
 """Project-scoped storage boundary for Deployer project data."""
 
 from dataclasses import dataclass
+import io
 import json
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,7 @@ from src.core.paths import (
     validate_path_component,
 )
 from src.core.secure_files import atomic_write_private_bytes
+from src.core.version_store import ProjectVersionStore
 
 
 SENSITIVE_PROJECT_FILENAMES = {
@@ -188,14 +190,26 @@ class ProjectStorage:
         return result
 
     def version_count(self, project_name: str) -> int:
-        """Return the number of archived ZIP versions for a runtime project."""
-        versions_dir = (
+        """Return the number of archived versions for a runtime project."""
+        return self.version_store(project_name).count()
+
+    def list_versions(self, project_name: str) -> list[dict[str, Any]]:
+        """Return archived versions, oldest first, read from their manifests."""
+        return [
+            summary.to_dict()
+            for summary in self.version_store(project_name).list_versions()
+        ]
+
+    def export_version(self, project_name: str, version: str) -> io.BytesIO:
+        """Assemble one archived version as a ZIP."""
+        return self.version_store(project_name).export(version)
+
+    def version_store(self, project_name: str) -> ProjectVersionStore:
+        """Return the content-addressed version store of a runtime project."""
+        return ProjectVersionStore(
             self.deployment_project_path(project_name)
             / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
         )
-        if not versions_dir.exists():
-            return 0
-        return len([path for path in versions_dir.iterdir() if path.suffix == ".zip"])
 
     def _build_tree(self, current_path: Path, rel_base: str) -> list[dict[str, Any]]:
         items: list[dict[str, Any]] = []
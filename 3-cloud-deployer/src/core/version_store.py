@@ -0,0 +1,386 @@
+"""
+Content-addressed, deduplicated store of archived project versions.
+
+Every upload used to be archived as a complete re-compressed ZIP, so each
+unchanged processor, scene asset, and config was compressed and stored
+again on every redeploy. A project's ``versions/`` directory now holds:
+
+- ``blobs/<aa>/<sha256>``: one raw DEFLATE stream per distinct file content,
+  written once and never modified
+- ``<timestamp>.json``: a small manifest per version mapping each project
+  path to its blob digest, size, and CRC
+
+A new version stores only blobs it does not already have. Exports are
+assembled on demand by copying the stored DEFLATE streams into a
+deterministic ZIP, which is byte-identical to the archives written before.
+Blobs that no manifest references any more are garbage-collected.
+``versions/*.zip`` archives from before the store are still counted and
+exported, and ``import_legacy_archives`` folds them into the store.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+from typing import Iterable
+import zipfile
+import zlib
+
+from src.core.deterministic_zip import (
+    PrecompressedZipMember,
+    atomic_write_bytes,
+    compress_zip_member,
+    write_precompressed_members,
+)
+
+MANIFEST_FORMAT = 1
+BLOBS_DIR_NAME = "blobs"
+# 0 keeps every version; otherwise the newest N are kept.
+DEFAULT_PROJECT_VERSION_LIMIT = 0
+_VERSION_NAME = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.\d{6}$")
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+class VersionNotFound(ValueError):
+    """Raised when a requested project version does not exist."""
+
+
+@dataclass(frozen=True)
+class VersionFile:
+    """One project file of a version, as recorded in its manifest."""
+
+    path: str
+    sha256: str
+    size: int
+    crc: int
+
+
+@dataclass(frozen=True)
+class VersionSummary:
+    version: str
+    file_count: int
+    size_bytes: int
+    legacy: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "file_count": self.file_count,
+            "size_bytes": self.size_bytes,
+            "legacy": self.legacy,
+        }
+
+
+def default_project_version_limit() -> int:
+    configured = os.environ.get("DEPLOYER_PROJECT_VERSION_LIMIT")
+    if configured:
+        limit = int(configured)
+        if limit < 0:
+            raise ValueError("DEPLOYER_PROJECT_VERSION_LIMIT must not be negative")
+        return limit
+    return DEFAULT_PROJECT_VERSION_LIMIT
+
+
+def new_version_name() -> str:
+    """Return a collision-safe, sortable version name for ``datetime.now()``."""
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f")
+
+
+class ProjectVersionStore:
+    """The version history under one project's ``versions/`` directory."""
+
+    def __init__(self, versions_dir: Path | str) -> None:
+        self.versions_dir = Path(versions_dir)
+        self.blobs_dir = self.versions_dir / BLOBS_DIR_NAME
+
+    # Writing ----------------------------------------------------------------
+
+    def add_version(
+        self,
+        files: Iterable[tuple[str, str, Path]],
+        *,
+        version: str | None = None,
+    ) -> str:
+        """
+        Record a version from ``(project path, sha256, source file)`` entries.
+
+        Only content whose digest is not stored yet is read and compressed.
+        Size and CRC of stored blobs come from the newest manifest, which
+        covers everything a redeploy leaves unchanged; any other stored blob
+        is read back on its own.
+        """
+        version = version or new_version_name()
+        known = {
+            file.sha256: (file.size, file.crc)
+            for previous in self._manifest_versions()[-1:]
+            for file in self.read_manifest(previous)
+        }
+        recorded = []
+        for relative_path, digest, source_path in files:
+            size, crc = self._ensure_blob(digest, source_path, known)
+            known[digest] = (size, crc)
+            recorded.append(
+                {"path": relative_path, "sha256": digest, "size": size, "crc": crc}
+            )
+        self._write_manifest(version, recorded)
+        return version
+
+    def import_legacy_archives(self) -> int:
+        """Move ``versions/*.zip`` archives into the store; return how many."""
+        imported = 0
+        for archive_path in sorted(self.versions_dir.glob("*.zip")):
+            if archive_path.is_symlink() or not _VERSION_NAME.match(archive_path.stem):
+                continue
+            recorded = []
+            with zipfile.ZipFile(archive_path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    content = archive.read(info)
+                    digest = hashlib.sha256(content).hexdigest()
+                    self._store_blob(digest, content)
+                    recorded.append(
+                        {
+                            "path": info.filename,
+                            "sha256": digest,
+                            "size": len(content),
+                            "crc": info.CRC,
+                        }
+                    )
+            self._write_manifest(archive_path.stem, recorded)
+            archive_path.unlink()
+            imported += 1
+        return imported
+
+    def copy_to(self, destination_dir: Path | str) -> "ProjectVersionStore":
+        """
+        Copy this history into ``destination_dir``.
+
+        Blobs are immutable, so they are hard-linked where possible.
+        """
+        destination = ProjectVersionStore(destination_dir)
+        destination.versions_dir.mkdir(parents=True, exist_ok=True)
+        if not self.versions_dir.is_dir():
+            return destination
+        for entry in sorted(self.versions_dir.iterdir()):
+            if entry.is_symlink():
+                raise ValueError("Project version history contains a symbolic link")
+            if entry.is_file() and entry.suffix in {".json", ".zip"}:
+                shutil.copy2(entry, destination.versions_dir / entry.name)
+        links_supported = True
+        for blob in self._blob_paths():
+            target = destination.blobs_dir / blob.parent.name / blob.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if links_supported:
+                try:
+                    os.link(blob, target, follow_symlinks=False)
+                    continue
+                except OSError:
+                    links_supported = False
+            shutil.copy2(blob, target)
+        return destination
+
+    def prune(self, keep: int) -> list[str]:
+        """Drop the oldest versions beyond the newest ``keep``; return their names."""
+        if keep <= 0:
+            return []
+        removed = [summary.version for summary in self.list_versions()[:-keep]]
+        for version in removed:
+            (self.versions_dir / f"{version}.json").unlink(missing_ok=True)
+            (self.versions_dir / f"{version}.zip").unlink(missing_ok=True)
+        return removed
+
+    def collect_garbage(self) -> int:
+        """Delete blobs that no manifest references; return how many."""
+        referenced = {
+            file.sha256
+            for version in self._manifest_versions()
+            for file in self.read_manifest(version)
+        }
+        removed = 0
+        for blob in self._blob_paths():
+            if blob.name not in referenced:
+                blob.unlink()
+                removed += 1
+        for shard in list(self.blobs_dir.iterdir()) if self.blobs_dir.is_dir() else ():
+            if shard.is_dir() and not any(shard.iterdir()):
+                shard.rmdir()
+        return removed
+
+    # Reading ----------------------------------------------------------------
+
+    def count(self) -> int:
+        """Number of versions, from directory entries only."""
+        if not self.versions_dir.is_dir():
+            return 0
+        return sum(
+            1
+            for path in self.versions_dir.iterdir()
+            if path.suffix in {".json", ".zip"} and _VERSION_NAME.match(path.stem)
+        )
+
+    def list_versions(self) -> list[VersionSummary]:
+        """All versions, oldest first, read from manifests only."""
+        summaries = [
+            VersionSummary(
+                version=version,
+                file_count=len(files),
+                size_bytes=sum(file.size for file in files),
+            )
+            for version in self._manifest_versions()
+            for files in (self.read_manifest(version),)
+        ]
+        for archive_path in self._legacy_archives():
+            summaries.append(
+                VersionSummary(
+                    version=archive_path.stem,
+                    file_count=0,
+                    size_bytes=archive_path.stat().st_size,
+                    legacy=True,
+                )
+            )
+        return sorted(summaries, key=lambda summary: summary.version)
+
+    def read_manifest(self, version: str) -> list[VersionFile]:
+        manifest_path = self._manifest_path(version)
+        try:
+            document = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError as exc:
+            raise VersionNotFound(f"Project version '{version}' does not exist.") from exc
+        if not isinstance(document, dict) or document.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported manifest for project version '{version}'")
+        files = []
+        for entry in document.get("files", ()):
+            if not _DIGEST.match(str(entry.get("sha256", ""))):
+                raise ValueError(f"Invalid blob digest in project version '{version}'")
+            files.append(
+                VersionFile(
+                    path=str(entry["path"]),
+                    sha256=entry["sha256"],
+                    size=int(entry["size"]),
+                    crc=int(entry["crc"]),
+                )
+            )
+        return files
+
+    def has_blob(self, digest: str) -> bool:
+        return bool(_DIGEST.match(digest)) and self._blob_path(digest).is_file()
+
+    def zip_member(self, path: str, digest: str) -> PrecompressedZipMember:
+        """Return a stored blob as a ZIP member for ``path``, verifying its digest."""
+        if not self.has_blob(digest):
+            raise FileNotFoundError(f"Blob {digest} is not stored")
+        compressed = self._blob_path(digest).read_bytes()
+        content = zlib.decompress(compressed, -15)
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f"Stored blob for {path} is corrupt")
+        return PrecompressedZipMember(
+            path, content, zlib.crc32(content) & 0xFFFFFFFF, compressed
+        )
+
+    def export(self, version: str) -> io.BytesIO:
+        """Assemble one version as a deterministic ZIP from its stored blobs."""
+        if not _VERSION_NAME.match(version):
+            raise VersionNotFound(f"Project version '{version}' does not exist.")
+        legacy_path = self.versions_dir / f"{version}.zip"
+        if not self._manifest_path(version).exists() and legacy_path.is_file():
+            return io.BytesIO(legacy_path.read_bytes())
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            write_precompressed_members(
+                archive,
+                (self._member(file) for file in self.read_manifest(version)),
+            )
+        buffer.seek(0)
+        return buffer
+
+    # Internals --------------------------------------------------------------
+
+    def _ensure_blob(
+        self,
+        digest: str,
+        source_path: Path,
+        known: dict[str, tuple[int, int]],
+    ) -> tuple[int, int]:
+        if not _DIGEST.match(digest):
+            raise ValueError(f"Invalid content digest: {digest}")
+        blob_path = self._blob_path(digest)
+        if blob_path.is_file():
+            if digest in known:
+                return known[digest]
+            compressed = blob_path.read_bytes()
+            content = zlib.decompress(compressed, -15)
+            return len(content), zlib.crc32(content) & 0xFFFFFFFF
+        content = source_path.read_bytes()
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f"Content of {source_path.name} does not match its digest")
+        member = self._store_blob(digest, content)
+        return len(content), member.crc
+
+    def _store_blob(self, digest: str, content: bytes) -> PrecompressedZipMember:
+        member = compress_zip_member("blob", content)
+        blob_path = self._blob_path(digest)
+        if not blob_path.is_file():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(blob_path, member.compressed)
+        return member
+
+    def _member(self, file: VersionFile) -> PrecompressedZipMember:
+        compressed = self._blob_path(file.sha256).read_bytes()
+        content = zlib.decompress(compressed, -15)
+        if len(content) != file.size:
+            raise ValueError(f"Stored blob for {file.path} is corrupt")
+        return PrecompressedZipMember(file.path, content, file.crc, compressed)
+
+    def _write_manifest(self, version: str, files: list[dict]) -> None:
+        if not _VERSION_NAME.match(version):
+            raise ValueError(f"Invalid project version name: {version}")
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        document = {"format": MANIFEST_FORMAT, "version": version, "files": files}
+        atomic_write_bytes(
+            self._manifest_path(version),
+            json.dumps(document, separators=(",", ":")).encode("utf-8"),
+        )
+
+    def _manifest_path(self, version: str) -> Path:
+        return self.versions_dir / f"{version}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest
+
+    def _manifest_versions(self) -> list[str]:
+        if not self.versions_dir.is_dir():
+            return []
+        return sorted(
+            path.stem
+            for path in self.versions_dir.glob("*.json")
+            if _VERSION_NAME.match(path.stem)
+        )
+
+    def _legacy_archives(self) -> list[Path]:
+        if not self.versions_dir.is_dir():
+            return []
+        return [
+            path
+            for path in sorted(self.versions_dir.glob("*.zip"))
+            if _VERSION_NAME.match(path.stem) and not self._manifest_path(path.stem).exists()
+        ]
+
+    def _blob_paths(self) -> list[Path]:
+        if not self.blobs_dir.is_dir():
+            return []
+        return [
+            blob
+            for shard in sorted(self.blobs_dir.iterdir())
+            if shard.is_dir() and not shard.is_symlink()
+            for blob in sorted(shard.iterdir())
+            if blob.is_file() and not blob.is_symlink() and _DIGEST.match(blob.name)
+        ]
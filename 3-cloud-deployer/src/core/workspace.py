@@ -4,17 +4,24 @@ from __future__ import annotations
 
 import copy
 from contextlib import contextmanager
-from dataclasses import dataclass, is_dataclass, replace
+from dataclasses import dataclass, field, is_dataclass, replace
 import logging
+import os
 from pathlib import Path
 import shutil
 import tempfile
 from typing import Iterator
 
+try:  # pragma: no cover - fcntl is unavailable on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 import constants as CONSTANTS
 from src.core.deployment_errors import WorkspaceSyncError
 from src.core.observability import OperationContext, operation_step, redact_sensitive
 from src.core.secure_files import atomic_write_private_bytes
+from src.terraform_workdir import TERRAFORM_ROOT_DIR_NAME
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +30,7 @@ EXCLUDED_DIR_NAMES = {
     CONSTANTS.PROJECT_VERSIONS_DIR_NAME,
     ".build",
     ".terraform",
+    TERRAFORM_ROOT_DIR_NAME,
     ".mypy_cache",
     ".pytest_cache",
     "__pycache__",
@@ -30,6 +38,38 @@ EXCLUDED_DIR_NAMES = {
 EXCLUDED_FILE_NAMES = {
     ".DS_Store",
 }
+# Top-level project paths a deployment writes into. They are always private
+# copies (or reflinks); every other input may share the source inode.
+WRITABLE_WORKSPACE_PATHS = {
+    "terraform",
+    "iot_devices_auth",
+    "iot_device_simulator",
+    CONSTANTS.CONFIG_INTER_CLOUD_FILE,
+}
+WORKSPACE_MODES = ("link", "copy")
+_FICLONE = 0x40049409
+
+
+@dataclass
+class WorkspaceMaterialization:
+    """How the files of one ephemeral workspace were materialized."""
+
+    mode: str
+    linked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    copied_bytes: int = 0
+    links_supported: bool = True
+    reflinks_supported: bool = True
+
+    def log_fields(self) -> dict:
+        return {
+            "workspace_mode": self.mode,
+            "files_linked": self.linked,
+            "files_reflinked": self.reflinked,
+            "files_copied": self.copied,
+            "bytes_copied": self.copied_bytes,
+        }
 
 
 @dataclass(frozen=True)
@@ -39,6 +79,10 @@ class EphemeralWorkspace:
     project_name: str
     source_path: Path
     workspace_path: Path
+    materialization: WorkspaceMaterialization | None = field(
+        default=None,
+        compare=False,
+    )
 
     @property
     def terraform_dir(self) -> Path:
@@ -71,6 +115,19 @@ def deployment_workspace(
     if operation_context:
         with operation_step(logger, operation_context, "workspace_prepare"):
             workspace = create_ephemeral_workspace(context, workspace_root=workspace_root)
+            if workspace.materialization is not None:
+                materialization = workspace.materialization
+                logger.info(
+                    "Workspace prepared (%s): %s linked, %s reflinked, %s copied",
+                    materialization.mode,
+                    materialization.linked,
+                    materialization.reflinked,
+                    materialization.copied,
+                    extra=operation_context.log_extra(
+                        phase="workspace_prepare",
+                        **materialization.log_fields(),
+                    ),
+                )
     else:
         workspace = create_ephemeral_workspace(context, workspace_root=workspace_root)
     runtime_context = _clone_context_with_project_path(context, workspace.workspace_path)
@@ -93,14 +150,25 @@ def deployment_workspace(
         workspace.cleanup()
 
 
-def create_ephemeral_workspace(context, workspace_root: Path | None = None) -> EphemeralWorkspace:
+def create_ephemeral_workspace(
+    context,
+    workspace_root: Path | None = None,
+    mode: str | None = None,
+) -> EphemeralWorkspace:
     """
-    Copy a validated project context into a temporary workspace.
+    Materialize a validated project context in a temporary workspace.
+
+    The workspace intentionally excludes deployer-internal caches and archived
+    ZIP versions. Symlinks are rejected to prevent copying files outside the
+    project boundary into the temporary workspace.
 
-    The copy intentionally excludes deployer-internal caches and archived ZIP
-    versions. Symlinks are rejected to prevent copying files outside the project
-    boundary into the temporary workspace.
+    In ``link`` mode (the default, or ``DEPLOYER_WORKSPACE_MODE``) read-only
+    inputs are hard-linked, falling back to reflinks and then plain copies,
+    while ``WRITABLE_WORKSPACE_PATHS`` always get private reflinks or copies.
+    Deployment code replaces files atomically, so a link never lets a write
+    reach the source project. ``copy`` mode copies every file.
     """
+    mode = _workspace_mode(mode)
     source_path = Path(context.project_path).resolve()
     if not source_path.exists():
         raise ValueError("Cannot create ephemeral workspace: project path does not exist.")
@@ -112,20 +180,14 @@ def create_ephemeral_workspace(context, workspace_root: Path | None = None) -> E
         raise ValueError("Ephemeral workspace root must not be inside the source project.")
     _ensure_workspace_root(root)
 
-    _assert_no_symlinks(source_path)
-
     workspace_path = Path(tempfile.mkdtemp(
         prefix=f"{_safe_prefix(context.project_name)}-",
         dir=root,
     )).resolve()
 
+    materialization = WorkspaceMaterialization(mode=mode)
     try:
-        shutil.copytree(
-            source_path,
-            workspace_path,
-            dirs_exist_ok=True,
-            ignore=_ignore_internal_artifacts,
-        )
+        _materialize_tree(source_path, workspace_path, (), materialization)
     except Exception:
         shutil.rmtree(workspace_path, ignore_errors=True)
         raise
@@ -134,6 +196,7 @@ def create_ephemeral_workspace(context, workspace_root: Path | None = None) -> E
         project_name=context.project_name,
         source_path=source_path,
         workspace_path=workspace_path,
+        materialization=materialization,
     )
 
 
@@ -153,7 +216,9 @@ def sync_runtime_outputs(workspace: EphemeralWorkspace) -> None:
 
     Build products, generated tfvars and provider caches stay ephemeral. Terraform
     state and simulator runtime assets are durable because subsequent destroy and
-    simulator/download flows depend on them.
+    simulator/download flows depend on them; the applied-inputs digest record is
+    durable so the next incremental deploy can diff against it, and the
+    Azure Digital Twins upload record so the next upload can skip unchanged twins.
     """
     _copy_private_file_if_exists(
         workspace.state_path,
@@ -165,15 +230,42 @@ def sync_runtime_outputs(workspace: EphemeralWorkspace) -> None:
         workspace.source_path / "terraform" / "terraform.tfstate.backup",
         workspace.source_path,
     )
+    _copy_private_file_if_exists(
+        workspace.terraform_dir / "applied-inputs.json",
+        workspace.source_path / "terraform" / "applied-inputs.json",
+        workspace.source_path,
+    )
+    _copy_private_file_if_exists(
+        workspace.terraform_dir / "adt-upload.json",
+        workspace.source_path / "terraform" / "adt-upload.json",
+        workspace.source_path,
+    )
     _copy_private_directory_if_exists(
         workspace.workspace_path / "iot_devices_auth",
         workspace.source_path / "iot_devices_auth",
         workspace.source_path,
     )
+    _sync_stack_states(workspace)
     _sync_generated_simulator_configs(workspace)
     _sync_build_metadata(workspace)
 
 
+def _sync_stack_states(workspace: EphemeralWorkspace) -> None:
+    """Copy per-stack Terraform state; per-stack tfvars stay ephemeral."""
+    stacks_dir = workspace.terraform_dir / "stacks"
+    if stacks_dir.is_symlink() or not stacks_dir.is_dir():
+        return
+    for stack_dir in sorted(stacks_dir.iterdir()):
+        if stack_dir.is_symlink() or not stack_dir.is_dir():
+            continue
+        for name in ("terraform.tfstate", "terraform.tfstate.backup"):
+            _copy_private_file_if_exists(
+                stack_dir / name,
+                workspace.source_path / "terraform" / "stacks" / stack_dir.name / name,
+                workspace.source_path,
+            )
+
+
 def _sync_outputs_with_observability(
     workspace: EphemeralWorkspace,
     operation_context: OperationContext | None,
@@ -314,30 +406,91 @@ def _ensure_workspace_root(root: Path) -> None:
     root.chmod(0o700)
 
 
-def _ignore_internal_artifacts(_directory: str, names: list[str]) -> set[str]:
-    ignored = set()
-    for name in names:
-        if name in EXCLUDED_DIR_NAMES or name in EXCLUDED_FILE_NAMES:
-            ignored.add(name)
-        elif name.endswith(".pyc"):
-            ignored.add(name)
-    return ignored
+def _workspace_mode(mode: str | None) -> str:
+    resolved = mode or os.environ.get("DEPLOYER_WORKSPACE_MODE") or "link"
+    if resolved not in WORKSPACE_MODES:
+        raise ValueError(
+            f"Unsupported workspace mode '{resolved}'; expected one of {', '.join(WORKSPACE_MODES)}."
+        )
+    return resolved
 
 
-def _assert_no_symlinks(source_path: Path) -> None:
-    for path in source_path.rglob("*"):
-        if _is_ignored_path(path, source_path):
+def _is_internal_artifact(name: str) -> bool:
+    return (
+        name in EXCLUDED_DIR_NAMES
+        or name in EXCLUDED_FILE_NAMES
+        or name.endswith(".pyc")
+    )
+
+
+def _materialize_tree(
+    source_dir: Path,
+    target_dir: Path,
+    relative_parts: tuple[str, ...],
+    materialization: WorkspaceMaterialization,
+) -> None:
+    """Validate and materialize one directory level in a single traversal."""
+    with os.scandir(source_dir) as iterator:
+        entries = sorted(iterator, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.name in EXCLUDED_DIR_NAMES:
             continue
-        if path.is_symlink():
+        if entry.is_symlink():
             raise ValueError("Cannot create ephemeral workspace: project contains symlinks.")
+        if _is_internal_artifact(entry.name):
+            continue
+        source = Path(entry.path)
+        target = target_dir / entry.name
+        parts = (*relative_parts, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            target.mkdir()
+            _materialize_tree(source, target, parts, materialization)
+        elif entry.is_file(follow_symlinks=False):
+            writable = parts[0] in WRITABLE_WORKSPACE_PATHS
+            _materialize_file(source, target, writable, materialization)
+        else:
+            raise ValueError(
+                "Cannot create ephemeral workspace: project contains unsupported file types."
+            )
+    shutil.copystat(source_dir, target_dir, follow_symlinks=False)
 
 
-def _is_ignored_path(path: Path, source_path: Path) -> bool:
+def _materialize_file(
+    source: Path,
+    target: Path,
+    writable: bool,
+    materialization: WorkspaceMaterialization,
+) -> None:
+    if materialization.mode == "link":
+        if not writable and materialization.links_supported:
+            try:
+                os.link(source, target, follow_symlinks=False)
+                materialization.linked += 1
+                return
+            except OSError:
+                materialization.links_supported = False
+        if materialization.reflinks_supported:
+            if _reflink(source, target):
+                shutil.copystat(source, target, follow_symlinks=False)
+                materialization.reflinked += 1
+                return
+            materialization.reflinks_supported = False
+    shutil.copy2(source, target, follow_symlinks=False)
+    materialization.copied += 1
+    materialization.copied_bytes += target.stat().st_size
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone ``source`` copy-on-write where the filesystem supports FICLONE."""
+    if fcntl is None:
+        return False
     try:
-        relative_parts = path.relative_to(source_path).parts
-    except ValueError:
+        with open(source, "rb") as source_file, open(target, "xb") as target_file:
+            fcntl.ioctl(target_file.fileno(), _FICLONE, source_file.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
         return False
-    return any(part in EXCLUDED_DIR_NAMES for part in relative_parts)
 
 
 def _safe_prefix(project_name: str) -> str:
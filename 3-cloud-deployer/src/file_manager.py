@@ -17,22 +17,17 @@ import constants as CONSTANTS
 from logger import logger
 import io
 import tempfile
+from contextlib import contextmanager
 from uuid import uuid4
 
 import src.validator as validator
 from src.core.project_storage import ProjectStorage, is_sensitive_project_file
 from src.core.secure_files import atomic_write_private_bytes
 from src.core.deterministic_zip import (
-    atomic_zip_archive,
-    write_zip_bytes,
     write_zip_file,
 )
-from src.validation.accessors import ZipFileAccessor
-from src.project_archive.policy import (
-    ArchiveLimitExceeded,
-    MAX_COMPRESSED_ARCHIVE_BYTES,
-    validate_archive,
-)
+from src.core.version_store import ProjectVersionStore, default_project_version_limit
+from src.project_archive.ingestion import IngestedArchive, ingest_archive
 
 
 GENERATED_PROJECT_PATHS = (
@@ -107,43 +102,41 @@ def create_project_from_zip(
     if safe_name != project_name:
         raise ValueError("Invalid project name.")
 
-    zip_source = _buffer_zip_source(zip_source)
+    storage = _get_project_storage(project_path)
+    target_dir = storage.deployment_project_path(safe_name)
 
-    # Validate before extraction (Universal Validation)
-    warnings = validator.validate_project_zip(zip_source)
-    if warnings is None:
-        warnings = []
+    with _ingested_archive(zip_source, work_dir=target_dir.parent) as archive:
+        # Validate before extraction (Universal Validation)
+        warnings = validator.validate_project_zip(archive)
+        if warnings is None:
+            warnings = []
 
-    zip_source.seek(0)
-    _validate_project_name_matches_manifest(
-        safe_name, _extract_deployment_manifest(zip_source)
-    )
+        _validate_project_name_matches_manifest(
+            safe_name, _extract_deployment_manifest(archive)
+        )
 
-    # Extract twin_name and creds from zip for duplicate check
-    zip_source.seek(0)
-    twin_name, creds = _extract_identity_from_zip(zip_source)
+        # Extract twin_name and creds from zip for duplicate check
+        twin_name, creds = _extract_identity_from_zip(archive)
 
-    # Check for duplicate project (same twin_name + same credentials)
-    conflicting_project = validator.check_duplicate_project(
-        twin_name, creds, exclude_project=project_name, project_path=project_path
-    )
-    if conflicting_project:
-        raise ValueError(
-            f"Duplicate project detected: '{conflicting_project}' has the same "
-            f"digital_twin_name and credentials."
+        # Check for duplicate project (same twin_name + same credentials)
+        conflicting_project = validator.check_duplicate_project(
+            twin_name, creds, exclude_project=project_name, project_path=project_path
         )
+        if conflicting_project:
+            raise ValueError(
+                f"Duplicate project detected: '{conflicting_project}' has the same "
+                f"digital_twin_name and credentials."
+            )
 
-    storage = _get_project_storage(project_path)
-    target_dir = storage.deployment_project_path(safe_name)
-    if target_dir.exists():
-        raise ValueError(f"Project '{project_name}' already exists.")
+        if target_dir.exists():
+            raise ValueError(f"Project '{project_name}' already exists.")
 
-    _replace_project_from_archive(
-        target_dir,
-        zip_source,
-        description=description,
-        existing_target=None,
-    )
+        _replace_project_from_archive(
+            target_dir,
+            archive,
+            description=description,
+            existing_target=None,
+        )
 
     logger.info(f"Created project '{project_name}' from zip.")
     return {"message": f"Project '{project_name}' created.", "warnings": warnings}
@@ -175,44 +168,41 @@ def update_project_from_zip(
     if safe_name != project_name:
         raise ValueError("Invalid project name.")
 
-    zip_source = _buffer_zip_source(zip_source)
+    storage = _get_project_storage(project_path)
+    target_dir = storage.deployment_project_path(safe_name)
 
-    # Validate entire zip content first (Universal Validation)
-    warnings = validator.validate_project_zip(zip_source)
-    if warnings is None:
-        warnings = []
+    with _ingested_archive(zip_source, work_dir=target_dir.parent) as archive:
+        # Validate entire zip content first (Universal Validation)
+        warnings = validator.validate_project_zip(archive)
+        if warnings is None:
+            warnings = []
 
-    zip_source.seek(0)
-    _validate_project_name_matches_manifest(
-        safe_name, _extract_deployment_manifest(zip_source)
-    )
+        _validate_project_name_matches_manifest(
+            safe_name, _extract_deployment_manifest(archive)
+        )
 
-    # Extract twin_name and creds from zip for duplicate check
-    zip_source.seek(0)
-    twin_name, creds = _extract_identity_from_zip(zip_source)
+        # Extract twin_name and creds from zip for duplicate check
+        twin_name, creds = _extract_identity_from_zip(archive)
 
-    # Check for duplicate project (exclude self)
-    conflicting_project = validator.check_duplicate_project(
-        twin_name, creds, exclude_project=project_name, project_path=project_path
-    )
-    if conflicting_project:
-        raise ValueError(
-            f"Duplicate project detected: '{conflicting_project}' has the same "
-            f"digital_twin_name and credentials."
+        # Check for duplicate project (exclude self)
+        conflicting_project = validator.check_duplicate_project(
+            twin_name, creds, exclude_project=project_name, project_path=project_path
         )
+        if conflicting_project:
+            raise ValueError(
+                f"Duplicate project detected: '{conflicting_project}' has the same "
+                f"digital_twin_name and credentials."
+            )
 
-    storage = _get_project_storage(project_path)
-    target_dir = storage.deployment_project_path(safe_name)
-
-    if not target_dir.is_dir() or target_dir.is_symlink():
-        raise ValueError(f"Project '{project_name}' does not exist.")
+        if not target_dir.is_dir() or target_dir.is_symlink():
+            raise ValueError(f"Project '{project_name}' does not exist.")
 
-    _replace_project_from_archive(
-        target_dir,
-        zip_source,
-        description=description,
-        existing_target=target_dir,
-    )
+        _replace_project_from_archive(
+            target_dir,
+            archive,
+            description=description,
+            existing_target=target_dir,
+        )
 
     logger.info(f"Updated project '{project_name}' from zip.")
     return {"message": f"Project '{project_name}' updated.", "warnings": warnings}
@@ -341,24 +331,25 @@ def update_function_code_file(
 # ==========================================
 # 5. Versioning & Metadata Helpers
 # ==========================================
-def _buffer_zip_source(zip_source) -> io.BytesIO:
-    """Return a bounded, seekable copy of one supported ZIP source."""
-    if isinstance(zip_source, bytes):
-        content = zip_source
-    elif isinstance(zip_source, (str, os.PathLike)):
-        source_path = Path(zip_source)
-        if source_path.stat().st_size > MAX_COMPRESSED_ARCHIVE_BYTES:
-            raise ArchiveLimitExceeded("ZIP exceeds the 100MB compressed-size limit")
-        content = source_path.read_bytes()
-    elif hasattr(zip_source, "read") and hasattr(zip_source, "seek"):
-        zip_source.seek(0)
-        content = zip_source.read(MAX_COMPRESSED_ARCHIVE_BYTES + 1)
-    else:
-        raise TypeError("zip_source must be bytes, a path, or a seekable binary stream")
+@contextmanager
+def _ingested_archive(zip_source, *, work_dir: Path | None = None):
+    """Yield the member index of one ZIP source, ingesting it unless it already is one."""
+    if isinstance(zip_source, IngestedArchive):
+        yield zip_source
+        return
+    with ingest_archive(zip_source, work_dir=work_dir) as archive:
+        yield archive
+
 
-    if len(content) > MAX_COMPRESSED_ARCHIVE_BYTES:
-        raise ArchiveLimitExceeded("ZIP exceeds the 100MB compressed-size limit")
-    return io.BytesIO(content)
+def ingest_project_archive(zip_source, *, work_dir: Path | None = None) -> IngestedArchive:
+    """
+    Ingest an upload once so several project operations can share it.
+
+    Every function here that takes a ``zip_source`` also accepts the result
+    and then neither re-parses nor re-extracts the archive. The caller closes
+    it.
+    """
+    return ingest_archive(zip_source, work_dir=work_dir)
 
 
 def extract_operation_archive(
@@ -369,19 +360,16 @@ def extract_operation_archive(
     prevalidated: bool = False,
 ) -> list[str]:
     """Validate and extract one secret-bearing package into a private runtime path."""
-    buffered = _buffer_zip_source(zip_source)
-    warnings = (
-        []
-        if prevalidated
-        else validate_deployment_operation_archive(buffered)
-    )
-    buffered.seek(0)
-    _validate_project_name_matches_manifest(
-        project_name,
-        _extract_deployment_manifest(buffered),
-    )
-    buffered.seek(0)
-    with zipfile.ZipFile(buffered, "r") as archive:
+    with _ingested_archive(zip_source, work_dir=destination.parent) as archive:
+        warnings = (
+            []
+            if prevalidated
+            else validate_deployment_operation_archive(archive)
+        )
+        _validate_project_name_matches_manifest(
+            project_name,
+            _extract_deployment_manifest(archive),
+        )
         _extract_canonical_project(archive, destination)
     _remove_generated_project_paths(destination)
     return warnings
@@ -389,17 +377,17 @@ def extract_operation_archive(
 
 def validate_deployment_operation_archive(zip_source) -> list[str]:
     """Require the canonical manifest contract before staging runtime state."""
-    buffered = _buffer_zip_source(zip_source)
-    warnings = validator.validate_project_zip(
-        buffered,
-        require_deployment_manifest=True,
-    )
+    with _ingested_archive(zip_source) as archive:
+        warnings = validator.validate_project_zip(
+            archive,
+            require_deployment_manifest=True,
+        )
     return warnings or []
 
 
 def _replace_project_from_archive(
     target_dir: Path,
-    zip_source: io.BytesIO,
+    archive: IngestedArchive,
     *,
     description: str | None,
     existing_target: Path | None,
@@ -410,19 +398,17 @@ def _replace_project_from_archive(
         tempfile.mkdtemp(prefix=f".{target_dir.name}.staging-", dir=target_dir.parent)
     )
     try:
-        zip_source.seek(0)
-        with zipfile.ZipFile(zip_source, "r") as archive:
-            _extract_canonical_project(archive, staging_dir)
+        _extract_canonical_project(archive, staging_dir)
         _remove_generated_project_paths(staging_dir)
         _remove_sensitive_project_files(staging_dir)
 
         existing_info = _read_project_info(existing_target)
         if existing_target is not None:
             _copy_version_history(existing_target, staging_dir)
-        _archive_zip_version(zip_source, staging_dir)
+        _archive_project_version(archive, staging_dir)
         _write_project_info(
             staging_dir,
-            zip_source,
+            archive,
             description,
             existing_info=existing_info,
         )
@@ -433,39 +419,22 @@ def _replace_project_from_archive(
 
 
 def _extract_canonical_project(
-    archive: zipfile.ZipFile,
+    archive: IngestedArchive,
     staging_dir: Path,
 ) -> None:
-    """Extract only the validated project root and flatten one ZIP wrapper folder."""
-    validate_archive(archive)
-    project_root = ZipFileAccessor(archive).get_project_root()
-    root_entry = project_root.rstrip("/")
-    for member in archive.infolist():
-        member_name = member.filename.rstrip("/")
-        if project_root:
-            if member_name == root_entry:
-                continue
-            if not member.filename.startswith(project_root):
-                raise ValueError(
-                    "ZIP contains files outside the canonical project root"
-                )
-            relative_name = member.filename[len(project_root) :].rstrip("/")
-        else:
-            relative_name = member_name
-        if not relative_name:
-            continue
-
+    """Copy the staged project root into ``staging_dir``, flattening one wrapper folder."""
+    for relative_name, member in archive.project_members():
         target = staging_dir.joinpath(*relative_name.split("/"))
-        if member.is_dir():
+        if member.is_dir:
             target.mkdir(parents=True, exist_ok=True)
             continue
         target.parent.mkdir(parents=True, exist_ok=True)
-        with archive.open(member, "r") as source:
-            if is_sensitive_project_file(relative_name):
-                atomic_write_private_bytes(target, source.read())
-            else:
-                with target.open("xb") as destination:
-                    shutil.copyfileobj(source, destination)
+        source_path = archive.staged_path(member.name)
+        if is_sensitive_project_file(relative_name):
+            atomic_write_private_bytes(target, source_path.read_bytes())
+        else:
+            with source_path.open("rb") as source, target.open("xb") as destination:
+                shutil.copyfileobj(source, destination)
 
 
 def _remove_generated_project_paths(staging_dir: Path) -> None:
@@ -585,13 +554,12 @@ def _copy_matching_runtime_files(
 def _copy_version_history(existing_target: Path, staging_dir: Path) -> None:
     source = existing_target / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
     if source.is_dir() and not source.is_symlink():
-        destination = staging_dir / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
-        destination.mkdir()
-        for version in sorted(source.iterdir()):
-            if version.is_symlink():
-                raise ValueError("Project version history contains a symbolic link")
-            if version.is_file() and version.suffix == ".zip":
-                shutil.copy2(version, destination / version.name)
+        destination = ProjectVersionStore(source).copy_to(
+            staging_dir / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
+        )
+        # Archives written before the version store are folded into it on
+        # the first upload that touches the project.
+        destination.import_legacy_archives()
 
 
 def _read_project_info(existing_target: Path | None) -> dict:
@@ -627,43 +595,39 @@ def _publish_staged_project(staging_dir: Path, target_dir: Path) -> None:
             )
 
 
-def _archive_zip_version(zip_source, target_dir):
+def _archive_project_version(zip_source, target_dir):
     """
-    Archives the uploaded zip to {target_dir}/versions/{timestamp}.zip.
+    Records the redacted upload as a new version in {target_dir}/versions.
+
+    Only file contents the version store has not seen before are compressed
+    and written; unchanged files add a manifest entry pointing at their
+    existing blob.
 
     Args:
-        zip_source: BytesIO containing the zip file.
+        zip_source: Ingested archive, or a BytesIO containing the zip file.
         target_dir: Project directory to archive into.
     """
-    versions_dir = os.path.join(target_dir, CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
-    os.makedirs(versions_dir, exist_ok=True)
-
+    store = ProjectVersionStore(Path(target_dir) / CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f")
-    version_path = Path(versions_dir) / f"{timestamp}.zip"
-    zip_source.seek(0)
-    with zipfile.ZipFile(zip_source, "r") as source_archive:
-        accessor = ZipFileAccessor(source_archive)
-        project_root = accessor.get_project_root()
-        with atomic_zip_archive(version_path) as version_archive:
-            for member in source_archive.infolist():
-                if member.is_dir() or not member.filename.startswith(project_root):
-                    continue
-                relative_path = member.filename[len(project_root) :]
-                top_level = relative_path.split("/", 1)[0]
-                if (
-                    not relative_path
+    with _ingested_archive(zip_source) as archive:
+        version = store.add_version(
+            (
+                (relative_path, member.sha256, archive.staged_path(member.name))
+                for relative_path, member in archive.project_members()
+                if not (
+                    member.is_dir
                     or is_sensitive_project_file(relative_path)
-                    or top_level in GENERATED_PROJECT_PATHS
+                    or relative_path.split("/", 1)[0] in GENERATED_PROJECT_PATHS
                     or relative_path == CONSTANTS.PROJECT_INFO_FILE
-                ):
-                    continue
-                write_zip_bytes(
-                    version_archive,
-                    relative_path,
-                    accessor.read_binary(member.filename),
                 )
+            ),
+            version=timestamp,
+        )
 
-    logger.info("Archived redacted project version to %s", version_path)
+    pruned = store.prune(default_project_version_limit())
+    if pruned:
+        store.collect_garbage()
+    logger.info("Archived redacted project version %s", version)
 
 
 def _write_project_info(
@@ -679,7 +643,7 @@ def _write_project_info(
 
     Args:
         target_dir: Project directory.
-        zip_source: BytesIO containing the zip file.
+        zip_source: Ingested archive, or a BytesIO containing the zip file.
         description: Optional description string.
     """
     existing_info = existing_info or {}
@@ -712,7 +676,7 @@ def _extract_identity_from_zip(zip_source):
     Extracts digital_twin_name and credentials from a zip file.
 
     Args:
-        zip_source: BytesIO containing the zip file.
+        zip_source: Ingested archive, or a BytesIO containing the zip file.
 
     Returns:
         tuple: (digital_twin_name, credentials_dict)
@@ -743,15 +707,13 @@ def _read_archive_json(
     required: bool,
 ):
     """Read JSON from the archive's one canonical project root."""
-    zip_source.seek(0)
-    with zipfile.ZipFile(zip_source, "r") as archive:
-        accessor = ZipFileAccessor(archive)
-        path = accessor.get_project_root() + filename
-        if not accessor.file_exists(path):
+    with _ingested_archive(zip_source) as archive:
+        path = archive.get_project_root() + filename
+        if not archive.file_exists(path):
             if required:
                 raise ValueError(f"Missing required archive file: {filename}")
             return None
-        return json.loads(accessor.read_text(path))
+        return json.loads(archive.read_text(path))
 
 
 def _validate_project_name_matches_manifest(
@@ -1,13 +1,36 @@
-"""Provider-specific read-only cloud log fetchers."""
+"""
+Provider-specific read-only cloud log fetchers.
+
+A trace polls every provider until its timeout. Each provider is queried
+through a ``LogSession`` created once per trace: it builds its SDK client on
+the first poll and keeps an incremental cursor, so later polls only return
+events the trace has not delivered yet. Every poll is a single multi-source
+query per provider (see ``src.log_tracing.queries``).
+
+CloudWatch and Cloud Logging order by event time, and events can be ingested
+a little after their timestamp. Their cursors therefore re-read a short
+overlap window and drop events already delivered by id. Log Analytics rows
+are paged in ingestion order and each query resumes after the last row read.
+"""
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+import threading
+from typing import Hashable
 
 from src.core.observability import redact_sensitive
+from src.log_tracing.queries import (
+    kql_contains,
+    kql_datetime,
+    kql_string,
+    query_cloud_logging,
+    query_cloudwatch,
+    query_log_analytics,
+)
 from src.utils.gcp_utils import parse_gcp_service_account
 
 
@@ -27,6 +50,12 @@ class ProviderFetchResult:
     error: str | None = None
 
 
+LOG_CURSOR_OVERLAP_SECONDS = 30.0
+AZURE_ROWS_PER_QUERY = 500
+GCP_PAGE_SIZE = 500
+GCP_MAX_ENTRIES_PER_POLL = 2000
+
+
 def _layer(resource_name: str) -> str:
     normalized = resource_name.lower()
     if "l0" in normalized or "ingestion" in normalized:
@@ -44,181 +73,366 @@ def _layer(resource_name: str) -> str:
     return "L?"
 
 
-def fetch_aws_logs(
-    log_groups: dict[str, str],
-    trace_id: str,
-    since_ms: int,
-    credentials: dict,
-    *,
-    query_timeout_seconds: float = 15,
-) -> ProviderFetchResult:
-    try:
+class _EventCursor:
+    """
+    Lower time bound of the next query plus the events delivered after it.
+
+    ``advance`` moves the bound to the newest delivered event minus the
+    overlap and forgets ids older than the new bound, so memory stays
+    proportional to the overlap window rather than the trace.
+    """
+
+    def __init__(self, start: float, overlap_seconds: float = LOG_CURSOR_OVERLAP_SECONDS) -> None:
+        self.start = start
+        self.overlap_seconds = overlap_seconds
+        self._newest = start
+        self._delivered: dict[Hashable, float] = {}
+
+    def accept(self, event_id: Hashable, timestamp: float) -> bool:
+        """Record an event; return ``False`` if it was already delivered."""
+        if event_id in self._delivered:
+            return False
+        self._delivered[event_id] = timestamp
+        self._newest = max(self._newest, timestamp)
+        return True
+
+    def advance(self) -> None:
+        self.start = max(self.start, self._newest - self.overlap_seconds)
+        self._delivered = {
+            event_id: timestamp
+            for event_id, timestamp in self._delivered.items()
+            if timestamp >= self.start
+        }
+
+
+class LogSession(ABC):
+    """
+    Incremental log queries of one provider for the lifetime of one trace.
+
+    ``fetch`` is safe to call while an earlier fetch is still running (for
+    example after the caller stopped waiting for it): it then returns only
+    what the earlier fetch produced in the meantime instead of issuing a
+    second overlapping query.
+    """
+
+    provider = ""
+
+    def __init__(self) -> None:
+        self._query_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: list[LogEntry] = []
+
+    def fetch(self, *, query_timeout_seconds: float = 15) -> ProviderFetchResult:
+        error = None
+        if self._query_lock.acquire(blocking=False):
+            try:
+                entries, error = self._poll(query_timeout_seconds)
+            except Exception as exc:
+                entries, error = [], redact_sensitive(exc)
+            finally:
+                self._query_lock.release()
+            with self._pending_lock:
+                self._pending.extend(entries)
+        with self._pending_lock:
+            entries, self._pending = self._pending, []
+        return ProviderFetchResult(self.provider, entries=entries, error=error)
+
+    @abstractmethod
+    def _poll(self, query_timeout_seconds: float) -> tuple[list[LogEntry], str | None]:
+        """Run one query and return its new entries and an optional error."""
+
+
+class UnavailableLogSession(LogSession):
+    """Session for a provider whose log source is not configured."""
+
+    def __init__(self, provider: str, error: str) -> None:
+        super().__init__()
+        self.provider = provider
+        self.error = error
+
+    def _poll(self, query_timeout_seconds: float) -> tuple[list[LogEntry], str | None]:
+        return [], self.error
+
+
+class AwsLogSession(LogSession):
+    """One CloudWatch Logs Insights query across all twin log groups per poll."""
+
+    provider = "aws"
+
+    def __init__(
+        self,
+        log_groups: dict[str, str],
+        trace_id: str,
+        since_ms: int,
+        credentials: dict,
+        *,
+        query_timeout_seconds: float = 15,
+    ) -> None:
+        super().__init__()
+        self.trace_id = trace_id
+        self.credentials = credentials
+        self.query_timeout_seconds = query_timeout_seconds
+        self._layers: dict[str, str] = {}
+        for layer_name, log_group in sorted(log_groups.items()):
+            if log_group:
+                self._layers.setdefault(log_group, layer_name)
+        self._cursor = _EventCursor(since_ms / 1000)
+        self._client = None
+
+    def _create_client(self):
         import boto3
         from botocore.config import Config
 
         client_args = {
-            key: credentials[key]
+            key: self.credentials[key]
             for key in (
                 "aws_access_key_id",
                 "aws_secret_access_key",
                 "aws_session_token",
             )
-            if credentials.get(key)
+            if self.credentials.get(key)
         }
-        region = credentials.get("aws_region") or credentials.get("region_name")
+        region = self.credentials.get("aws_region") or self.credentials.get("region_name")
         if region:
             client_args["region_name"] = region
         client_args["config"] = Config(
-            connect_timeout=max(1, query_timeout_seconds),
-            read_timeout=max(1, query_timeout_seconds),
+            connect_timeout=max(1, self.query_timeout_seconds),
+            read_timeout=max(1, self.query_timeout_seconds),
             retries={"max_attempts": 2, "mode": "standard"},
         )
-        client = boto3.client("logs", **client_args)
-    except Exception as exc:
-        return ProviderFetchResult("aws", error=redact_sensitive(exc))
-
-    entries = []
-    failures = []
-    for layer_name, log_group in sorted(log_groups.items()):
-        if not log_group:
-            continue
-        try:
-            response = client.filter_log_events(
-                logGroupName=log_group,
-                startTime=since_ms,
-                filterPattern=f'"{trace_id}"',
-                limit=50,
-            )
-            function_name = log_group.rsplit("/", 1)[-1]
-            entries.extend(
-                LogEntry(
-                    timestamp=datetime.fromtimestamp(
-                        event["timestamp"] / 1000,
-                        tz=timezone.utc,
-                    ).isoformat(),
-                    message=redact_sensitive(event.get("message", "").strip()),
-                    layer=layer_name,
-                    provider="aws",
-                    function=function_name,
-                )
-                for event in response.get("events", [])
+        return boto3.client("logs", **client_args)
+
+    def _poll(self, query_timeout_seconds: float) -> tuple[list[LogEntry], str | None]:
+        if self._client is None:
+            self._client = self._create_client()
+        if not self._layers:
+            return [], None
+        records = query_cloudwatch(
+            self._client,
+            self._layers,
+            self.trace_id,
+            datetime.fromtimestamp(self._cursor.start, tz=timezone.utc),
+            datetime.now(timezone.utc),
+            timeout=query_timeout_seconds,
+        )
+        entries = [
+            LogEntry(
+                timestamp=record.timestamp.isoformat(),
+                message=redact_sensitive(record.message.strip()),
+                layer=self._layers.get(record.source, _layer(record.source)),
+                provider="aws",
+                function=record.source.rsplit("/", 1)[-1],
             )
-        except Exception as exc:
-            failures.append(f"{log_group}: {redact_sensitive(exc)}")
-    return ProviderFetchResult(
-        "aws",
-        entries=entries,
-        error="; ".join(failures) or None,
-    )
+            for record in records
+            if self._cursor.accept(record.record_id, record.timestamp.timestamp())
+        ]
+        self._cursor.advance()
+        return entries, None
 
 
-def fetch_azure_logs(
-    workspace_id: str,
-    trace_id: str,
-    credentials: dict,
-    started_at: datetime,
-    *,
-    query_timeout_seconds: float = 15,
-) -> ProviderFetchResult:
-    try:
+class AzureLogSession(LogSession):
+    """
+    Log Analytics queries that resume after the last ingested row.
+
+    Ingestion time is assigned per batch, so many rows can share one value.
+    Rows are therefore ordered by ``(ingestion time, TimeGenerated, _ItemId)``
+    and each query resumes strictly after the last key it read; a full page
+    of rows with one ingestion time cannot be returned again.
+    """
+
+    provider = "azure"
+
+    def __init__(
+        self,
+        workspace_id: str,
+        trace_id: str,
+        credentials: dict,
+        started_at: datetime,
+    ) -> None:
+        super().__init__()
+        self.workspace_id = workspace_id
+        self.trace_id = trace_id
+        self.credentials = credentials
+        self.started_at = started_at
+        self._after: tuple[datetime, datetime, str] | None = None
+        self._client = None
+
+    def _create_client(self):
         from azure.identity import ClientSecretCredential
         from azure.monitor.query import LogsQueryClient
 
         credential = ClientSecretCredential(
-            tenant_id=credentials.get("azure_tenant_id"),
-            client_id=credentials.get("azure_client_id"),
-            client_secret=credentials.get("azure_client_secret"),
+            tenant_id=self.credentials.get("azure_tenant_id"),
+            client_id=self.credentials.get("azure_client_id"),
+            client_secret=self.credentials.get("azure_client_secret"),
         )
-        client = LogsQueryClient(credential)
-        query = (
+        return LogsQueryClient(credential)
+
+    def _query(self) -> str:
+        if self._after is None:
+            resume = f"IngestedAt >= {kql_datetime(self.started_at)}"
+        else:
+            ingested, generated, item_id = (
+                kql_datetime(self._after[0]),
+                kql_datetime(self._after[1]),
+                kql_string(self._after[2]),
+            )
+            resume = (
+                f"IngestedAt > {ingested} or (IngestedAt == {ingested} and "
+                f"(Generated > {generated} or (Generated == {generated} "
+                f"and strcmp(ItemId, {item_id}) > 0)))"
+            )
+        # Keys are binned to microseconds so they compare equal to the
+        # Python datetimes the cursor keeps.
+        return (
             "union isfuzzy=true AppTraces, FunctionAppLogs "
-            f'| where Message contains "{trace_id}" '
-            "| project TimeGenerated, Message, OperationName "
-            "| order by TimeGenerated asc | take 100"
+            f"| where {kql_contains('Message', self.trace_id)} "
+            "| extend IngestedAt = bin(ingestion_time(), 1microsecond), "
+            "Generated = bin(TimeGenerated, 1microsecond), ItemId = tostring(_ItemId) "
+            f"| where {resume} "
+            "| project TimeGenerated, Message, OperationName, IngestedAt, Generated, ItemId "
+            "| order by IngestedAt asc, Generated asc, ItemId asc "
+            f"| take {AZURE_ROWS_PER_QUERY}"
         )
-        response = client.query_workspace(
-            workspace_id,
-            query,
-            timespan=(started_at, datetime.now(timezone.utc)),
-            server_timeout=max(1, int(query_timeout_seconds)),
+
+    def _poll(self, query_timeout_seconds: float) -> tuple[list[LogEntry], str | None]:
+        if self._client is None:
+            self._client = self._create_client()
+        rows, partial_error = query_log_analytics(
+            self._client,
+            self.workspace_id,
+            self._query(),
+            (self.started_at, datetime.now(timezone.utc)),
+            server_timeout=query_timeout_seconds,
         )
-        tables = getattr(response, "tables", None)
-        partial_error = None
-        if tables is None:
-            tables = getattr(response, "partial_data", [])
-            partial_error = getattr(response, "partial_error", None)
-        entries = [
-            LogEntry(
-                timestamp=(
-                    row[0].isoformat() if hasattr(row[0], "isoformat") else str(row[0])
-                ),
-                message=redact_sensitive(row[1]),
-                layer=_layer(str(row[2]) if len(row) > 2 else ""),
-                provider="azure",
-                function=str(row[2]) if len(row) > 2 else "",
+        entries = []
+        for row in rows:
+            operation = str(row[2]) if len(row) > 2 else ""
+            if len(row) > 5 and isinstance(row[3], datetime) and isinstance(row[4], datetime):
+                self._after = (row[3], row[4], str(row[5]))
+            entries.append(
+                LogEntry(
+                    timestamp=(
+                        row[0].isoformat() if hasattr(row[0], "isoformat") else str(row[0])
+                    ),
+                    message=redact_sensitive(row[1]),
+                    layer=_layer(operation),
+                    provider="azure",
+                    function=operation,
+                )
             )
-            for table in tables
-            for row in table.rows
-        ]
-        return ProviderFetchResult(
-            "azure",
-            entries=entries,
-            error=redact_sensitive(partial_error) if partial_error else None,
-        )
-    except Exception as exc:
-        return ProviderFetchResult("azure", error=redact_sensitive(exc))
+        # A full page means more rows are waiting; the next poll resumes
+        # after the last row of this one.
+        return entries, redact_sensitive(partial_error) if partial_error else None
 
 
-def fetch_gcp_logs(
-    project_id: str,
-    trace_id: str,
-    credentials: dict,
-    project_path: Path,
-    started_at: datetime,
-    *,
-    query_timeout_seconds: float = 15,
-) -> ProviderFetchResult:
-    try:
+class GcpLogSession(LogSession):
+    """Cloud Logging queries in ascending time order from the cursor."""
+
+    provider = "gcp"
+
+    def __init__(
+        self,
+        project_id: str,
+        trace_id: str,
+        credentials: dict,
+        project_path: Path,
+        started_at: datetime,
+    ) -> None:
+        super().__init__()
+        self.project_id = project_id
+        self.trace_id = trace_id
+        self.credentials = credentials
+        self.project_path = project_path
+        self._cursor = _EventCursor(
+            (started_at - timedelta(seconds=LOG_CURSOR_OVERLAP_SECONDS)).timestamp()
+        )
+        self._client = None
+
+    def _create_client(self):
         from google.cloud import logging as cloud_logging
 
-        credentials_input = credentials.get("gcp_credentials_file")
+        credentials_input = self.credentials.get("gcp_credentials_file")
         if not credentials_input:
             raise ValueError("GCP credentials are not configured")
         if not str(credentials_input).lstrip().startswith("{"):
             path = Path(credentials_input)
             if not path.is_absolute():
-                credentials_input = str(project_path / path)
+                credentials_input = str(self.project_path / path)
         _, _, parsed_credentials = parse_gcp_service_account(str(credentials_input))
-        client = cloud_logging.Client(
-            project=project_id,
+        return cloud_logging.Client(
+            project=self.project_id,
             credentials=parsed_credentials,
         )
-        cutoff = started_at - timedelta(seconds=30)
-        filter_value = (
-            '(resource.type="cloud_function" OR '
-            'resource.type="cloud_run_revision") '
-            f'AND (textPayload:"{trace_id}" OR jsonPayload.message:"{trace_id}") '
-            f'AND timestamp >= "{cutoff.isoformat()}"'
+
+    def _poll(self, query_timeout_seconds: float) -> tuple[list[LogEntry], str | None]:
+        if self._client is None:
+            self._client = self._create_client()
+        records = query_cloud_logging(
+            self._client,
+            self.trace_id,
+            datetime.fromtimestamp(self._cursor.start, tz=timezone.utc),
+            max_results=GCP_MAX_ENTRIES_PER_POLL,
+            page_size=GCP_PAGE_SIZE,
+            timeout=query_timeout_seconds,
         )
-        entries = []
-        for entry in client.list_entries(
-            filter_=filter_value,
-            max_results=50,
-            timeout=max(1, query_timeout_seconds),
-        ):
-            payload: Any = entry.payload
-            message = payload.get("message", payload) if isinstance(payload, dict) else payload
-            labels = entry.resource.labels if entry.resource else {}
-            resource_name = labels.get("function_name") or labels.get("service_name") or ""
-            entries.append(
-                LogEntry(
-                    timestamp=entry.timestamp.isoformat() if entry.timestamp else "",
-                    message=redact_sensitive(message or ""),
-                    layer=_layer(resource_name),
-                    provider="gcp",
-                    function=resource_name,
-                )
+        entries = [
+            LogEntry(
+                timestamp=record.timestamp.isoformat(),
+                message=redact_sensitive(record.message),
+                layer=_layer(record.source),
+                provider="gcp",
+                function=record.source,
             )
-        return ProviderFetchResult("gcp", entries=entries)
-    except Exception as exc:
-        return ProviderFetchResult("gcp", error=redact_sensitive(exc))
+            for record in records
+            if self._cursor.accept(record.record_id, record.timestamp.timestamp())
+        ]
+        self._cursor.advance()
+        return entries, None
+
+
+def fetch_aws_logs(
+    log_groups: dict[str, str],
+    trace_id: str,
+    since_ms: int,
+    credentials: dict,
+    *,
+    query_timeout_seconds: float = 15,
+) -> ProviderFetchResult:
+    """Run a single CloudWatch query; traces keep an ``AwsLogSession`` instead."""
+    return AwsLogSession(
+        log_groups,
+        trace_id,
+        since_ms,
+        credentials,
+        query_timeout_seconds=query_timeout_seconds,
+    ).fetch(query_timeout_seconds=query_timeout_seconds)
+
+
+def fetch_azure_logs(
+    workspace_id: str,
+    trace_id: str,
+    credentials: dict,
+    started_at: datetime,
+    *,
+    query_timeout_seconds: float = 15,
+) -> ProviderFetchResult:
+    """Run a single Log Analytics query; traces keep an ``AzureLogSession`` instead."""
+    return AzureLogSession(workspace_id, trace_id, credentials, started_at).fetch(
+        query_timeout_seconds=query_timeout_seconds
+    )
+
+
+def fetch_gcp_logs(
+    project_id: str,
+    trace_id: str,
+    credentials: dict,
+    project_path: Path,
+    started_at: datetime,
+    *,
+    query_timeout_seconds: float = 15,
+) -> ProviderFetchResult:
+    """Run a single Cloud Logging query; traces keep a ``GcpLogSession`` instead."""
+    return GcpLogSession(project_id, trace_id, credentials, project_path, started_at).fetch(
+        query_timeout_seconds=query_timeout_seconds
+    )
@@ -0,0 +1,204 @@
+"""
+Multi-source cloud log queries shared by log tracing and verification.
+
+Each provider is searched with one query per poll, however many functions
+log there; callers demultiplex the returned ``LogRecord`` objects by their
+``source``:
+
+- AWS: one CloudWatch Logs Insights query across all twin log groups
+  (Insights accepts at most ``INSIGHTS_MAX_LOG_GROUPS`` groups per query)
+- Azure: one KQL query over the Log Analytics workspace
+- GCP: one Cloud Logging filter across all function and Cloud Run resources
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import math
+import time
+from typing import Any, Iterable, Sequence
+
+INSIGHTS_MAX_LOG_GROUPS = 50
+INSIGHTS_MAX_ROWS = 10000
+INSIGHTS_POLL_SECONDS = 0.5
+_INSIGHTS_FAILED = {"Failed", "Cancelled", "Timeout", "Unknown"}
+GCP_FUNCTION_RESOURCES = ("cloud_function", "cloud_run_revision")
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    source: str
+    timestamp: datetime
+    message: str
+    record_id: str
+
+
+def _quoted(value: str) -> str:
+    """Double-quoted literal for Insights, KQL, and Cloud Logging filters."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def insights_query(pattern: str, limit: int = INSIGHTS_MAX_ROWS) -> str:
+    return (
+        "fields @timestamp, @message, @log, @ptr "
+        f"| filter @message like {_quoted(pattern)} "
+        f"| sort @timestamp asc | limit {limit}"
+    )
+
+
+def query_cloudwatch(
+    client,
+    log_groups: Iterable[str],
+    pattern: str,
+    start: datetime,
+    end: datetime,
+    *,
+    limit: int = INSIGHTS_MAX_ROWS,
+    timeout: float = 15,
+) -> list[LogRecord]:
+    """
+    Search all log groups with Logs Insights and return matches oldest first.
+
+    ``source`` is the log group name. Raises ``TimeoutError`` (after stopping
+    the queries) when Insights does not finish within ``timeout``.
+    """
+    groups = sorted({group for group in log_groups if group})
+    if not groups:
+        return []
+    query_ids = [
+        client.start_query(
+            logGroupNames=groups[offset : offset + INSIGHTS_MAX_LOG_GROUPS],
+            startTime=int(start.timestamp()),
+            endTime=math.ceil(end.timestamp()),
+            queryString=insights_query(pattern, limit),
+            limit=limit,
+        )["queryId"]
+        for offset in range(0, len(groups), INSIGHTS_MAX_LOG_GROUPS)
+    ]
+    deadline = time.monotonic() + timeout
+    records: list[LogRecord] = []
+    pending = list(query_ids)
+    while pending:
+        for query_id in list(pending):
+            response = client.get_query_results(queryId=query_id)
+            status = response.get("status")
+            if status == "Complete":
+                records.extend(_insights_record(row) for row in response.get("results", []))
+                pending.remove(query_id)
+            elif status in _INSIGHTS_FAILED:
+                raise RuntimeError(f"CloudWatch Logs Insights query {status.lower()}")
+        if not pending:
+            break
+        if time.monotonic() >= deadline:
+            for query_id in pending:
+                try:
+                    client.stop_query(queryId=query_id)
+                except Exception:
+                    pass
+            raise TimeoutError("CloudWatch Logs Insights query timed out")
+        time.sleep(INSIGHTS_POLL_SECONDS)
+    return sorted(records, key=lambda record: record.timestamp)
+
+
+def _insights_record(row: Sequence[dict]) -> LogRecord:
+    fields = {field.get("field"): field.get("value", "") for field in row}
+    # @log is "<account id>:<log group name>".
+    source = fields.get("@log", "").split(":", 1)[-1]
+    timestamp = datetime.strptime(
+        fields.get("@timestamp", "1970-01-01 00:00:00.000"),
+        "%Y-%m-%d %H:%M:%S.%f",
+    ).replace(tzinfo=timezone.utc)
+    message = fields.get("@message", "")
+    return LogRecord(
+        source=source,
+        timestamp=timestamp,
+        message=message,
+        record_id=fields.get("@ptr") or f"{source}:{timestamp.isoformat()}:{message}",
+    )
+
+
+def kql_contains(column: str, pattern: str) -> str:
+    return f"{column} contains {_quoted(pattern)}"
+
+
+def kql_datetime(value: datetime) -> str:
+    return f"datetime({value.astimezone(timezone.utc).isoformat()})"
+
+
+def kql_string(value: str) -> str:
+    return _quoted(value)
+
+
+def query_log_analytics(
+    client,
+    workspace_id: str,
+    query: str,
+    timespan: Any,
+    *,
+    server_timeout: float = 15,
+) -> tuple[list[Any], str | None]:
+    """Run one KQL query; return all rows and the partial-result error, if any."""
+    response = client.query_workspace(
+        workspace_id,
+        query,
+        timespan=timespan,
+        server_timeout=max(1, int(server_timeout)),
+    )
+    tables = getattr(response, "tables", None)
+    partial_error = None
+    if tables is None:
+        tables = getattr(response, "partial_data", [])
+        partial_error = getattr(response, "partial_error", None)
+    rows = [row for table in tables or [] for row in table.rows]
+    return rows, str(partial_error) if partial_error else None
+
+
+def cloud_logging_filter(pattern: str, since: datetime) -> str:
+    """Filter matching ``pattern`` in any function or Cloud Run revision log."""
+    resources = " OR ".join(
+        f'resource.type="{resource}"' for resource in GCP_FUNCTION_RESOURCES
+    )
+    literal = _quoted(pattern)
+    return (
+        f"({resources}) "
+        f"AND (textPayload:{literal} OR jsonPayload.message:{literal}) "
+        f'AND timestamp >= "{since.astimezone(timezone.utc).isoformat()}"'
+    )
+
+
+def query_cloud_logging(
+    client,
+    pattern: str,
+    since: datetime,
+    *,
+    max_results: int,
+    page_size: int | None = None,
+    timeout: float = 15,
+) -> list[LogRecord]:
+    """Search function logs oldest first; ``source`` is the function or service."""
+    from google.cloud import logging as cloud_logging
+
+    records = []
+    for entry in client.list_entries(
+        filter_=cloud_logging_filter(pattern, since),
+        order_by=cloud_logging.ASCENDING,
+        page_size=page_size or max_results,
+        max_results=max_results,
+        timeout=max(1, timeout),
+    ):
+        payload: Any = entry.payload
+        message = payload.get("message", payload) if isinstance(payload, dict) else payload
+        labels = entry.resource.labels if entry.resource else {}
+        source = labels.get("function_name") or labels.get("service_name") or ""
+        timestamp = entry.timestamp or since
+        records.append(
+            LogRecord(
+                source=source,
+                timestamp=timestamp,
+                message=str(message or ""),
+                record_id=getattr(entry, "insert_id", None)
+                or f"{source}:{timestamp.isoformat()}:{message}",
+            )
+        )
+    return records
@@ -15,10 +15,12 @@ from src.core.config_loader import ProjectConfigLoader, normalize_provider_name
 from src.core.observability import redact_sensitive, redact_structure
 from src.iot_device_simulator.sender import send_test_message
 from src.log_tracing.fetchers import (
+    AwsLogSession,
+    AzureLogSession,
+    GcpLogSession,
+    LogSession,
     ProviderFetchResult,
-    fetch_aws_logs,
-    fetch_azure_logs,
-    fetch_gcp_logs,
+    UnavailableLogSession,
 )
 from src.log_tracing.registry import TraceRegistry
 from src.runtime_outputs import load_terraform_outputs
@@ -110,7 +112,6 @@ class LogTraceService:
         started_at = datetime.now(timezone.utc)
         started_monotonic = time.monotonic()
         last_heartbeat = started_monotonic
-        seen: set[tuple] = set()
         reported_provider_errors: set[str] = set()
         had_provider_errors = False
         total_logs = 0
@@ -153,7 +154,19 @@ class LogTraceService:
                 )
                 return
 
-            providers = providers_to_query(bundle.config.providers)
+            # Sessions keep their clients and cursors for the whole trace, so
+            # each poll only returns events that were not delivered before.
+            sessions = {
+                provider: self._create_session(
+                    provider,
+                    trace_id,
+                    started_at,
+                    bundle.credentials,
+                    outputs,
+                    bundle.project_path,
+                )
+                for provider in sorted(providers_to_query(bundle.config.providers))
+            }
             deadline = started_monotonic + self.timeout_seconds
             first_iteration = True
             while first_iteration or time.monotonic() < deadline:
@@ -163,14 +176,10 @@ class LogTraceService:
                     *(
                         self._fetch_with_timeout(
                             provider,
-                            trace_id,
-                            started_at,
-                            bundle.credentials,
-                            outputs,
-                            bundle.project_path,
+                            session,
                             timeout=min(self.provider_timeout_seconds, remaining),
                         )
-                        for provider in sorted(providers)
+                        for provider, session in sessions.items()
                     )
                 )
                 entries = []
@@ -193,15 +202,6 @@ class LogTraceService:
                         )
 
                 for entry in sorted(entries, key=lambda item: item.timestamp):
-                    key = (
-                        entry.provider,
-                        entry.function,
-                        entry.timestamp,
-                        entry.message,
-                    )
-                    if key in seen:
-                        continue
-                    seen.add(key)
                     total_logs += 1
                     payload = asdict(entry)
                     payload["prefix"] = f"[{entry.layer}-{entry.provider.upper()}]"
@@ -250,26 +250,13 @@ class LogTraceService:
     async def _fetch_with_timeout(
         self,
         provider: str,
-        trace_id: str,
-        started_at: datetime,
-        credentials: dict,
-        outputs: dict,
-        project_path,
+        session: LogSession,
         *,
         timeout: float,
     ) -> ProviderFetchResult:
         try:
             return await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._fetch_provider,
-                    provider,
-                    trace_id,
-                    started_at,
-                    credentials,
-                    outputs,
-                    project_path,
-                    timeout,
-                ),
+                asyncio.to_thread(self._fetch_provider, session, timeout),
                 timeout=timeout,
             )
         except TimeoutError:
@@ -278,33 +265,35 @@ class LogTraceService:
             return ProviderFetchResult(provider, error=redact_sensitive(exc))
 
     @staticmethod
-    def _fetch_provider(
+    def _fetch_provider(session: LogSession, query_timeout: float) -> ProviderFetchResult:
+        return session.fetch(query_timeout_seconds=query_timeout)
+
+    def _create_session(
+        self,
         provider: str,
         trace_id: str,
         started_at: datetime,
         credentials: dict,
         outputs: dict,
         project_path,
-        query_timeout: float,
-    ) -> ProviderFetchResult:
+    ) -> LogSession:
         if provider == "aws":
-            return fetch_aws_logs(
+            return AwsLogSession(
                 outputs.get("aws_cloudwatch_log_groups", {}),
                 trace_id,
                 int(started_at.timestamp() * 1000),
                 credentials.get("aws", {}),
-                query_timeout_seconds=query_timeout,
+                query_timeout_seconds=self.provider_timeout_seconds,
             )
         if provider == "azure":
             workspace_id = outputs.get("azure_log_analytics_workspace_id")
             if not workspace_id:
-                return ProviderFetchResult("azure", error="Workspace ID not available")
-            return fetch_azure_logs(
+                return UnavailableLogSession("azure", "Workspace ID not available")
+            return AzureLogSession(
                 workspace_id,
                 trace_id,
                 credentials.get("azure", {}),
                 started_at,
-                query_timeout_seconds=query_timeout,
             )
         if provider == "gcp":
             gcp_credentials = credentials.get("gcp", {})
@@ -312,16 +301,15 @@ class LogTraceService:
                 "gcp_project_id"
             )
             if not project_id:
-                return ProviderFetchResult("gcp", error="Project ID not available")
-            return fetch_gcp_logs(
+                return UnavailableLogSession("gcp", "Project ID not available")
+            return GcpLogSession(
                 project_id,
                 trace_id,
                 gcp_credentials,
                 project_path,
                 started_at,
-                query_timeout_seconds=query_timeout,
             )
-        return ProviderFetchResult(provider, error="Unsupported provider")
+        return UnavailableLogSession(provider, "Unsupported provider")
 
     @staticmethod
     def _event(event: str, data: dict) -> dict:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
@@ -18,6 +18,7 @@ import file_manager
 from src.core.project_storage import ProjectStorage
 from src.core.secure_files import atomic_write_private_bytes
 from src.core.workspace import EphemeralWorkspace, sync_runtime_outputs
+from src.project_archive.ingestion import IngestedArchive
 from src.runtime_state import RuntimeStateStore
 
 
@@ -74,10 +75,32 @@ class OperationPackageStore:
         )
         self.ttl = timedelta(seconds=ttl_seconds)
 
-    def stage(self, project_name: str, archive: bytes) -> StagedOperationPackage:
-        """Extract one validated package and return an opaque operation token."""
+    def stage(
+        self,
+        project_name: str,
+        archive: bytes | IngestedArchive,
+    ) -> StagedOperationPackage:
+        """Extract one validated package and return an opaque operation token.
+
+        ``archive`` may already be ingested; the caller then keeps ownership.
+        """
         safe_name = self.project_storage.context(project_name).project_name
-        warnings = file_manager.validate_deployment_operation_archive(archive)
+        # Validation and extraction share one ingestion of the archive.
+        with (
+            nullcontext(archive)
+            if isinstance(archive, IngestedArchive)
+            else file_manager.ingest_project_archive(archive)
+        ) as ingested:
+            warnings = file_manager.validate_deployment_operation_archive(ingested)
+            token, expires_at = self._extract(safe_name, ingested)
+        return StagedOperationPackage(
+            project_name=safe_name,
+            token=token,
+            expires_at=expires_at,
+            warnings=list(warnings),
+        )
+
+    def _extract(self, safe_name: str, archive) -> tuple[str, datetime]:
         self._ensure_root()
         self.cleanup_expired()
         token = secrets.token_urlsafe(32)
@@ -110,12 +133,7 @@ class OperationPackageStore:
         except Exception:
             shutil.rmtree(package_path, ignore_errors=True)
             raise
-        return StagedOperationPackage(
-            project_name=safe_name,
-            token=token,
-            expires_at=expires_at,
-            warnings=list(warnings),
-        )
+        return token, expires_at
 
     @contextmanager
     def acquire(self, project_name: str, token: str) -> Iterator[Path]:
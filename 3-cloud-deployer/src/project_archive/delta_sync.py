@@ -0,0 +1,163 @@
+"""
+Delta synchronization of generated project packages.
+
+The orchestration backend regenerates the complete project package for
+every deploy, but between redeploys most of it (processors, scene GLBs,
+unchanged configs) is byte-identical to a version the Deployer already
+stores. The sync protocol avoids sending those bytes again:
+
+1. The backend sends a manifest of ``(path, sha256, size)`` entries.
+2. The Deployer answers with the digests its version store lacks.
+3. The backend uploads a ZIP holding only those files plus the manifest.
+
+``assemble_project_archive`` rebuilds the full package from stored blobs
+and the uploaded delta. The result goes through the normal staging path,
+so validation and the atomic project swap are unchanged. Credential files
+are never stored as version blobs and are therefore always part of the
+delta.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import io
+import re
+from typing import Iterable
+import zipfile
+
+from src.core.deterministic_zip import (
+    PrecompressedZipMember,
+    compress_zip_member,
+    write_precompressed_members,
+)
+from src.core.version_store import ProjectVersionStore
+from src.project_archive.policy import (
+    MAX_MEMBERS,
+    MAX_TOTAL_UNCOMPRESSED_BYTES,
+    ArchiveLimitExceeded,
+    validate_archive,
+)
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    path: str
+    sha256: str
+    size: int
+
+
+class MissingProjectBlobs(ValueError):
+    """Raised when the delta omits content the version store no longer has."""
+
+    error_code = "PACKAGE_CONTENT_MISSING"
+
+    def __init__(self, digests: list[str]) -> None:
+        super().__init__(
+            f"{len(digests)} file(s) of the sync manifest are neither uploaded nor stored"
+        )
+        self.digests = digests
+
+
+def parse_manifest(entries: Iterable[dict]) -> list[ManifestEntry]:
+    """Validate a sync manifest and return its entries in package order."""
+    manifest = []
+    paths = set()
+    total_size = 0
+    for entry in entries:
+        path = entry.get("path")
+        digest = entry.get("sha256")
+        size = entry.get("size")
+        if not isinstance(path, str) or not path or path.endswith("/"):
+            raise ValueError("Sync manifest contains an invalid path")
+        if not isinstance(digest, str) or not _DIGEST.match(digest):
+            raise ValueError(f"Sync manifest has an invalid digest for {path}")
+        if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+            raise ValueError(f"Sync manifest has an invalid size for {path}")
+        if path in paths:
+            raise ValueError(f"Duplicate path in sync manifest: {path}")
+        paths.add(path)
+        total_size += size
+        manifest.append(ManifestEntry(path=path, sha256=digest, size=size))
+    if not manifest:
+        raise ValueError("Sync manifest is empty")
+    if len(manifest) > MAX_MEMBERS:
+        raise ArchiveLimitExceeded(f"Sync manifest exceeds {MAX_MEMBERS} files")
+    if total_size > MAX_TOTAL_UNCOMPRESSED_BYTES:
+        raise ArchiveLimitExceeded("Sync manifest exceeds the uncompressed-size limit")
+    return manifest
+
+
+def missing_digests(
+    store: ProjectVersionStore,
+    manifest: list[ManifestEntry],
+) -> list[str]:
+    """Return the manifest digests the store cannot supply, in manifest order."""
+    missing = []
+    for entry in manifest:
+        if entry.sha256 not in missing and not store.has_blob(entry.sha256):
+            missing.append(entry.sha256)
+    return missing
+
+
+def assemble_project_archive(
+    store: ProjectVersionStore,
+    manifest: list[ManifestEntry],
+    delta: bytes,
+) -> bytes:
+    """
+    Rebuild the full project package from stored blobs and an uploaded delta.
+
+    Raises:
+        MissingProjectBlobs: If content is neither in the delta nor stored
+            (for example, a blob was garbage-collected since planning)
+        ArchivePolicyError: If the delta violates the archive policy
+        ValueError: If delta content does not match the manifest
+    """
+    uploaded = _read_delta(delta, manifest)
+    members: list[PrecompressedZipMember] = []
+    missing: list[str] = []
+    for entry in manifest:
+        content = uploaded.get(entry.path)
+        if content is not None:
+            members.append(compress_zip_member(entry.path, content))
+        elif store.has_blob(entry.sha256):
+            member = store.zip_member(entry.path, entry.sha256)
+            if len(member.content) != entry.size:
+                raise ValueError(f"Sync manifest size does not match {entry.path}")
+            members.append(member)
+        elif entry.sha256 not in missing:
+            missing.append(entry.sha256)
+    if missing:
+        raise MissingProjectBlobs(missing)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        write_precompressed_members(archive, members)
+    return buffer.getvalue()
+
+
+def _read_delta(delta: bytes, manifest: list[ManifestEntry]) -> dict[str, bytes]:
+    expected = {entry.path: entry for entry in manifest}
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(delta), "r")
+    except zipfile.BadZipFile as exc:
+        raise ValueError("Invalid ZIP archive") from exc
+    uploaded = {}
+    with archive:
+        validate_archive(archive)
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            entry = expected.get(info.filename)
+            if entry is None:
+                raise ValueError(f"Delta contains a file outside the manifest: {info.filename}")
+            content = archive.read(info)
+            if len(content) != entry.size or (
+                hashlib.sha256(content).hexdigest() != entry.sha256
+            ):
+                raise ValueError(f"Delta content does not match the manifest: {info.filename}")
+            uploaded[info.filename] = content
+    return uploaded
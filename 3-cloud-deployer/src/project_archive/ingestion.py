@@ -0,0 +1,223 @@
+"""
+Single-pass ingestion of uploaded project archives.
+
+An upload used to be buffered in memory and reopened as a ``ZipFile`` by
+every consumer: validation, manifest and identity lookups, extraction, and
+version archiving each parsed the central directory and decompressed the
+members they needed again. Ingestion reads the central directory once,
+checks it against the archive policy once, and decompresses every member
+exactly once into a private staging directory while hashing it.
+
+The resulting ``IngestedArchive`` is the member index all later steps read
+from. It implements the validation ``FileAccessor`` protocol, so
+``src.validation.core`` checks run against staged files, and project
+extraction copies staged files instead of inflating the archive again.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import io
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import BinaryIO, Iterator
+import zipfile
+
+from src.project_archive.policy import (
+    ArchiveLimitExceeded,
+    MAX_COMPRESSED_ARCHIVE_BYTES,
+    MAX_MEMBER_BYTES,
+    UPLOAD_READ_CHUNK_BYTES,
+    validate_archive,
+)
+from src.validation.accessors import find_project_root, validate_project_boundary
+
+# Small text members (the JSON configs) are read by several validators.
+_MAX_CACHED_TEXT_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """One archive entry as recorded in the member index."""
+
+    name: str
+    is_dir: bool
+    size: int
+    sha256: str | None
+
+
+class IngestedArchive:
+    """Member index and staged contents of one ingested archive."""
+
+    def __init__(
+        self,
+        root: Path,
+        members: dict[str, ArchiveMember],
+        project_root: str,
+    ) -> None:
+        self._root = root
+        self._members_dir = root / "members"
+        self.members = members
+        self.project_root = project_root
+        self._files = list(members)
+        self._text_cache: dict[str, str] = {}
+
+    def __enter__(self) -> "IngestedArchive":
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    # FileAccessor protocol -------------------------------------------------
+
+    def list_files(self) -> list[str]:
+        return self._files
+
+    def file_exists(self, path: str) -> bool:
+        return path in self.members
+
+    def read_text(self, path: str) -> str:
+        cached = self._text_cache.get(path)
+        if cached is None:
+            cached = self.read_binary(path).decode("utf-8")
+            if len(cached) <= _MAX_CACHED_TEXT_BYTES:
+                self._text_cache[path] = cached
+        return cached
+
+    def read_binary(self, path: str) -> bytes:
+        """Read file contents as bytes."""
+        return self.staged_path(path).read_bytes()
+
+    def get_project_root(self) -> str:
+        return self.project_root
+
+    # Index access ----------------------------------------------------------
+
+    def staged_path(self, path: str) -> Path:
+        """Return the staged copy of one file member."""
+        member = self.members.get(path)
+        if member is None or member.is_dir:
+            raise FileNotFoundError(f"File not found in ZIP: {path}")
+        return self._members_dir.joinpath(*path.rstrip("/").split("/"))
+
+    def digest(self, path: str) -> str:
+        """Return the SHA-256 of one file member's content."""
+        member = self.members.get(path)
+        if member is None or member.sha256 is None:
+            raise FileNotFoundError(f"File not found in ZIP: {path}")
+        return member.sha256
+
+    def project_members(self) -> Iterator[tuple[str, ArchiveMember]]:
+        """Yield ``(path relative to the project root, member)`` in archive order."""
+        root_entry = self.project_root.rstrip("/")
+        for member in self.members.values():
+            name = member.name.rstrip("/")
+            if self.project_root and name == root_entry:
+                continue
+            relative_name = name[len(self.project_root):] if self.project_root else name
+            if relative_name:
+                yield relative_name, member
+
+
+def ingest_archive(zip_source, *, work_dir: Path | str | None = None) -> IngestedArchive:
+    """
+    Validate and stage one archive; close the result to remove the staging files.
+
+    ``zip_source`` may be raw bytes, a path, or a seekable binary stream such
+    as an upload already spooled to disk; none of them is copied. Staged
+    members live in a private temporary directory below ``work_dir``
+    (default: the system temp dir). Pass the destination's parent so that
+    later copies stay on one filesystem.
+
+    Raises:
+        ArchivePolicyError: If the archive violates the archive policy
+        ValueError: If the project root is ambiguous or the ZIP is unreadable
+    """
+    if work_dir is not None:
+        Path(work_dir).mkdir(parents=True, exist_ok=True)
+    root = Path(tempfile.mkdtemp(prefix=".archive-ingest-", dir=work_dir))
+    try:
+        with _open_source(zip_source) as source:
+            try:
+                archive = zipfile.ZipFile(source, "r")
+            except zipfile.BadZipFile as exc:
+                raise ValueError("Invalid ZIP archive") from exc
+            with archive:
+                validate_archive(archive)
+                infos = archive.infolist()
+                names = [info.filename for info in infos]
+                project_root = find_project_root(names)
+                validate_project_boundary(names, project_root)
+                members_dir = root / "members"
+                members_dir.mkdir()
+                members = {
+                    info.filename: _stage_member(archive, info, members_dir)
+                    for info in infos
+                }
+        return IngestedArchive(root, members, project_root)
+    except BaseException:
+        shutil.rmtree(root, ignore_errors=True)
+        raise
+
+
+@contextmanager
+def _open_source(zip_source) -> Iterator[BinaryIO]:
+    if isinstance(zip_source, bytes):
+        _check_compressed_size(len(zip_source))
+        yield io.BytesIO(zip_source)
+    elif isinstance(zip_source, (str, os.PathLike)):
+        source_path = Path(zip_source)
+        _check_compressed_size(source_path.stat().st_size)
+        with source_path.open("rb") as source:
+            yield source
+    elif hasattr(zip_source, "read") and hasattr(zip_source, "seek"):
+        _check_compressed_size(zip_source.seek(0, os.SEEK_END))
+        zip_source.seek(0)
+        try:
+            yield zip_source
+        finally:
+            zip_source.seek(0)
+    else:
+        raise TypeError("zip_source must be bytes, a path, or a seekable binary stream")
+
+
+def _check_compressed_size(size: int) -> None:
+    if size > MAX_COMPRESSED_ARCHIVE_BYTES:
+        raise ArchiveLimitExceeded("ZIP exceeds the 100MB compressed-size limit")
+
+
+def _stage_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    members_dir: Path,
+) -> ArchiveMember:
+    target = members_dir.joinpath(*info.filename.rstrip("/").split("/"))
+    if info.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        return ArchiveMember(name=info.filename, is_dir=True, size=0, sha256=None)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    # The staging root is private (mkdtemp), so credential files staged here
+    # are not readable by other users; extraction decides final permissions.
+    with archive.open(info, "r") as source, target.open("xb") as destination:
+        while chunk := source.read(UPLOAD_READ_CHUNK_BYTES):
+            size += len(chunk)
+            if size > MAX_MEMBER_BYTES:
+                raise ValueError("ZIP entry exceeds the per-file read limit")
+            digest.update(chunk)
+            destination.write(chunk)
+    return ArchiveMember(
+        name=info.filename,
+        is_dir=False,
+        size=size,
+        sha256=digest.hexdigest(),
+    )
@@ -35,9 +35,12 @@ def validate_archive(zf: zipfile.ZipFile) -> None:
         )
 
     names: set[str] = set()
+    file_names: set[str] = set()
     total_size = 0
     for member in members:
         _validate_member_path(member.filename, names)
+        if not member.is_dir():
+            file_names.add(PurePosixPath(member.filename).as_posix())
         _validate_member_type(member)
         if member.flag_bits & 0x1:
             raise ArchivePolicyError("Encrypted ZIP entries are not supported")
@@ -56,6 +59,7 @@ def validate_archive(zf: zipfile.ZipFile) -> None:
             member.file_size / max(1, member.compress_size) > MAX_COMPRESSION_RATIO
         ):
             raise ArchiveLimitExceeded("ZIP entry has an unsafe compression ratio")
+    _validate_file_directory_conflicts(names, file_names)
 
 
 def _validate_compressed_size(zf: zipfile.ZipFile) -> None:
@@ -84,6 +88,16 @@ def _validate_member_path(raw_name: str, names: set[str]) -> None:
     names.add(canonical)
 
 
+def _validate_file_directory_conflicts(names: set[str], file_names: set[str]) -> None:
+    """Reject archives that use one path both as a file and as a directory."""
+    for name in names:
+        for parent in PurePosixPath(name).parents:
+            if parent.as_posix() in file_names:
+                raise ArchivePolicyError(
+                    "ZIP contains a path used both as a file and as a directory"
+                )
+
+
 def _validate_member_type(member: zipfile.ZipInfo) -> None:
     mode = (member.external_attr >> 16) & 0xFFFF
     if stat.S_ISLNK(mode):
@@ -21,7 +21,12 @@ from typing import Optional, Tuple, List
 from src.function_registry import (
     Layer, get_by_layer, get_l0_for_config
 )
-from src.core.deterministic_zip import write_zip_bytes, write_zip_file
+from src.core.deterministic_zip import (
+    precompressed_tree_members,
+    write_precompressed_members,
+    write_zip_bytes,
+    write_zip_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -100,15 +105,18 @@ def _add_shared_files(zf: zipfile.ZipFile, azure_functions_dir: Path) -> None:
     # Add _shared directory if exists
     shared_dir = azure_functions_dir / "_shared"
     if shared_dir.exists() and shared_dir.is_dir():
+        shared_files = []
         for root, directories, files in os.walk(shared_dir):
             directories.sort()
             for file in sorted(files):
                 # Skip __pycache__
                 if "__pycache__" in root or file.endswith(".pyc"):
                     continue
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(azure_functions_dir)
-                write_zip_file(zf, file_path, arcname)
+                shared_files.append(Path(root) / file)
+        # Identical across every bundle: raw-copy members compressed once per digest
+        write_precompressed_members(
+            zf, precompressed_tree_members(shared_dir, "_shared", shared_files)
+        )
 
 
 def _clean_function_app_imports(content: str) -> str:
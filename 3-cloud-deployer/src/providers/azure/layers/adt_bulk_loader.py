@@ -0,0 +1,342 @@
+"""
+Bulk upload of DTDL models, twins, and relationships to Azure Digital Twins.
+
+The data plane has no batch endpoint for twins or relationships, so the
+loader issues their upserts on a bounded thread pool, ordered by the
+dependency graph of the hierarchy:
+
+- models come first; only models the instance does not have yet are created,
+  in batches ordered so that every model follows the models it references
+- twins are upserted concurrently once the models exist
+- a relationship is upserted as soon as both of its twins were attempted
+
+Twins whose content digest matches the previous upload and that still exist
+in the instance are not sent again. The digests are recorded in
+``terraform/adt-upload.json`` next to the project's Terraform state.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+from azure.core.exceptions import (
+    AzureError,
+    ClientAuthenticationError,
+    HttpResponseError,
+)
+
+from src.core.secure_files import atomic_write_private_bytes
+from src.providers.terraform.runtime_outcome import RuntimeRun
+
+logger = logging.getLogger(__name__)
+
+ADT_UPLOAD_RECORD_FILE_NAME = "adt-upload.json"
+ADT_UPLOAD_SCHEMA_VERSION = "adt-upload.v1"
+ADT_MODEL_BATCH_SIZE = 250
+DEFAULT_ADT_UPLOAD_WORKERS = 8
+_TWIN_IDS_QUERY = "SELECT T.$dtId FROM DIGITALTWINS T"
+
+
+def default_adt_upload_workers() -> int:
+    configured = os.environ.get("DEPLOYER_ADT_UPLOAD_WORKERS")
+    if configured:
+        workers = int(configured)
+        if workers <= 0:
+            raise ValueError("DEPLOYER_ADT_UPLOAD_WORKERS must be positive")
+        return workers
+    return DEFAULT_ADT_UPLOAD_WORKERS
+
+
+@dataclass
+class AdtUploadReport:
+    """Counts and wall time of one hierarchy upload."""
+
+    models_created: int = 0
+    models_existing: int = 0
+    twins_upserted: int = 0
+    twins_unchanged: int = 0
+    relationships_upserted: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Successful twin and relationship upserts per second."""
+        upserts = self.twins_upserted + self.relationships_upserted
+        return upserts / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.models_created} models created ({self.models_existing} existing), "
+            f"{self.twins_upserted} twins and {self.relationships_upserted} relationships "
+            f"upserted in {self.seconds:.1f}s ({self.throughput:.1f}/s), "
+            f"{self.twins_unchanged} unchanged twins skipped"
+        )
+
+
+def twin_digest(twin: dict) -> str:
+    encoded = json.dumps(twin, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def upload_record_path(project_path: str | Path) -> Path:
+    return Path(project_path) / "terraform" / ADT_UPLOAD_RECORD_FILE_NAME
+
+
+def load_upload_record(path: Path) -> dict[str, str]:
+    """Return the twin digests of the last upload, or ``{}`` when unusable."""
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(record, dict)
+        or record.get("schema_version") != ADT_UPLOAD_SCHEMA_VERSION
+        or not isinstance(record.get("twins"), dict)
+    ):
+        return {}
+    return record["twins"]
+
+
+def save_upload_record(path: Path, twins: dict[str, str]) -> None:
+    # The record belongs next to the Terraform state; without a terraform
+    # directory there is no deployment to remember it for.
+    if not path.parent.is_dir():
+        return
+    payload = {"schema_version": ADT_UPLOAD_SCHEMA_VERSION, "twins": twins}
+    atomic_write_private_bytes(
+        path,
+        json.dumps(payload, indent=2, sort_keys=True).encode("utf-8"),
+    )
+
+
+def order_models(models: list[dict]) -> list[dict]:
+    """
+    Order models so each follows the models it references.
+
+    A reference is any string value (``extends``, component and relationship
+    schemas or targets) equal to the ``@id`` of another model in the batch.
+    Models in a reference cycle keep their input order; ADT reports the cycle.
+    """
+    ids = {model.get("@id") for model in models}
+    dependencies = {
+        index: _referenced_ids(model, ids) - {model.get("@id")}
+        for index, model in enumerate(models)
+    }
+    ordered: list[dict] = []
+    placed: set[str] = set()
+    remaining = list(range(len(models)))
+    while remaining:
+        ready = [index for index in remaining if dependencies[index] <= placed]
+        if not ready:
+            ready = remaining
+        for index in ready:
+            ordered.append(models[index])
+            placed.add(models[index].get("@id"))
+        remaining = [index for index in remaining if index not in set(ready)]
+    return ordered
+
+
+def _referenced_ids(value: Any, ids: set) -> set[str]:
+    if isinstance(value, str):
+        return {value} if value in ids else set()
+    if isinstance(value, dict):
+        return {
+            ref
+            for key, item in value.items()
+            if key != "@id"
+            for ref in _referenced_ids(item, ids)
+        }
+    if isinstance(value, list):
+        return {ref for item in value for ref in _referenced_ids(item, ids)}
+    return set()
+
+
+def upload_hierarchy(
+    client,
+    hierarchy: dict,
+    project_path: str | Path,
+    run: RuntimeRun,
+    *,
+    workers: int | None = None,
+) -> AdtUploadReport:
+    """
+    Upload the models, twins, and relationships of an Azure hierarchy.
+
+    Model failures raise. Twin and relationship failures are collected on
+    ``run`` so the rest of the graph is still uploaded.
+    """
+    started = perf_counter()
+    report = AdtUploadReport()
+    _create_missing_models(client, hierarchy.get("models", []), report)
+
+    twins = hierarchy.get("twins", [])
+    relationships = hierarchy.get("relationships", [])
+    record_path = upload_record_path(project_path)
+    previous = load_upload_record(record_path)
+    digests = {twin.get("$dtId", "unknown"): twin_digest(twin) for twin in twins}
+    unchanged = _unchanged_twins(client, previous, digests)
+    report.twins_unchanged = sum(
+        1 for twin in twins if twin.get("$dtId", "unknown") in unchanged
+    )
+
+    uploaded = _upsert_graph(
+        client,
+        [twin for twin in twins if twin.get("$dtId", "unknown") not in unchanged],
+        relationships,
+        run,
+        report,
+        workers or default_adt_upload_workers(),
+    )
+    save_upload_record(
+        record_path,
+        {
+            twin_id: digest
+            for twin_id, digest in digests.items()
+            if twin_id in unchanged or twin_id in uploaded
+        },
+    )
+    report.seconds = perf_counter() - started
+    return report
+
+
+def _create_missing_models(client, models: list[dict], report: AdtUploadReport) -> None:
+    try:
+        existing = {model.id for model in client.list_models()}
+        missing = [model for model in models if model.get("@id") not in existing]
+        report.models_existing = len(models) - len(missing)
+        ordered = order_models(missing)
+        for offset in range(0, len(ordered), ADT_MODEL_BATCH_SIZE):
+            batch = ordered[offset : offset + ADT_MODEL_BATCH_SIZE]
+            report.models_created += len(list(client.create_models(batch)))
+    except HttpResponseError as e:
+        if "already exists" in str(e).lower() or "ModelIdAlreadyExists" in str(e):
+            logger.info("✓ DTDL models already exist (skipping)")
+        else:
+            logger.error(f"HTTP error uploading DTDL models: {e.status_code} - {e.message}")
+            raise
+    except ClientAuthenticationError as e:
+        logger.error(f"PERMISSION DENIED uploading DTDL models: {e.message}")
+        raise
+    except AzureError as e:
+        logger.error(f"Azure error uploading DTDL models: {type(e).__name__}: {e}")
+        raise
+
+
+def _unchanged_twins(client, previous: dict[str, str], digests: dict[str, str]) -> set[str]:
+    """Twins recorded with the same digest that the instance still has."""
+    candidates = {
+        twin_id for twin_id, digest in digests.items() if previous.get(twin_id) == digest
+    }
+    if not candidates:
+        return set()
+    try:
+        live = {item.get("$dtId") for item in client.query_twins(_TWIN_IDS_QUERY)}
+    except AzureError as e:
+        logger.warning(f"Could not list existing twins, upserting all: {type(e).__name__}: {e}")
+        return set()
+    return candidates & live
+
+
+def _upsert_graph(
+    client,
+    twins: list[dict],
+    relationships: list[dict],
+    run: RuntimeRun,
+    report: AdtUploadReport,
+    workers: int,
+) -> set[str]:
+    """Upsert twins, then each relationship once its twins were attempted."""
+    pending_twins: dict[str, int] = {}
+    for twin in twins:
+        twin_id = twin.get("$dtId", "unknown")
+        pending_twins[twin_id] = pending_twins.get(twin_id, 0) + 1
+    waiting: list[int] = []
+    dependents: dict[str, list[int]] = {}
+    for index, rel in enumerate(relationships):
+        endpoints = {rel.get("$dtId"), rel.get("$targetId")} & pending_twins.keys()
+        waiting.append(len(endpoints))
+        for twin_id in endpoints:
+            dependents.setdefault(twin_id, []).append(index)
+
+    uploaded: set[str] = set()
+    futures: dict[Future, tuple[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="adt-upload") as executor:
+
+        def submit(kind: str, key: Any, resource: str, action: Callable[[], bool]) -> None:
+            context = contextvars.copy_context()
+            future = executor.submit(context.run, run.attempt, resource, action, default=False)
+            futures[future] = (kind, key)
+
+        def submit_relationship(index: int) -> None:
+            rel = relationships[index]
+            source_id = rel.get("$dtId", "unknown")
+            rel_id = rel.get("$relationshipId", "unknown")
+            submit(
+                "relationship",
+                index,
+                rel_id,
+                lambda: _upserted(
+                    client.upsert_relationship,
+                    source_id,
+                    rel_id,
+                    {
+                        "$targetId": rel.get("$targetId"),
+                        "$relationshipName": rel.get("$relationshipName"),
+                    },
+                ),
+            )
+
+        if twins:
+            logger.info(f"Creating {len(twins)} Digital Twins...")
+        for twin in twins:
+            twin_id = twin.get("$dtId", "unknown")
+            submit(
+                "twin",
+                twin_id,
+                twin_id,
+                lambda twin_id=twin_id, twin=twin: _upserted(
+                    client.upsert_digital_twin, twin_id, twin
+                ),
+            )
+        if relationships:
+            logger.info(f"Creating {len(relationships)} relationships...")
+        for index in _ready(range(len(relationships)), waiting):
+            submit_relationship(index)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, key = futures.pop(future)
+                succeeded = future.result()
+                if kind == "relationship":
+                    report.relationships_upserted += int(succeeded)
+                    continue
+                report.twins_upserted += int(succeeded)
+                if succeeded:
+                    uploaded.add(key)
+                pending_twins[key] -= 1
+                if pending_twins[key]:
+                    continue
+                for index in dependents.get(key, []):
+                    waiting[index] -= 1
+                for index in _ready(dependents.get(key, []), waiting):
+                    submit_relationship(index)
+    return uploaded
+
+
+def _ready(indexes: Iterable[int], waiting: list[int]) -> list[int]:
+    return [index for index in indexes if waiting[index] == 0]
+
+
+def _upserted(upsert: Callable[..., Any], *args: Any) -> bool:
+    upsert(*args)
+    return True
@@ -29,7 +29,6 @@ import logging
 from azure.core.exceptions import (
     ResourceNotFoundError,
     ClientAuthenticationError,
-    HttpResponseError,
     AzureError
 )
 
@@ -220,7 +219,8 @@ def upload_dtdl_models(provider: 'AzureProvider', config, project_path: str) ->
     Args:
         provider: Initialized AzureProvider with clients and naming
         config: Project configuration with hierarchy containing models/twins/relationships
-        project_path: Path to project directory (unused, kept for API consistency)
+        project_path: Path to project directory; the digests of uploaded twins
+            are recorded under its terraform/ directory
         
     Raises:
         ValueError: If provider or config is None, or hierarchy is not a dict
@@ -242,64 +242,20 @@ def upload_dtdl_models(provider: 'AzureProvider', config, project_path: str) ->
     if not client:
         raise RuntimeError("Azure Digital Twins instance is not accessible")
     
-    # Step 1: Upload models (already valid DTDL v3 from azure_hierarchy.json)
     models = hierarchy.get("models", [])
-    if models:
-        logger.info(f"Uploading {len(models)} DTDL models...")
-        try:
-            created_models = client.create_models(models)
-            model_count = len(list(created_models))
-            logger.info(f"✓ Uploaded {model_count} DTDL models")
-        except HttpResponseError as e:
-            if "already exists" in str(e).lower() or "ModelIdAlreadyExists" in str(e):
-                logger.info("✓ DTDL models already exist (skipping)")
-            else:
-                logger.error(f"HTTP error uploading DTDL models: {e.status_code} - {e.message}")
-                raise
-        except ClientAuthenticationError as e:
-            logger.error(f"PERMISSION DENIED uploading DTDL models: {e.message}")
-            raise
-        except AzureError as e:
-            logger.error(f"Azure error uploading DTDL models: {type(e).__name__}: {e}")
-            raise
-    else:
+    if not models:
         logger.info("No DTDL models to upload (empty hierarchy)")
         return
-    
-    # Step 2: Create twins from hierarchy (use pre-defined $dtId and $metadata.$model)
+
+    # Models, then twins, then relationships; twins and relationships are
+    # upserted concurrently and unchanged twins are skipped.
+    from src.providers.azure.layers.adt_bulk_loader import upload_hierarchy
     from src.providers.terraform.runtime_outcome import RuntimeRun
 
     run = RuntimeRun("Azure", "Digital Twins", logger)
-    twins = hierarchy.get("twins", [])
-    if twins:
-        logger.info(f"Creating {len(twins)} Digital Twins...")
-        for twin in twins:
-            twin_id = twin.get("$dtId", "unknown")
-            run.attempt(
-                twin_id,
-                lambda twin_id=twin_id, twin=twin: client.upsert_digital_twin(
-                    twin_id,
-                    twin,
-                ),
-            )
-    
-    # Step 3: Create relationships from hierarchy
-    relationships = hierarchy.get("relationships", [])
-    if relationships:
-        logger.info(f"Creating {len(relationships)} relationships...")
-        for rel in relationships:
-            source_id = rel.get("$dtId", "unknown")
-            rel_id = rel.get("$relationshipId", "unknown")
-            run.attempt(
-                rel_id,
-                lambda source_id=source_id, rel_id=rel_id, rel=rel: client.upsert_relationship(
-                    source_id, rel_id,
-                    {
-                        "$targetId": rel.get("$targetId"),
-                        "$relationshipName": rel.get("$relationshipName")
-                    }
-                ),
-            )
+    logger.info(f"Uploading {len(models)} DTDL models...")
+    report = upload_hierarchy(client, hierarchy, project_path, run)
+    logger.info(f"✓ {report.summary()}")
 
     run.raise_if_failed()
     
@@ -43,9 +43,19 @@ def create_terraform_strategy(
     context: 'DeploymentContext',
     terraform_dir: str | None = None,
     project_path: str | None = None,
+    force_init: bool | None = None,
+    incremental: bool = False,
 ):
-    """Create the canonical Terraform strategy for deploy/destroy operations."""
+    """
+    Create the canonical Terraform strategy for deploy/destroy operations.
+
+    The Terraform root persists per project outside the ephemeral workspace
+    so an unchanged twin can skip ``terraform init`` on the next operation.
+    ``incremental`` applies only resources whose inputs changed since the
+    last successful apply.
+    """
     from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+    from src.terraform_workdir import terraform_root_path
 
     resolved_terraform_dir = terraform_dir or str(Path(__file__).parent.parent / "terraform")
     resolved_project_path = project_path or str(context.project_path)
@@ -53,6 +63,9 @@ def create_terraform_strategy(
     return TerraformDeployerStrategy(
         terraform_dir=resolved_terraform_dir,
         project_path=resolved_project_path,
+        terraform_root_dir=str(terraform_root_path(context.project_name)),
+        force_init=force_init,
+        incremental=incremental,
     )
 
 
@@ -64,6 +77,7 @@ def deploy_all(
     context: 'DeploymentContext',
     provider: str,
     operation_context: OperationContext | None = None,
+    incremental: bool = False,
 ) -> dict:
     """
     Deploy all layers using Terraform (primary approach).
@@ -74,6 +88,7 @@ def deploy_all(
     Args:
         context: Deployment context with config and credentials
         provider: Cloud provider name (aws, azure, gcp)
+        incremental: Apply only resources whose inputs changed
     
     Returns:
         Dictionary of Terraform outputs
@@ -85,7 +100,7 @@ def deploy_all(
     )
 
     with deployment_workspace(context, operation_context=operation_context) as (runtime_context, _workspace):
-        strategy = create_terraform_strategy(runtime_context)
+        strategy = create_terraform_strategy(runtime_context, incremental=incremental)
         if operation_context:
             with operation_step(logger, operation_context, "terraform_deploy"):
                 return strategy.deploy_all(runtime_context)
@@ -229,6 +244,7 @@ async def deploy_all_stream(
     project_path: str | None = None,
     output_sink: dict | None = None,
     operation_context: OperationContext | None = None,
+    incremental: bool = False,
 ):
     """Stream canonical Terraform deployment log lines."""
     if strategy is not None:
@@ -243,6 +259,7 @@ async def deploy_all_stream(
             runtime_context,
             terraform_dir=terraform_dir,
             project_path=str(runtime_context.project_path),
+            incremental=incremental,
         )
         if operation_context:
             with operation_step(logger, operation_context, "terraform_deploy_stream"):
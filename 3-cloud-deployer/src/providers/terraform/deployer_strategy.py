@@ -13,11 +13,17 @@ from src.providers.terraform.destruction_lifecycle import (
     DestructionLifecycleMixin,
     DestroyResult,
 )
+from src.providers.terraform.stacks import StackExecutor, load_stack_layout
 from src.providers.terraform.provider_runtime import (
     initialize_providers,
     run_post_deployment,
 )
 from src.terraform_runner import TerraformRunner
+from src.terraform_workdir import (
+    TERRAFORM_ROOT_DIR_NAME,
+    force_init_requested,
+    prepare_terraform_root,
+)
 from src.tfvars_generator import ConfigurationError, generate_tfvars
 from src.validation.directory_validator import validate_project_directory
 
@@ -32,7 +38,14 @@ PREFLIGHT_VALID_STATUS = "valid"
 class TerraformDeployerStrategy(DeploymentLifecycleMixin, DestructionLifecycleMixin):
     """Coordinate Terraform with explicitly SDK-owned lifecycle operations."""
 
-    def __init__(self, terraform_dir: str, project_path: str):
+    def __init__(
+        self,
+        terraform_dir: str,
+        project_path: str,
+        terraform_root_dir: str | None = None,
+        force_init: bool | None = None,
+        incremental: bool = False,
+    ):
         if not terraform_dir:
             raise ValueError("terraform_dir is required")
         if not project_path:
@@ -42,19 +55,53 @@ class TerraformDeployerStrategy(DeploymentLifecycleMixin, DestructionLifecycleMi
         self.project_path = Path(project_path)
         self.tfvars_path = self.project_path / "terraform" / "generated.tfvars.json"
         self.state_path = self.project_path / "terraform" / "terraform.tfstate"
+        self.terraform_root_dir = (
+            Path(terraform_root_dir)
+            if terraform_root_dir
+            else self.project_path / "terraform" / TERRAFORM_ROOT_DIR_NAME
+        )
+        self.force_init = force_init_requested() if force_init is None else force_init
+        self.incremental = incremental
         self._runner: TerraformRunner | None = None
+        self._stacks: StackExecutor | None = None
+        self._stacks_loaded = False
         self._providers_config: dict | None = None
         self._terraform_outputs: dict | None = None
 
     @property
     def runner(self) -> TerraformRunner:
         if self._runner is None:
+            # Each project inits in its own root; only the plugin cache is shared.
+            prepare_terraform_root(self.terraform_dir, self.terraform_root_dir)
             self._runner = TerraformRunner(
-                terraform_dir=str(self.terraform_dir),
+                terraform_dir=str(self.terraform_root_dir),
                 state_path=str(self.state_path),
+                force_init=self.force_init,
             )
         return self._runner
 
+    @property
+    def stacks(self) -> StackExecutor | None:
+        """Return the stack executor when the Terraform directory declares stacks."""
+        if not self._stacks_loaded:
+            layout = load_stack_layout(self.terraform_dir)
+            if layout is not None:
+                self._stacks = StackExecutor(
+                    layout,
+                    project_path=self.project_path,
+                    terraform_root_dir=self.terraform_root_dir,
+                    base_tfvars_path=self.tfvars_path,
+                    force_init=self.force_init,
+                    apply_root=self._apply_root_module_async,
+                )
+            self._stacks_loaded = True
+        return self._stacks
+
+    def _read_outputs(self) -> dict:
+        if self.stacks is not None:
+            return self.stacks.merged_outputs()
+        return self.runner.output()
+
     def _load_providers_config(self) -> dict:
         if self._providers_config is None:
             self._providers_config = load_providers_config(self.project_path)
@@ -72,14 +119,23 @@ class TerraformDeployerStrategy(DeploymentLifecycleMixin, DestructionLifecycleMi
         self.tfvars_path.parent.mkdir(parents=True, exist_ok=True)
         generate_tfvars(str(self.project_path), str(self.tfvars_path))
 
-    def _build_packages(self) -> None:
+    def _build_packages(self, on_package_built=None) -> list:
         from src.providers.terraform.package_builder import build_all_packages
 
+        records = []
+
+        def collect(record) -> None:
+            records.append(record)
+            if on_package_built is not None:
+                on_package_built(record)
+
         build_all_packages(
             self.terraform_dir,
             self.project_path,
             self._load_providers_config(),
+            on_package_built=collect,
         )
+        return sorted(records, key=lambda record: record.name)
 
     def _validate_project(self) -> None:
         validate_project_directory(
@@ -174,7 +230,7 @@ class TerraformDeployerStrategy(DeploymentLifecycleMixin, DestructionLifecycleMi
 
     def get_outputs(self) -> dict:
         if self._terraform_outputs is None:
-            self._terraform_outputs = self.runner.output()
+            self._terraform_outputs = self._read_outputs()
         return self._terraform_outputs
 
 
@@ -7,6 +7,18 @@ import logging
 from typing import TYPE_CHECKING, AsyncIterator
 
 from src.providers.terraform.deployment_metadata import mark_built_packages_deployed
+from src.providers.terraform.deployment_stages import BlockingStage, blocking_stage
+from src.providers.terraform.incremental_deploy import (
+    APPLIED_INPUTS_FILE_NAME,
+    IncrementalPlan,
+    TerraformReferenceGraph,
+    capture_applied_inputs,
+    load_applied_inputs,
+    plan_incremental_deploy,
+    save_applied_inputs,
+)
+from src.terraform_runner import TerraformError
+
 if TYPE_CHECKING:
     from src.core.context import DeploymentContext
 
@@ -32,6 +44,45 @@ class DeploymentLifecycleMixin:
     def _record_applied_packages(self) -> int:
         return mark_built_packages_deployed(self.project_path)
 
+    @property
+    def applied_inputs_path(self):
+        return self.project_path / "terraform" / APPLIED_INPUTS_FILE_NAME
+
+    def _capture_inputs(self) -> dict | None:
+        if not self.tfvars_path.is_file():
+            return None
+        return capture_applied_inputs(self.project_path, self.tfvars_path, self.terraform_dir)
+
+    def _record_applied_inputs(self, inputs: dict | None, *, targeted: bool) -> None:
+        if inputs is not None:
+            save_applied_inputs(self.applied_inputs_path, inputs, targeted=targeted)
+
+    def _plan_incremental(self, inputs: dict | None) -> IncrementalPlan | None:
+        """Return the incremental plan, or ``None`` when the mode is off."""
+        if not getattr(self, "incremental", False) or inputs is None:
+            return None
+        return plan_incremental_deploy(
+            TerraformReferenceGraph.from_directory(self.terraform_dir),
+            load_applied_inputs(self.applied_inputs_path),
+            inputs,
+            project_path=self.project_path,
+            tfvars_path=self.tfvars_path,
+            state_path=self.state_path,
+        )
+
+    def _apply(self, plan: IncrementalPlan | None) -> bool:
+        """Apply fully or by target; return whether the apply was targeted."""
+        if plan is not None and plan.unchanged:
+            return False
+        if plan is not None and plan.targets:
+            try:
+                self.runner.apply(var_file=str(self.tfvars_path), targets=plan.targets)
+                return True
+            except TerraformError:
+                logger.warning("Targeted apply failed; falling back to a full apply")
+        self.runner.apply(var_file=str(self.tfvars_path))
+        return False
+
     def deploy_all(
         self,
         context: "DeploymentContext | None" = None,
@@ -46,9 +97,20 @@ class DeploymentLifecycleMixin:
             context,
             skip_credential_check=skip_credential_check,
         )
-        self.runner.init()
-        self.runner.apply(var_file=str(self.tfvars_path))
-        self._terraform_outputs = self.runner.output()
+        if self.stacks is not None:
+            logger.info("Applying Terraform stacks: %s", self.stacks.layout.describe())
+            if getattr(self, "incremental", False):
+                logger.info(self._stack_incremental_notice())
+            self._terraform_outputs = self.stacks.apply()
+        else:
+            self.runner.init()
+            inputs = self._capture_inputs()
+            plan = self._plan_incremental(inputs)
+            for line in plan.describe() if plan is not None else ():
+                logger.info(line)
+            targeted = self._apply(plan)
+            self._record_applied_inputs(inputs, targeted=targeted)
+            self._terraform_outputs = self.runner.output()
         deployed_packages = self._record_applied_packages()
         logger.info("Recorded %d applied user function packages", deployed_packages)
         self._run_post_deployment(context)
@@ -67,27 +129,100 @@ class DeploymentLifecycleMixin:
         yield "Terraform deployment starting"
         if not skip_credential_check:
             yield "[1/7] Validating cloud credentials"
-            self._validate_credentials()
+            async for line in blocking_stage(self._validate_credentials).run():
+                yield line
         else:
             yield "[1/7] Credential validation explicitly skipped"
 
         yield "[2/7] Initializing provider SDK clients"
-        self._initialize_providers(context)
+        async for line in blocking_stage(self._initialize_providers, context).run():
+            yield line
         yield "[3/7] Validating project and building packages"
-        self._validate_project()
-        self._build_packages()
-        self._generate_tfvars()
-
-        yield "[4/7] Terraform init"
-        async for line in self.runner.init_async():
+        validation = blocking_stage(self._validate_project)
+        async for line in validation.run():
             yield line
-        yield "[5/7] Terraform apply"
-        async for line in self.runner.apply_async(str(self.tfvars_path)):
+        yield f"  Project validated in {validation.duration_ms} ms"
+        async for line in self._build_packages_async():
+            yield line
+        tfvars = blocking_stage(self._generate_tfvars)
+        async for line in tfvars.run():
             yield line
+        yield f"  Generated tfvars in {tfvars.duration_ms} ms"
+
+        if self.stacks is not None:
+            yield f"[4/7] Terraform stacks: {self.stacks.layout.describe()}"
+            if getattr(self, "incremental", False):
+                yield self._stack_incremental_notice()
+            yield "[5/7] Terraform init and apply per stack"
+            async for line in self.stacks.apply_async():
+                yield line
+            self._terraform_outputs = await asyncio.to_thread(self.stacks.merged_outputs)
+        else:
+            async for line in self._apply_root_async():
+                yield line
+            self._terraform_outputs = self.runner.output()
 
-        self._terraform_outputs = self.runner.output()
         deployed_packages = self._record_applied_packages()
         yield f"[6/7] Recorded {deployed_packages} applied user function packages"
         yield "[7/7] Running SDK-owned post-deployment operations"
         await asyncio.to_thread(self._run_post_deployment, context)
         yield "Terraform deployment complete"
+
+    async def _build_packages_async(self) -> AsyncIterator[str]:
+        """Build packages on the stage executor, streaming each as it finishes."""
+        streamed: set[str] = set()
+
+        def build(report):
+            def on_package_built(record) -> None:
+                streamed.add(record.name)
+                report(f"  Package {record.describe()}")
+
+            return self._build_packages(on_package_built=on_package_built)
+
+        stage = BlockingStage(build)
+        async for line in stage.run():
+            yield line
+        for record in stage.result or ():
+            if record.name not in streamed:
+                yield f"  Package {record.describe()}"
+        yield f"  Packages ready in {stage.duration_ms} ms"
+
+    def _stack_incremental_notice(self) -> str:
+        root = self.stacks.layout.root
+        if root is None:
+            return "Incremental mode applies to the root module only; applying all stacks"
+        return f"Incremental mode applies to the {root.name} stack; applying other stacks fully"
+
+    async def _apply_root_async(self) -> AsyncIterator[str]:
+        """Init and apply the single root module, incrementally when enabled."""
+        yield "[4/7] Terraform init"
+        async for line in self.runner.init_async():
+            yield line
+        yield "[5/7] Terraform apply"
+        async for line in self._apply_root_module_async(init=False):
+            yield line
+
+    async def _apply_root_module_async(self, *, init: bool = True) -> AsyncIterator[str]:
+        """Apply the root module against the project state, incrementally when enabled."""
+        if init:
+            async for line in self.runner.init_async():
+                yield line
+        inputs = await asyncio.to_thread(self._capture_inputs)
+        plan = await asyncio.to_thread(self._plan_incremental, inputs)
+        for line in plan.describe() if plan is not None else ():
+            yield line
+        targeted = False
+        if plan is not None and plan.targets:
+            try:
+                async for line in self.runner.apply_async(
+                    str(self.tfvars_path),
+                    targets=plan.targets,
+                ):
+                    yield line
+                targeted = True
+            except TerraformError:
+                yield "Targeted apply failed; falling back to a full apply"
+        if not targeted and (plan is None or not plan.unchanged):
+            async for line in self.runner.apply_async(str(self.tfvars_path)):
+                yield line
+        self._record_applied_inputs(inputs, targeted=targeted)
@@ -0,0 +1,96 @@
+"""Run blocking deployment stages off the event loop with streamed progress.
+
+Package builds, project validation, tfvars generation, and provider client
+setup hash, zip, and call cloud SDKs synchronously. The streaming deploy
+endpoint drives them from an async generator, so running them inline would
+stall every other request and SSE heartbeat of the deployer for the whole
+build. Stages run on one bounded, process-wide executor instead; a stage can
+report progress lines from its worker thread, which the generator yields as
+they arrive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import os
+import threading
+from time import perf_counter
+from typing import AsyncIterator, Callable, Generic, TypeVar
+
+DEFAULT_DEPLOY_STAGE_WORKERS = 4
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def default_deploy_stage_workers() -> int:
+    configured = os.environ.get("DEPLOYER_DEPLOY_STAGE_WORKERS")
+    if configured:
+        workers = int(configured)
+        if workers <= 0:
+            raise ValueError("DEPLOYER_DEPLOY_STAGE_WORKERS must be positive")
+        return workers
+    return DEFAULT_DEPLOY_STAGE_WORKERS
+
+
+def get_deploy_stage_executor() -> ThreadPoolExecutor:
+    """Return the shared executor that bounds concurrent blocking stages."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=default_deploy_stage_workers(),
+                thread_name_prefix="deploy-stage",
+            )
+        return _executor
+
+
+class BlockingStage(Generic[T]):
+    """
+    One blocking stage: ``work(report)`` runs on the stage executor.
+
+    Iterate ``run()`` to receive the lines ``work`` passes to ``report``
+    while it runs; afterwards ``result`` holds its return value and
+    ``duration_ms`` its wall time. Exceptions propagate from ``run()``.
+    """
+
+    def __init__(self, work: Callable[[Callable[[str], None]], T]) -> None:
+        self._work = work
+        self.result: T | None = None
+        self.duration_ms = 0
+
+    async def run(self) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue[str] = asyncio.Queue()
+
+        def report(line: str) -> None:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+
+        started = perf_counter()
+        future = loop.run_in_executor(
+            get_deploy_stage_executor(),
+            functools.partial(contextvars.copy_context().run, self._work, report),
+        )
+        while not future.done():
+            getter = asyncio.ensure_future(lines.get())
+            await asyncio.wait({future, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        # Lines reported just before completion are scheduled ahead of the
+        # future's result callback; let them land, then drain.
+        await asyncio.sleep(0)
+        while not lines.empty():
+            yield lines.get_nowait()
+        self.result = future.result()
+        self.duration_ms = int(round((perf_counter() - started) * 1000))
+
+
+def blocking_stage(function: Callable[..., T], *args, **kwargs) -> BlockingStage[T]:
+    """Wrap a plain blocking call that reports no progress."""
+    return BlockingStage(lambda _report: function(*args, **kwargs))
@@ -120,8 +120,11 @@ class DestructionLifecycleMixin:
             try:
                 if not self.tfvars_path.exists():
                     self._generate_tfvars()
-                self.runner.init()
-                self.runner.destroy(var_file=str(self.tfvars_path))
+                if self.stacks is not None:
+                    self.stacks.destroy()
+                else:
+                    self.runner.init()
+                    self.runner.destroy(var_file=str(self.tfvars_path))
                 result.terraform_success = True
             except TerraformError as exc:
                 result.terraform_error = sanitize_deployment_message(str(exc))
@@ -157,8 +160,11 @@ class DestructionLifecycleMixin:
 
         yield "Terraform destroy starting"
         yield "[1/4] Terraform init"
-        async for line in self.runner.init_async():
-            yield line
+        if self.stacks is None:
+            async for line in self.runner.init_async():
+                yield line
+        else:
+            yield f"Stacks are initialized as they are destroyed: {self.stacks.layout.describe()}"
 
         yield "[2/4] Pre-destroy cleanup"
         if context is not None and context.credentials:
@@ -171,7 +177,12 @@ class DestructionLifecycleMixin:
             yield "No credentials available; pre-destroy cleanup skipped"
 
         yield "[3/4] Terraform destroy"
-        async for line in self.runner.destroy_async(str(self.tfvars_path)):
+        destroy_lines = (
+            self.stacks.destroy_async()
+            if self.stacks is not None
+            else self.runner.destroy_async(str(self.tfvars_path))
+        )
+        async for line in destroy_lines:
             yield line
 
         yield "[4/4] Provider fallback cleanup"
@@ -321,21 +332,21 @@ class DestructionLifecycleMixin:
     def has_deployed_resources(self) -> bool:
         """Return whether the Terraform state contains root resources."""
         try:
-            state = self.runner.show_state()
+            if self.stacks is not None:
+                return self.stacks.has_resources()
+            return self.runner.has_root_resources()
         except Exception as exc:
             logger.warning(
                 "Could not inspect Terraform state: %s",
                 sanitize_deployment_message(str(exc)),
             )
             return False
-        resources = state.get("values", {}).get("root_module", {}).get("resources", [])
-        return bool(resources)
 
     def _get_terraform_outputs_safe(self) -> dict:
         if self._terraform_outputs is not None:
             return self._terraform_outputs
         try:
-            return self.runner.output()
+            return self._read_outputs()
         except Exception as exc:
             logger.warning(
                 "Could not read Terraform outputs: %s",
@@ -0,0 +1,413 @@
+"""Change detection and resource targeting for incremental Terraform deploys.
+
+After every successful apply the deployer records digests of the applied
+inputs: each generated tfvars value (with the ephemeral workspace path
+normalized away), each built package ZIP, and the Terraform sources. An
+incremental deploy diffs the current inputs against that record, maps the
+changed ones onto the resources that consume them through a lightweight
+reference graph of the root module, and applies only those resources (plus
+their dependents) with ``-target``. Anything the graph cannot map safely
+falls back to a full apply.
+
+Only digests are persisted, never tfvars values, because tfvars carry
+credentials and tokens.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+from pathlib import Path
+import re
+from typing import Any, Iterable
+
+from src.core.secure_files import atomic_write_private_bytes
+
+logger = logging.getLogger(__name__)
+
+APPLIED_INPUTS_SCHEMA_VERSION = "terraform-applied-inputs.v1"
+APPLIED_INPUTS_FILE_NAME = "applied-inputs.json"
+DEFAULT_MAX_TARGET_FRACTION = 0.5
+_PROJECT_PLACEHOLDER = "${project_path}"
+_PACKAGE_PROVIDER_PREFIXES = {
+    "aws": ("aws_", "awscc_"),
+    "azure": ("azurerm_", "azuread_"),
+    "gcp": ("google_",),
+}
+_BLOCK_HEADER = re.compile(
+    r'^(resource|data|module|locals|output|provider|variable|terraform)\b([^{\n]*)\{',
+    re.MULTILINE,
+)
+_LABEL = re.compile(r'"([^"]+)"')
+_VAR_REFERENCE = re.compile(r"\bvar\.([A-Za-z_][\w-]*)")
+_LOCAL_REFERENCE = re.compile(r"\blocal\.([A-Za-z_][\w-]*)")
+_RESOURCE_REFERENCE = re.compile(r"\b(data\.)?([a-z][a-z0-9]*_[a-z0-9_]+)\.([A-Za-z_][\w-]*)")
+_MODULE_REFERENCE = re.compile(r"\bmodule\.([A-Za-z_][\w-]*)")
+_LOCAL_ATTRIBUTE = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*=(?!=)")
+_COMMENT = re.compile(r"(?m)^\s*(?:#|//).*$")
+
+
+@dataclass(frozen=True)
+class _Node:
+    address: str
+    kind: str
+    text: str
+
+
+@dataclass
+class TerraformReferenceGraph:
+    """Which resources, locals, and outputs read which variables and resources."""
+
+    nodes: dict[str, _Node] = field(default_factory=dict)
+    references: dict[str, set[str]] = field(default_factory=dict)
+    variable_readers: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    dependents: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    @classmethod
+    def from_directory(cls, module_dir: Path) -> "TerraformReferenceGraph":
+        graph = cls()
+        for path in sorted(Path(module_dir).glob("*.tf")):
+            graph._add_file(_COMMENT.sub("", path.read_text(encoding="utf-8")))
+        graph._link()
+        return graph
+
+    @property
+    def resource_addresses(self) -> list[str]:
+        return sorted(
+            address for address, node in self.nodes.items() if node.kind in {"resource", "module"}
+        )
+
+    def _add_file(self, text: str) -> None:
+        for match in _BLOCK_HEADER.finditer(text):
+            kind = match.group(1)
+            labels = _LABEL.findall(match.group(2))
+            body = _balanced_block(text, match.end() - 1)
+            if kind == "resource" and len(labels) == 2:
+                self._add_node(f"{labels[0]}.{labels[1]}", kind, body)
+            elif kind == "data" and len(labels) == 2:
+                self._add_node(f"data.{labels[0]}.{labels[1]}", kind, body)
+            elif kind == "module" and labels:
+                self._add_node(f"module.{labels[0]}", kind, body)
+            elif kind == "output" and labels:
+                self._add_node(f"output.{labels[0]}", kind, body)
+            elif kind == "provider" and labels:
+                self._add_node(f"provider.{labels[0]}.{len(self.nodes)}", kind, body)
+            elif kind == "locals":
+                for name, expression in _local_attributes(body):
+                    self._add_node(f"local.{name}", "local", expression)
+
+    def _add_node(self, address: str, kind: str, text: str) -> None:
+        self.nodes[address] = _Node(address, kind, text)
+
+    def _link(self) -> None:
+        for address, node in self.nodes.items():
+            references: set[str] = set()
+            for variable in _VAR_REFERENCE.findall(node.text):
+                self.variable_readers[variable].add(address)
+            references.update(f"local.{name}" for name in _LOCAL_REFERENCE.findall(node.text))
+            references.update(f"module.{name}" for name in _MODULE_REFERENCE.findall(node.text))
+            for data_prefix, resource_type, name in _RESOURCE_REFERENCE.findall(node.text):
+                references.add(f"{'data.' if data_prefix else ''}{resource_type}.{name}")
+            references = {reference for reference in references if reference in self.nodes}
+            references.discard(address)
+            self.references[address] = references
+            for reference in references:
+                self.dependents[reference].add(address)
+
+    def downstream(self, seeds: Iterable[str]) -> set[str]:
+        """Return ``seeds`` plus every node that transitively reads them."""
+        affected = set(seeds)
+        pending = list(affected)
+        while pending:
+            for dependent in self.dependents.get(pending.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        return affected
+
+
+@dataclass(frozen=True)
+class IncrementalPlan:
+    """Outcome of change detection for one deploy."""
+
+    targets: tuple[str, ...] = ()
+    changed_variables: tuple[str, ...] = ()
+    changed_packages: tuple[str, ...] = ()
+    skipped_resources: int = 0
+    full_apply_reason: str | None = None
+
+    @property
+    def full_apply(self) -> bool:
+        return self.full_apply_reason is not None
+
+    @property
+    def unchanged(self) -> bool:
+        return (
+            not self.full_apply
+            and not self.changed_variables
+            and not self.changed_packages
+        )
+
+    def describe(self) -> list[str]:
+        if self.full_apply:
+            return [f"Incremental deploy not possible ({self.full_apply_reason}); running full apply"]
+        if self.unchanged:
+            return ["No Terraform inputs changed since the last apply; skipping terraform apply"]
+        lines = [
+            f"Incremental deploy: {len(self.targets)} targeted resources, "
+            f"{self.skipped_resources} unchanged resources skipped"
+        ]
+        if self.changed_variables:
+            lines.append("  Changed variables: " + ", ".join(self.changed_variables))
+        if self.changed_packages:
+            lines.append("  Changed packages: " + ", ".join(self.changed_packages))
+        return lines
+
+
+def capture_applied_inputs(
+    project_path: Path,
+    tfvars_path: Path,
+    terraform_dir: Path,
+) -> dict[str, Any]:
+    """Digest the inputs of the apply that is about to run (no raw values)."""
+    project_path = Path(project_path)
+    tfvars = json.loads(Path(tfvars_path).read_text(encoding="utf-8"))
+    return {
+        "schema_version": APPLIED_INPUTS_SCHEMA_VERSION,
+        "terraform_sources": _terraform_source_digest(terraform_dir),
+        "variables": {
+            name: _digest(_canonical_value(value, project_path))
+            for name, value in sorted(tfvars.items())
+        },
+        "packages": _package_digests(project_path),
+    }
+
+
+def load_applied_inputs(path: Path) -> dict[str, Any] | None:
+    try:
+        record = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(record, dict)
+        or record.get("schema_version") != APPLIED_INPUTS_SCHEMA_VERSION
+        or not isinstance(record.get("variables"), dict)
+        or not isinstance(record.get("packages"), dict)
+    ):
+        return None
+    return record
+
+
+def save_applied_inputs(path: Path, record: dict[str, Any], *, targeted: bool) -> None:
+    payload = dict(record)
+    payload["applied_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    payload["targeted"] = targeted
+    atomic_write_private_bytes(
+        Path(path),
+        json.dumps(payload, indent=2, sort_keys=True).encode("utf-8"),
+    )
+
+
+def plan_incremental_deploy(
+    graph: TerraformReferenceGraph,
+    previous: dict[str, Any] | None,
+    current: dict[str, Any],
+    *,
+    project_path: Path,
+    tfvars_path: Path,
+    state_path: Path,
+    max_target_fraction: float = DEFAULT_MAX_TARGET_FRACTION,
+) -> IncrementalPlan:
+    """Map changed inputs to ``-target`` addresses or explain why not."""
+    if previous is None:
+        return IncrementalPlan(full_apply_reason="no record of a previous apply")
+    if not _state_has_resources(state_path):
+        return IncrementalPlan(full_apply_reason="Terraform state is empty")
+    if previous.get("terraform_sources") != current["terraform_sources"]:
+        return IncrementalPlan(full_apply_reason="Terraform configuration changed")
+
+    changed_variables = _changed_keys(previous["variables"], current["variables"])
+    changed_packages = _changed_keys(previous["packages"], current["packages"])
+    if not changed_variables and not changed_packages:
+        return IncrementalPlan(skipped_resources=len(graph.resource_addresses))
+
+    seeds: set[str] = set()
+    for variable in changed_variables:
+        seeds.update(graph.variable_readers.get(variable, ()))
+
+    tfvars = json.loads(Path(tfvars_path).read_text(encoding="utf-8"))
+    canonical_tfvars = {
+        name: _canonical_value(value, Path(project_path)) for name, value in tfvars.items()
+    }
+    for package in changed_packages:
+        readers = _package_readers(graph, package, canonical_tfvars)
+        if not readers:
+            return IncrementalPlan(
+                changed_variables=changed_variables,
+                changed_packages=changed_packages,
+                full_apply_reason=f"cannot map package {package} to resources",
+            )
+        seeds.update(readers)
+
+    affected = graph.downstream(seeds)
+    for address in sorted(affected):
+        kind = graph.nodes[address].kind
+        if kind == "provider":
+            return IncrementalPlan(
+                changed_variables=changed_variables,
+                changed_packages=changed_packages,
+                full_apply_reason="provider configuration inputs changed",
+            )
+        if kind == "output" and not any(
+            graph.nodes[reference].kind in {"resource", "data", "module"}
+            for reference in graph.references[address]
+        ):
+            return IncrementalPlan(
+                changed_variables=changed_variables,
+                changed_packages=changed_packages,
+                full_apply_reason=f"{address} depends only on changed inputs",
+            )
+
+    targets = tuple(
+        address for address in sorted(affected)
+        if graph.nodes[address].kind in {"resource", "module"}
+    )
+    if not targets:
+        # Changed inputs that reach no resource can still feed outputs; only a
+        # full apply refreshes those, and skipping would record them as applied.
+        return IncrementalPlan(
+            changed_variables=changed_variables,
+            changed_packages=changed_packages,
+            full_apply_reason="changed inputs affect only outputs",
+        )
+    total = len(graph.resource_addresses)
+    if total and len(targets) > total * max_target_fraction:
+        return IncrementalPlan(
+            changed_variables=changed_variables,
+            changed_packages=changed_packages,
+            full_apply_reason=f"{len(targets)} of {total} resources affected",
+        )
+    return IncrementalPlan(
+        targets=targets,
+        changed_variables=changed_variables,
+        changed_packages=changed_packages,
+        skipped_resources=total - len(targets),
+    )
+
+
+def _package_readers(
+    graph: TerraformReferenceGraph,
+    package: str,
+    canonical_tfvars: dict[str, Any],
+) -> set[str]:
+    """Find resources that read one ``.build/<provider>/<file>`` package."""
+    parts = Path(package).parts
+    prefixes = _PACKAGE_PROVIDER_PREFIXES.get(parts[1] if len(parts) > 2 else "", ())
+    file_name = f"/{Path(package).name}"
+
+    def provider_matches(address: str) -> bool:
+        resource_type = address.removeprefix("data.").split(".", 1)[0]
+        return resource_type.startswith(prefixes) if prefixes else True
+
+    readers = {
+        address
+        for address, node in graph.nodes.items()
+        if node.kind in {"resource", "local"} and file_name in node.text
+    }
+    package_path = f"{_PROJECT_PLACEHOLDER}/{package}"
+    for name, value in canonical_tfvars.items():
+        if package_path in json.dumps(value):
+            readers.update(graph.variable_readers.get(name, ()))
+    expanded = graph.downstream(readers)
+    return {
+        address
+        for address in expanded
+        if graph.nodes[address].kind == "resource" and provider_matches(address)
+    }
+
+
+def _balanced_block(text: str, opening: int) -> str:
+    depth = 0
+    for index in range(opening, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return text[opening + 1:index]
+    return text[opening + 1:]
+
+
+def _local_attributes(body: str) -> Iterable[tuple[str, str]]:
+    """Split a ``locals`` body into top-level ``name = expression`` pairs."""
+    name: str | None = None
+    expression: list[str] = []
+    depth = 0
+    for line in body.splitlines():
+        match = _LOCAL_ATTRIBUTE.match(line) if depth == 0 else None
+        if match:
+            if name is not None:
+                yield name, "\n".join(expression)
+            name, expression = match.group(1), [line[match.end():]]
+        elif name is not None:
+            expression.append(line)
+        depth += sum(line.count(character) for character in "{[(")
+        depth -= sum(line.count(character) for character in "}])")
+        depth = max(depth, 0)
+    if name is not None:
+        yield name, "\n".join(expression)
+
+
+def _canonical_value(value: Any, project_path: Path) -> Any:
+    """Replace the (ephemeral) workspace path so equal inputs hash equally."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    for prefix in {str(project_path), str(Path(project_path).resolve())}:
+        encoded = encoded.replace(json.dumps(prefix)[1:-1], _PROJECT_PLACEHOLDER)
+    return json.loads(encoded)
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _package_digests(project_path: Path) -> dict[str, str]:
+    build_dir = project_path / ".build"
+    digests = {}
+    if not build_dir.is_dir():
+        return digests
+    for path in sorted(build_dir.rglob("*.zip")):
+        if path.is_file() and not path.is_symlink():
+            relative = path.relative_to(project_path).as_posix()
+            digests[relative] = "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
+    return digests
+
+
+def _terraform_source_digest(terraform_dir: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(Path(terraform_dir).glob("*.tf")):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return "sha256:" + digest.hexdigest()
+
+
+def _changed_keys(previous: dict[str, str], current: dict[str, str]) -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            key
+            for key in set(previous) | set(current)
+            if previous.get(key) != current.get(key)
+        )
+    )
+
+
+def _state_has_resources(state_path: Path) -> bool:
+    try:
+        state = json.loads(Path(state_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return isinstance(state, dict) and bool(state.get("resources"))
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from src.function_registry import get_functions_for_provider_build as get_functions_for_provider_build
 from src.providers.terraform.package_builders.aws import (
@@ -10,6 +10,9 @@ from src.providers.terraform.package_builders.aws import (
     build_aws_lambda_packages,
     get_lambda_zip_path,
 )
+from src.providers.terraform.package_builders.artifact_cache import (
+    track_artifact_cache_lookups,
+)
 from src.providers.terraform.package_builders.azure import (
     _add_azure_function_app_directly,
     _create_azure_function_zip,
@@ -37,6 +40,10 @@ from src.providers.terraform.package_builders.gcp import (
     build_gcp_cloud_function_packages,
     get_gcp_zip_path,
 )
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuildRecord,
+    PackageBuildScheduler,
+)
 from src.providers.terraform.package_builders.user import (
     _compute_source_hash,
     _reconcile_user_hash_metadata,
@@ -54,24 +61,48 @@ def build_all_packages(
     terraform_dir: Path,
     project_path: Path,
     providers_config: dict,
+    *,
+    max_workers: Optional[int] = None,
+    on_package_built: Optional[Callable[[PackageBuildRecord], None]] = None,
 ) -> Dict[str, Path]:
-    """Build every provider and user-function package required by one deployment."""
+    """Build every provider and user-function package required by one deployment.
+
+    Provider builders run side by side and share one bounded worker pool for
+    their archive writes (``DEPLOYER_PACKAGE_BUILD_WORKERS`` by default).
+    ``on_package_built`` receives the size and build time of each package.
+    """
     terraform_dir = Path(terraform_dir)
     project_path = Path(project_path)
     validate_terraform_provider_capabilities(providers_config)
 
+    with track_artifact_cache_lookups() as cache_lookups:
+        with PackageBuildScheduler(max_workers, on_package_built) as scheduler:
+            results = scheduler.coordinate(
+                [
+                    lambda: build_aws_lambda_packages(terraform_dir, project_path, providers_config),
+                    lambda: build_azure_function_packages(terraform_dir, project_path, providers_config),
+                    lambda: build_gcp_cloud_function_packages(terraform_dir, project_path, providers_config),
+                    lambda: build_user_packages(project_path, providers_config),
+                ]
+            )
+
     packages: Dict[str, Path] = {}
-    packages.update(build_aws_lambda_packages(terraform_dir, project_path, providers_config))
-    packages.update(build_azure_function_packages(terraform_dir, project_path, providers_config))
-    packages.update(build_gcp_cloud_function_packages(terraform_dir, project_path, providers_config))
-    packages.update(build_user_packages(project_path, providers_config))
+    for result in results:
+        packages.update(result)
 
-    logger.info("Built %s function packages", len(packages))
+    logger.info(
+        "Built %s function packages (artifact cache: %s hits, %s misses, hit rate %.0f%%)",
+        len(packages),
+        cache_lookups.hits,
+        cache_lookups.misses,
+        cache_lookups.hit_rate * 100,
+    )
     return packages
 
 
 __all__ = [
     "BUILD_DIR",
+    "PackageBuildRecord",
     "_add_azure_function_app_directly",
     "_clean_old_versioned_zips",
     "_compute_content_hash",
@@ -0,0 +1,326 @@
+"""Deployer-wide content-addressed cache for built function packages."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+import threading
+from typing import Any, Callable, Iterator, Mapping, Optional
+from uuid import uuid4
+
+from src.providers.terraform.package_builders.common import _should_include_file
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_CACHE_FORMAT_VERSION = "function-artifact-cache.v1"
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_BUILDER_SOURCES = (
+    Path(__file__).resolve().parent,
+    Path(__file__).resolve().parents[3] / "core" / "deterministic_zip.py",
+)
+
+
+@dataclass
+class ArtifactCacheLookups:
+    """Hits and misses of the artifact cache seen by one package build."""
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_build_lookups: ContextVar[Optional[ArtifactCacheLookups]] = ContextVar(
+    "artifact_cache_lookups",
+    default=None,
+)
+
+
+@contextmanager
+def track_artifact_cache_lookups() -> Iterator[ArtifactCacheLookups]:
+    """Count the cache lookups made in this context and the threads it spawns.
+
+    ``stats()`` is cumulative for the process and shared by concurrent
+    deployments; builders submit their work with ``contextvars.copy_context``,
+    so these counts cover exactly one build.
+    """
+    lookups = ArtifactCacheLookups()
+    token = _build_lookups.set(lookups)
+    try:
+        yield lookups
+    finally:
+        _build_lookups.reset(token)
+
+
+def source_tree_digest(path: Path | None) -> str | None:
+    """Hash the files a package builder would read from one source tree."""
+    if path is None or not path.exists():
+        return None
+    if path.is_file():
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    digest = hashlib.sha256()
+    for file_path in sorted(path.rglob("*")):
+        if not file_path.is_file() or not _should_include_file(file_path):
+            continue
+        relative = file_path.relative_to(path).as_posix().encode("utf-8")
+        content = file_path.read_bytes()
+        digest.update(len(relative).to_bytes(4, "big") + relative)
+        digest.update(len(content).to_bytes(8, "big") + content)
+    return digest.hexdigest()
+
+
+def _builder_digest() -> str:
+    """Digest the builder code itself so builder changes invalidate the cache."""
+    digest = hashlib.sha256(ARTIFACT_CACHE_FORMAT_VERSION.encode("utf-8"))
+    for source in _BUILDER_SOURCES:
+        paths = sorted(source.glob("*.py")) if source.is_dir() else [source]
+        for path in paths:
+            digest.update(path.name.encode("utf-8"))
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class FunctionArtifactCache:
+    """Size-bounded LRU store of package ZIPs keyed by their complete inputs.
+
+    Entries are immutable, read-only files named by the SHA-256 of the
+    package kind, source tree digests, rename parameters, and builder code
+    digest. Hits are hard-linked into the project build directory (copied when
+    the cache lives on another filesystem); recency is tracked through the
+    entry mtime so eviction survives process restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        configured_root = os.environ.get("DEPLOYER_ARTIFACT_CACHE_ROOT")
+        self.root = (
+            Path(root)
+            if root is not None
+            else Path(configured_root)
+            if configured_root
+            else Path(tempfile.gettempdir()) / "twin2multicloud-function-artifacts"
+        ).resolve()
+        configured_max = os.environ.get("DEPLOYER_ARTIFACT_CACHE_MAX_BYTES")
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(configured_max)
+            if configured_max
+            else DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+        )
+        if self.max_bytes < 0:
+            raise ValueError("Artifact cache size limit must not be negative")
+        self._builder_digest = _builder_digest()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def key(
+        self,
+        kind: str,
+        *,
+        sources: Mapping[str, Path | None],
+        parameters: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Return the cache identity of one package build."""
+        identity = {
+            "kind": kind,
+            "builder": self._builder_digest,
+            "sources": {
+                name: source_tree_digest(path)
+                for name, path in sorted(sources.items())
+            },
+            "parameters": dict(sorted((parameters or {}).items())),
+        }
+        encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def materialize(
+        self,
+        key: str,
+        output_path: Path,
+        build: Callable[[Path], None],
+    ) -> bool:
+        """Place the package for ``key`` at ``output_path``; return True on a hit."""
+        if not self.enabled:
+            build(output_path)
+            return False
+        entry = self._entry_path(key)
+        try:
+            self._ensure_root()
+            if self._is_entry(entry):
+                self._place(entry, output_path)
+                os.utime(entry)
+                self._record_lookup(hit=True)
+                return True
+        except OSError:
+            logger.warning("Function artifact cache unavailable; building directly")
+            build(output_path)
+            return False
+
+        self._record_lookup(hit=False)
+        build(output_path)
+        try:
+            self._store(output_path, entry)
+            self._evict()
+        except OSError:
+            logger.warning("Could not store function package in artifact cache")
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        """Return process-local hit metrics and the current on-disk footprint."""
+        entries = self._entries()
+        with self._lock:
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hitRate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "maxBytes": self.max_bytes,
+        }
+
+    def _record_lookup(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        lookups = _build_lookups.get()
+        if lookups is not None:
+            lookups.record(hit)
+
+    def _entry_path(self, key: str) -> Path:
+        if len(key) != 64 or any(char not in "0123456789abcdef" for char in key):
+            raise ValueError("Invalid function artifact cache key")
+        return self.root / "objects" / key[:2] / f"{key}.zip"
+
+    @staticmethod
+    def _is_entry(path: Path) -> bool:
+        try:
+            metadata = os.lstat(path)
+        except FileNotFoundError:
+            return False
+        return stat.S_ISREG(metadata.st_mode)
+
+    @staticmethod
+    def _place(entry: Path, output_path: Path) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = output_path.with_suffix(output_path.suffix + f".{uuid4().hex}.tmp")
+        try:
+            try:
+                os.link(entry, temporary)
+            except OSError:
+                shutil.copyfile(entry, temporary)
+            temporary.replace(output_path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    @staticmethod
+    def _store(output_path: Path, entry: Path) -> None:
+        entry.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temporary = entry.with_suffix(f".{uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(output_path, temporary)
+            temporary.chmod(0o444)
+            temporary.replace(entry)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    def _entries(self) -> list[tuple[Path, int, int]]:
+        objects = self.root / "objects"
+        if not objects.is_dir():
+            return []
+        entries = []
+        for path in objects.glob("*/*.zip"):
+            try:
+                metadata = os.lstat(path)
+            except FileNotFoundError:
+                continue
+            if stat.S_ISREG(metadata.st_mode):
+                entries.append((path, metadata.st_size, metadata.st_mtime_ns))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def _ensure_root(self) -> None:
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.root.is_symlink() or not self.root.is_dir():
+            raise OSError("Function artifact cache root is invalid")
+
+
+_caches: dict[Path, FunctionArtifactCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_function_artifact_cache() -> FunctionArtifactCache:
+    """Return the process-wide cache for the currently configured root."""
+    configured_root = os.environ.get("DEPLOYER_ARTIFACT_CACHE_ROOT")
+    root = (
+        Path(configured_root)
+        if configured_root
+        else Path(tempfile.gettempdir()) / "twin2multicloud-function-artifacts"
+    ).resolve()
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = FunctionArtifactCache(root=root)
+        return cache
+
+
+def materialize_function_package(
+    kind: str,
+    output_path: Path,
+    build: Callable[[Path], None],
+    *,
+    sources: Mapping[str, Path | None],
+    parameters: Mapping[str, Any] | None = None,
+) -> bool:
+    """Reuse or build one function package through the shared artifact cache."""
+    cache = get_function_artifact_cache()
+    if not cache.enabled:
+        build(output_path)
+        return False
+    key = cache.key(kind, sources=sources, parameters=parameters)
+    return cache.materialize(key, output_path, build)
@@ -7,7 +7,17 @@ from typing import Dict, Optional
 from src.core.config_loader import load_optimization_flags as _load_optimization_flags
 from src.core.deterministic_zip import atomic_zip_archive, write_zip_file
 from src.function_registry import get_functions_for_provider_build
-from src.providers.terraform.package_builders.common import _should_include_file
+from src.providers.terraform.package_builders.artifact_cache import (
+    materialize_function_package,
+)
+from src.providers.terraform.package_builders.common import (
+    _add_shared_modules,
+    _should_include_file,
+)
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuild,
+    run_package_builds,
+)
 
 logger = logging.getLogger(__name__)
 PROVIDERS_ROOT = Path(__file__).resolve().parents[2]
@@ -40,15 +50,26 @@ def build_aws_lambda_packages(
     functions_to_build = get_functions_for_provider_build("aws", providers_config, optimization_flags)
     
     # Build each function
+    builds = []
     for func_name in functions_to_build:
         func_dir = lambda_dir / func_name
         if func_dir.exists():
             zip_path = build_dir / f"{func_name}.zip"
-            _create_lambda_zip(func_dir, shared_dir, zip_path)
-            packages[f"aws_{func_name}"] = zip_path
-            logger.info(f"  ✓ Built: {func_name}.zip")
+            builds.append(
+                PackageBuild(
+                    f"aws_{func_name}",
+                    zip_path,
+                    lambda func_dir=func_dir, zip_path=zip_path: _create_lambda_zip(
+                        func_dir, shared_dir, zip_path
+                    ),
+                )
+            )
         else:
             logger.warning(f"  ⚠ Lambda dir not found: {func_dir}")
+    run_package_builds(builds)
+    for build in builds:
+        packages[build.name] = build.path
+        logger.info(f"  ✓ Built: {build.path.name}")
     
     if not functions_to_build:
         logger.info("  No AWS Lambda functions needed for this configuration")
@@ -63,7 +84,7 @@ def _create_lambda_zip(
     output_path: Path,
     digital_twin_name: Optional[str] = None,
     device_id: Optional[str] = None
-) -> None:
+) -> bool:
     """
     Create a Lambda deployment ZIP with function code and shared modules.
     
@@ -73,7 +94,21 @@ def _create_lambda_zip(
         output_path: Path to output ZIP file
         digital_twin_name: Optional digital twin name for processor renaming
         device_id: Optional device ID for processor renaming
+
+    Returns:
+        True when the package came from the shared artifact cache
     """
+    return materialize_function_package(
+        "aws-lambda",
+        output_path,
+        lambda target: _write_lambda_zip(func_dir, shared_dir, target),
+        # Lambda packages are not renamed, so twin/device names stay out of the key.
+        sources={"function": func_dir, "shared": shared_dir},
+    )
+
+
+def _write_lambda_zip(func_dir: Path, shared_dir: Path, output_path: Path) -> None:
+    """Write the Lambda ZIP for one function and the shared modules."""
     with atomic_zip_archive(output_path) as zf:
         # Add function files
         for file_path in sorted(func_dir.rglob('*')):
@@ -82,11 +117,7 @@ def _create_lambda_zip(
                 write_zip_file(zf, file_path, arcname)
         
         # Add shared modules
-        if shared_dir.exists():
-            for file_path in sorted(shared_dir.rglob('*')):
-                if file_path.is_file() and _should_include_file(file_path):
-                    arcname = f"_shared/{file_path.relative_to(shared_dir)}"
-                    write_zip_file(zf, file_path, arcname)
+        _add_shared_modules(zf, shared_dir)
 
 
 
@@ -30,11 +30,18 @@ from src.providers.azure.azure_bundler import (
     bundle_l2_functions as _azure_bundle_l2,
     bundle_l3_functions as _azure_bundle_l3,
 )
+from src.providers.terraform.package_builders.artifact_cache import (
+    materialize_function_package,
+)
 from src.providers.terraform.package_builders.common import (
     _clean_old_versioned_zips,
     _compute_content_hash,
     _should_include_file,
 )
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuild,
+    run_package_builds,
+)
 
 logger = logging.getLogger(__name__)
 PROVIDERS_ROOT = Path(__file__).resolve().parents[2]
@@ -70,13 +77,24 @@ def build_azure_function_packages(
     # Get functions from registry
     functions_to_build = get_functions_for_provider_build("azure", providers_config)
     
+    builds = []
     for func_name in functions_to_build:
         app_dir = azure_funcs_dir / func_name
         if app_dir.exists():
             zip_path = build_dir / f"{func_name}.zip"
-            _create_azure_function_zip(app_dir, zip_path)
-            packages[f"azure_{func_name}"] = zip_path
-            logger.info(f"  ✓ Built: {func_name}.zip")
+            builds.append(
+                PackageBuild(
+                    f"azure_{func_name}",
+                    zip_path,
+                    lambda app_dir=app_dir, zip_path=zip_path: _create_azure_function_zip(
+                        app_dir, zip_path
+                    ),
+                )
+            )
+    run_package_builds(builds)
+    for build in builds:
+        packages[build.name] = build.path
+        logger.info(f"  ✓ Built: {build.path.name}")
     
     return packages
 
@@ -394,8 +412,17 @@ def build_azure_user_bundle(project_path: Path, providers_config: dict, optimiza
 
 
 
-def _create_azure_function_zip(app_dir: Path, output_path: Path) -> None:
-    """Create an Azure Function App deployment ZIP."""
+def _create_azure_function_zip(app_dir: Path, output_path: Path) -> bool:
+    """Create an Azure Function App deployment ZIP; True means a cache hit."""
+    return materialize_function_package(
+        "azure-function-app",
+        output_path,
+        lambda target: _write_azure_function_zip(app_dir, target),
+        sources={"app": app_dir},
+    )
+
+
+def _write_azure_function_zip(app_dir: Path, output_path: Path) -> None:
     with atomic_zip_archive(output_path) as zf:
         for file_path in sorted(app_dir.rglob('*')):
             if file_path.is_file() and _should_include_file(file_path):
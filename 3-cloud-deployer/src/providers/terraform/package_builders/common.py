@@ -3,6 +3,13 @@
 import glob
 import hashlib
 from pathlib import Path
+from typing import Optional
+import zipfile
+
+from src.core.deterministic_zip import (
+    precompressed_tree_members,
+    write_precompressed_members,
+)
 
 def _compute_content_hash(data: bytes) -> str:
     """Compute a short SHA-256 hash for content-based package versioning."""
@@ -37,6 +44,25 @@ def _should_include_file(file_path: Path) -> bool:
 
 
 
+def _add_shared_modules(zf: zipfile.ZipFile, shared_dir: Optional[Path]) -> None:
+    """
+    Append the provider's _shared/ modules to a function ZIP.
+
+    Every function package embeds the same shared files, so their members are
+    compressed once per content digest and raw-copied into each archive.
+    """
+    if not shared_dir or not shared_dir.exists():
+        return
+    files = [
+        file_path
+        for file_path in sorted(shared_dir.rglob('*'))
+        if file_path.is_file() and _should_include_file(file_path)
+    ]
+    write_precompressed_members(
+        zf, precompressed_tree_members(shared_dir, "_shared", files)
+    )
+
+
 def _merge_requirements(wrapper_req: Path, user_req: Path) -> str:
     """Merge wrapper and user requirements.txt files."""
     lines = set()
@@ -8,7 +8,18 @@ from typing import Dict, Optional
 from src.core.config_loader import load_optimization_flags as _load_optimization_flags
 from src.core.deterministic_zip import atomic_zip_archive, write_zip_bytes, write_zip_file
 from src.function_registry import get_functions_for_provider_build
-from src.providers.terraform.package_builders.common import _merge_requirements, _should_include_file
+from src.providers.terraform.package_builders.artifact_cache import (
+    materialize_function_package,
+)
+from src.providers.terraform.package_builders.common import (
+    _add_shared_modules,
+    _merge_requirements,
+    _should_include_file,
+)
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuild,
+    run_package_builds,
+)
 
 logger = logging.getLogger(__name__)
 PROVIDERS_ROOT = Path(__file__).resolve().parents[2]
@@ -58,6 +69,7 @@ def build_gcp_cloud_function_packages(
     cloud_functions_dir.mkdir(parents=True, exist_ok=True)
     
     # Build each function
+    builds = []
     for func_name in functions_to_build:
         func_dir = gcp_funcs_dir / func_name
         if func_dir.exists():
@@ -70,11 +82,21 @@ def build_gcp_cloud_function_packages(
             zip_path = build_dir / f"{func_name}.zip"
             # Note: processor_wrapper no longer merges user code - per-device processors
             # are built separately via build_user_packages() which creates individual ZIPs
-            _create_gcp_function_zip(func_dir, shared_dir, zip_path)
-            packages[f"gcp_{func_name}"] = zip_path
-            logger.info(f"  ✓ Built GCP: {func_name}.zip")
+            builds.append(
+                PackageBuild(
+                    f"gcp_{func_name}",
+                    zip_path,
+                    lambda func_dir=func_dir, zip_path=zip_path: _create_gcp_function_zip(
+                        func_dir, shared_dir, zip_path
+                    ),
+                )
+            )
         else:
             logger.warning(f"  ⚠ GCP function dir not found: {func_dir}")
+    run_package_builds(builds)
+    for build in builds:
+        packages[build.name] = build.path
+        logger.info(f"  ✓ Built GCP: {build.path.name}")
     
     # Note: User functions (processors, event_actions, event_feedback) are built separately
     # via build_user_packages() which creates individual ZIPs per function (like AWS)
@@ -93,7 +115,7 @@ def _create_gcp_function_zip(
     project_path: Optional[Path] = None,
     digital_twin_name: Optional[str] = None,
     device_id: Optional[str] = None
-) -> None:
+) -> bool:
     """
     Create a GCP Cloud Function deployment ZIP with shared modules.
     
@@ -104,7 +126,33 @@ def _create_gcp_function_zip(
         project_path: Optional project path for processor user code merge
         digital_twin_name: Optional digital twin name for processor renaming
         device_id: Optional device ID for processor renaming
+
+    Returns:
+        True when the package came from the shared artifact cache
     """
+    return materialize_function_package(
+        "gcp-cloud-function",
+        output_path,
+        lambda target: _write_gcp_function_zip(
+            func_dir,
+            shared_dir,
+            target,
+            digital_twin_name=digital_twin_name,
+            device_id=device_id,
+        ),
+        sources={"function": func_dir, "shared": shared_dir},
+        parameters={"digital_twin_name": digital_twin_name, "device_id": device_id},
+    )
+
+
+def _write_gcp_function_zip(
+    func_dir: Path,
+    shared_dir: Path,
+    output_path: Path,
+    *,
+    digital_twin_name: Optional[str] = None,
+    device_id: Optional[str] = None,
+) -> None:
     with atomic_zip_archive(output_path) as zf:
         # Add function code (skip requirements.txt - will merge with defaults later)
         for file_path in sorted(func_dir.rglob('*')):
@@ -124,11 +172,7 @@ def _create_gcp_function_zip(
                     write_zip_file(zf, file_path, arcname)
         
         # Add shared modules under _shared/
-        if shared_dir and shared_dir.exists():
-            for file_path in sorted(shared_dir.rglob('*')):
-                if file_path.is_file() and _should_include_file(file_path):
-                    arcname = Path("_shared") / file_path.relative_to(shared_dir)
-                    write_zip_file(zf, file_path, arcname)
+        _add_shared_modules(zf, shared_dir)
         
         # Merge defaults with function's requirements.txt (always include defaults)
         defaults = {"functions-framework", "requests", "google-cloud-firestore", 
@@ -187,11 +231,7 @@ def _create_gcp_processor_zip(
                     write_zip_file(zf, file_path, arcname)
         
         # 2. Add shared modules under _shared/
-        if shared_dir and shared_dir.exists():
-            for file_path in sorted(shared_dir.rglob('*')):
-                if file_path.is_file() and _should_include_file(file_path):
-                    arcname = Path("_shared") / file_path.relative_to(shared_dir)
-                    write_zip_file(zf, file_path, arcname)
+        _add_shared_modules(zf, shared_dir)
         
         # 3. Add/Overwrite with user processor code (process.py)
         # Skip requirements.txt - will merge later
@@ -0,0 +1,163 @@
+"""Bounded parallel execution of independent function package builds."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+import contextvars
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import threading
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PACKAGE_BUILD_WORKERS = 8
+_active_scheduler: ContextVar[Optional["PackageBuildScheduler"]] = ContextVar(
+    "package_build_scheduler",
+    default=None,
+)
+
+
+@dataclass(frozen=True)
+class PackageBuildRecord:
+    """Timing and size evidence for one built function package."""
+
+    name: str
+    path: Path
+    size_bytes: int
+    duration_ms: int
+    cache_hit: bool
+
+    def describe(self) -> str:
+        source = "cached" if self.cache_hit else "built"
+        return (
+            f"{self.name}: {self.size_bytes / 1024:.1f} KiB "
+            f"in {self.duration_ms} ms ({source})"
+        )
+
+
+@dataclass(frozen=True)
+class PackageBuild:
+    """One independent package write: ``build`` must only touch ``path``."""
+
+    name: str
+    path: Path
+    build: Callable[[], object]
+
+
+def default_package_build_workers() -> int:
+    configured = os.environ.get("DEPLOYER_PACKAGE_BUILD_WORKERS")
+    if configured:
+        workers = int(configured)
+        if workers <= 0:
+            raise ValueError("DEPLOYER_PACKAGE_BUILD_WORKERS must be positive")
+        return workers
+    return min(DEFAULT_MAX_PACKAGE_BUILD_WORKERS, os.cpu_count() or 1)
+
+
+class PackageBuildScheduler:
+    """Share one bounded worker pool across every builder of a deployment.
+
+    Builders keep discovery, source copies, and metadata publication on their
+    own thread and hand only the archive writes to ``run``. Each write targets
+    its own file through an atomic rename, so output bytes do not depend on
+    scheduling order. Workers are threads: DEFLATE in ``zlib`` releases the GIL,
+    and the package cache statistics stay in one process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        on_package_built: Callable[[PackageBuildRecord], None] | None = None,
+    ) -> None:
+        self.max_workers = max_workers or default_package_build_workers()
+        if self.max_workers <= 0:
+            raise ValueError("Package build worker count must be positive")
+        self.on_package_built = on_package_built
+        self._records: list[PackageBuildRecord] = []
+        self._records_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._token = None
+
+    def __enter__(self) -> "PackageBuildScheduler":
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="package-build",
+        )
+        self._token = _active_scheduler.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_scheduler.reset(self._token)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    @property
+    def records(self) -> list[PackageBuildRecord]:
+        with self._records_lock:
+            return list(self._records)
+
+    def run(self, builds: Sequence[PackageBuild]) -> None:
+        """Run independent builds and raise the first failure after all settle."""
+        if self._executor is None:
+            raise RuntimeError("PackageBuildScheduler must be entered before use")
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, self._build_one, build)
+            for build in builds
+        ]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def coordinate(self, tasks: Sequence[Callable[[], object]]) -> list[object]:
+        """Run provider-level builders side by side, outside the worker pool.
+
+        Coordinators block on ``run``; keeping them on their own threads means
+        they can never occupy every worker and deadlock the pool.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(tasks)),
+            thread_name_prefix="package-coordinator",
+        ) as coordinators:
+            futures = [
+                coordinators.submit(contextvars.copy_context().run, task)
+                for task in tasks
+            ]
+            errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
+
+    def _build_one(self, build: PackageBuild) -> None:
+        started = perf_counter()
+        outcome = build.build()
+        record = PackageBuildRecord(
+            name=build.name,
+            path=build.path,
+            size_bytes=build.path.stat().st_size,
+            duration_ms=int(round((perf_counter() - started) * 1000)),
+            cache_hit=outcome is True,
+        )
+        with self._records_lock:
+            self._records.append(record)
+        if self.on_package_built is not None:
+            try:
+                self.on_package_built(record)
+            except Exception:
+                logger.debug("Package build callback failed", exc_info=True)
+
+
+def run_package_builds(builds: Sequence[PackageBuild]) -> None:
+    """Build through the active scheduler, or inline when none is active."""
+    scheduler = _active_scheduler.get()
+    if scheduler is None:
+        for build in builds:
+            build.build()
+        return
+    scheduler.run(builds)
@@ -18,12 +18,23 @@ from src.function_metadata import (
 from src.providers.terraform.package_builders.aws import _create_lambda_zip
 from src.providers.terraform.package_builders.azure import _create_azure_function_zip
 from src.providers.terraform.package_builders.gcp import _create_gcp_function_zip
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuild,
+    run_package_builds,
+)
 
 logger = logging.getLogger(__name__)
 PROVIDERS_ROOT = Path(__file__).resolve().parents[2]
 WORKFLOW_ACTION_TYPES = frozenset({"step_function", "logic_app", "workflow"})
 
 
+@dataclass(frozen=True)
+class _PlannedUserPackage:
+    name: str
+    source_hash: str
+    build: PackageBuild
+
+
 @dataclass(frozen=True)
 class _UserPackageLayout:
     provider: str
@@ -143,9 +154,9 @@ def _build_archive(
     *,
     twin_name: str | None = None,
     device_id: str | None = None,
-) -> None:
+) -> bool:
     if layout.provider == "aws":
-        _create_lambda_zip(
+        return _create_lambda_zip(
             source_dir,
             layout.shared_dir,
             target,
@@ -153,7 +164,7 @@ def _build_archive(
             device_id=device_id,
         )
     elif layout.provider == "gcp":
-        _create_gcp_function_zip(
+        return _create_gcp_function_zip(
             source_dir,
             layout.shared_dir,
             target,
@@ -161,7 +172,34 @@ def _build_archive(
             device_id=device_id,
         )
     else:
-        _create_azure_function_zip(source_dir, target)
+        return _create_azure_function_zip(source_dir, target)
+
+
+def _plan_package(
+    layout: _UserPackageLayout,
+    name: str,
+    source_dir: Path,
+    *,
+    twin_name: str | None = None,
+    device_id: str | None = None,
+) -> _PlannedUserPackage:
+    source_hash = _hash_source(name, source_dir)
+    target = layout.build_dir / f"{name}.zip"
+    return _PlannedUserPackage(
+        name=name,
+        source_hash=source_hash,
+        build=PackageBuild(
+            name,
+            target,
+            lambda: _build_archive(
+                layout,
+                source_dir,
+                target,
+                twin_name=twin_name,
+                device_id=device_id,
+            ),
+        ),
+    )
 
 
 def _hash_source(
@@ -194,13 +232,11 @@ def _publish_build_metadata(
     active.add(name)
 
 
-def _build_event_actions(
-    project_path: Path,
+def _plan_event_actions(
     layout: _UserPackageLayout,
     events: list[dict],
-    packages: dict[str, Path],
-    active: set[str],
-) -> None:
+) -> list[_PlannedUserPackage]:
+    planned: list[_PlannedUserPackage] = []
     built: set[str] = set()
     for event in events:
         action = event.get("action")
@@ -215,30 +251,17 @@ def _build_event_actions(
         validate_path_component(name, "function name")
         if name in built:
             continue
-        source_dir = layout.event_actions_dir / name
-        source_hash = _hash_source(name, source_dir)
-        target = layout.build_dir / f"{name}.zip"
-        _build_archive(layout, source_dir, target)
-        _publish_build_metadata(
-            project_path,
-            layout,
-            name,
-            source_hash,
-            target,
-            active,
-        )
-        packages[name] = target
+        planned.append(_plan_package(layout, name, layout.event_actions_dir / name))
         built.add(name)
+    return planned
 
 
-def _build_processors(
-    project_path: Path,
+def _plan_processors(
     layout: _UserPackageLayout,
     devices: list[dict],
     twin_name: str,
-    packages: dict[str, Path],
-    active: set[str],
-) -> None:
+) -> list[_PlannedUserPackage]:
+    planned: list[_PlannedUserPackage] = []
     built: set[str] = set()
     for device in devices:
         device_id = device.get("id")
@@ -247,50 +270,23 @@ def _build_processors(
         validate_path_component(device_id, "device id")
         if device_id in built:
             continue
-        name = f"processor-{device_id}"
-        source_dir = layout.processors_dir / device_id
-        source_hash = _hash_source(name, source_dir)
-        target = layout.build_dir / f"{name}.zip"
-        _build_archive(
-            layout,
-            source_dir,
-            target,
-            twin_name=twin_name,
-            device_id=device_id,
-        )
-        packages[name] = target
-        _publish_build_metadata(
-            project_path,
-            layout,
-            name,
-            source_hash,
-            target,
-            active,
+        planned.append(
+            _plan_package(
+                layout,
+                f"processor-{device_id}",
+                layout.processors_dir / device_id,
+                twin_name=twin_name,
+                device_id=device_id,
+            )
         )
         built.add(device_id)
+    return planned
 
 
-def _build_feedback(
-    project_path: Path,
-    layout: _UserPackageLayout,
-    packages: dict[str, Path],
-    active: set[str],
-) -> None:
+def _plan_feedback(layout: _UserPackageLayout) -> list[_PlannedUserPackage]:
     if not layout.feedback_dir.exists():
-        return
-    name = "event-feedback"
-    source_hash = _hash_source(name, layout.feedback_dir)
-    target = layout.build_dir / f"{name}.zip"
-    _build_archive(layout, layout.feedback_dir, target)
-    packages[name] = target
-    _publish_build_metadata(
-        project_path,
-        layout,
-        name,
-        source_hash,
-        target,
-        active,
-    )
+        return []
+    return [_plan_package(layout, "event-feedback", layout.feedback_dir)]
 
 
 def build_user_packages(
@@ -307,9 +303,22 @@ def build_user_packages(
     packages: dict[str, Path] = {}
     active: set[str] = set()
 
-    _build_event_actions(project_path, layout, events, packages, active)
-    _build_processors(project_path, layout, devices, twin_name, packages, active)
-    _build_feedback(project_path, layout, packages, active)
+    planned = [
+        *_plan_event_actions(layout, events),
+        *_plan_processors(layout, devices, twin_name),
+        *_plan_feedback(layout),
+    ]
+    run_package_builds([package.build for package in planned])
+    for package in planned:
+        packages[package.name] = package.build.path
+        _publish_build_metadata(
+            project_path,
+            layout,
+            package.name,
+            package.source_hash,
+            package.build.path,
+            active,
+        )
     _reconcile_user_hash_metadata(project_path, layout.provider, active)
     logger.info("Built %s user packages for %s", len(packages), layout.provider)
     return packages
@@ -0,0 +1,473 @@
+"""Layered Terraform stacks with one state each and an explicit output DAG.
+
+A Terraform directory may declare independent stacks in ``stacks.json``::
+
+    {
+      "stacks": [
+        {"name": "aws", "module": "stacks/aws"},
+        {"name": "azure", "module": "stacks/azure"},
+        {
+          "name": "cross_cloud",
+          "module": "stacks/cross_cloud",
+          "depends_on": ["aws", "azure"],
+          "inputs": {"aws_ingestion_url": "aws.ingestion_url"}
+        }
+      ]
+    }
+
+Every stack is its own root module with its own state, Terraform root, and
+tfvars. One stack may use ``"module": "."``, the directory itself; that root
+stack keeps the project's single-root state and Terraform root, so existing
+deployments, status checks, and incremental applies keep working for it. A stack receives the generated tfvars values for the variables it
+declares, plus ``inputs``: variables filled from outputs of the stacks it
+depends on. Stacks whose dependencies are satisfied run concurrently, and
+their streamed lines are tagged with the stack name. Destroy walks the same
+DAG in reverse.
+
+Splitting a stack out of the root module moves its resources out of the
+root state the first time the stack runs, so they are neither destroyed nor
+created twice.
+
+Without a manifest the directory is a single root module, and the deployer
+keeps using one runner and one state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+import re
+from typing import AsyncIterator, Callable, Mapping
+
+from src.core.secure_files import atomic_write_private_bytes
+from src.terraform_runner import TerraformRunner
+from src.terraform_state import (
+    STACK_STATES_DIR_NAME,
+    UnsupportedTerraformState,
+    read_terraform_state,
+)
+from src.terraform_workdir import prepare_terraform_root
+
+logger = logging.getLogger(__name__)
+
+STACK_MANIFEST_NAME = "stacks.json"
+DEFAULT_MAX_PARALLEL_STACKS = 3
+_STACK_NAME = re.compile(r"^[a-z][a-z0-9_-]{0,62}$")
+_VARIABLE_BLOCK = re.compile(r'^\s*variable\s+"([^"]+)"', re.MULTILINE)
+_RESOURCE_BLOCK = re.compile(r'^\s*(resource|data)\s+"([^"]+)"\s+"([^"]+)"', re.MULTILINE)
+_INSTANCE_KEY = re.compile(r"\[[^\]]*\]$")
+
+
+@dataclass(frozen=True)
+class TerraformStack:
+    """One independently applied root module."""
+
+    name: str
+    module_dir: Path
+    depends_on: tuple[str, ...] = ()
+    inputs: Mapping[str, str] = field(default_factory=dict)
+    root: bool = False
+
+
+@dataclass(frozen=True)
+class StackLayout:
+    """Validated, topologically ordered stacks of one Terraform directory."""
+
+    stacks: tuple[TerraformStack, ...]
+
+    def get(self, name: str) -> TerraformStack:
+        return next(stack for stack in self.stacks if stack.name == name)
+
+    @property
+    def root(self) -> TerraformStack | None:
+        return next((stack for stack in self.stacks if stack.root), None)
+
+    def dependents(self, name: str) -> tuple[str, ...]:
+        return tuple(stack.name for stack in self.stacks if name in stack.depends_on)
+
+    def waves(self) -> list[list[str]]:
+        """Group stacks into levels that may run side by side."""
+        level: dict[str, int] = {}
+        for stack in self.stacks:
+            level[stack.name] = 1 + max((level[name] for name in stack.depends_on), default=-1)
+        waves: list[list[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for stack in self.stacks:
+            waves[level[stack.name]].append(stack.name)
+        return waves
+
+    def describe(self) -> str:
+        return " -> ".join(", ".join(wave) for wave in self.waves())
+
+
+def load_stack_layout(terraform_dir: Path) -> StackLayout | None:
+    """
+    Load ``stacks.json`` from ``terraform_dir``.
+
+    Returns:
+        The validated layout in dependency order, or ``None`` when the
+        directory is a single root module
+
+    Raises:
+        ValueError: If the manifest is malformed, references unknown stacks
+            or outputs of non-dependencies, escapes ``terraform_dir``, uses
+            ``terraform_dir`` itself more than once, or is cyclic
+    """
+    terraform_dir = Path(terraform_dir)
+    manifest_path = terraform_dir / STACK_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise ValueError(f"Invalid {STACK_MANIFEST_NAME}: {exc}") from exc
+    entries = manifest.get("stacks") if isinstance(manifest, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{STACK_MANIFEST_NAME} must list at least one stack")
+
+    root = terraform_dir.resolve()
+    stacks: dict[str, TerraformStack] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError("Each stack must be an object")
+        name = entry.get("name")
+        if not isinstance(name, str) or not _STACK_NAME.match(name):
+            raise ValueError(f"Invalid stack name: {name!r}")
+        if name in stacks:
+            raise ValueError(f"Duplicate stack name: {name}")
+        module = str(entry.get("module", ""))
+        module_dir = (terraform_dir / module).resolve()
+        is_root = module_dir == root and module == "."
+        if not is_root and (
+            module_dir == root or not module_dir.is_relative_to(root) or not module_dir.is_dir()
+        ):
+            raise ValueError(f"Stack {name} module must be a subdirectory of {terraform_dir}")
+        if is_root and any(stack.root for stack in stacks.values()):
+            raise ValueError(f"Only one stack may use {terraform_dir} itself")
+        depends_on = tuple(entry.get("depends_on", ()))
+        inputs = dict(entry.get("inputs", {}))
+        for variable, reference in inputs.items():
+            upstream, _, output = str(reference).partition(".")
+            if not output or upstream not in depends_on:
+                raise ValueError(
+                    f"Stack {name} input {variable} must reference '<dependency>.<output>'"
+                )
+        stacks[name] = TerraformStack(name, module_dir, depends_on, inputs, is_root)
+
+    ordered: list[TerraformStack] = []
+    placed: set[str] = set()
+    pending = list(stacks.values())
+    for stack in pending:
+        unknown = set(stack.depends_on) - set(stacks)
+        if unknown:
+            raise ValueError(f"Stack {stack.name} depends on unknown stacks: {sorted(unknown)}")
+    while pending:
+        ready = [stack for stack in pending if set(stack.depends_on) <= placed]
+        if not ready:
+            raise ValueError(
+                "Stack dependencies are cyclic: " + ", ".join(stack.name for stack in pending)
+            )
+        for stack in ready:
+            ordered.append(stack)
+            placed.add(stack.name)
+            pending.remove(stack)
+    return StackLayout(tuple(ordered))
+
+
+def default_max_parallel_stacks() -> int:
+    configured = os.environ.get("DEPLOYER_TERRAFORM_STACK_WORKERS")
+    if configured:
+        workers = int(configured)
+        if workers <= 0:
+            raise ValueError("DEPLOYER_TERRAFORM_STACK_WORKERS must be positive")
+        return workers
+    return DEFAULT_MAX_PARALLEL_STACKS
+
+
+class StackExecutor:
+    """Apply, read, and destroy the stacks of one project."""
+
+    def __init__(
+        self,
+        layout: StackLayout,
+        *,
+        project_path: Path,
+        terraform_root_dir: Path,
+        base_tfvars_path: Path,
+        force_init: bool = False,
+        max_parallel: int | None = None,
+        apply_root: Callable[[], AsyncIterator[str]] | None = None,
+    ) -> None:
+        self.layout = layout
+        self.project_path = Path(project_path)
+        self.terraform_root_dir = Path(terraform_root_dir)
+        self.base_tfvars_path = Path(base_tfvars_path)
+        self.force_init = force_init
+        self.max_parallel = max_parallel or default_max_parallel_stacks()
+        # Lets the deployer init and apply the root stack itself, for example
+        # incrementally; other stacks always get a full apply.
+        self.apply_root = apply_root
+        self.outputs: dict[str, dict] = {}
+        self._runners: dict[str, TerraformRunner] = {}
+
+    def stack_dir(self, name: str) -> Path:
+        return self.project_path / "terraform" / STACK_STATES_DIR_NAME / name
+
+    def state_path(self, name: str) -> Path:
+        if self.layout.get(name).root:
+            return self.project_path / "terraform" / "terraform.tfstate"
+        return self.stack_dir(name) / "terraform.tfstate"
+
+    def runner(self, name: str) -> TerraformRunner:
+        if name not in self._runners:
+            stack = self.layout.get(name)
+            root_dir = (
+                self.terraform_root_dir
+                if stack.root
+                else self.terraform_root_dir / STACK_STATES_DIR_NAME / name
+            )
+            root = prepare_terraform_root(stack.module_dir, root_dir)
+            self._runners[name] = TerraformRunner(
+                terraform_dir=str(root),
+                state_path=str(self.state_path(name)),
+                force_init=self.force_init,
+            )
+        return self._runners[name]
+
+    def stack_outputs(self, name: str) -> dict:
+        if name not in self.outputs:
+            self.outputs[name] = self.runner(name).output()
+        return self.outputs[name]
+
+    def merged_outputs(self) -> dict:
+        """Merge stack outputs in dependency order for post-deployment steps."""
+        merged: dict = {}
+        for stack in self.layout.stacks:
+            outputs = self.stack_outputs(stack.name)
+            duplicates = set(merged) & set(outputs)
+            if duplicates:
+                logger.warning(
+                    "Stack %s overrides outputs of earlier stacks: %s",
+                    stack.name,
+                    ", ".join(sorted(duplicates)),
+                )
+            merged.update(outputs)
+        return merged
+
+    def has_resources(self) -> bool:
+        return any(
+            self.runner(stack.name).has_root_resources()
+            for stack in self.layout.stacks
+            if self.state_path(stack.name).is_file()
+        )
+
+    def migrate_root_state(self) -> list[str]:
+        """
+        Move resources of stacks split out of the root module into their state.
+
+        A stack without state yet takes over every resource it declares that
+        the root stack no longer declares but its state still tracks. Returns
+        one log line per stack that took resources over.
+        """
+        root = self.layout.root
+        if root is None or not self.state_path(root.name).is_file():
+            return []
+        tracked = {
+            _INSTANCE_KEY.sub("", address)
+            for address in self._root_state_addresses(root.name)
+            if not address.startswith("module.")
+        }
+        kept = _declared_addresses(root.module_dir)
+        moves = {
+            stack.name: sorted((_declared_addresses(stack.module_dir) - kept) & tracked)
+            for stack in self.layout.stacks
+            if not stack.root and not self.state_path(stack.name).exists()
+        }
+        moves = {name: addresses for name, addresses in moves.items() if addresses}
+        if not moves:
+            return []
+        runner = self.runner(root.name)
+        runner.init()
+        lines = []
+        for name, addresses in moves.items():
+            self.stack_dir(name).mkdir(parents=True, exist_ok=True)
+            for address in addresses:
+                runner.state_move(address, str(self.state_path(name)))
+            lines.append(
+                f"[{name}] Moved {len(addresses)} resources out of the {root.name} state"
+            )
+        return lines
+
+    def _root_state_addresses(self, name: str) -> list[str]:
+        try:
+            view = read_terraform_state(self.state_path(name))
+        except UnsupportedTerraformState:
+            result = self.runner(name).state_list()
+            return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        return [] if view is None else list(view.resource_addresses)
+
+    def write_tfvars(self, name: str) -> Path:
+        """Write the stack's tfvars: its declared variables plus upstream outputs."""
+        stack = self.layout.get(name)
+        base = json.loads(self.base_tfvars_path.read_text(encoding="utf-8"))
+        declared = set()
+        for path in sorted(stack.module_dir.glob("*.tf")):
+            declared.update(_VARIABLE_BLOCK.findall(path.read_text(encoding="utf-8")))
+        values = {key: value for key, value in base.items() if key in declared}
+        for variable, reference in stack.inputs.items():
+            upstream, _, output = reference.partition(".")
+            outputs = self.stack_outputs(upstream)
+            if output not in outputs:
+                raise ValueError(f"Stack {name} input {variable}: {reference} is not an output")
+            values[variable] = outputs[output]
+        target = self.stack_dir(name) / "generated.tfvars.json"
+        atomic_write_private_bytes(
+            target,
+            json.dumps(values, indent=2, sort_keys=True).encode("utf-8"),
+        )
+        return target
+
+    async def apply_async(self) -> AsyncIterator[str]:
+        """Apply every stack, running independent ones concurrently."""
+
+        async def apply_stack(name: str) -> AsyncIterator[str]:
+            runner = await asyncio.to_thread(self.runner, name)
+            if self.layout.get(name).root and self.apply_root is not None:
+                async for line in self.apply_root():
+                    yield line
+            else:
+                tfvars = await asyncio.to_thread(self.write_tfvars, name)
+                async for line in runner.init_async():
+                    yield line
+                async for line in runner.apply_async(str(tfvars)):
+                    yield line
+            self.outputs[name] = await asyncio.to_thread(runner.output)
+
+        self.outputs.clear()
+        for line in await asyncio.to_thread(self.migrate_root_state):
+            yield line
+        dependencies = {stack.name: stack.depends_on for stack in self.layout.stacks}
+        async for line in self._run_graph(dependencies, apply_stack):
+            yield line
+
+    async def destroy_async(self) -> AsyncIterator[str]:
+        """Destroy every stack after all stacks that consume its outputs."""
+
+        async def destroy_stack(name: str) -> AsyncIterator[str]:
+            runner = await asyncio.to_thread(self.runner, name)
+            tfvars = await asyncio.to_thread(self.write_tfvars, name)
+            async for line in runner.init_async():
+                yield line
+            async for line in runner.destroy_async(str(tfvars)):
+                yield line
+
+        for line in await asyncio.to_thread(self.migrate_root_state):
+            yield line
+        dependencies = {stack.name: self.layout.dependents(stack.name) for stack in self.layout.stacks}
+        async for line in self._run_graph(dependencies, destroy_stack):
+            yield line
+
+    def apply(self) -> dict:
+        _drain(self.apply_async)
+        return self.merged_outputs()
+
+    def destroy(self) -> None:
+        _drain(self.destroy_async)
+
+    async def _run_graph(
+        self,
+        dependencies: dict[str, tuple[str, ...]],
+        action: Callable[[str], AsyncIterator[str]],
+    ) -> AsyncIterator[str]:
+        """
+        Run ``action`` per stack once its dependencies finished.
+
+        A failed stack blocks its transitive dependents, while unrelated
+        stacks run to completion; the first failure in layout order is raised
+        after every started stack settled.
+        """
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        finished = {name: asyncio.Event() for name in dependencies}
+        unavailable: set[str] = set()
+        failures: dict[str, BaseException] = {}
+        limiter = asyncio.Semaphore(self.max_parallel)
+
+        async def run(name: str) -> None:
+            try:
+                for dependency in dependencies[name]:
+                    await finished[dependency].wait()
+                blocked = sorted(set(dependencies[name]) & unavailable)
+                if blocked:
+                    unavailable.add(name)
+                    await queue.put(f"[{name}] Skipped: {', '.join(blocked)} did not complete")
+                    return
+                async with limiter:
+                    async for line in action(name):
+                        await queue.put(f"[{name}] {line}")
+                await queue.put(f"[{name}] ✓ Stack complete")
+            except Exception as exc:
+                unavailable.add(name)
+                failures[name] = exc
+                await queue.put(f"[{name}] ✗ Stack failed ({type(exc).__name__})")
+            finally:
+                finished[name].set()
+
+        tasks = [asyncio.create_task(run(name)) for name in dependencies]
+
+        async def close() -> None:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await queue.put(None)
+
+        closer = asyncio.create_task(close())
+        try:
+            while (line := await queue.get()) is not None:
+                yield line
+        finally:
+            for task in (*tasks, closer):
+                task.cancel()
+            await asyncio.gather(*tasks, closer, return_exceptions=True)
+        for stack in self.layout.stacks:
+            if stack.name in failures:
+                raise failures[stack.name]
+
+
+def _declared_addresses(module_dir: Path) -> set[str]:
+    """Return the resource and data source addresses a module declares."""
+    addresses = set()
+    for path in sorted(Path(module_dir).glob("*.tf")):
+        for kind, resource_type, name in _RESOURCE_BLOCK.findall(path.read_text(encoding="utf-8")):
+            addresses.add(f"{'data.' if kind == 'data' else ''}{resource_type}.{name}")
+    return addresses
+
+
+def _drain(lines: Callable[[], AsyncIterator[str]]) -> None:
+    """Consume ``lines`` to completion, logging each line."""
+
+    async def consume() -> None:
+        async for line in lines():
+            logger.info(line)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(consume())
+        return
+    # A synchronous deploy called from a coroutine cannot start a nested loop;
+    # run the stacks on a loop of their own in a worker thread instead.
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="terraform-stacks") as executor:
+        executor.submit(context.run, asyncio.run, consume()).result()
+
+
+__all__ = [
+    "STACK_MANIFEST_NAME",
+    "StackExecutor",
+    "StackLayout",
+    "TerraformStack",
+    "load_stack_layout",
+]
@@ -8,6 +8,7 @@ from logger import logger
 from src.core.observability import redact_sensitive
 from src.core.paths import resolve_project_context_path
 from src.terraform_runner import TerraformRunner
+from src.terraform_state import project_state_paths
 
 
 def load_terraform_outputs(project_name: str, project_path: Path | None = None) -> dict:
@@ -19,11 +20,17 @@ def load_terraform_outputs(project_name: str, project_path: Path | None = None)
         return {}
 
     terraform_dir = Path(__file__).resolve().parent / "terraform"
+    outputs: dict = {}
     try:
-        return TerraformRunner(
-            terraform_dir=str(terraform_dir),
-            state_path=str(state_path),
-        ).output()
+        # Split-out stacks keep their own state; their outputs are merged in.
+        for path in project_state_paths(state_path):
+            outputs.update(
+                TerraformRunner(
+                    terraform_dir=str(terraform_dir),
+                    state_path=str(path),
+                ).output()
+            )
     except Exception as exc:
         logger.error(f"Failed to read Terraform outputs: {redact_sensitive(exc)}")
         return {}
+    return outputs
@@ -0,0 +1,339 @@
+"""
+Concurrent, cached execution of deployment status probes.
+
+The dashboard polls the status and verification endpoints. Each poll used to
+initialize provider SDK clients and query L1, L4 and L5 one after another,
+so every poll paid several cloud round-trips in sequence. This module makes
+polling cheap:
+
+- independent probes run concurrently on one bounded, process-wide executor,
+  each with its own timeout, so one slow provider cannot stall the response
+- initialized provider clients are reused per project and credential set
+- probe results are cached for a short TTL; concurrent pollers of the same
+  project share one in-flight probe
+
+Deploy and destroy invalidate a project's cached results and clients when
+they finish, so the first poll afterwards always reflects the new state.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+import contextvars
+import copy
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Generic, Hashable, Mapping, TypeVar
+
+DEFAULT_STATUS_CACHE_TTL_SECONDS = 10.0
+DEFAULT_STATUS_PROBE_TIMEOUT_SECONDS = 20.0
+DEFAULT_STATUS_PROBE_WORKERS = 8
+DEFAULT_PROVIDER_CLIENT_IDLE_SECONDS = 900.0
+T = TypeVar("T")
+
+
+def default_status_cache_ttl() -> float:
+    configured = os.environ.get("DEPLOYER_STATUS_CACHE_TTL_SECONDS")
+    if configured:
+        ttl = float(configured)
+        if ttl < 0:
+            raise ValueError("DEPLOYER_STATUS_CACHE_TTL_SECONDS must not be negative")
+        return ttl
+    return DEFAULT_STATUS_CACHE_TTL_SECONDS
+
+
+def default_status_probe_timeout() -> float:
+    configured = os.environ.get("DEPLOYER_STATUS_PROBE_TIMEOUT_SECONDS")
+    if configured:
+        timeout = float(configured)
+        if timeout <= 0:
+            raise ValueError("DEPLOYER_STATUS_PROBE_TIMEOUT_SECONDS must be positive")
+        return timeout
+    return DEFAULT_STATUS_PROBE_TIMEOUT_SECONDS
+
+
+def default_status_probe_workers() -> int:
+    configured = os.environ.get("DEPLOYER_STATUS_PROBE_WORKERS")
+    if configured:
+        workers = int(configured)
+        if workers <= 0:
+            raise ValueError("DEPLOYER_STATUS_PROBE_WORKERS must be positive")
+        return workers
+    return DEFAULT_STATUS_PROBE_WORKERS
+
+
+def default_provider_client_idle_seconds() -> float:
+    configured = os.environ.get("DEPLOYER_STATUS_CLIENT_IDLE_SECONDS")
+    if configured:
+        idle = float(configured)
+        if idle < 0:
+            raise ValueError("DEPLOYER_STATUS_CLIENT_IDLE_SECONDS must not be negative")
+        return idle
+    return DEFAULT_PROVIDER_CLIENT_IDLE_SECONDS
+
+
+def fingerprint(value: Any) -> str:
+    """Return a stable digest of JSON-like probe inputs (never the inputs)."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_status_probe_executor() -> ThreadPoolExecutor:
+    """Return the shared executor that bounds concurrent status probes."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=default_status_probe_workers(),
+                thread_name_prefix="status-probe",
+            )
+        return _executor
+
+
+class ProbeBatch(Generic[T]):
+    """
+    Probes submitted together; ``results`` waits for each up to its timeout.
+
+    Probes must not wait on other probes: submit nested fan-outs from the
+    calling thread so a full executor cannot deadlock on itself. A probe that
+    times out keeps its worker until it returns, but its result is discarded.
+    """
+
+    def __init__(
+        self,
+        probes: Mapping[str, Callable[[], T]],
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        self.timeout = timeout if timeout is not None else default_status_probe_timeout()
+        executor = get_status_probe_executor()
+        self._started = time.monotonic()
+        self._futures: dict[str, Future] = {
+            name: executor.submit(contextvars.copy_context().run, probe)
+            for name, probe in probes.items()
+        }
+
+    def results(self, on_timeout: Callable[[str], T]) -> dict[str, T]:
+        """Return probe results by name; exceptions from probes propagate."""
+        collected: dict[str, T] = {}
+        for name, future in self._futures.items():
+            remaining = self.timeout - (time.monotonic() - self._started)
+            try:
+                collected[name] = future.result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                future.cancel()
+                collected[name] = on_timeout(name)
+        return collected
+
+
+def run_probes(
+    probes: Mapping[str, Callable[[], T]],
+    on_timeout: Callable[[str], T],
+    *,
+    timeout: float | None = None,
+) -> dict[str, T]:
+    """Run independent probes concurrently and collect their results."""
+    return ProbeBatch(probes, timeout=timeout).results(on_timeout)
+
+
+def timeout_message(timeout: float) -> str:
+    return f"Status probe timed out after {timeout:g}s"
+
+
+@dataclass
+class _Flight:
+    generation: int
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    succeeded: bool = False
+
+
+class StatusCache:
+    """
+    Short-lived per-project cache of probe results with single-flight.
+
+    ``invalidate`` bumps the project generation, so a probe that started
+    before the invalidation cannot store its now-stale result.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._inflight: dict[tuple[str, Hashable], _Flight] = {}
+        self._generations: dict[str, int] = {}
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else default_status_cache_ttl()
+
+    def get_or_compute(self, project_name: str, key: Hashable, compute: Callable[[], T]) -> T:
+        ttl = self.ttl
+        if ttl <= 0:
+            return compute()
+        slot = (project_name, key)
+        with self._lock:
+            cached = self._entries.get(slot)
+            if cached is not None and cached[0] > self._clock():
+                return copy.deepcopy(cached[1])
+            flight = self._inflight.get(slot)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[slot] = _Flight(self._generations.get(project_name, 0))
+        if not leader:
+            flight.done.wait()
+            if flight.succeeded:
+                return copy.deepcopy(flight.value)
+            return compute()
+
+        try:
+            value = compute()
+        except BaseException:
+            with self._lock:
+                if self._inflight.get(slot) is flight:
+                    del self._inflight[slot]
+            flight.done.set()
+            raise
+        with self._lock:
+            if self._inflight.get(slot) is flight:
+                del self._inflight[slot]
+            now = self._clock()
+            if self._generations.get(project_name, 0) == flight.generation:
+                self._entries = {
+                    entry_slot: entry
+                    for entry_slot, entry in self._entries.items()
+                    if entry[0] > now
+                }
+                self._entries[slot] = (now + ttl, value)
+            flight.value = value
+            flight.succeeded = True
+        flight.done.set()
+        return copy.deepcopy(value)
+
+    def invalidate(self, project_name: str) -> None:
+        with self._lock:
+            self._generations[project_name] = self._generations.get(project_name, 0) + 1
+            for slots in (self._entries, self._inflight):
+                for slot in [slot for slot in slots if slot[0] == project_name]:
+                    del slots[slot]
+
+
+class ProviderClientPool:
+    """
+    Initialized provider SDK clients, reused per project and credential set.
+
+    Clients are keyed by a digest of their credentials, so rotated
+    credentials get fresh clients. Idle clients are dropped after
+    ``idle_seconds``; ``0`` disables reuse.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._clients: dict[tuple[str, str, str], tuple[float, Any]] = {}
+        self._init_locks: dict[tuple[str, str, str], threading.Lock] = {}
+
+    @property
+    def idle_seconds(self) -> float:
+        if self._idle_seconds is not None:
+            return self._idle_seconds
+        return default_provider_client_idle_seconds()
+
+    def get(
+        self,
+        project_name: str,
+        provider_name: str,
+        credentials_fingerprint: str,
+        create: Callable[[], T],
+    ) -> T:
+        """Return the pooled client, creating it at most once concurrently."""
+        if self.idle_seconds <= 0:
+            return create()
+        key = (project_name, provider_name, credentials_fingerprint)
+        with self._lock:
+            client = self._touch_locked(key)
+            if client is not None:
+                return client
+            init_lock = self._init_locks.setdefault(key, threading.Lock())
+        with init_lock:
+            with self._lock:
+                client = self._touch_locked(key)
+                if client is not None:
+                    return client
+            client = create()
+            with self._lock:
+                if self._init_locks.get(key) is init_lock:
+                    self._clients[key] = (self._clock(), client)
+            return client
+
+    def invalidate(self, project_name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._clients if key[0] == project_name]:
+                del self._clients[key]
+            for key in [key for key in self._init_locks if key[0] == project_name]:
+                del self._init_locks[key]
+
+    def _touch_locked(self, key: tuple[str, str, str]) -> Any:
+        now = self._clock()
+        idle_seconds = self.idle_seconds
+        for stale in [
+            stale
+            for stale, (used_at, _client) in self._clients.items()
+            if now - used_at > idle_seconds
+        ]:
+            del self._clients[stale]
+            self._init_locks.pop(stale, None)
+        entry = self._clients.get(key)
+        if entry is None:
+            return None
+        self._clients[key] = (now, entry[1])
+        return entry[1]
+
+
+_status_cache: StatusCache | None = None
+_client_pool: ProviderClientPool | None = None
+_singletons_lock = threading.Lock()
+
+
+def get_status_cache() -> StatusCache:
+    """Return the process-wide status result cache."""
+    global _status_cache
+    with _singletons_lock:
+        if _status_cache is None:
+            _status_cache = StatusCache()
+        return _status_cache
+
+
+def get_provider_client_pool() -> ProviderClientPool:
+    """Return the process-wide pool of initialized provider clients."""
+    global _client_pool
+    with _singletons_lock:
+        if _client_pool is None:
+            _client_pool = ProviderClientPool()
+        return _client_pool
+
+
+def invalidate_project_status(project_name: str) -> None:
+    """Drop cached status results and provider clients after a deploy or destroy."""
+    get_status_cache().invalidate(project_name)
+    get_provider_client_pool().invalidate(project_name)
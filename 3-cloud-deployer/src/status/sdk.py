@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable
 
 from src.core.factory import create_context
 from src.core.observability import redact_sensitive, redact_structure
 from src.core.registry import ProviderRegistry
+from src.status.engine import (
+    ProbeBatch,
+    fingerprint,
+    get_provider_client_pool,
+    get_status_cache,
+    timeout_message,
+)
+
+# Component key -> (layer provider key, provider info method)
+SDK_COMPONENTS = {
+    "twin_management": ("layer_4_provider", "info_l4"),
+    "iot_devices": ("layer_1_provider", "info_l1"),
+    "visualization": ("layer_5_provider", "info_l5"),
+}
 
 
 def _safe(value: Any) -> Any:
@@ -17,20 +32,32 @@ def _component(status: str, provider: str, **details) -> dict[str, Any]:
     return {"status": status, "provider": provider, **_safe(details)}
 
 
-def _initialize_provider(context, provider_name: str):
+def _initialize_provider(context, provider_name: str, project_name: str):
     if provider_name in context.providers:
         return context.providers[provider_name]
     credentials = context.credentials.get(provider_name, {})
     if not credentials and provider_name != "aws":
         raise ValueError(f"Credentials not configured for {provider_name}")
-    provider = ProviderRegistry.get(provider_name)
-    provider.initialize_clients(credentials, context.config.digital_twin_name)
+    twin_name = context.config.digital_twin_name
+
+    def create():
+        provider = ProviderRegistry.get(provider_name)
+        provider.initialize_clients(credentials, twin_name)
+        return provider
+
+    provider = get_provider_client_pool().get(
+        project_name,
+        provider_name,
+        fingerprint({"credentials": credentials, "twin": twin_name}),
+        create,
+    )
     context.providers[provider_name] = provider
     return provider
 
 
 def _probe(
     context,
+    project_name: str,
     provider_name: str | None,
     method_name: str,
     *,
@@ -39,7 +66,7 @@ def _probe(
     if not configured or not provider_name or provider_name == "none":
         return _component("not_configured", provider_name or "")
     try:
-        provider = _initialize_provider(context, provider_name)
+        provider = _initialize_provider(context, provider_name, project_name)
         method: Callable = getattr(provider, method_name)
         details = method(context)
         if details:
@@ -59,7 +86,12 @@ def check_sdk_managed(
     *,
     context=None,
 ) -> dict[str, Any]:
-    """Probe each component through the provider configured for its layer."""
+    """
+    Probe each component through the provider configured for its layer.
+
+    Components are probed concurrently and the result is cached briefly per
+    project, layer assignment, and credential set; see ``src.status.engine``.
+    """
     del provider  # Kept in the public contract for backward compatibility.
     try:
         context = context or create_context(project_name)
@@ -74,16 +106,49 @@ def check_sdk_managed(
         }
 
     providers = context.config.providers
-    l1 = providers.get("layer_1_provider")
-    l4 = providers.get("layer_4_provider")
-    l5 = providers.get("layer_5_provider")
+    owners = {
+        component: providers.get(layer_key)
+        for component, (layer_key, _method) in SDK_COMPONENTS.items()
+    }
+    key = fingerprint(
+        {
+            "owners": owners,
+            "twin": context.config.digital_twin_name,
+            "credentials": context.credentials,
+        }
+    )
+    return get_status_cache().get_or_compute(
+        project_name,
+        ("sdk", key),
+        lambda: _probe_components(project_name, context, owners),
+    )
+
+
+def _probe_components(
+    project_name: str,
+    context,
+    owners: dict[str, str | None],
+) -> dict[str, Any]:
+    batch = ProbeBatch(
+        {
+            component: functools.partial(
+                _probe, context, project_name, owners[component], method_name
+            )
+            for component, (_layer_key, method_name) in SDK_COMPONENTS.items()
+        }
+    )
+    components = batch.results(
+        lambda component: _component(
+            "error",
+            owners[component] or "",
+            message=timeout_message(batch.timeout),
+        )
+    )
     result = {
         "provider": "/".join(
-            sorted({name for name in (l1, l4, l5) if name and name != "none"})
+            sorted({name for name in owners.values() if name and name != "none"})
         ),
-        "twin_management": _probe(context, l4, "info_l4"),
-        "iot_devices": _probe(context, l1, "info_l1"),
-        "visualization": _probe(context, l5, "info_l5"),
+        **components,
     }
     statuses = [component["status"] for component in result.values() if isinstance(component, dict)]
     if any(status == "error" for status in statuses):
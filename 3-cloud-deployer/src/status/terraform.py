@@ -10,6 +10,11 @@ from logger import logger
 from src.core.observability import redact_sensitive
 from src.core.paths import resolve_project_context_path
 from src.terraform_runner import TerraformRunner
+from src.terraform_state import (
+    UnsupportedTerraformState,
+    project_state_paths,
+    read_terraform_state,
+)
 from src.tfvars_generator import generate_tfvars
 
 
@@ -32,15 +37,40 @@ def _empty_state(status: str, *, error: str | None = None) -> dict[str, Any]:
     return result
 
 
-def _runner(project_name: str, project_path: Path | None = None) -> TerraformRunner:
+def _state_path(project_name: str, project_path: Path | None = None) -> Path:
     project_path = project_path or resolve_project_context_path(project_name)
+    return project_path / "terraform" / "terraform.tfstate"
+
+
+def _runner(project_name: str, project_path: Path | None = None) -> TerraformRunner:
     terraform_dir = Path(__file__).resolve().parents[1] / "terraform"
     return TerraformRunner(
         str(terraform_dir),
-        state_path=str(project_path / "terraform" / "terraform.tfstate"),
+        state_path=str(_state_path(project_name, project_path)),
     )
 
 
+def _state_resources(
+    project_name: str,
+    project_path: Path | None = None,
+) -> list[str] | None:
+    """
+    Return resource addresses from the local states, or ``None`` to use the CLI.
+
+    Covers the root state and the states of stacks split out of it.
+    """
+    resources: list[str] = []
+    try:
+        for state_path in project_state_paths(_state_path(project_name, project_path)):
+            view = read_terraform_state(state_path)
+            if view is not None:
+                resources.extend(view.resource_addresses)
+    except UnsupportedTerraformState as exc:
+        logger.debug("Falling back to terraform state list: %s", exc)
+        return None
+    return resources
+
+
 def run_terraform_status_command(
     args: list[str],
     project_name: str,
@@ -70,17 +100,24 @@ def check_terraform_state(
     project_name: str,
     project_path: Path | None = None,
 ) -> dict[str, Any]:
-    """Classify canonical Terraform addresses without calling cloud APIs."""
+    """
+    Classify canonical Terraform addresses without calling cloud APIs.
+
+    Addresses come from the cached local state; ``terraform state list`` only
+    runs when the state cannot be parsed directly.
+    """
     try:
-        result = run_terraform_status_command(
-            ["state", "list"], project_name, project_path
-        )
+        resources = _state_resources(project_name, project_path)
+        if resources is None:
+            result = run_terraform_status_command(
+                ["state", "list"], project_name, project_path
+            )
     except Exception as exc:
         diagnostic = redact_sensitive(exc)
         logger.warning("Terraform state check failed: %s", diagnostic)
         return _empty_state("error", error="Terraform state check failed")
 
-    if result.returncode != 0:
+    if resources is None and result.returncode != 0:
         diagnostic = redact_sensitive(result.stderr or result.stdout)
         if (
             "no state file" in diagnostic.lower()
@@ -90,7 +127,8 @@ def check_terraform_state(
         logger.warning("Terraform state list failed: %s", diagnostic)
         return _empty_state("error", error="Terraform state list failed")
 
-    resources = [line for line in result.stdout.splitlines() if line.strip()]
+    if resources is None:
+        resources = [line for line in result.stdout.splitlines() if line.strip()]
     if not resources:
         return _empty_state("not_deployed")
 
@@ -137,6 +175,12 @@ def check_terraform_drift(
 ) -> dict[str, Any]:
     """Compare deployed resources to state using transient credential tfvars."""
     project_path = project_path or resolve_project_context_path(project_name)
+    if _state_resources(project_name, project_path) == []:
+        # Nothing is tracked, so a refresh-only plan cannot report drift.
+        return {
+            "status": "no_drift",
+            "message": "No Terraform-managed resources are deployed",
+        }
     try:
         with tempfile.TemporaryDirectory(prefix="twin2multicloud-drift-") as temp_dir:
             var_file = Path(temp_dir) / "generated.tfvars.json"
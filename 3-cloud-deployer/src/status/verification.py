@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+import functools
 from pathlib import Path
 from typing import Literal
 
 from src.core.config_loader import ProjectConfigLoader
 from src.core.factory import create_context
 from src.core.observability import redact_sensitive
+from src.status.engine import ProbeBatch, timeout_message
 from src.status.metadata import check_function_artifacts
 from src.status.sdk import check_sdk_managed
 from src.status.terraform import check_terraform_state
@@ -89,6 +91,50 @@ def _sdk_check(
     )
 
 
+def local_status_probes(
+    project_name: str,
+    project_path: Path | None = None,
+) -> ProbeBatch[dict]:
+    """Start the Terraform state and function metadata reads concurrently."""
+    args = (project_name, project_path) if project_path is not None else (project_name,)
+    return ProbeBatch(
+        {
+            "state": functools.partial(check_terraform_state, *args),
+            "metadata": functools.partial(check_function_artifacts, *args),
+        }
+    )
+
+
+def collect_local_status(batch: ProbeBatch[dict]) -> dict[str, dict]:
+    """Wait for ``local_status_probes``; a timed-out read reports an error."""
+
+    def timed_out(name: str) -> dict:
+        message = timeout_message(batch.timeout)
+        if name == "metadata":
+            return {"status": "error", "error": message, "functions": {}}
+        return {"status": "error", "error": message}
+
+    return batch.results(timed_out)
+
+
+def _terraform_check(state: dict) -> InfrastructureCheck:
+    if state.get("status") == "error":
+        return _check(
+            "Terraform state",
+            "fail",
+            detail=state.get("error", "State check failed"),
+            layer="L0",
+        )
+    if state.get("status") == "not_deployed":
+        return _check("Terraform state", "fail", detail="No deployment state", layer="L0")
+    return _check(
+        "Terraform state",
+        "pass",
+        detail=f"{state.get('total_resources', 0)} resources",
+        layer="L0",
+    )
+
+
 def verify_infrastructure(
     project_name: str,
     provider: str | None = None,
@@ -97,35 +143,10 @@ def verify_infrastructure(
 ) -> dict:
     """Combine independent local-state, metadata, and provider evidence."""
     del provider  # Layer ownership comes from the canonical project config.
+    # Local evidence is read on the probe executor while this thread loads
+    # the config and fans out the provider probes.
+    local = local_status_probes(project_name, project_path)
     checks: list[InfrastructureCheck] = []
-    state = (
-        check_terraform_state(project_name, project_path)
-        if project_path is not None
-        else check_terraform_state(project_name)
-    )
-    if state.get("status") == "error":
-        checks.append(
-            _check(
-                "Terraform state",
-                "fail",
-                detail=state.get("error", "State check failed"),
-                layer="L0",
-            )
-        )
-    elif state.get("status") == "not_deployed":
-        checks.append(
-            _check("Terraform state", "fail", detail="No deployment state", layer="L0")
-        )
-    else:
-        checks.append(
-            _check(
-                "Terraform state",
-                "pass",
-                detail=f"{state.get('total_resources', 0)} resources",
-                layer="L0",
-            )
-        )
-
     try:
         context = (
             ProjectConfigLoader().create_context_from_path(
@@ -137,6 +158,7 @@ def verify_infrastructure(
         )
         config = context.config
     except Exception as exc:
+        checks.append(_terraform_check(collect_local_status(local)["state"]))
         checks.append(
             _check(
                 "Project configuration",
@@ -147,8 +169,11 @@ def verify_infrastructure(
         )
         return _result(checks)
 
-    providers = config.providers
     sdk = check_sdk_managed(project_name, context=context)
+    evidence = collect_local_status(local)
+    state = evidence["state"]
+    checks.append(_terraform_check(state))
+    providers = config.providers
     checks.extend(
         [
             _state_check(
@@ -226,12 +251,18 @@ def verify_infrastructure(
         ]
     )
 
-    metadata = (
-        check_function_artifacts(project_name, project_path)
-        if project_path is not None
-        else check_function_artifacts(project_name)
-    )
-    if metadata["functions"]:
+    metadata = evidence["metadata"]
+    if metadata.get("status") == "error":
+        checks.append(
+            _check(
+                "User functions",
+                "fail",
+                providers.get("layer_2_provider", ""),
+                metadata.get("error", "Function metadata unavailable"),
+                "L2",
+            )
+        )
+    elif metadata["functions"]:
         deployed = sum(1 for item in metadata["functions"].values() if item["deployed"])
         total = len(metadata["functions"])
         checks.append(
@@ -99,10 +99,7 @@ locals {
   aws_l4_connector_function_name = "${var.digital_twin_name}-l4-connector"
   aws_l4_scene_id                = "main-scene"
 
-  # L5 Grafana
-  aws_l5_grafana_role_name      = "${var.digital_twin_name}-l5-grafana-role"
-  aws_l5_grafana_workspace_name = "${var.digital_twin_name}-grafana"
-  aws_l5_grafana_api_key_name   = "${var.digital_twin_name}-admin-key"
+  # L5 Grafana names live in stacks/aws_l5.
 
   # E2E Testing
   aws_e2e_iot_publish_policy = "${var.digital_twin_name}-e2e-iot-publish"
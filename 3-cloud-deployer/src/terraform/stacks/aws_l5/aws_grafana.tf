@@ -14,6 +14,9 @@
 #
 # Note: Grafana datasources and dashboards are configured via Grafana API
 # using the API key created by Terraform.
+#
+# L5 reads nothing from the other layers, so it is a separate stack with its
+# own state that is applied next to the core stack (see ../../stacks.json).
 
 # ==============================================================================
 # L5 Locals
@@ -23,6 +26,10 @@ locals {
   l5_aws_enabled = var.layer_5_provider == "aws"
 }
 
+data "aws_caller_identity" "current" {
+  count = local.l5_aws_enabled ? 1 : 0
+}
+
 # ==============================================================================
 # IAM Role for Managed Grafana
 # ==============================================================================
@@ -66,7 +73,7 @@ resource "aws_iam_role_policy_attachment" "l5_grafana_cloudwatch" {
 resource "aws_grafana_workspace" "main" {
   count                    = local.l5_aws_enabled ? 1 : 0
   name                     = local.aws_l5_grafana_workspace_name
-  description              = "Grafana workspace for ${var.digital_twin_name} Digital Twin (${local.deployment_suffix})"
+  description              = "Grafana workspace for ${var.digital_twin_name} Digital Twin"
   account_access_type      = "CURRENT_ACCOUNT"
   authentication_providers = ["AWS_SSO"]
   permission_type          = "SERVICE_MANAGED"
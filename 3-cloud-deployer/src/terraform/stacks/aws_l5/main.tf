@@ -0,0 +1,57 @@
+# AWS L5 Stack
+#
+# Root module of the AWS visualization layer. It has its own state and is
+# applied concurrently with the core stack in src/terraform; see stacks.json.
+# It only reads the generated tfvars, so it takes no stack inputs.
+
+terraform {
+  required_version = ">= 1.6.0"
+
+  required_providers {
+    # NOTE: v5.92+ required for aws_identitystore_users data source
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.92"
+    }
+  }
+}
+
+provider "aws" {
+  region     = var.aws_region
+  access_key = var.aws_access_key_id
+  secret_key = var.aws_secret_access_key
+
+  # Skip validation when AWS credentials are not provided (L5 not on AWS)
+  skip_credentials_validation = var.aws_access_key_id == "" ? true : false
+  skip_requesting_account_id  = var.aws_access_key_id == "" ? true : false
+}
+
+# AWS Provider for IAM Identity Center (SSO)
+# SSO is region-specific and may be enabled in a different region than main resources.
+# For example, SSO might be in us-east-1 while resources are in eu-central-1.
+provider "aws" {
+  alias      = "sso"
+  region     = var.aws_sso_region != "" ? var.aws_sso_region : var.aws_region
+  access_key = var.aws_access_key_id
+  secret_key = var.aws_secret_access_key
+
+  # Skip validation when AWS credentials are not provided
+  skip_credentials_validation = var.aws_access_key_id == "" ? true : false
+  skip_requesting_account_id  = var.aws_access_key_id == "" ? true : false
+}
+
+# ==============================================================================
+# Locals
+# ==============================================================================
+
+locals {
+  aws_common_tags = {
+    DigitalTwin = var.digital_twin_name
+    Environment = var.environment
+    ManagedBy   = "terraform"
+  }
+
+  aws_l5_grafana_role_name      = "${var.digital_twin_name}-l5-grafana-role"
+  aws_l5_grafana_workspace_name = "${var.digital_twin_name}-grafana"
+  aws_l5_grafana_api_key_name   = "${var.digital_twin_name}-admin-key"
+}
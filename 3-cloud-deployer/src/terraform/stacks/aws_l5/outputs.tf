@@ -0,0 +1,63 @@
+# Outputs
+#
+# Merged with the core stack outputs for post-deployment steps.
+
+# ==============================================================================
+# AWS L5 Grafana Outputs
+# ==============================================================================
+
+output "aws_grafana_workspace_id" {
+  description = "ID of the Grafana Workspace"
+  value       = try(aws_grafana_workspace.main[0].id, null)
+}
+
+output "aws_grafana_endpoint" {
+  description = "Endpoint URL of the Grafana Workspace"
+  value       = try(aws_grafana_workspace.main[0].endpoint, null)
+}
+
+output "aws_grafana_api_key" {
+  description = "API Key for Grafana configuration"
+  value       = try(aws_grafana_workspace_api_key.admin[0].key, null)
+  sensitive   = true
+}
+
+output "aws_platform_user_email" {
+  description = "Platform user email"
+  value       = var.platform_user_email != "" && local.l5_aws_enabled ? var.platform_user_email : null
+}
+
+output "aws_grafana_login_instructions" {
+  description = "How to access Grafana"
+  value = local.platform_user_enabled ? join("\n", [
+    "========== AWS Managed Grafana Access ==========",
+    "Email: ${var.platform_user_email}",
+    "Check email for AWS IAM Identity Center activation link",
+    "URL: ${try(aws_grafana_workspace.main[0].endpoint, "Not available")}",
+    "================================================"
+  ]) : null
+}
+
+output "aws_sso_available" {
+  description = "Whether IAM Identity Center was detected in the SSO region"
+  value       = local.l5_aws_enabled ? local.sso_available : null
+}
+
+output "aws_platform_user_created" {
+  description = "Whether a new Identity Store user was created (true = cleanup should delete it)"
+  value       = local.l5_aws_enabled ? local.aws_should_create_user : null
+}
+
+output "aws_grafana_sso_warning" {
+  description = "Warning if SSO not available and admin user couldn't be created"
+  value = local.l5_aws_enabled && var.platform_user_email != "" && !local.sso_available ? join("\n", [
+    "========== WARNING: AWS Grafana Admin Not Created ==========",
+    "IAM Identity Center not detected in region: ${var.aws_sso_region != "" ? var.aws_sso_region : var.aws_region}",
+    "",
+    "SOLUTION: Set aws_sso_region to the region where your SSO is enabled.",
+    "Check: Go to IAM Identity Center console and note the region in the info box.",
+    "",
+    "Grafana workspace was still created. Add yourself manually via AWS Console.",
+    "============================================================"
+  ]) : null
+}
@@ -0,0 +1,70 @@
+# Input Variables
+#
+# The subset of ../../variables.tf that L5 reads. The deployer writes only
+# the declared variables into this stack's tfvars.
+
+variable "digital_twin_name" {
+  description = "Name prefix for all resources (from config.json digital_twin_name)"
+  type        = string
+
+  validation {
+    condition     = can(regex("^[a-z][a-z0-9-]{1,20}$", var.digital_twin_name))
+    error_message = "digital_twin_name must be lowercase alphanumeric with hyphens, 2-21 chars."
+  }
+}
+
+variable "environment" {
+  description = "Deployment environment (dev, staging, prod)"
+  type        = string
+  default     = "dev"
+}
+
+variable "layer_5_provider" {
+  description = "Cloud provider for L5 (Visualization)"
+  type        = string
+  default     = "azure"
+}
+
+variable "aws_access_key_id" {
+  description = "AWS Access Key ID"
+  type        = string
+  default     = ""
+  sensitive   = true
+}
+
+variable "aws_secret_access_key" {
+  description = "AWS Secret Access Key"
+  type        = string
+  default     = ""
+  sensitive   = true
+}
+
+variable "aws_region" {
+  description = "AWS region for resources"
+  type        = string
+  default     = "eu-central-1"
+}
+
+variable "aws_sso_region" {
+  description = "AWS region where IAM Identity Center (SSO) is enabled. Defaults to aws_region if not specified. SSO is region-specific and may be in a different region (e.g., us-east-1)."
+  type        = string
+  default     = ""
+}
+
+variable "platform_user_email" {
+  description = "Email for platform admin user. Required when L4=Azure (ADT access) or L5=AWS/Azure (Grafana access). For Azure: use format 'user@TENANT.onmicrosoft.com'"
+  type        = string
+  default     = ""
+}
+
+variable "platform_user_first_name" {
+  description = "First name for platform user"
+  type        = string
+  default     = "Platform"
+}
+
+variable "platform_user_last_name" {
+  description = "Last name for platform user"
+  type        = string
+  default     = "Admin"
+}
@@ -19,14 +19,28 @@ Usage:
 """
 
 import asyncio
+import copy
 # The executable is fixed and every argument is validated before invocation.
 import subprocess  # nosec B404
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+import re
+import signal
+from typing import Optional, Sequence
 
 from src.core.observability import redact_sensitive
+from src.terraform_state import UnsupportedTerraformState, read_terraform_state
+from src.terraform_workdir import (
+    acquire_init_lock,
+    clear_init_record,
+    init_fingerprint,
+    init_is_current,
+    init_lock,
+    record_init,
+    release_init_lock,
+    terraform_environment,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +48,8 @@ _ALLOWED_TERRAFORM_COMMANDS = frozenset(
     {"apply", "destroy", "init", "output", "plan", "show", "state", "validate"}
 )
 _STATEFUL_COMMANDS = frozenset({"apply", "destroy", "output", "plan", "show"})
+_INTERRUPT_GRACE_SECONDS = 60
+_TARGET_ADDRESS = re.compile(r"^(?:data\.)?[A-Za-z][\w-]*\.[A-Za-z_][\w-]*(?:\[[^\]\s]+\])?$|^module\.[A-Za-z_][\w-]*$")
 
 
 class TerraformError(Exception):
@@ -57,7 +73,12 @@ class TerraformRunner:
         terraform_dir: Path to the Terraform configuration directory
     """
     
-    def __init__(self, terraform_dir: str, state_path: str = None):
+    def __init__(
+        self,
+        terraform_dir: str,
+        state_path: str = None,
+        force_init: bool = False,
+    ):
         """
         Initialize the Terraform runner.
         
@@ -66,6 +87,8 @@ class TerraformRunner:
                            (typically /app/src/terraform inside Docker)
             state_path: Optional absolute path to terraform.tfstate file
                        (for per-project state isolation)
+            force_init: Always run init, even when the recorded init fingerprint
+                        of this working directory still matches
         
         Raises:
             ValueError: If terraform_dir is empty or None
@@ -75,6 +98,7 @@ class TerraformRunner:
         
         self.terraform_dir = Path(terraform_dir)
         self.state_path = Path(state_path) if state_path else None
+        self.force_init = force_init
         
         if not self.terraform_dir.exists():
             raise ValueError(f"Terraform directory does not exist: {terraform_dir}")
@@ -105,12 +129,23 @@ class TerraformRunner:
         subcommand = args[0]
         command = ["terraform", f"-chdir={self.terraform_dir}", subcommand]
         if subcommand == "state":
-            if len(args) != 2 or args[1] != "list":
-                raise ValueError("Only 'terraform state list' is allowed")
-            command.append("list")
-            if self.state_path:
-                command.append(f"-state={self.state_path}")
-            return command
+            if args[1:] == ["list"]:
+                command.append("list")
+                if self.state_path:
+                    command.append(f"-state={self.state_path}")
+                return command
+            if (
+                len(args) == 4
+                and args[1] == "mv"
+                and args[2].startswith("-state-out=")
+                and _TARGET_ADDRESS.match(args[3])
+            ):
+                command.append("mv")
+                if self.state_path:
+                    command.append(f"-state={self.state_path}")
+                command.extend([args[2], args[3], args[3]])
+                return command
+            raise ValueError("Only 'terraform state list' and 'terraform state mv' are allowed")
         if no_color:
             command.append("-no-color")
         if self.state_path and subcommand in _STATEFUL_COMMANDS:
@@ -122,6 +157,17 @@ class TerraformRunner:
         """List resources from the isolated project state without cloud mutation."""
         return self._run_command(["state", "list"], check=False)
 
+    def state_move(self, address: str, state_out: str) -> None:
+        """
+        Move one resource, with all its instances, into another local state.
+
+        Raises:
+            TerraformError: If the move fails
+        """
+        if not state_out:
+            raise ValueError("state_out is required")
+        self._run_command(["state", "mv", f"-state-out={state_out}", address])
+
     def refresh_only_plan(self, var_file: str) -> subprocess.CompletedProcess:
         """Run drift detection and preserve Terraform's detailed exit code."""
         if not var_file:
@@ -167,6 +213,7 @@ class TerraformRunner:
             # Command comes exclusively from _build_command's allowlist.
             process = subprocess.Popen(  # nosec B603
                 cmd,
+                env=terraform_environment(),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -192,6 +239,7 @@ class TerraformRunner:
             # Command comes exclusively from _build_command's allowlist.
             result = subprocess.run(  # nosec B603
                 cmd,
+                env=terraform_environment(),
                 capture_output=capture_output,
                 text=True,
                 check=False
@@ -210,13 +258,26 @@ class TerraformRunner:
         
         return result
     
-    def init(self, backend: bool = True, upgrade: bool = False) -> None:
+    def init(
+        self,
+        backend: bool = True,
+        upgrade: bool = False,
+        force: bool = False,
+    ) -> bool:
         """
         Initialize Terraform (download providers).
         
+        Init is skipped when the provider requirements, lock file, and backend
+        configuration match the fingerprint recorded by the last successful
+        init of this working directory.
+        
         Args:
             backend: Whether to initialize backend (use False for validation only)
-            upgrade: Whether to upgrade providers to latest versions
+            upgrade: Whether to upgrade providers to latest versions (always runs)
+            force: Run init even when the recorded fingerprint matches
+        
+        Returns:
+            True if init ran, False if it was skipped
         
         Raises:
             TerraformError: If init fails
@@ -229,9 +290,24 @@ class TerraformRunner:
         if upgrade:
             args.append("-upgrade")
         
-        logger.info("Initializing Terraform...")
-        self._run_command(args)
+        with init_lock(self.terraform_dir):
+            if self._init_is_current(backend, upgrade or force):
+                logger.info("✓ Terraform init skipped: providers and backend unchanged")
+                return False
+            logger.info("Initializing Terraform...")
+            clear_init_record(self.terraform_dir)
+            self._run_command(args)
+            record_init(self.terraform_dir, init_fingerprint(self.terraform_dir, backend=backend))
         logger.info("✓ Terraform initialized")
+        return True
+
+    def _init_is_current(self, backend: bool, forced: bool) -> bool:
+        if forced or self.force_init:
+            return False
+        return init_is_current(
+            self.terraform_dir,
+            init_fingerprint(self.terraform_dir, backend=backend),
+        )
     
     def validate(self) -> bool:
         """
@@ -252,7 +328,8 @@ class TerraformRunner:
         self,
         var_file: str,
         out_file: Optional[str] = None,
-        destroy: bool = False
+        destroy: bool = False,
+        targets: Optional[Sequence[str]] = None,
     ) -> str:
         """
         Create an execution plan.
@@ -262,6 +339,7 @@ class TerraformRunner:
             out_file: Optional path to save the plan. Defaults to the project
                       workspace when state_path is set, otherwise terraform_dir.
             destroy: If True, plan for destruction instead of creation
+            targets: Optional resource addresses to restrict the plan to
         
         Returns:
             Path to the saved plan file
@@ -284,6 +362,7 @@ class TerraformRunner:
         
         if destroy:
             args.append("-destroy")
+        args.extend(_target_arguments(targets))
         
         logger.info(f"Creating execution plan (var_file={var_file})...")
         self._run_command(args)
@@ -295,7 +374,8 @@ class TerraformRunner:
         self,
         plan_file: Optional[str] = None,
         var_file: Optional[str] = None,
-        auto_approve: bool = True
+        auto_approve: bool = True,
+        targets: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Apply the Terraform plan.
@@ -304,6 +384,8 @@ class TerraformRunner:
             plan_file: Path to a saved plan file (from plan())
             var_file: Path to tfvars.json (required if plan_file not provided)
             auto_approve: Skip interactive approval
+            targets: Optional resource addresses to restrict the apply to;
+                     ignored with a saved plan, which already carries them
         
         Raises:
             ValueError: If neither plan_file nor var_file is provided
@@ -321,6 +403,7 @@ class TerraformRunner:
             args.append(plan_file)
         elif var_file:
             args.append(f"-var-file={var_file}")
+            args.extend(_target_arguments(targets))
         
         logger.info("Applying Terraform configuration...")
         self._run_command(args, stream_output=True)
@@ -364,9 +447,21 @@ class TerraformRunner:
         Returns:
             Dictionary of outputs (or single value if name specified)
         
+        Outputs are read from the local state file when it is a supported
+        JSON state; the CLI is only used as a fallback.
+        
         Raises:
             TerraformError: If output command fails
         """
+        view = self._state_view()
+        if view is not None:
+            if name is None:
+                return view.output_values()
+            if name in view.outputs:
+                return copy.deepcopy(view.outputs[name].get("value"))
+        elif self.state_path and not self.state_path.exists() and name is None:
+            return {}
+
         args = ["output", "-json"]
         
         if name:
@@ -385,6 +480,26 @@ class TerraformRunner:
         
         return {k: v.get("value") for k, v in outputs.items()}
     
+    def _state_view(self):
+        """Return the parsed local state, or ``None`` to use the CLI instead."""
+        if not self.state_path:
+            return None
+        try:
+            return read_terraform_state(self.state_path)
+        except UnsupportedTerraformState as exc:
+            logger.debug("Reading Terraform state through the CLI: %s", exc)
+            return None
+
+    def has_root_resources(self) -> bool:
+        """Return whether the state contains resources of the root module."""
+        view = self._state_view()
+        if view is not None:
+            return view.root_resource_count > 0
+        if self.state_path and not self.state_path.exists():
+            return False
+        state = self.show_state()
+        return bool(state.get("values", {}).get("root_module", {}).get("resources", []))
+
     def show_state(self) -> dict:
         """
         Show the current Terraform state.
@@ -427,27 +542,42 @@ class TerraformRunner:
         
         process = await asyncio.create_subprocess_exec(
             *cmd,
+            env=terraform_environment(),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT
         )
         
-        # Stream output line by line
-        async for line in process.stdout:
-            decoded = line.decode().rstrip()
-            yield decoded
-        
-        await process.wait()
+        try:
+            # Stream output line by line
+            async for line in process.stdout:
+                decoded = line.decode().rstrip()
+                yield decoded
+            
+            await process.wait()
+        finally:
+            if process.returncode is None:
+                # The consumer stopped early (cancelled operation or closed
+                # stream); let Terraform write its state before it exits.
+                await _interrupt_process(process)
         
         if process.returncode != 0:
             raise TerraformError(args[0] if args else "terraform", process.returncode, "See streamed output")
     
-    async def init_async(self, backend: bool = True, upgrade: bool = False):
+    async def init_async(
+        self,
+        backend: bool = True,
+        upgrade: bool = False,
+        force: bool = False,
+    ):
         """
         Initialize Terraform with async streaming.
         
+        Skipped under the same fingerprint rules as ``init``.
+        
         Args:
             backend: Whether to initialize backend
             upgrade: Whether to upgrade providers
+            force: Run init even when the recorded fingerprint matches
             
         Yields:
             Output lines from terraform init
@@ -460,17 +590,28 @@ class TerraformRunner:
         if upgrade:
             args.append("-upgrade")
         
-        yield "Initializing Terraform..."
-        async for line in self._run_command_async(args):
-            yield line
+        # Another operation on the same root may hold the lock; wait off-loop.
+        lock = await asyncio.to_thread(acquire_init_lock, self.terraform_dir)
+        try:
+            if self._init_is_current(backend, upgrade or force):
+                yield "✓ Terraform init skipped: providers and backend unchanged"
+                return
+            yield "Initializing Terraform..."
+            clear_init_record(self.terraform_dir)
+            async for line in self._run_command_async(args):
+                yield line
+            record_init(self.terraform_dir, init_fingerprint(self.terraform_dir, backend=backend))
+        finally:
+            release_init_lock(lock)
         yield "✓ Terraform initialized"
     
-    async def apply_async(self, var_file: str):
+    async def apply_async(self, var_file: str, targets: Optional[Sequence[str]] = None):
         """
         Apply Terraform configuration with async streaming.
         
         Args:
             var_file: Path to the tfvars.json file
+            targets: Optional resource addresses to restrict the apply to
             
         Yields:
             Output lines from terraform apply
@@ -479,6 +620,7 @@ class TerraformRunner:
             raise ValueError("var_file is required")
         
         args = ["apply", "-auto-approve", f"-var-file={var_file}"]
+        args.extend(_target_arguments(targets))
         
         yield "Applying Terraform configuration..."
         async for line in self._run_command_async(args):
@@ -504,3 +646,26 @@ class TerraformRunner:
         async for line in self._run_command_async(args):
             yield line
         yield "✓ Destroy complete"
+
+
+async def _interrupt_process(process) -> None:
+    """Stop Terraform like Ctrl+C would, killing it if it does not exit in time."""
+    try:
+        process.send_signal(signal.SIGINT)
+        await asyncio.wait_for(process.wait(), timeout=_INTERRUPT_GRACE_SECONDS)
+    except ProcessLookupError:
+        return
+    except asyncio.TimeoutError:
+        logger.warning("Terraform did not stop after interrupt; killing it")
+        process.kill()
+        await process.wait()
+
+
+def _target_arguments(targets: Optional[Sequence[str]]) -> list[str]:
+    """Build ``-target`` arguments for validated resource addresses."""
+    arguments = []
+    for target in targets or ():
+        if not isinstance(target, str) or not _TARGET_ADDRESS.match(target):
+            raise ValueError(f"Invalid Terraform target address: {target!r}")
+        arguments.append(f"-target={target}")
+    return arguments
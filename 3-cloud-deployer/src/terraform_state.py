@@ -0,0 +1,146 @@
+"""
+Read-only view of a project's local ``terraform.tfstate``.
+
+Status polls, output lookups, and post-deploy steps only need the resource
+addresses and outputs that Terraform already wrote to the project state.
+Parsing that JSON directly avoids a Terraform process start and provider
+schema load per call. Parsed views are cached per file and reused while the
+file's device, inode, size, and modification time are unchanged; Terraform
+replaces the state file on every write, so any apply or destroy invalidates
+the entry.
+
+Callers fall back to the Terraform CLI on ``UnsupportedTerraformState``, for
+example for state formats this reader does not understand.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+SUPPORTED_STATE_VERSION = 4
+STACK_STATES_DIR_NAME = "stacks"
+_MAX_CACHED_STATES = 64
+_cache: "OrderedDict[Path, tuple[tuple[int, int, int, int], TerraformStateView]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class UnsupportedTerraformState(ValueError):
+    """Raised when a state file cannot be read without the Terraform CLI."""
+
+
+@dataclass(frozen=True)
+class TerraformStateView:
+    """Resource addresses and outputs of one parsed state snapshot."""
+
+    serial: int
+    lineage: str
+    resource_addresses: tuple[str, ...]
+    root_resource_count: int
+    outputs: dict[str, dict[str, Any]]
+
+    def output_values(self) -> dict[str, Any]:
+        """Return outputs unwrapped like ``TerraformRunner.output()``."""
+        return {
+            name: copy.deepcopy(output.get("value"))
+            for name, output in self.outputs.items()
+        }
+
+    @property
+    def has_resources(self) -> bool:
+        return bool(self.resource_addresses)
+
+
+def read_terraform_state(state_path: Path | str) -> TerraformStateView | None:
+    """
+    Return the parsed view of ``state_path``, or ``None`` when it does not exist.
+
+    Raises:
+        UnsupportedTerraformState: If the file is not a readable v4 JSON state
+    """
+    path = Path(state_path)
+    try:
+        metadata = os.stat(path)
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise UnsupportedTerraformState(f"Cannot stat Terraform state: {exc}") from exc
+    key = path.resolve()
+    signature = (metadata.st_dev, metadata.st_ino, metadata.st_size, metadata.st_mtime_ns)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    view = _parse_state(path)
+    with _cache_lock:
+        _cache[key] = (signature, view)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHED_STATES:
+            _cache.popitem(last=False)
+    return view
+
+
+def project_state_paths(state_path: Path | str) -> list[Path]:
+    """
+    Return ``state_path`` followed by the states of the project's split-out stacks.
+
+    Stack states live in ``stacks/<stack>/terraform.tfstate`` next to the root
+    state; stacks that were never applied have none.
+    """
+    state_path = Path(state_path)
+    stacks_dir = state_path.parent / STACK_STATES_DIR_NAME
+    if stacks_dir.is_symlink() or not stacks_dir.is_dir():
+        return [state_path]
+    return [state_path, *sorted(stacks_dir.glob("*/terraform.tfstate"))]
+
+
+def clear_state_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _parse_state(path: Path) -> TerraformStateView:
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise UnsupportedTerraformState(f"Cannot parse Terraform state: {exc}") from exc
+    if not isinstance(document, dict) or document.get("version") != SUPPORTED_STATE_VERSION:
+        raise UnsupportedTerraformState("Unsupported Terraform state format version")
+
+    addresses: list[str] = []
+    root_resources = 0
+    for resource in document.get("resources") or ():
+        instances = resource.get("instances") or ()
+        if not instances:
+            continue
+        module = resource.get("module") or ""
+        if not module:
+            root_resources += 1
+        mode_prefix = "data." if resource.get("mode") == "data" else ""
+        base = f"{module + '.' if module else ''}{mode_prefix}{resource['type']}.{resource['name']}"
+        for instance in instances:
+            if "index_key" in instance:
+                addresses.append(f"{base}[{json.dumps(instance['index_key'])}]")
+            else:
+                addresses.append(base)
+
+    outputs = {
+        name: dict(output)
+        for name, output in (document.get("outputs") or {}).items()
+        if isinstance(output, dict)
+    }
+    return TerraformStateView(
+        serial=int(document.get("serial", 0)),
+        lineage=str(document.get("lineage", "")),
+        resource_addresses=tuple(sorted(addresses)),
+        root_resource_count=root_resources,
+        outputs=outputs,
+    )
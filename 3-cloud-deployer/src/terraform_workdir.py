@@ -0,0 +1,308 @@
+"""
+Per-project Terraform root modules sharing one provider plugin cache.
+
+Every project gets its own lightweight Terraform working directory instead
+of running ``-chdir`` against the shared ``src/terraform`` configuration. The root holds hard links (or copies) of the versioned ``.tf``
+sources and its own copy of the dependency lock file, so ``.terraform/``
+provider installs and lock-file updates never cross projects and several
+projects can init and apply concurrently.
+
+Provider binaries come from ``DEPLOYER_TERRAFORM_PLUGIN_CACHE_DIR``, a
+deployer-wide cache that the container image populates at build time and
+mounts read-only. Terraform links providers out of the cache instead of
+downloading them, so ``init`` only has to resolve the lock file.
+
+Deployments keep one persistent root per project under
+``DEPLOYER_TERRAFORM_ROOTS_DIR`` and record a fingerprint of everything
+``terraform init`` depends on after each successful init, so a redeploy of an
+unchanged twin skips init entirely.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import shutil
+from typing import Iterator
+
+try:  # pragma: no cover - fcntl is unavailable on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+TERRAFORM_ROOT_DIR_NAME = ".terraform-root"
+DEFAULT_TERRAFORM_ROOTS_DIR = Path("/var/lib/twin2multicloud-deployer/terraform-roots")
+TERRAFORM_LOCK_FILE_NAME = ".terraform.lock.hcl"
+INIT_FINGERPRINT_VERSION = "terraform-init-fingerprint.v1"
+INIT_RECORD_NAME = "deployer-init.json"
+_INIT_LOCK_NAME = ".deployer-init.lock"
+_LOCK_SOURCE_NAME = ".deployer-lock-source"
+_ROOT_MODULE_SUFFIXES = (".tf", ".tf.json")
+_INIT_BLOCK_PATTERN = re.compile(
+    r'\b(?:required_providers|backend\s+"[^"]*"|cloud|module\s+"[^"]*"|provider\s+"[^"]*")\s*\{'
+)
+_RESOURCE_TYPE_PATTERN = re.compile(
+    r'^\s*(?:resource|data|ephemeral)\s+"([A-Za-z0-9]+)_',
+    re.MULTILINE,
+)
+_HCL_COMMENT_PATTERN = re.compile(r"(?m)^\s*(?:#|//).*$")
+
+
+def plugin_cache_dir() -> Path | None:
+    """Return the configured provider plugin cache when it exists."""
+    configured = os.environ.get("DEPLOYER_TERRAFORM_PLUGIN_CACHE_DIR")
+    if not configured:
+        return None
+    cache_dir = Path(configured)
+    if not cache_dir.is_dir():
+        logger.warning("Terraform plugin cache is not a directory; providers will be downloaded")
+        return None
+    return cache_dir
+
+
+def terraform_environment() -> dict[str, str] | None:
+    """
+    Return the subprocess environment for Terraform commands.
+
+    ``None`` keeps the inherited environment. An explicit ``TF_PLUGIN_CACHE_DIR``
+    set by the operator always wins over the deployer-wide cache.
+    """
+    cache_dir = plugin_cache_dir()
+    if cache_dir is None or os.environ.get("TF_PLUGIN_CACHE_DIR"):
+        return None
+    environment = dict(os.environ)
+    environment["TF_PLUGIN_CACHE_DIR"] = str(cache_dir)
+    return environment
+
+
+def prepare_terraform_root(module_dir: Path, root_dir: Path) -> Path:
+    """
+    Materialize a project-private Terraform root for ``module_dir``.
+
+    Root module files are hard-linked when both trees share a filesystem and
+    copied otherwise; files that no longer exist in ``module_dir`` are removed.
+    The lock file is copied, never linked, because ``terraform init`` may
+    rewrite it, and only when the versioned lock file changed. An existing
+    ``.terraform/`` directory is kept so repeated runs against the same root
+    reuse their provider installs. The files are swapped under the root's
+    init lock, so a concurrent ``terraform init`` never sees a half-prepared
+    root.
+
+    Raises:
+        ValueError: If either directory is missing or a symlink
+    """
+    module_dir = Path(module_dir)
+    root_dir = Path(root_dir)
+    if module_dir.is_symlink() or not module_dir.is_dir():
+        raise ValueError(f"Terraform module directory does not exist: {module_dir}")
+    if root_dir.is_symlink():
+        raise ValueError("Terraform root directory must not be a symlink")
+    root_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    sources = {
+        path.name: path
+        for path in module_dir.iterdir()
+        if path.name.endswith(_ROOT_MODULE_SUFFIXES) and path.is_file()
+    }
+    with init_lock(root_dir):
+        for existing in root_dir.iterdir():
+            if existing.name.endswith(_ROOT_MODULE_SUFFIXES) and existing.name not in sources:
+                existing.unlink()
+
+        for name, source in sorted(sources.items()):
+            target = root_dir / name
+            if target.exists() and os.path.samefile(source, target):
+                continue
+            _link_or_copy(source, target)
+
+        _refresh_lock_file(module_dir, root_dir)
+    return root_dir
+
+
+def force_init_requested() -> bool:
+    """Return whether operators disabled init skipping via the environment."""
+    return os.environ.get("DEPLOYER_TERRAFORM_FORCE_INIT", "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
+def terraform_root_path(project_name: str) -> Path:
+    """Return the persistent Terraform root of one project."""
+    configured = os.environ.get("DEPLOYER_TERRAFORM_ROOTS_DIR")
+    base = Path(configured) if configured else DEFAULT_TERRAFORM_ROOTS_DIR
+    safe = "".join(
+        character if character.isalnum() or character in {"-", "_"} else "-"
+        for character in project_name
+    ).strip("-_") or "project"
+    suffix = hashlib.sha256(project_name.encode("utf-8")).hexdigest()[:12]
+    return base.resolve() / f"{safe}-{suffix}"
+
+
+def init_fingerprint(root_dir: Path, *, backend: bool = True) -> str:
+    """
+    Fingerprint every input that changes what ``terraform init`` installs.
+
+    Covers the dependency lock file, ``required_providers``, backend/cloud,
+    provider and module blocks, the provider prefixes of all resource and data
+    types (implicit providers), the plugin cache location, and the Terraform
+    executable itself.
+    """
+    root_dir = Path(root_dir)
+    digest = hashlib.sha256(INIT_FINGERPRINT_VERSION.encode("utf-8"))
+
+    def update(label: str, value: bytes | str) -> None:
+        payload = value.encode("utf-8") if isinstance(value, str) else value
+        digest.update(label.encode("utf-8") + b"\0")
+        digest.update(len(payload).to_bytes(8, "big") + payload)
+
+    lock_file = root_dir / TERRAFORM_LOCK_FILE_NAME
+    update("lock", lock_file.read_bytes() if lock_file.is_file() else b"")
+    implicit_providers: set[str] = set()
+    for path in sorted(root_dir.iterdir()):
+        if not path.name.endswith(_ROOT_MODULE_SUFFIXES) or not path.is_file():
+            continue
+        text = path.read_text(encoding="utf-8")
+        if path.name.endswith(".tf.json"):
+            document = json.loads(text)
+            relevant = {
+                key: document[key]
+                for key in ("terraform", "provider", "module")
+                if key in document
+            }
+            for kind in ("resource", "data"):
+                implicit_providers.update(
+                    resource_type.split("_", 1)[0]
+                    for resource_type in document.get(kind, {})
+                )
+            update(f"json:{path.name}", json.dumps(relevant, sort_keys=True))
+            continue
+        text = _HCL_COMMENT_PATTERN.sub("", text)
+        for block in _init_blocks(text):
+            update(f"hcl:{path.name}", " ".join(block.split()))
+        implicit_providers.update(_RESOURCE_TYPE_PATTERN.findall(text))
+    update("implicit-providers", ",".join(sorted(implicit_providers)))
+
+    environment = terraform_environment() or os.environ
+    update("plugin-cache", environment.get("TF_PLUGIN_CACHE_DIR", ""))
+    executable = shutil.which("terraform")
+    if executable:
+        metadata = os.stat(executable)
+        update("terraform", f"{os.path.realpath(executable)}:{metadata.st_size}:{metadata.st_mtime_ns}")
+    update("backend", "backend" if backend else "no-backend")
+    return digest.hexdigest()
+
+
+def init_is_current(root_dir: Path, fingerprint: str) -> bool:
+    """Return whether the last successful init of ``root_dir`` used ``fingerprint``."""
+    record_path = Path(root_dir) / ".terraform" / INIT_RECORD_NAME
+    try:
+        record = json.loads(record_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return isinstance(record, dict) and record.get("fingerprint") == fingerprint
+
+
+def record_init(root_dir: Path, fingerprint: str) -> None:
+    """Record a successful init inside ``.terraform`` so deleting it invalidates."""
+    data_dir = Path(root_dir) / ".terraform"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(
+        {
+            "fingerprint": fingerprint,
+            "initializedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        },
+        sort_keys=True,
+    )
+    temporary = data_dir / f".{INIT_RECORD_NAME}.tmp"
+    temporary.write_text(payload, encoding="utf-8")
+    temporary.replace(data_dir / INIT_RECORD_NAME)
+
+
+def clear_init_record(root_dir: Path) -> None:
+    (Path(root_dir) / ".terraform" / INIT_RECORD_NAME).unlink(missing_ok=True)
+
+
+def acquire_init_lock(root_dir: Path):
+    """Take the exclusive init lock of one root; pass the handle to release."""
+    handle = open(Path(root_dir) / _INIT_LOCK_NAME, "a+b")
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+    return handle
+
+
+def release_init_lock(handle) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    finally:
+        handle.close()
+
+
+@contextmanager
+def init_lock(root_dir: Path) -> Iterator[None]:
+    """Serialize init of one root across threads and processes."""
+    handle = acquire_init_lock(root_dir)
+    try:
+        yield
+    finally:
+        release_init_lock(handle)
+
+
+def _init_blocks(text: str) -> Iterator[str]:
+    for match in _INIT_BLOCK_PATTERN.finditer(text):
+        depth = 0
+        for index in range(match.end() - 1, len(text)):
+            if text[index] == "{":
+                depth += 1
+            elif text[index] == "}":
+                depth -= 1
+                if depth == 0:
+                    yield text[match.start():index + 1]
+                    break
+
+
+def _refresh_lock_file(module_dir: Path, root_dir: Path) -> None:
+    """
+    Copy the versioned lock file only when it changed upstream.
+
+    ``terraform init`` may add checksums to the root's copy; replacing it on
+    every run would both invalidate the init fingerprint and drop them.
+    """
+    lock_file = module_dir / TERRAFORM_LOCK_FILE_NAME
+    if not lock_file.is_file():
+        return
+    content = lock_file.read_bytes()
+    source_digest = hashlib.sha256(content).hexdigest()
+    marker = root_dir / _LOCK_SOURCE_NAME
+    target = root_dir / TERRAFORM_LOCK_FILE_NAME
+    try:
+        unchanged = target.is_file() and marker.read_text(encoding="utf-8") == source_digest
+    except OSError:
+        unchanged = False
+    if unchanged:
+        return
+    target.write_bytes(content)
+    marker.write_text(source_digest, encoding="utf-8")
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    temporary = target.with_name(f".{target.name}.tmp")
+    temporary.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(source, temporary)
+        except OSError:
+            shutil.copyfile(source, temporary)
+        temporary.replace(target)
+    finally:
+        temporary.unlink(missing_ok=True)
@@ -14,6 +14,35 @@ import constants as CONSTANTS
 from src.project_archive.policy import MAX_MEMBER_BYTES, validate_archive
 
 
+def find_project_root(filenames: List[str]) -> str:
+    """Resolve one unambiguous root from an exact ``config.json`` entry."""
+    roots = set()
+    for filename in filenames:
+        path = Path(filename)
+        if path.name != CONSTANTS.CONFIG_FILE:
+            continue
+        parent = path.parent.as_posix()
+        roots.add("" if parent == "." else parent.strip("/"))
+    if len(roots) > 1:
+        raise ValueError("ZIP contains multiple project roots")
+    if not roots:
+        return ""
+    root = roots.pop()
+    return f"{root}/" if root else ""
+
+
+def validate_project_boundary(filenames: List[str], project_root: str) -> None:
+    """Reject sibling files when the project uses a wrapper directory."""
+    if not project_root:
+        return
+    root_entry = project_root.rstrip("/")
+    for filename in filenames:
+        if filename.rstrip("/") == root_entry:
+            continue
+        if not filename.startswith(project_root):
+            raise ValueError("ZIP contains files outside the canonical project root")
+
+
 class ZipFileAccessor:
     """FileAccessor implementation for ZIP files."""
     
@@ -21,35 +50,8 @@ class ZipFileAccessor:
         validate_archive(zf)
         self._zf = zf
         self._files = zf.namelist()
-        self._project_root = self._find_project_root()
-        self._validate_project_boundary()
-    
-    def _find_project_root(self) -> str:
-        """Resolve one unambiguous root from an exact ``config.json`` entry."""
-        roots = set()
-        for filename in self._files:
-            path = Path(filename)
-            if path.name != CONSTANTS.CONFIG_FILE:
-                continue
-            parent = path.parent.as_posix()
-            roots.add("" if parent == "." else parent.strip("/"))
-        if len(roots) > 1:
-            raise ValueError("ZIP contains multiple project roots")
-        if not roots:
-            return ""
-        root = roots.pop()
-        return f"{root}/" if root else ""
-
-    def _validate_project_boundary(self) -> None:
-        """Reject sibling files when the project uses a wrapper directory."""
-        if not self._project_root:
-            return
-        root_entry = self._project_root.rstrip("/")
-        for filename in self._files:
-            if filename.rstrip("/") == root_entry:
-                continue
-            if not filename.startswith(self._project_root):
-                raise ValueError("ZIP contains files outside the canonical project root")
+        self._project_root = find_project_root(self._files)
+        validate_project_boundary(self._files, self._project_root)
     
     def list_files(self) -> List[str]:
         return self._files
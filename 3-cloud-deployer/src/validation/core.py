@@ -25,6 +25,11 @@ from src.deployment_specification import (
     DeploymentSpecificationError,
     validate_deployment_manifest,
 )
+from src.validation.result_cache import (
+    CheckRecorder,
+    content_digest,
+    get_validation_result_cache,
+)
 
 
 # ==========================================
@@ -100,6 +105,11 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    # Per-run validation cache statistics and wall-clock seconds per check
+    cache_hits: int = 0
+    cache_misses: int = 0
+    check_timings: Dict[str, float] = field(default_factory=dict)
+    
     def add_error(self, error: str) -> None:
         """Add an error and mark result as invalid."""
         self.errors.append(error)
@@ -136,6 +146,11 @@ class ValidationContext:
     # Context injection for Mode A (Wizard Step 3)
     skip_config_files: List[str] = field(default_factory=list)  # Files to skip checking
     skip_credentials: bool = False  # Skip credential validation
+    
+    # Cached per-file check outcomes, hit counts, and per-check timings
+    recorder: CheckRecorder = field(
+        default_factory=lambda: CheckRecorder(get_validation_result_cache())
+    )
 
 
 # ==========================================
@@ -244,8 +259,13 @@ def check_config_schemas(accessor: FileAccessor, ctx: ValidationContext) -> None
                 except json.JSONDecodeError:
                     parsed = None
                 
-                # Validate content
-                validate_config_content(basename, content)
+                # Validate content (cached by content digest)
+                ctx.recorder.run_cached(
+                    "config_schema",
+                    [content_digest(content)],
+                    lambda: validate_config_content(basename, content),
+                    {"file": basename},
+                )
                 
                 # If validation passed, capture parsed configs for dependency checks
                 if parsed is not None:
@@ -511,16 +531,29 @@ def check_state_machines(accessor: FileAccessor, ctx: ValidationContext) -> None
     if not target_file:
         return  # Unknown provider, skip
     
+    def validate(content: str) -> None:
+        try:
+            validate_state_machine_content(target_file, content)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"State Machine validation failed for {target_file}: {e}")
+
     # Only validate the provider's state machine if it exists
     for filepath in ctx.all_files:
         if os.path.basename(filepath) == target_file:
             try:
                 content = accessor.read_text(filepath)
-                validate_state_machine_content(target_file, content)
             except ValueError:
                 raise
             except Exception as e:
                 raise ValueError(f"State Machine validation failed for {target_file}: {e}")
+            ctx.recorder.run_cached(
+                "state_machine",
+                [content_digest(content)],
+                lambda: validate(content),
+                {"file": target_file},
+            )
             return  # Found and validated
 
 
@@ -584,12 +617,24 @@ def check_processor_syntax(accessor: FileAccessor, ctx: ValidationContext, l2_pr
         if matched_provider:
             try:
                 content = accessor.read_text(filepath)
-                ast.parse(content)  # Syntax check
-                _validate_entry_point_signature(content, filepath, matched_provider)
-            except SyntaxError as e:
-                raise ValueError(f"Syntax error in {filepath}: {e.msg} at line {e.lineno}")
             except Exception as e:
                 raise ValueError(f"Validation failed for {filepath}: {e}")
+            ctx.recorder.run_cached(
+                "processor_syntax",
+                [content_digest(content)],
+                lambda: _check_user_code(content, filepath, matched_provider),
+                {"path": filepath, "provider": matched_provider},
+            )
+
+
+def _check_user_code(content: str, filepath: str, provider: str) -> None:
+    try:
+        ast.parse(content)  # Syntax check
+        _validate_entry_point_signature(content, filepath, provider)
+    except SyntaxError as e:
+        raise ValueError(f"Syntax error in {filepath}: {e.msg} at line {e.lineno}")
+    except Exception as e:
+        raise ValueError(f"Validation failed for {filepath}: {e}")
 
 
 def _validate_entry_point_signature(content: str, filename: str, provider: str) -> None:
@@ -822,16 +867,29 @@ def check_hierarchy_provider_match(accessor: FileAccessor, ctx: ValidationContex
         )
     
     # Validate content based on provider
+    def validate(content: str) -> None:
+        try:
+            if layer_4_provider == "aws":
+                validate_aws_hierarchy_content(content)
+            elif layer_4_provider == "azure":
+                validate_azure_hierarchy_content(content)
+        except ValueError:
+            raise  # Re-raise with original message
+        except Exception as e:
+            raise ValueError(f"Hierarchy validation failed for {expected_file}: {e}")
+
     try:
         content = accessor.read_text(full_path)
-        if layer_4_provider == "aws":
-            validate_aws_hierarchy_content(content)
-        elif layer_4_provider == "azure":
-            validate_azure_hierarchy_content(content)
     except ValueError:
-        raise  # Re-raise with original message
+        raise
     except Exception as e:
         raise ValueError(f"Hierarchy validation failed for {expected_file}: {e}")
+    ctx.recorder.run_cached(
+        "hierarchy",
+        [content_digest(content)],
+        lambda: validate(content),
+        {"provider": layer_4_provider},
+    )
 
 
 def check_scene_assets(accessor: FileAccessor, ctx: ValidationContext) -> None:
@@ -993,6 +1051,11 @@ def check_user_config_for_l4_l5(accessor: FileAccessor, ctx: ValidationContext)
 # 6. Main Orchestrator
 # ==========================================
 
+def _timed_check(ctx: ValidationContext, check_fn, *args, **kwargs) -> None:
+    with ctx.recorder.timed(check_fn.__name__):
+        check_fn(*args, **kwargs)
+
+
 def run_all_checks(
     accessor: FileAccessor,
     *,
@@ -1013,9 +1076,11 @@ def run_all_checks(
     ctx = build_context(accessor)
     
     # Phase 2: Schema validation (populates ctx.prov_config)
-    check_required_files(accessor, ctx)
-    check_config_schemas(accessor, ctx)
-    check_deployment_manifest(
+    _timed_check(ctx, check_required_files, accessor, ctx)
+    _timed_check(ctx, check_config_schemas, accessor, ctx)
+    _timed_check(
+        ctx,
+        check_deployment_manifest,
         accessor,
         ctx,
         required=require_deployment_manifest,
@@ -1028,23 +1093,28 @@ def run_all_checks(
     l2_provider = l2_provider.lower()
     
     # Phase 4: Provider-specific validations
-    check_provider_function_directory(accessor, ctx, l2_provider)
-    check_state_machines(accessor, ctx)  # Already uses ctx.prov_config
-    check_processor_syntax(accessor, ctx, l2_provider)
-    check_event_actions(ctx)
-    check_event_action_types(ctx)  # Validate workflow action types match L2 provider
-    check_feedback_function(ctx)
-    check_processor_folders_match_devices(accessor, ctx, l2_provider)
-    check_state_machine_presence(ctx)  # Already provider-aware
+    _timed_check(ctx, check_provider_function_directory, accessor, ctx, l2_provider)
+    _timed_check(ctx, check_state_machines, accessor, ctx)  # Already uses ctx.prov_config
+    _timed_check(ctx, check_processor_syntax, accessor, ctx, l2_provider)
+    _timed_check(ctx, check_event_actions, ctx)
+    _timed_check(ctx, check_event_action_types, ctx)  # Validate workflow action types match L2 provider
+    _timed_check(ctx, check_feedback_function, ctx)
+    _timed_check(ctx, check_processor_folders_match_devices, accessor, ctx, l2_provider)
+    _timed_check(ctx, check_state_machine_presence, ctx)  # Already provider-aware
     
     # Phase 5: Cross-cutting validations
-    check_payloads_vs_devices(accessor, ctx)
-    check_credentials_per_provider(ctx)
-    check_hierarchy_provider_match(accessor, ctx)
-    check_scene_assets(accessor, ctx)
-    check_user_config_for_l4_l5(accessor, ctx)  # Validates config_user.json
+    _timed_check(ctx, check_payloads_vs_devices, accessor, ctx)
+    _timed_check(ctx, check_credentials_per_provider, ctx)
+    _timed_check(ctx, check_hierarchy_provider_match, accessor, ctx)
+    _timed_check(ctx, check_scene_assets, accessor, ctx)
+    _timed_check(ctx, check_user_config_for_l4_l5, accessor, ctx)  # Validates config_user.json
     
     logger.info("✓ All validation checks passed")
+    logger.debug(
+        "Validation cache: %d hit(s), %d miss(es)",
+        ctx.recorder.cache_hits,
+        ctx.recorder.cache_misses,
+    )
 
 
 def run_all_checks_aggregated(
@@ -1057,7 +1127,8 @@ def run_all_checks_aggregated(
     Run all validation checks, aggregating errors instead of failing fast.
     
     This mode collects ALL validation errors to provide maximum feedback
-    to users on their first upload attempt.
+    to users on their first upload attempt. The result also reports
+    validation cache hits/misses and the wall-clock time of each check.
     
     Args:
         accessor: FileAccessor implementation (ZIP or Directory)
@@ -1083,17 +1154,19 @@ def run_all_checks_aggregated(
     
     # Phase 2: Required files and schema validation
     try:
-        check_required_files(accessor, ctx)
+        _timed_check(ctx, check_required_files, accessor, ctx)
     except ValueError as e:
         result.add_error(str(e))
     
     try:
-        check_config_schemas(accessor, ctx)
+        _timed_check(ctx, check_config_schemas, accessor, ctx)
     except ValueError as e:
         result.add_error(str(e))
 
     try:
-        check_deployment_manifest(
+        _timed_check(
+            ctx,
+            check_deployment_manifest,
             accessor,
             ctx,
             required=require_deployment_manifest,
@@ -1106,7 +1179,7 @@ def run_all_checks_aggregated(
     if not l2_provider and not ctx.prov_config:
         result.add_error("Missing config_providers.json or layer_2_provider not set")
         # Return early - can't do provider-specific checks without this
-        return result
+        return _with_check_stats(result, ctx)
     
     # Phase 4: Provider-specific validations (each collected separately)
     for check_fn, args in [
@@ -1120,7 +1193,7 @@ def run_all_checks_aggregated(
         (check_state_machine_presence, (ctx,)),
     ]:
         try:
-            check_fn(*args)
+            _timed_check(ctx, check_fn, *args)
         except ValueError as e:
             result.add_error(str(e))
     
@@ -1138,7 +1211,7 @@ def run_all_checks_aggregated(
     
     for check_fn, args in cross_checks:
         try:
-            check_fn(*args)
+            _timed_check(ctx, check_fn, *args)
         except ValueError as e:
             result.add_error(str(e))
     
@@ -1147,4 +1220,16 @@ def run_all_checks_aggregated(
     else:
         logger.warning(f"Validation found {len(result.errors)} error(s)")
     
+    return _with_check_stats(result, ctx)
+
+
+def _with_check_stats(result: ValidationResult, ctx: ValidationContext) -> ValidationResult:
+    result.cache_hits = ctx.recorder.cache_hits
+    result.cache_misses = ctx.recorder.cache_misses
+    result.check_timings = dict(ctx.recorder.check_timings)
+    logger.debug(
+        "Validation cache: %d hit(s), %d miss(es)",
+        result.cache_hits,
+        result.cache_misses,
+    )
     return result
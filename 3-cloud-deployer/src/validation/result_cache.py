@@ -0,0 +1,322 @@
+"""
+Deployer-wide on-disk cache of project validation outcomes.
+
+Every upload and deploy re-runs the project checks, although most of their
+input files are byte-identical to the previous run. Checks whose outcome
+depends only on the content of declared input files (JSON schema checks,
+processor syntax and entry points, state machines, hierarchies) record
+their result here under the SHA-256 of:
+
+- the check id and its ``CHECK_VERSIONS`` entry
+- the digests of the validation code and the running Python version
+- the digests of the input file contents and any check parameters
+
+A cached outcome is either "passed" or the exact ``ValueError`` message the
+check raised. Checks that fail for other reasons are never cached.
+"""
+
+from __future__ import annotations
+
+import ast
+from contextlib import contextmanager
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import stat
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterator, Mapping, Sequence
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_CACHE_FORMAT_VERSION = "validation-result-cache.v1"
+DEFAULT_VALIDATION_CACHE_MAX_ENTRIES = 8192
+
+# Bump a check's version when its behavior changes without a code change in
+# the digested modules (for example, a schema file edited in place).
+CHECK_VERSIONS = {
+    "config_schema": 1,
+    "processor_syntax": 1,
+    "state_machine": 1,
+    "hierarchy": 1,
+}
+
+_SRC_ROOT = Path(__file__).resolve().parents[1]
+_VALIDATION_ENTRY_MODULES = (
+    _SRC_ROOT / "validation" / "core.py",
+    _SRC_ROOT / "validator.py",
+)
+
+
+def _module_files(name: str, src_root: Path) -> list[Path]:
+    """Map an absolute import to the project files it may load."""
+    parts = name.split(".")
+    if parts[0] == "src":
+        parts = parts[1:]
+    if not parts:
+        return []
+    base = src_root.joinpath(*parts)
+    return [
+        path
+        for path in (base.with_suffix(".py"), base / "__init__.py")
+        if path.is_file()
+    ]
+
+
+def _validation_sources(
+    entry_modules: Sequence[Path] = _VALIDATION_ENTRY_MODULES,
+    src_root: Path = _SRC_ROOT,
+) -> list[Path]:
+    """Return the validation modules and every project module they import.
+
+    Imports are read from the source, including function-local ones, so a
+    helper the validators start calling is digested without being listed here.
+    """
+    seen: set[Path] = set()
+    pending = list(entry_modules)
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.is_file():
+            continue
+        seen.add(path)
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    package = path.parents[node.level - 1]
+                    if package != src_root and src_root not in package.parents:
+                        continue
+                    prefix = ".".join(package.relative_to(src_root).parts)
+                    module = ".".join(part for part in (prefix, module) if part)
+                names = [module] if module else []
+                names.extend(
+                    f"{module}.{alias.name}" if module else alias.name
+                    for alias in node.names
+                )
+            else:
+                continue
+            for name in names:
+                pending.extend(_module_files(name, src_root))
+    return sorted(seen)
+
+
+def _validation_code_digest(
+    entry_modules: Sequence[Path] = _VALIDATION_ENTRY_MODULES,
+    src_root: Path = _SRC_ROOT,
+) -> str:
+    """Digest the validation code so code changes invalidate cached outcomes."""
+    digest = hashlib.sha256(VALIDATION_CACHE_FORMAT_VERSION.encode("utf-8"))
+    digest.update(f"{sys.version_info.major}.{sys.version_info.minor}".encode("utf-8"))
+    for path in _validation_sources(entry_modules, src_root):
+        digest.update(path.relative_to(src_root).as_posix().encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def content_digest(content: str | bytes) -> str:
+    """Return the SHA-256 of the content a check validates."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class ValidationResultCache:
+    """Entry-bounded LRU store of check outcomes keyed by their complete inputs.
+
+    Entries are small JSON files named by their key; recency is tracked
+    through the entry mtime so eviction survives process restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: Path | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        configured_root = os.environ.get("DEPLOYER_VALIDATION_CACHE_ROOT")
+        self.root = (
+            Path(root)
+            if root is not None
+            else Path(configured_root)
+            if configured_root
+            else Path(tempfile.gettempdir()) / "twin2multicloud-validation-cache"
+        ).resolve()
+        configured_max = os.environ.get("DEPLOYER_VALIDATION_CACHE_MAX_ENTRIES")
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(configured_max)
+            if configured_max
+            else DEFAULT_VALIDATION_CACHE_MAX_ENTRIES
+        )
+        if self.max_entries < 0:
+            raise ValueError("Validation cache entry limit must not be negative")
+        self._code_digest = _validation_code_digest()
+        self._lock = threading.Lock()
+        self._stores_since_eviction = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(
+        self,
+        check_id: str,
+        input_digests: Sequence[str],
+        parameters: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Return the cache identity of one check run."""
+        identity = {
+            "check": check_id,
+            "version": CHECK_VERSIONS[check_id],
+            "code": self._code_digest,
+            "inputs": list(input_digests),
+            "parameters": dict(sorted((parameters or {}).items())),
+        }
+        encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> tuple[bool, str | None]:
+        """Return ``(hit, error message)``; a hit with ``None`` means the check passed."""
+        if not self.enabled:
+            return False, None
+        entry = self._entry_path(key)
+        try:
+            outcome = json.loads(entry.read_text(encoding="utf-8"))
+            os.utime(entry)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable validation cache entry")
+            return False, None
+        error = outcome.get("error") if isinstance(outcome, dict) else None
+        return True, error if isinstance(error, str) else None
+
+    def store(self, key: str, error: str | None) -> None:
+        if not self.enabled:
+            return
+        entry = self._entry_path(key)
+        temporary = entry.with_suffix(f".{uuid4().hex}.tmp")
+        try:
+            self._ensure_root()
+            entry.parent.mkdir(mode=0o700, exist_ok=True)
+            temporary.write_text(json.dumps({"error": error}), encoding="utf-8")
+            temporary.replace(entry)
+        except OSError:
+            logger.warning("Could not store validation outcome in cache")
+            return
+        finally:
+            temporary.unlink(missing_ok=True)
+        with self._lock:
+            self._stores_since_eviction += 1
+            due = self._stores_since_eviction >= max(1, self.max_entries // 8)
+            if due:
+                self._stores_since_eviction = 0
+        if due:
+            self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        if len(key) != 64 or any(char not in "0123456789abcdef" for char in key):
+            raise ValueError("Invalid validation cache key")
+        return self.root / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[tuple[Path, int]]:
+        if not self.root.is_dir():
+            return []
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                metadata = os.lstat(path)
+            except FileNotFoundError:
+                continue
+            if stat.S_ISREG(metadata.st_mode):
+                entries.append((path, metadata.st_mtime_ns))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        for path, _ in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
+
+    def _ensure_root(self) -> None:
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.root.is_symlink() or not self.root.is_dir():
+            raise OSError("Validation cache root is invalid")
+
+
+class CheckRecorder:
+    """Per-run cache hit counts and wall-clock timings of validation checks."""
+
+    def __init__(self, cache: ValidationResultCache | None = None) -> None:
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.check_timings: dict[str, float] = {}
+
+    @contextmanager
+    def timed(self, check_name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.check_timings[check_name] = round(
+                self.check_timings.get(check_name, 0.0) + elapsed, 6
+            )
+
+    def run_cached(
+        self,
+        check_id: str,
+        input_digests: Sequence[str],
+        run: Callable[[], None],
+        parameters: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Run ``run`` unless an outcome for the same inputs is cached."""
+        cache = self.cache
+        if cache is None or not cache.enabled:
+            run()
+            return
+        key = cache.key(check_id, input_digests, parameters)
+        hit, error = cache.lookup(key)
+        if hit:
+            self.cache_hits += 1
+            if error is not None:
+                raise ValueError(error)
+            return
+        self.cache_misses += 1
+        try:
+            run()
+        except ValueError as exc:
+            cache.store(key, str(exc))
+            raise
+        cache.store(key, None)
+
+
+_caches: dict[Path, ValidationResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_validation_result_cache() -> ValidationResultCache:
+    """Return the process-wide cache for the currently configured root."""
+    configured_root = os.environ.get("DEPLOYER_VALIDATION_CACHE_ROOT")
+    root = (
+        Path(configured_root)
+        if configured_root
+        else Path(tempfile.gettempdir()) / "twin2multicloud-validation-cache"
+    ).resolve()
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = ValidationResultCache(root=root)
+        return cache
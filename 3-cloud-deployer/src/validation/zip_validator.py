@@ -11,11 +11,12 @@ from typing import Union
 
 from src.validation.core import run_all_checks
 from src.validation.accessors import ZipFileAccessor
+from src.project_archive.ingestion import IngestedArchive
 from src.project_archive.policy import validate_archive
 
 
 def validate_project_zip(
-    zip_source: Union[str, bytes, io.BytesIO],
+    zip_source: Union[str, bytes, io.BytesIO, IngestedArchive],
     *,
     require_deployment_manifest: bool = False,
 ) -> None:
@@ -26,11 +27,19 @@ def validate_project_zip(
     schema validation, and cross-config consistency checks.
     
     Args:
-        zip_source: Path to zip file, raw bytes, or BytesIO object
+        zip_source: Path to zip file, raw bytes, BytesIO object, or an
+            ingested archive (already checked against the archive policy)
         
     Raises:
         ValueError: For any validation failure with descriptive message
     """
+    if isinstance(zip_source, IngestedArchive):
+        run_all_checks(
+            zip_source,
+            require_deployment_manifest=require_deployment_manifest,
+        )
+        return
+
     if isinstance(zip_source, bytes):
         zip_source = io.BytesIO(zip_source)
 
@@ -50,6 +50,8 @@ class VerificationSummary:
     failed: int = 0
     skipped: int = 0
     failed_phase: str | None = None
+    # One {"phase": int, "seconds": float | None} entry per phase that ran.
+    time_to_verdict: list[dict] = field(default_factory=list)
 
     def include(self, outcome: PhaseOutcome) -> None:
         self.passed += outcome.passed
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 import time
 import uuid
 
+import aiohttp
+
 from src.verification import probes
 from src.verification.contracts import (
     PhaseEmission,
@@ -24,17 +26,22 @@ PHASE_3_TIMEOUT = 60
 PHASE_3_POLL_INTERVAL = 2
 PHASE_4_TIMEOUT = 60
 PHASE_4_POLL_INTERVAL = 5
+HOT_READER_CONNECTIONS = 4
 EVENT_CHECKER_TRACE_MARKER = "T2MC_EVENT_CHECKER_RECEIVED"
+_END = object()
 
 
 class _PhaseRun:
     """Forward phase events immediately while retaining its final outcome."""
 
-    def __init__(self, source: AsyncIterator[PhaseEmission]) -> None:
+    def __init__(self, phase: int, source: AsyncIterator[PhaseEmission]) -> None:
+        self.phase = phase
         self._source = source
         self.outcome: PhaseOutcome | None = None
+        self.time_to_verdict: float | None = None
 
     async def events(self) -> AsyncIterator[str]:
+        started = time.monotonic()
         async for emission in self._source:
             if emission.event is not None:
                 yield emission.event
@@ -42,6 +49,7 @@ class _PhaseRun:
                 if self.outcome is not None:
                     raise RuntimeError("Verification phase emitted multiple outcomes")
                 self.outcome = emission.outcome
+                self.time_to_verdict = round(time.monotonic() - started, 1)
         if self.outcome is None:
             raise RuntimeError("Verification phase completed without an outcome")
 
@@ -50,6 +58,43 @@ class _PhaseRun:
             raise RuntimeError("Verification phase outcome requested before completion")
         return self.outcome
 
+    def record(self, summary: VerificationSummary) -> PhaseOutcome:
+        outcome = self.require_outcome()
+        summary.include(outcome)
+        summary.time_to_verdict.append(
+            {"phase": self.phase, "seconds": self.time_to_verdict}
+        )
+        return outcome
+
+
+async def _run_concurrently(*runs: _PhaseRun) -> AsyncIterator[str]:
+    """Run independent phases together but stream their events phase by phase.
+
+    Events of later phases are buffered until the earlier phases finish, so
+    log lines stay grouped under their phase while the slow waits overlap.
+    """
+    queues: list[asyncio.Queue] = [asyncio.Queue() for _ in runs]
+
+    async def drain(run: _PhaseRun, queue: asyncio.Queue) -> None:
+        try:
+            async for event in run.events():
+                queue.put_nowait(event)
+        finally:
+            queue.put_nowait(_END)
+
+    tasks = [
+        asyncio.create_task(drain(run, queue)) for run, queue in zip(runs, queues)
+    ]
+    try:
+        for queue in queues:
+            while (event := await queue.get()) is not _END:
+                yield event
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class DataFlowVerificationOrchestrator:
     """Run request-local verification without global mutable cloud state."""
@@ -74,35 +119,30 @@ class DataFlowVerificationOrchestrator:
             .replace("+00:00", "Z"),
         }
 
-        phase_one = _PhaseRun(self._phase_message_delivery(send_payload, trace_id))
+        phase_one = _PhaseRun(1, self._phase_message_delivery(send_payload, trace_id))
         async for event in phase_one.events():
             yield event
-        phase_one_outcome = phase_one.require_outcome()
-        summary.include(phase_one_outcome)
-        if phase_one_outcome.failed:
+        if phase_one.record(summary).failed:
             async for event in self._terminal_skip(summary, started, (2, 3, 4)):
                 yield event
             return
 
-        phase_two = _PhaseRun(self._phase_hot_storage(payload["iotDeviceId"], trace_id))
+        phase_two = _PhaseRun(2, self._phase_hot_storage(payload["iotDeviceId"], trace_id))
         async for event in phase_two.events():
             yield event
-        phase_two_outcome = phase_two.require_outcome()
-        summary.include(phase_two_outcome)
-        if phase_two_outcome.failed:
+        if phase_two.record(summary).failed:
             async for event in self._terminal_skip(summary, started, (3, 4)):
                 yield event
             return
 
-        phase_three = _PhaseRun(self._phase_digital_twin(payload["iotDeviceId"]))
-        async for event in phase_three.events():
-            yield event
-        summary.include(phase_three.require_outcome())
-
-        phase_four = _PhaseRun(self._phase_event_flow(trace_id))
-        async for event in phase_four.events():
+        # Digital-twin readiness and event flow only depend on the trace having
+        # reached hot storage, so their waits overlap.
+        phase_three = _PhaseRun(3, self._phase_digital_twin(payload["iotDeviceId"]))
+        phase_four = _PhaseRun(4, self._phase_event_flow(trace_id))
+        async for event in _run_concurrently(phase_three, phase_four):
             yield event
-        summary.include(phase_four.require_outcome())
+        phase_three.record(summary)
+        phase_four.record(summary)
         yield self._done_event(summary, started)
 
     async def _phase_message_delivery(
@@ -185,24 +225,29 @@ class DataFlowVerificationOrchestrator:
 
         started = time.monotonic()
         result = ProbeResult(success=False, error="not started")
-        while time.monotonic() - started < PHASE_2_TIMEOUT:
-            remaining = PHASE_2_TIMEOUT - (time.monotonic() - started)
-            result = await asyncio.to_thread(
-                probes.poll_hot_reader,
-                url,
-                device_id,
-                self.context.terraform_outputs.get("inter_cloud_token"),
-                min(20, remaining),
-                PHASE_2_POLL_INTERVAL,
-                trace_id=trace_id,
-            )
-            if result.success:
-                break
-            yield PhaseEmission(
-                event=self._log_event(
-                    f"Still waiting for trace evidence ({time.monotonic() - started:.1f}s)"
+        delays = probes.backoff_delays(PHASE_2_POLL_INTERVAL)
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HOT_READER_CONNECTIONS)
+        ) as session:
+            while time.monotonic() - started < PHASE_2_TIMEOUT:
+                remaining = PHASE_2_TIMEOUT - (time.monotonic() - started)
+                result = await probes.poll_hot_reader(
+                    url,
+                    device_id,
+                    self.context.terraform_outputs.get("inter_cloud_token"),
+                    min(20, remaining),
+                    PHASE_2_POLL_INTERVAL,
+                    trace_id=trace_id,
+                    session=session,
+                    delays=delays,
+                )
+                if result.success:
+                    break
+                yield PhaseEmission(
+                    event=self._log_event(
+                        f"Still waiting for trace evidence ({time.monotonic() - started:.1f}s)"
+                    )
                 )
-            )
 
         if result.success:
             elapsed = round(time.monotonic() - started, 1)
@@ -458,6 +503,9 @@ class DataFlowVerificationOrchestrator:
                 "fail_count": summary.failed,
                 "skip_count": summary.skipped,
                 "total_time": round(time.monotonic() - started, 1),
+                "time_to_verdict": sorted(
+                    summary.time_to_verdict, key=lambda entry: entry["phase"]
+                ),
                 "failed_phase": summary.failed_phase,
                 "hints": (
                     probes.cloud_log_hints(self.context.providers)
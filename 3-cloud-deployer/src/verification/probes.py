@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import random
 import time
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
 
 from src.core.observability import redact_sensitive
+from src.log_tracing.queries import (
+    kql_contains,
+    query_cloud_logging,
+    query_cloudwatch,
+    query_log_analytics,
+)
 from src.utils.gcp_utils import parse_gcp_service_account
 from src.verification.contracts import ProbeResult
 
+POLL_INITIAL_DELAY = 0.25
+POLL_BACKOFF_FACTOR = 2.0
+POLL_JITTER = 0.2
+
 
 def hot_reader_url(provider: str | None, outputs: dict) -> str | None:
     mapping = {
@@ -32,7 +45,28 @@ def _validated_https_url(url: str) -> str:
     return url
 
 
-def poll_hot_reader(
+def backoff_delays(
+    poll_interval: float,
+    *,
+    initial: float = POLL_INITIAL_DELAY,
+) -> Iterator[float]:
+    """Yield poll delays that start fast and double up to ``poll_interval``.
+
+    Each delay is jittered by ``POLL_JITTER`` so concurrent probes do not
+    poll a provider in lockstep.
+    """
+    delay = min(initial, poll_interval)
+    while True:
+        spread = delay * POLL_JITTER
+        yield max(0.0, delay + random.uniform(-spread, spread))  # nosec B311
+        delay = min(poll_interval, delay * POLL_BACKOFF_FACTOR)
+
+
+def _remaining_delay(delays: Iterator[float], started: float, timeout: float) -> float:
+    return max(0.0, min(next(delays), timeout - (time.monotonic() - started)))
+
+
+async def poll_hot_reader(
     url: str,
     device_id: str,
     inter_cloud_token: str | None,
@@ -40,30 +74,51 @@ def poll_hot_reader(
     poll_interval: float,
     *,
     trace_id: str,
+    session: aiohttp.ClientSession | None = None,
+    delays: Iterator[float] | None = None,
 ) -> ProbeResult:
-    """Poll the canonical hot-reader contract for the current trace."""
+    """Poll the canonical hot-reader contract for the current trace.
+
+    Pass a shared ``session`` to reuse its connections across calls, and a
+    shared ``delays`` schedule to keep backing off where the last call stopped.
+    """
     try:
         endpoint = _validated_https_url(url)
     except ValueError as exc:
         return ProbeResult(success=False, error=str(exc))
 
+    if session is None:
+        async with aiohttp.ClientSession() as owned_session:
+            return await poll_hot_reader(
+                endpoint,
+                device_id,
+                inter_cloud_token,
+                timeout,
+                poll_interval,
+                trace_id=trace_id,
+                session=owned_session,
+                delays=delays,
+            )
+
     headers = {}
     if inter_cloud_token:
         headers["X-Inter-Cloud-Token"] = inter_cloud_token
+    delays = delays or backoff_delays(poll_interval)
     started = time.monotonic()
     last_diagnostic = "no response"
 
     while time.monotonic() - started < timeout:
         try:
-            response = requests.get(  # nosec B113
+            async with session.get(
                 endpoint,
                 params={"device_id": device_id, "limit": "20"},
                 headers=headers,
-                timeout=min(10, max(1, timeout)),
-            )
-            last_diagnostic = f"HTTP {response.status_code}"
-            if response.status_code == 200:
-                body = response.json()
+                timeout=aiohttp.ClientTimeout(total=min(10, max(1, timeout))),
+            ) as response:
+                status = response.status
+                last_diagnostic = f"HTTP {status}"
+                body = await response.json(content_type=None) if status == 200 else None
+            if status == 200:
                 if isinstance(body, list):
                     items = body
                 elif isinstance(body, dict):
@@ -81,19 +136,19 @@ def poll_hot_reader(
                         elapsed=round(time.monotonic() - started, 1),
                         evidence={"record_count": len(matches)},
                     )
-            elif response.status_code in {401, 403}:
+            elif status in {401, 403}:
                 return ProbeResult(
                     success=False,
-                    error=f"Hot reader authorization failed ({response.status_code})",
+                    error=f"Hot reader authorization failed ({status})",
                 )
-            elif response.status_code != 404:
+            elif status != 404:
                 return ProbeResult(
                     success=False,
-                    error=f"Hot reader returned HTTP {response.status_code}",
+                    error=f"Hot reader returned HTTP {status}",
                 )
-        except (requests.RequestException, ValueError) as exc:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
             last_diagnostic = redact_sensitive(exc)
-        time.sleep(poll_interval)
+        await asyncio.sleep(_remaining_delay(delays, started, timeout))
 
     return ProbeResult(
         success=False,
@@ -136,6 +191,7 @@ def check_twinmaker_entity(
             error=f"TwinMaker client initialization failed: {redact_sensitive(exc)}",
         )
 
+    delays = backoff_delays(poll_interval)
     started = time.monotonic()
     while time.monotonic() - started < timeout:
         try:
@@ -167,7 +223,7 @@ def check_twinmaker_entity(
             last_error = redact_sensitive(exc)
         else:
             last_error = "entity not found"
-        time.sleep(poll_interval)
+        time.sleep(_remaining_delay(delays, started, timeout))
 
     return ProbeResult(
         success=False,
@@ -204,6 +260,7 @@ def check_adt_twin(
             error=f"ADT client initialization failed: {redact_sensitive(exc)}",
         )
 
+    delays = backoff_delays(poll_interval)
     started = time.monotonic()
     while time.monotonic() - started < timeout:
         try:
@@ -221,7 +278,7 @@ def check_adt_twin(
             last_error = redact_sensitive(exc)
         else:
             last_error = "twin not found"
-        time.sleep(poll_interval)
+        time.sleep(_remaining_delay(delays, started, timeout))
 
     return ProbeResult(
         success=False,
@@ -306,28 +363,31 @@ def _check_aws_logs(
 
     function_name = outputs.get(f"aws_l2_{step_name}_function_name", step_name)
     log_group = f"/aws/lambda/{function_name}"
+    delays = backoff_delays(poll_interval)
     started = time.monotonic()
     while time.monotonic() - started < timeout:
         try:
-            end_time = int(time.time() * 1000)
-            response = client.filter_log_events(
-                logGroupName=log_group,
-                startTime=end_time - 15 * 60 * 1000,
-                endTime=end_time,
-                filterPattern=f'"{pattern}"',
+            end_time = datetime.now(timezone.utc)
+            records = query_cloudwatch(
+                client,
+                [log_group],
+                pattern,
+                end_time - timedelta(minutes=15),
+                end_time,
                 limit=5,
+                timeout=max(1.0, min(15.0, timeout - (time.monotonic() - started))),
             )
-            if response.get("events"):
+            if records:
                 return ProbeResult(
                     success=True,
                     elapsed=round(time.monotonic() - started, 1),
-                    evidence={"log_count": len(response["events"])},
+                    evidence={"log_count": len(records)},
                 )
         except Exception as exc:
             last_error = redact_sensitive(exc)
         else:
             last_error = "no matching logs"
-        time.sleep(poll_interval)
+        time.sleep(_remaining_delay(delays, started, timeout))
     return ProbeResult(
         success=False,
         elapsed=round(time.monotonic() - started, 1),
@@ -365,21 +425,21 @@ def _check_azure_logs(
             error=f"Azure Monitor client initialization failed: {redact_sensitive(exc)}",
         )
 
-    escaped_pattern = pattern.replace('"', '""')
     query = (
-        'AppTraces | where AppRoleName contains "l2-functions" '
-        f'| where Message contains "{escaped_pattern}" '
+        f"AppTraces | where {kql_contains('AppRoleName', 'l2-functions')} "
+        f"| where {kql_contains('Message', pattern)} "
         "| where TimeGenerated > ago(60m) | limit 10"
     )
+    delays = backoff_delays(poll_interval)
     started = time.monotonic()
     while time.monotonic() - started < timeout:
         try:
-            response = client.query_workspace(
+            rows, _partial_error = query_log_analytics(
+                client,
                 workspace_id,
                 query,
-                timespan=timedelta(minutes=60),
+                timedelta(minutes=60),
             )
-            rows = response.tables[0].rows if response.tables else []
             if rows:
                 return ProbeResult(
                     success=True,
@@ -390,7 +450,7 @@ def _check_azure_logs(
             last_error = redact_sensitive(exc)
         else:
             last_error = "no matching logs"
-        time.sleep(poll_interval)
+        time.sleep(_remaining_delay(delays, started, timeout))
     return ProbeResult(
         success=False,
         elapsed=round(time.monotonic() - started, 1),
@@ -433,18 +493,16 @@ def _check_gcp_logs(
             error=f"GCP logging client initialization failed: {redact_sensitive(exc)}",
         )
 
-    escaped_pattern = pattern.replace('"', '\\"')
+    delays = backoff_delays(poll_interval)
     started = time.monotonic()
     while time.monotonic() - started < timeout:
         try:
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=15)
-            filter_value = (
-                '(resource.type="cloud_function" OR '
-                'resource.type="cloud_run_revision") '
-                f'AND textPayload:"{escaped_pattern}" '
-                f'AND timestamp >= "{cutoff.isoformat()}"'
+            entries = query_cloud_logging(
+                client,
+                pattern,
+                datetime.now(timezone.utc) - timedelta(minutes=15),
+                max_results=5,
             )
-            entries = list(client.list_entries(filter_=filter_value, max_results=5))
             if entries:
                 return ProbeResult(
                     success=True,
@@ -455,7 +513,7 @@ def _check_gcp_logs(
             last_error = redact_sensitive(exc)
         else:
             last_error = "no matching logs"
-        time.sleep(poll_interval)
+        time.sleep(_remaining_delay(delays, started, timeout))
     return ProbeResult(
         success=False,
         elapsed=round(time.monotonic() - started, 1),
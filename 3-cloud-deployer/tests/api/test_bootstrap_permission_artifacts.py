@@ -286,7 +286,7 @@ def test_permission_inventory_matches_current_terraform_provider_types():
 
     for provider, prefixes in expected_prefixes.items():
         actual_types = set()
-        for path in terraform_dir.glob("*.tf"):
+        for path in terraform_dir.rglob("*.tf"):
             for resource_type in re.findall(r'^(?:resource|data) "([^"]+)"', path.read_text(), flags=re.M):
                 if resource_type.startswith(prefixes):
                     actual_types.add(resource_type)
@@ -18,6 +18,7 @@ import rest_api
 from src.api import deployment
 from src.api.dependencies import validate_provider
 from src.api.operation_context import operation_project_path as real_operation_project_path
+from src.core.operation_scheduler import OperationScheduler
 from src.deployment_specification.errors import DeploymentSpecificationError
 
 
@@ -113,9 +114,9 @@ def test_deploy_route_invokes_canonical_facade_with_hard_response_shape():
             deployment.core_deployer, "deploy_all", return_value=outputs
         ) as mock_deploy_all,
     ):
-        response = deployment.deploy_all(
+        response = asyncio.run(deployment.deploy_all(
             OPERATION_TOKEN, provider="aws", project_name="test_api_project"
-        )
+        ))
 
     mock_template_guard.assert_called_once_with("test_api_project", "deploy")
     mock_validate_provider.assert_called_once_with("aws")
@@ -167,12 +168,14 @@ def test_destroy_route_invokes_canonical_facade_with_hard_response_shape():
             deployment, "create_context", return_value=context
         ) as mock_create_context,
         patch.object(deployment.core_deployer, "destroy_all") as mock_destroy_all,
+        patch.object(deployment, "invalidate_project_status") as mock_invalidate,
     ):
-        response = deployment.destroy_all(
+        response = asyncio.run(deployment.destroy_all(
             OPERATION_TOKEN, provider="aws", project_name="test_api_project"
-        )
+        ))
 
     mock_template_guard.assert_called_once_with("test_api_project", "destroy")
+    mock_invalidate.assert_called_once_with("test_api_project")
     mock_validate_provider.assert_called_once_with("aws")
     mock_storage.assert_not_called()
     mock_validate_directory.assert_called_once_with(
@@ -209,7 +212,7 @@ async def _collect_stream(streaming_response) -> str:
 
 
 async def _fake_deploy_stream(
-    context, strategy=None, output_sink=None, operation_context=None
+    context, strategy=None, output_sink=None, operation_context=None, incremental=False
 ):
     assert context is not None
     assert strategy is None
@@ -228,7 +231,7 @@ async def _fake_destroy_stream(context, strategy=None, operation_context=None):
 
 
 async def _fake_failing_deploy_stream(
-    context, strategy=None, output_sink=None, operation_context=None
+    context, strategy=None, output_sink=None, operation_context=None, incremental=False
 ):
     yield "terraform init"
     raise RuntimeError(
@@ -242,7 +245,7 @@ async def _fake_failing_destroy_stream(context, strategy=None, operation_context
 
 
 async def _fake_secret_deploy_stream(
-    context, strategy=None, output_sink=None, operation_context=None
+    context, strategy=None, output_sink=None, operation_context=None, incremental=False
 ):
     assert context is not None
     yield "terraform apply azure_client_secret=super-secret-value"
@@ -471,6 +474,105 @@ def test_destroy_stream_failure_uses_typed_safe_error_event():
     assert "super-secret" not in body
 
 
+@contextmanager
+def _scheduled_deploy_stream(monkeypatch, scheduler):
+    monkeypatch.setattr(deployment, "get_operation_scheduler", lambda: scheduler)
+    context = MagicMock(name="deployment_context")
+    with (
+        patch.object(deployment, "check_template_protection"),
+        patch.object(deployment, "validate_provider", return_value="aws"),
+        patch.object(deployment, "validate_project_directory"),
+        patch.object(deployment, "create_context", return_value=context),
+        patch.object(deployment.core_deployer, "deploy_all_stream", new=_fake_deploy_stream),
+    ):
+        yield
+
+
+def test_deploy_stream_reports_queue_position_until_project_slot_frees(monkeypatch):
+    scheduler = OperationScheduler(max_concurrent=2)
+    running = scheduler.submit("test_api_project", "destroy", "op-running")
+
+    async def run():
+        response = await deployment.deploy_stream(
+            OPERATION_TOKEN, provider="aws", project_name="test_api_project"
+        )
+        iterator = response.body_iterator
+        first = await anext(iterator)
+        scheduler.release(running)
+        rest = [chunk async for chunk in iterator]
+        return first, "".join(rest)
+
+    with _scheduled_deploy_stream(monkeypatch, scheduler):
+        first, rest = asyncio.run(run())
+
+    assert '"message":"Queued: position 1 of 1' in first
+    assert '"queue_position":1,"queue_length":1,"eta_seconds":' in first
+    assert '"message":"terraform apply"' in rest
+    assert "event: complete" in rest
+    assert scheduler.snapshot()["running"] == []
+
+
+def test_queued_deploy_waits_on_the_event_loop_until_its_slot_frees(monkeypatch):
+    scheduler = OperationScheduler(max_concurrent=1)
+    running = scheduler.submit("other_project", "deploy", "op-running")
+    deploy_calls = []
+
+    def fake_deploy_all(context, provider, **kwargs):
+        deploy_calls.append(provider)
+        return {}
+
+    async def run():
+        task = asyncio.create_task(
+            deployment.deploy_all(
+                OPERATION_TOKEN, provider="aws", project_name="test_api_project"
+            )
+        )
+        # A queued request must not block the loop that serves other routes.
+        while not scheduler.snapshot()["queued"]:
+            await asyncio.sleep(0.01)
+        assert deploy_calls == []
+        scheduler.release(running)
+        return await task
+
+    with (
+        _scheduled_deploy_stream(monkeypatch, scheduler),
+        patch.object(deployment.core_deployer, "deploy_all", new=fake_deploy_all),
+    ):
+        response = asyncio.run(run())
+
+    assert response["status"] == "success"
+    assert deploy_calls == ["aws"]
+    assert scheduler.snapshot()["running"] == []
+
+
+def test_cancelling_a_queued_stream_ends_it_with_a_cancellation_error(monkeypatch):
+    scheduler = OperationScheduler(max_concurrent=1)
+    running = scheduler.submit("other_project", "deploy", "op-running")
+
+    async def run():
+        response = await deployment.deploy_stream(
+            OPERATION_TOKEN, provider="aws", project_name="test_api_project"
+        )
+        iterator = response.body_iterator
+        await anext(iterator)
+        queued_id = scheduler.snapshot()["queued"][0]["operation_id"]
+        with pytest.raises(HTTPException) as missing:
+            deployment.cancel_operation(queued_id, project_name="other_project")
+        assert missing.value.status_code == 404
+        result = deployment.cancel_operation(queued_id, project_name="test_api_project")
+        return result, "".join([chunk async for chunk in iterator])
+
+    with _scheduled_deploy_stream(monkeypatch, scheduler):
+        result, rest = asyncio.run(run())
+
+    assert result["state"] == "cancelled"
+    assert '"error_code":"OPERATION_CANCELLED"' in rest
+    assert "terraform init" not in rest
+    assert [op["operation_id"] for op in scheduler.snapshot()["running"]] == [
+        running.operation_id
+    ]
+
+
 def test_google_provider_alias_is_normalized_to_gcp_in_deploy_response():
     context = MagicMock(name="deployment_context")
 
@@ -489,9 +591,9 @@ def test_google_provider_alias_is_normalized_to_gcp_in_deploy_response():
             deployment.core_deployer, "deploy_all", return_value={}
         ) as mock_deploy_all,
     ):
-        response = deployment.deploy_all(
+        response = asyncio.run(deployment.deploy_all(
             OPERATION_TOKEN, provider="google", project_name="test_api_project"
-        )
+        ))
 
     operation_context = mock_deploy_all.call_args.kwargs["operation_context"]
     mock_create_context.assert_called_once_with(
@@ -531,9 +633,9 @@ def test_request_scoped_project_does_not_require_active_project_match():
             deployment.core_deployer, "deploy_all", return_value={}
         ) as mock_deploy_all,
     ):
-        response = deployment.deploy_all(
+        response = asyncio.run(deployment.deploy_all(
             OPERATION_TOKEN, provider="aws", project_name="requested"
-        )
+        ))
 
     assert response["project_name"] == "requested"
     assert mock_deploy_all.call_args.args == (context, "aws")
@@ -551,9 +653,9 @@ def test_request_boundary_http_error_redacts_detail():
         ),
     ):
         with pytest.raises(HTTPException) as exc_info:
-            deployment.deploy_all(
+            asyncio.run(deployment.deploy_all(
                 OPERATION_TOKEN, provider="aws", project_name="template"
-            )
+            ))
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail["error_code"] == "VALIDATION_ERROR"
@@ -583,9 +685,9 @@ def test_directory_validation_failure_maps_to_400_before_deploy():
         patch.object(deployment.core_deployer, "deploy_all") as mock_deploy_all,
     ):
         with pytest.raises(HTTPException) as exc_info:
-            deployment.deploy_all(
+            asyncio.run(deployment.deploy_all(
                 OPERATION_TOKEN, provider="aws", project_name="test_api_project"
-            )
+            ))
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail["error_code"] == "VALIDATION_ERROR"
@@ -619,11 +721,11 @@ def test_deployment_specification_failure_exposes_only_stable_safe_contract():
         patch.object(deployment.core_deployer, "deploy_all") as mock_deploy_all,
     ):
         with pytest.raises(HTTPException) as exc_info:
-            deployment.deploy_all(
+            asyncio.run(deployment.deploy_all(
                 OPERATION_TOKEN,
                 provider="aws",
                 project_name="test_api_project",
-            )
+            ))
 
     assert exc_info.value.status_code == 400
     assert (
@@ -657,9 +759,9 @@ def test_directory_validation_error_redacts_runtime_project_paths():
         patch.object(deployment, "create_context") as mock_create_context,
     ):
         with pytest.raises(HTTPException) as exc_info:
-            deployment.deploy_all(
+            asyncio.run(deployment.deploy_all(
                 OPERATION_TOKEN, provider="aws", project_name="test_api_project"
-            )
+            ))
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail["error_code"] == "VALIDATION_ERROR"
@@ -689,11 +791,11 @@ def test_facade_failure_maps_to_500_without_leaking_exception_detail(caplog):
             ),
         ):
             with pytest.raises(HTTPException) as exc_info:
-                deployment.deploy_all(
+                asyncio.run(deployment.deploy_all(
                     OPERATION_TOKEN,
                     provider="aws",
                     project_name="test_api_project",
-                )
+                ))
 
     assert exc_info.value.status_code == 500
     assert exc_info.value.detail["error_code"] == "DEPLOYMENT_ERROR"
@@ -726,11 +828,11 @@ def test_destroy_facade_failure_maps_to_destruction_error_without_leaking_detail
             ),
         ):
             with pytest.raises(HTTPException) as exc_info:
-                deployment.destroy_all(
+                asyncio.run(deployment.destroy_all(
                     OPERATION_TOKEN,
                     provider="aws",
                     project_name="test_api_project",
-                )
+                ))
 
     assert exc_info.value.status_code == 500
     assert exc_info.value.detail["error_code"] == "DESTRUCTION_ERROR"
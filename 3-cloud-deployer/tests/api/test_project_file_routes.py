@@ -1,6 +1,9 @@
 """Project file browser API boundary tests."""
 
+import hashlib
+import io
 import json
+import zipfile
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
@@ -10,12 +13,20 @@ import pytest
 import constants as CONSTANTS
 import rest_api
 from src.core.project_storage import ProjectStorage
+from src.project_archive.ingestion import IngestedArchive
 import src.api.projects as project_routes
 
 
 client = TestClient(rest_api.app)
 
 
+def _package_zip() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("config.json", b"{}")
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def project_storage(tmp_path, monkeypatch):
     storage = ProjectStorage(tmp_path)
@@ -120,18 +131,19 @@ def test_operation_package_endpoint_stages_token_and_persists_project_definition
 
     monkeypatch.setattr(project_routes, "get_operation_package_store", FakeStore)
     monkeypatch.setattr(project_routes, "get_project_storage", MissingStorage)
+    def create_project_from_zip(project_name, content):
+        calls.append(("create", project_name, content))
+        return {"project_name": project_name, "warnings": ["definition warning"]}
+
     monkeypatch.setattr(
         project_routes.file_manager,
         "create_project_from_zip",
-        lambda project_name, content: {
-            "project_name": project_name,
-            "warnings": ["definition warning"],
-        },
+        create_project_from_zip,
     )
 
     response = client.post(
         "/projects/test_operation/operation-package",
-        files={"file": ("project.zip", b"deployment-package", "application/zip")},
+        files={"file": ("project.zip", _package_zip(), "application/zip")},
     )
 
     assert response.status_code == 200
@@ -141,7 +153,32 @@ def test_operation_package_endpoint_stages_token_and_persists_project_definition
         "expires_at": "2026-07-14T00:00:00+00:00",
         "warnings": ["definition warning", "stage warning"],
     }
-    assert calls == [("stage", "test_operation", b"deployment-package")]
+    assert [(call, project) for call, project, _archive in calls] == [
+        ("stage", "test_operation"),
+        ("create", "test_operation"),
+    ]
+    # Both consumers read the same single ingestion of the upload.
+    assert isinstance(calls[0][2], IngestedArchive)
+    assert calls[0][2] is calls[1][2]
+
+
+def test_operation_package_endpoint_rejects_file_directory_conflicts(monkeypatch):
+    class FakeStore:
+        def stage(self, _project_name, _content):
+            raise AssertionError("conflicting archive must not be staged")
+
+    monkeypatch.setattr(project_routes, "get_operation_package_store", FakeStore)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("config.json", b"{}")
+        archive.writestr("config.json/nested.json", b"{}")
+
+    response = client.post(
+        "/projects/test_operation/operation-package",
+        files={"file": ("project.zip", buffer.getvalue(), "application/zip")},
+    )
+
+    assert response.status_code == 400
 
 
 def test_operation_package_endpoint_discards_stage_when_definition_update_fails(
@@ -180,7 +217,7 @@ def test_operation_package_endpoint_discards_stage_when_definition_update_fails(
 
     response = client.post(
         "/projects/test_operation/operation-package",
-        files={"file": ("project.zip", b"deployment-package", "application/zip")},
+        files={"file": ("project.zip", _package_zip(), "application/zip")},
     )
 
     assert response.status_code == 400
@@ -238,3 +275,105 @@ def test_project_delete_rejects_active_operation(monkeypatch):
 
     assert response.status_code == 409
     assert response.json()["detail"] == "Project has an active deployment operation"
+
+
+def test_project_versions_are_listed_and_exported_from_the_store(
+    project_storage,
+    tmp_path,
+):
+    storage = project_routes.get_project_storage()
+    store = storage.version_store(project_storage)
+    staged = tmp_path / "config.json"
+    staged.write_bytes(b"{}")
+    version = store.add_version(
+        [("config.json", hashlib.sha256(b"{}").hexdigest(), staged)],
+        version="2026-01-01_00-00-00.000000",
+    )
+
+    listing = client.get(f"/projects/{project_storage}/versions")
+    exported = client.get(f"/projects/{project_storage}/versions/{version}/export")
+    missing = client.get(
+        f"/projects/{project_storage}/versions/2026-01-02_00-00-00.000000/export"
+    )
+
+    assert listing.json()["versions"] == [
+        {"version": version, "file_count": 1, "size_bytes": 2, "legacy": False}
+    ]
+    assert exported.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(exported.content)) as archive:
+        assert archive.read("config.json") == b"{}"
+    assert missing.status_code == 404
+
+
+def test_delta_operation_package_stages_the_assembled_archive(
+    project_storage,
+    tmp_path,
+    monkeypatch,
+):
+    storage = project_routes.get_project_storage()
+    scene = bytes(range(256)) * 16
+    staged_scene = tmp_path / "scene.glb"
+    staged_scene.write_bytes(scene)
+    storage.version_store(project_storage).add_version(
+        [("scene.glb", hashlib.sha256(scene).hexdigest(), staged_scene)],
+        version="2026-01-01_00-00-00.000000",
+    )
+    staged = []
+
+    class FakeStore:
+        def stage(self, project_name, content):
+            staged.append(content.read_binary("scene.glb"))
+            return SimpleNamespace(
+                token="opaque-operation-token",
+                expires_at=datetime(2026, 7, 14, tzinfo=timezone.utc),
+                warnings=[],
+            )
+
+    monkeypatch.setattr(project_routes, "get_operation_package_store", FakeStore)
+    monkeypatch.setattr(
+        project_routes.file_manager,
+        "update_project_from_zip",
+        lambda project_name, content: {"warnings": []},
+    )
+    manifest = {
+        "files": [
+            {"path": "config.json", "sha256": hashlib.sha256(b"{}").hexdigest(), "size": 2},
+            {"path": "scene.glb", "sha256": hashlib.sha256(scene).hexdigest(), "size": len(scene)},
+        ]
+    }
+    delta = io.BytesIO()
+    with zipfile.ZipFile(delta, "w") as archive:
+        archive.writestr("config.json", b"{}")
+
+    plan = client.post(
+        f"/projects/{project_storage}/operation-package/plan", json=manifest
+    )
+    response = client.post(
+        f"/projects/{project_storage}/operation-package/delta",
+        data={"manifest": json.dumps(manifest)},
+        files={"file": ("delta.zip", delta.getvalue(), "application/zip")},
+    )
+
+    assert plan.json()["missing"] == [hashlib.sha256(b"{}").hexdigest()]
+    assert response.status_code == 200
+    assert staged == [scene]
+
+
+def test_delta_operation_package_reports_content_gone_since_planning(project_storage):
+    manifest = {
+        "files": [
+            {"path": "config.json", "sha256": hashlib.sha256(b"{}").hexdigest(), "size": 2},
+        ]
+    }
+    delta = io.BytesIO()
+    with zipfile.ZipFile(delta, "w") as archive:
+        archive.writestr("placeholder/", b"")
+
+    response = client.post(
+        f"/projects/{project_storage}/operation-package/delta",
+        data={"manifest": json.dumps(manifest)},
+        files={"file": ("delta.zip", delta.getvalue(), "application/zip")},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["error_code"] == "PACKAGE_CONTENT_MISSING"
@@ -1,9 +1,10 @@
 """Status API regression tests."""
 
 from contextlib import contextmanager
+import json
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -11,12 +12,31 @@ from fastapi import HTTPException
 from src.api import status
 from src.status import metadata as metadata_status
 from src.status import terraform as terraform_status
+from src import terraform_state
+from src.terraform_runner import TerraformRunner
 
 
 SOURCE_HASH = "sha256:" + "a" * 64
 ARTIFACT_HASH = "sha256:" + "b" * 64
 
 
+def _write_state(project, resources, outputs=None, version=4):
+    state_path = project / "terraform" / "terraform.tfstate"
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(
+        json.dumps(
+            {
+                "version": version,
+                "serial": 3,
+                "lineage": "lineage",
+                "outputs": outputs or {},
+                "resources": resources,
+            }
+        )
+    )
+    return state_path
+
+
 def test_request_validation_normalizes_google_alias(tmp_path):
     with patch.object(
         status,
@@ -162,6 +182,10 @@ def test_duplicate_function_metadata_keeps_both_artifacts(tmp_path):
 def test_drift_detection_uses_transient_tfvars_without_persisting_secrets(tmp_path):
     project = tmp_path / "upload" / "factory"
     (project / "terraform").mkdir(parents=True)
+    _write_state(
+        project,
+        [{"mode": "managed", "type": "aws_s3_bucket", "name": "cold", "instances": [{}]}],
+    )
     completed = SimpleNamespace(returncode=0, stdout="", stderr="")
 
     with (
@@ -248,6 +272,10 @@ def test_detailed_status_uses_acquired_operation_workspace(tmp_path):
 def test_drift_detection_redacts_terraform_diagnostics(tmp_path):
     project = tmp_path / "upload" / "factory"
     project.mkdir(parents=True)
+    _write_state(
+        project,
+        [{"mode": "managed", "type": "aws_s3_bucket", "name": "cold", "instances": [{}]}],
+    )
     completed = SimpleNamespace(
         returncode=2,
         stdout="azure_client_secret=sensitive-value",
@@ -309,6 +337,7 @@ def test_state_command_failure_is_not_reported_as_not_deployed(monkeypatch):
         stdout="",
         stderr="api_key=sensitive-value",
     )
+    monkeypatch.setattr(terraform_status, "_state_resources", lambda *args: None)
     monkeypatch.setattr(
         terraform_status,
         "run_terraform_status_command",
@@ -336,6 +365,7 @@ def test_state_resources_are_classified_by_canonical_addresses(monkeypatch):
         ),
         stderr="",
     )
+    monkeypatch.setattr(terraform_status, "_state_resources", lambda *args: None)
     monkeypatch.setattr(
         terraform_status,
         "run_terraform_status_command",
@@ -350,3 +380,121 @@ def test_state_resources_are_classified_by_canonical_addresses(monkeypatch):
     assert result["l3"]["hot"]["deployed"] is True
     assert result["l3"]["cold"]["deployed"] is False
     assert result["l4"]["deployed"] is True
+
+
+def test_state_is_read_directly_and_cached_until_replaced(tmp_path, monkeypatch):
+    project = tmp_path / "upload" / "factory"
+    state_path = _write_state(
+        project,
+        [
+            {
+                "mode": "managed",
+                "type": "aws_lambda_function",
+                "name": "l2_persister",
+                "instances": [{"index_key": 0}],
+            },
+            {
+                "module": "module.twin",
+                "mode": "data",
+                "type": "aws_iam_policy_document",
+                "name": "l4_twinmaker",
+                "instances": [{"index_key": "main"}],
+            },
+            {"mode": "managed", "type": "aws_s3_bucket", "name": "gone", "instances": []},
+        ],
+    )
+
+    def no_cli(*args):
+        raise AssertionError("terraform CLI must not run for a readable state")
+
+    monkeypatch.setattr(terraform_status, "run_terraform_status_command", no_cli)
+    result = terraform_status.check_terraform_state("factory", project)
+
+    assert result["total_resources"] == 2
+    assert result["l2"]["resources"] == ["aws_lambda_function.l2_persister[0]"]
+    assert result["l4"]["resources"] == [
+        'module.twin.data.aws_iam_policy_document.l4_twinmaker["main"]'
+    ]
+    first = terraform_state.read_terraform_state(state_path)
+    assert terraform_state.read_terraform_state(state_path) is first
+
+    _write_state(project, [])
+    assert terraform_status.check_terraform_state("factory", project)["status"] == "not_deployed"
+    assert terraform_status.check_terraform_drift("factory", project)["status"] == "no_drift"
+
+
+def test_split_out_stack_states_are_classified_with_the_root_state(tmp_path, monkeypatch):
+    project = tmp_path / "upload" / "factory"
+    state_path = _write_state(
+        project,
+        [
+            {
+                "mode": "managed",
+                "type": "aws_lambda_function",
+                "name": "l2_persister",
+                "instances": [{"index_key": 0}],
+            }
+        ],
+    )
+    stack_state = state_path.parent / "stacks" / "aws_l5" / "terraform.tfstate"
+    stack_state.parent.mkdir(parents=True)
+    stack_state.write_text(
+        json.dumps(
+            {
+                "version": 4,
+                "serial": 1,
+                "lineage": "stack",
+                "resources": [
+                    {
+                        "mode": "managed",
+                        "type": "aws_grafana_workspace",
+                        "name": "main",
+                        "instances": [{"index_key": 0}],
+                    }
+                ],
+            }
+        )
+    )
+    monkeypatch.setattr(terraform_status, "run_terraform_status_command", None)
+
+    result = terraform_status.check_terraform_state("factory", project)
+
+    assert result["total_resources"] == 2
+    assert result["l5"]["resources"] == ["aws_grafana_workspace.main[0]"]
+
+
+def test_unsupported_state_falls_back_to_state_list(tmp_path, monkeypatch):
+    project = tmp_path / "upload" / "factory"
+    _write_state(project, [], version=3)
+    completed = SimpleNamespace(returncode=0, stdout="aws_dynamodb_table.l3_hot[0]\n", stderr="")
+    monkeypatch.setattr(
+        terraform_status,
+        "run_terraform_status_command",
+        lambda *args: completed,
+    )
+
+    result = terraform_status.check_terraform_state("factory", project)
+
+    assert result["l3"]["hot"]["resources"] == ["aws_dynamodb_table.l3_hot[0]"]
+
+
+def test_runner_outputs_come_from_state_without_cli(tmp_path, monkeypatch):
+    project = tmp_path / "upload" / "factory"
+    state_path = _write_state(
+        project,
+        [],
+        outputs={
+            "aws_region": {"value": "eu-central-1", "type": "string"},
+            "tags": {"value": {"twin": "factory"}, "type": ["map", "string"]},
+        },
+    )
+    runner = TerraformRunner(str(tmp_path), state_path=str(state_path))
+    monkeypatch.setattr(runner, "_run_command", MagicMock(side_effect=AssertionError("no CLI")))
+
+    outputs = runner.output()
+    outputs["tags"]["twin"] = "mutated"
+    runner.output("tags")["twin"] = "mutated"
+
+    assert runner.output() == {"aws_region": "eu-central-1", "tags": {"twin": "factory"}}
+    assert runner.output("aws_region") == "eu-central-1"
+    assert runner.has_root_resources() is False
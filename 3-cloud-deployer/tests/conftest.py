@@ -15,7 +15,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "s
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 @pytest.fixture(scope="function", autouse=True)
-def mock_env_vars(request, monkeypatch):
+def mock_env_vars(request, monkeypatch, tmp_path_factory):
     """Set mock environment variables to prevent accidental cloud calls.
     
     Note: This fixture is skipped for E2E tests which need real credentials.
@@ -30,6 +30,20 @@ def mock_env_vars(request, monkeypatch):
     monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
     monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
     monkeypatch.setenv("REGION", "eu-central-1")
+    monkeypatch.setenv(
+        "DEPLOYER_ARTIFACT_CACHE_ROOT",
+        str(tmp_path_factory.mktemp("function-artifacts")),
+    )
+    # Validation outcomes are cached by content; tests that patch validators
+    # must not see results from other tests. Cache tests opt back in.
+    monkeypatch.setenv("DEPLOYER_VALIDATION_CACHE_MAX_ENTRIES", "0")
+    # Same for cached status probes and pooled provider clients.
+    monkeypatch.setenv("DEPLOYER_STATUS_CACHE_TTL_SECONDS", "0")
+    monkeypatch.setenv("DEPLOYER_STATUS_CLIENT_IDLE_SECONDS", "0")
+    monkeypatch.setenv(
+        "DEPLOYER_TERRAFORM_ROOTS_DIR",
+        str(tmp_path_factory.mktemp("terraform-roots")),
+    )
 
 @pytest.fixture(scope="function")
 def mock_project_config():
@@ -45,8 +45,14 @@ def test_provider_fetches_run_concurrently_and_results_are_redacted(monkeypatch)
         lambda name: {},
     )
     barrier = Barrier(2, timeout=1)
+    delivered = set()
 
-    def fetch(provider, *args):
+    def fetch(session, query_timeout):
+        provider = session.provider
+        # Sessions only return events that were not delivered before.
+        if provider in delivered:
+            return ProviderFetchResult(provider)
+        delivered.add(provider)
         barrier.wait()
         return ProviderFetchResult(
             provider,
@@ -0,0 +1,164 @@
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.providers.azure.layers import adt_bulk_loader
+from src.providers.azure.layers.adt_bulk_loader import order_models, upload_hierarchy
+from src.providers.terraform.runtime_outcome import RuntimeRun
+
+
+class _FakeDigitalTwins:
+    """In-memory ADT data plane with the client methods the loader uses."""
+
+    def __init__(self, models=(), twins=(), upsert_barrier=None):
+        self.models = set(models)
+        self.twins = dict.fromkeys(twins)
+        self.relationships = {}
+        self.calls = []
+        self.upsert_barrier = upsert_barrier
+        self._lock = threading.Lock()
+
+    def list_models(self):
+        return [SimpleNamespace(id=model_id) for model_id in sorted(self.models)]
+
+    def create_models(self, models):
+        for model in models:
+            referenced = set(model.get("extends", []))
+            assert referenced <= self.models, f"{model['@id']} uploaded before its base"
+            self.models.add(model["@id"])
+        self._record(("models", tuple(model["@id"] for model in models)))
+        return models
+
+    def query_twins(self, query):
+        self._record(("query",))
+        return [{"$dtId": twin_id} for twin_id in self.twins]
+
+    def upsert_digital_twin(self, twin_id, twin):
+        if self.upsert_barrier is not None:
+            self.upsert_barrier.wait()
+        with self._lock:
+            self.twins[twin_id] = twin
+            self.calls.append(("twin", twin_id))
+
+    def upsert_relationship(self, source_id, relationship_id, relationship):
+        with self._lock:
+            assert source_id in self.twins and relationship["$targetId"] in self.twins
+            self.relationships[(source_id, relationship_id)] = relationship
+            self.calls.append(("relationship", relationship_id))
+
+    def _record(self, call):
+        with self._lock:
+            self.calls.append(call)
+
+
+def _hierarchy(temperature=20):
+    return {
+        "models": [
+            {"@id": "dtmi:factory:Machine;1", "extends": ["dtmi:factory:Asset;1"]},
+            {"@id": "dtmi:factory:Asset;1"},
+        ],
+        "twins": [
+            {"$dtId": "line-1", "$metadata": {"$model": "dtmi:factory:Asset;1"}},
+            {
+                "$dtId": "press-1",
+                "$metadata": {"$model": "dtmi:factory:Machine;1"},
+                "temperature": temperature,
+            },
+        ],
+        "relationships": [
+            {
+                "$dtId": "line-1",
+                "$relationshipId": "line-1-contains-press-1",
+                "$targetId": "press-1",
+                "$relationshipName": "contains",
+            }
+        ],
+    }
+
+
+def _run():
+    return RuntimeRun("Azure", "Digital Twins", logging.getLogger(__name__))
+
+
+def test_models_are_created_after_the_models_they_extend():
+    ordered = order_models(_hierarchy()["models"])
+
+    assert [model["@id"] for model in ordered] == [
+        "dtmi:factory:Asset;1",
+        "dtmi:factory:Machine;1",
+    ]
+
+
+def test_hierarchy_is_uploaded_models_then_twins_then_relationships(tmp_path):
+    (tmp_path / "terraform").mkdir()
+    client = _FakeDigitalTwins(models={"dtmi:factory:Asset;1"})
+
+    report = upload_hierarchy(client, _hierarchy(), tmp_path, _run())
+
+    assert client.calls[0] == ("models", ("dtmi:factory:Machine;1",))
+    assert sorted(client.calls[1:3]) == [("twin", "line-1"), ("twin", "press-1")]
+    assert client.calls[3] == ("relationship", "line-1-contains-press-1")
+    assert (report.models_created, report.models_existing) == (1, 1)
+    assert (report.twins_upserted, report.relationships_upserted) == (2, 1)
+    assert "2 twins and 1 relationships upserted" in report.summary()
+
+
+def test_twin_upserts_run_concurrently(tmp_path):
+    client = _FakeDigitalTwins(upsert_barrier=threading.Barrier(2, timeout=5))
+
+    report = upload_hierarchy(client, _hierarchy(), tmp_path, _run(), workers=2)
+
+    assert report.twins_upserted == 2
+
+
+def test_unchanged_twins_are_skipped_on_the_next_upload(tmp_path):
+    (tmp_path / "terraform").mkdir()
+    client = _FakeDigitalTwins()
+    upload_hierarchy(client, _hierarchy(), tmp_path, _run())
+    client.calls.clear()
+
+    report = upload_hierarchy(client, _hierarchy(temperature=21), tmp_path, _run())
+
+    twin_calls = [call for call in client.calls if call[0] == "twin"]
+    assert twin_calls == [("twin", "press-1")]
+    assert (report.twins_upserted, report.twins_unchanged) == (1, 1)
+
+
+def test_recorded_twins_missing_from_the_instance_are_uploaded_again(tmp_path):
+    (tmp_path / "terraform").mkdir()
+    upload_hierarchy(_FakeDigitalTwins(), _hierarchy(), tmp_path, _run())
+    recreated = _FakeDigitalTwins()
+
+    report = upload_hierarchy(recreated, _hierarchy(), tmp_path, _run())
+
+    assert report.twins_upserted == 2
+    assert report.twins_unchanged == 0
+
+
+def test_failed_twins_are_not_recorded_as_uploaded(tmp_path):
+    (tmp_path / "terraform").mkdir()
+
+    class FailingPress(_FakeDigitalTwins):
+        def upsert_digital_twin(self, twin_id, twin):
+            if twin_id == "press-1":
+                raise RuntimeError("throttled")
+            super().upsert_digital_twin(twin_id, twin)
+
+    run = _run()
+    upload_hierarchy(FailingPress(), _hierarchy(), tmp_path, run)
+
+    record = adt_bulk_loader.load_upload_record(adt_bulk_loader.upload_record_path(tmp_path))
+    assert set(record) == {"line-1"}
+    assert [failure.resource for failure in run.failures] == [
+        "press-1",
+        "line-1-contains-press-1",
+    ]
+
+
+def test_upload_workers_must_be_positive(monkeypatch):
+    monkeypatch.setenv("DEPLOYER_ADT_UPLOAD_WORKERS", "0")
+
+    with pytest.raises(ValueError, match="must be positive"):
+        adt_bulk_loader.default_adt_upload_workers()
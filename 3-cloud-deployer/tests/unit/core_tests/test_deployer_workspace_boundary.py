@@ -39,7 +39,7 @@ def test_deploy_all_runs_strategy_against_runtime_workspace_context():
 
     assert result == {"ok": {"value": True}}
     mock_workspace.assert_called_once_with(source_context, operation_context=None)
-    mock_strategy.assert_called_once_with(runtime_context)
+    mock_strategy.assert_called_once_with(runtime_context, incremental=False)
     strategy.deploy_all.assert_called_once_with(runtime_context)
 
 
@@ -171,6 +171,7 @@ def test_deploy_all_stream_sets_outputs_from_runtime_workspace_strategy():
         runtime_context,
         terraform_dir=None,
         project_path="/tmp/workspace/factory",
+        incremental=False,
     )
 
 
@@ -0,0 +1,171 @@
+"""Unit tests for deploy/destroy admission control."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.deployment_errors import OperationCancelled
+from src.core.operation_scheduler import (
+    OperationScheduler,
+    default_max_concurrent_operations,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _states(*tickets):
+    return [ticket.state for ticket in tickets]
+
+
+def test_admits_up_to_the_limit_and_one_operation_per_project():
+    scheduler = OperationScheduler(max_concurrent=2)
+
+    first = scheduler.submit("plant", "deploy", "op-1")
+    same_project = scheduler.submit("plant", "destroy", "op-2")
+    other = scheduler.submit("factory", "deploy", "op-3")
+    over_limit = scheduler.submit("depot", "deploy", "op-4")
+
+    assert _states(first, same_project, other, over_limit) == [
+        "running",
+        "queued",
+        "running",
+        "queued",
+    ]
+
+    scheduler.release(other)
+    # The busy project does not hold back the next project in line.
+    assert _states(same_project, over_limit) == ["queued", "running"]
+
+    scheduler.release(first)
+    assert same_project.state == "running"
+
+
+def test_eta_replays_the_queue_against_running_slots():
+    clock = FakeClock()
+    scheduler = OperationScheduler(max_concurrent=1, clock=clock)
+    running = scheduler.submit("plant", "deploy", "op-1")
+    clock.now += 100
+    scheduler.release(running)  # deploy estimate: 0.3 * 100 + 0.7 * 600 = 450
+
+    scheduler.submit("plant", "deploy", "op-2")
+    clock.now += 50
+    first_queued = scheduler.submit("factory", "destroy", "op-3")
+    second_queued = scheduler.submit("depot", "deploy", "op-4")
+
+    assert scheduler.status(first_queued).eta_seconds == 400
+    status = scheduler.status(second_queued)
+    assert (status.position, status.queue_length, status.running) == (2, 2, 1)
+    assert status.eta_seconds == 400 + 420
+    assert status.describe() == (
+        "Queued: position 2 of 2, 1 operation(s) running, estimated start in ~14 min"
+    )
+
+
+def test_sync_waiter_starts_when_the_project_frees_up():
+    scheduler = OperationScheduler(max_concurrent=1)
+    running = scheduler.submit("plant", "deploy", "op-1")
+    entered = threading.Event()
+
+    def second_operation():
+        with scheduler.admit("plant", "destroy", "op-2"):
+            entered.set()
+
+    worker = threading.Thread(target=second_operation)
+    worker.start()
+    assert not entered.wait(0.05)
+
+    scheduler.release(running)
+    worker.join(timeout=5)
+
+    assert entered.is_set()
+    assert scheduler.snapshot() == {"max_concurrent": 1, "running": [], "queued": []}
+
+
+def test_cancelling_a_queued_operation_wakes_its_waiter():
+    scheduler = OperationScheduler(max_concurrent=1)
+    scheduler.submit("plant", "deploy", "op-1")
+    errors = []
+
+    def queued_operation():
+        try:
+            with scheduler.admit("factory", "deploy", "op-2"):
+                pass
+        except OperationCancelled as exc:
+            errors.append(exc)
+
+    worker = threading.Thread(target=queued_operation)
+    worker.start()
+    while not scheduler.snapshot()["queued"]:
+        threading.Event().wait(0.01)
+
+    assert scheduler.cancel("op-2", project_name="plant") is None
+    assert scheduler.cancel("op-2", project_name="factory") == "cancelled"
+    worker.join(timeout=5)
+
+    assert errors and errors[0].code.value == "OPERATION_CANCELLED"
+    assert scheduler.snapshot()["queued"] == []
+
+
+def test_cancelling_a_running_operation_flags_it():
+    scheduler = OperationScheduler(max_concurrent=1)
+    ticket = scheduler.submit("plant", "deploy", "op-1")
+    ticket.raise_if_cancelled()
+
+    assert scheduler.cancel("op-1") == "running"
+    with pytest.raises(OperationCancelled):
+        ticket.raise_if_cancelled()
+    assert scheduler.snapshot()["running"][0]["cancel_requested"] is True
+
+
+def test_async_waiter_reports_positions_then_runs():
+    scheduler = OperationScheduler(max_concurrent=1)
+    running = scheduler.submit("plant", "deploy", "op-1")
+    ahead = scheduler.submit("factory", "deploy", "op-2")
+    ticket = scheduler.submit("depot", "deploy", "op-3")
+
+    async def wait():
+        positions = []
+        async for status in scheduler.wait_async(ticket):
+            positions.append(status.position)
+            # Releases come from other requests' threads.
+            target = running if len(positions) == 1 else ahead
+            threading.Thread(target=scheduler.release, args=(target,)).start()
+        return positions
+
+    assert asyncio.run(wait()) == [2, 1]
+    assert ticket.state == "running"
+
+
+def test_async_admit_queues_on_the_loop_and_releases_on_exit():
+    scheduler = OperationScheduler(max_concurrent=1)
+    running = scheduler.submit("plant", "deploy", "op-1")
+
+    async def admitted():
+        async with scheduler.admit_async("plant", "destroy", "op-2") as ticket:
+            assert ticket.state == "running"
+            return scheduler.snapshot()["running"][0]["operation_id"]
+
+    async def run():
+        task = asyncio.create_task(admitted())
+        while not scheduler.snapshot()["queued"]:
+            await asyncio.sleep(0)
+        scheduler.release(running)
+        return await task
+
+    assert asyncio.run(run()) == "op-2"
+    assert scheduler.snapshot() == {"max_concurrent": 1, "running": [], "queued": []}
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_max_concurrent_operations_must_be_positive(monkeypatch, value):
+    monkeypatch.setenv("DEPLOYER_MAX_CONCURRENT_OPERATIONS", value)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        default_max_concurrent_operations()
@@ -47,6 +47,27 @@ def test_terraform_runner_builds_isolated_state_list_command(tmp_path):
         runner._build_command(["state", "rm", "resource.name"])
 
 
+def test_terraform_runner_moves_one_resource_between_local_states(tmp_path):
+    state_path = tmp_path / "runtime" / "terraform.tfstate"
+    stack_state = tmp_path / "runtime" / "stacks" / "l5" / "terraform.tfstate"
+    runner = TerraformRunner(str(tmp_path), state_path=str(state_path))
+
+    assert runner._build_command(
+        ["state", "mv", f"-state-out={stack_state}", "aws_grafana_workspace.main"]
+    ) == [
+        "terraform",
+        f"-chdir={tmp_path}",
+        "state",
+        "mv",
+        f"-state={state_path}",
+        f"-state-out={stack_state}",
+        "aws_grafana_workspace.main",
+        "aws_grafana_workspace.main",
+    ]
+    with pytest.raises(ValueError, match="state mv"):
+        runner._build_command(["state", "mv", "-state-out=x", "-lock=false"])
+
+
 def test_simulator_entrypoint_is_selected_from_fixed_module_allowlist(tmp_path):
     device = (
         tmp_path
@@ -0,0 +1,166 @@
+"""Unit tests for the content-addressed project version store."""
+
+import hashlib
+import io
+import zipfile
+
+import pytest
+
+from src.core import deterministic_zip
+from src.core.deterministic_zip import write_zip_bytes
+from src.core.version_store import (
+    ProjectVersionStore,
+    VersionNotFound,
+    default_project_version_limit,
+)
+
+
+def _stage(tmp_path, files):
+    entries = []
+    for name, content in files.items():
+        staged = tmp_path / "staged" / hashlib.sha256(content).hexdigest()
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_bytes(content)
+        entries.append((name, hashlib.sha256(content).hexdigest(), staged))
+    return entries
+
+
+def _blobs(store):
+    return sorted(path.name for path in store.blobs_dir.rglob("*") if path.is_file())
+
+
+def test_unchanged_files_are_stored_once(tmp_path):
+    store = ProjectVersionStore(tmp_path / "versions")
+    shared = b"print('unchanged')\n" * 50
+
+    store.add_version(
+        _stage(tmp_path, {"config.json": b"{}", "lambda/main.py": shared}),
+        version="2026-01-01_00-00-00.000000",
+    )
+    store.add_version(
+        _stage(tmp_path, {"config.json": b'{"v": 2}', "lambda/main.py": shared}),
+        version="2026-01-02_00-00-00.000000",
+    )
+
+    assert len(_blobs(store)) == 3
+    assert store.count() == 2
+    assert [summary.to_dict() for summary in store.list_versions()] == [
+        {
+            "version": "2026-01-01_00-00-00.000000",
+            "file_count": 2,
+            "size_bytes": 2 + len(shared),
+            "legacy": False,
+        },
+        {
+            "version": "2026-01-02_00-00-00.000000",
+            "file_count": 2,
+            "size_bytes": 8 + len(shared),
+            "legacy": False,
+        },
+    ]
+
+
+def test_new_versions_read_only_the_newest_manifest(tmp_path, monkeypatch):
+    store = ProjectVersionStore(tmp_path / "versions")
+    old = b"old-only\n" * 20
+    shared = b"print('unchanged')\n" * 50
+    store.add_version(
+        _stage(tmp_path, {"old.txt": old}), version="2026-01-01_00-00-00.000000"
+    )
+    store.add_version(
+        _stage(tmp_path, {"lambda/main.py": shared}),
+        version="2026-01-02_00-00-00.000000",
+    )
+    read = []
+    read_manifest = store.read_manifest
+    monkeypatch.setattr(
+        store, "read_manifest", lambda version: read.append(version) or read_manifest(version)
+    )
+
+    store.add_version(
+        _stage(tmp_path, {"lambda/main.py": shared, "old.txt": old, "new.txt": b"new"}),
+        version="2026-01-03_00-00-00.000000",
+    )
+
+    assert read == ["2026-01-02_00-00-00.000000"]
+    monkeypatch.undo()
+    latest = store.read_manifest("2026-01-03_00-00-00.000000")
+    assert latest[:2] == (
+        store.read_manifest("2026-01-02_00-00-00.000000")
+        + store.read_manifest("2026-01-01_00-00-00.000000")
+    )
+    assert hashlib.sha256(b"new").digest() not in deterministic_zip._compressed_payloads
+
+
+def test_export_matches_a_directly_written_archive(tmp_path):
+    store = ProjectVersionStore(tmp_path / "versions")
+    files = {"config.json": b"{}", "scene_assets/scene.glb": bytes(range(256)) * 8}
+    store.add_version(_stage(tmp_path, files), version="2026-01-01_00-00-00.000000")
+
+    expected = io.BytesIO()
+    with zipfile.ZipFile(expected, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            write_zip_bytes(archive, name, content)
+
+    assert store.export("2026-01-01_00-00-00.000000").getvalue() == expected.getvalue()
+    with pytest.raises(VersionNotFound):
+        store.export("2026-01-03_00-00-00.000000")
+    with pytest.raises(VersionNotFound):
+        store.export("../../config")
+
+
+def test_prune_and_garbage_collection_drop_unreferenced_blobs(tmp_path):
+    store = ProjectVersionStore(tmp_path / "versions")
+    for day, content in enumerate([b"one", b"two", b"three"], start=1):
+        store.add_version(
+            _stage(tmp_path, {"config.json": b"{}", "data.txt": content}),
+            version=f"2026-01-0{day}_00-00-00.000000",
+        )
+
+    assert store.prune(2) == ["2026-01-01_00-00-00.000000"]
+    assert store.collect_garbage() == 1
+
+    assert hashlib.sha256(b"one").hexdigest() not in _blobs(store)
+    assert len(_blobs(store)) == 3
+    assert store.count() == 2
+
+
+def test_legacy_archives_are_listed_exported_and_imported(tmp_path):
+    versions_dir = tmp_path / "versions"
+    versions_dir.mkdir()
+    legacy = versions_dir / "2025-06-01_12-00-00.000000.zip"
+    with zipfile.ZipFile(legacy, "w", zipfile.ZIP_DEFLATED) as archive:
+        write_zip_bytes(archive, "config.json", b"{}")
+    legacy_bytes = legacy.read_bytes()
+    store = ProjectVersionStore(versions_dir)
+
+    assert store.list_versions()[0].legacy is True
+    assert store.export("2025-06-01_12-00-00.000000").getvalue() == legacy_bytes
+
+    assert store.import_legacy_archives() == 1
+    assert not legacy.exists()
+    assert store.list_versions()[0].legacy is False
+    assert store.export("2025-06-01_12-00-00.000000").getvalue() == legacy_bytes
+
+
+def test_copy_shares_blobs_with_the_source(tmp_path):
+    store = ProjectVersionStore(tmp_path / "old" / "versions")
+    store.add_version(
+        _stage(tmp_path, {"config.json": b"{}"}),
+        version="2026-01-01_00-00-00.000000",
+    )
+
+    copied = store.copy_to(tmp_path / "new" / "versions")
+
+    assert copied.count() == 1
+    assert _blobs(copied) == _blobs(store)
+    assert copied.export("2026-01-01_00-00-00.000000").getvalue() == (
+        store.export("2026-01-01_00-00-00.000000").getvalue()
+    )
+
+
+def test_version_limit_must_not_be_negative(monkeypatch):
+    monkeypatch.setenv("DEPLOYER_PROJECT_VERSION_LIMIT", "-1")
+
+    with pytest.raises(ValueError, match="must not be negative"):
+        default_project_version_limit()
@@ -105,6 +105,12 @@ def test_sync_runtime_outputs_copies_only_durable_allowlisted_outputs(tmp_path):
         (workspace.workspace_path / "terraform" / "terraform.tfstate").write_text("state")
         (workspace.workspace_path / "terraform" / "terraform.tfstate.backup").write_text("backup")
         (workspace.workspace_path / "terraform" / "generated.tfvars.json").write_text("secret")
+        (workspace.workspace_path / "terraform" / "applied-inputs.json").write_text("digests")
+        (workspace.workspace_path / "terraform" / "adt-upload.json").write_text("twin digests")
+        stack_dir = workspace.workspace_path / "terraform" / "stacks" / "aws"
+        stack_dir.mkdir(parents=True)
+        (stack_dir / "terraform.tfstate").write_text("aws-state")
+        (stack_dir / "generated.tfvars.json").write_text("secret")
 
         auth_dir = workspace.workspace_path / "iot_devices_auth" / "device-1"
         auth_dir.mkdir(parents=True)
@@ -146,6 +152,10 @@ def test_sync_runtime_outputs_copies_only_durable_allowlisted_outputs(tmp_path):
         / "config_generated.json"
     ).stat().st_mode & 0o777 == 0o600
     assert not (project / "terraform" / "generated.tfvars.json").exists()
+    assert (project / "terraform" / "applied-inputs.json").read_text() == "digests"
+    assert (project / "terraform" / "adt-upload.json").read_text() == "twin digests"
+    assert (project / "terraform" / "stacks" / "aws" / "terraform.tfstate").read_text() == "aws-state"
+    assert not (project / "terraform" / "stacks" / "aws" / "generated.tfvars.json").exists()
     assert not (project / "iot_device_simulator" / "aws" / "device-1" / "payloads.json").exists()
     assert (project / ".build" / "metadata" / "processor.aws.json").read_text() == metadata_payload
     assert not (project / ".build" / "aws").exists()
@@ -190,6 +200,10 @@ def test_deployment_workspace_logs_prepare_phase_with_operation_context(tmp_path
     assert not workspace_path.exists()
     assert "Deployment phase started: workspace_prepare" in caplog.text
     assert "Deployment phase completed: workspace_prepare" in caplog.text
+    assert "Workspace prepared (link)" in caplog.text
+    assert any(
+        getattr(record, "files_linked", None) == 1 for record in caplog.records
+    )
     assert "op-123" in [getattr(record, "operation_id", None) for record in caplog.records]
 
 
@@ -271,3 +285,96 @@ def test_create_ephemeral_workspace_rejects_missing_project_path(tmp_path):
             _context(tmp_path / "missing"),
             workspace_root=tmp_path / "workspaces",
         )
+
+
+def test_link_mode_shares_read_only_inputs_and_copies_writable_paths(tmp_path):
+    project = tmp_path / "upload" / "factory"
+    (project / "scene_assets").mkdir(parents=True)
+    (project / "scene_assets" / "scene.glb").write_bytes(b"glb" * 1024)
+    (project / "config.json").write_text("{}")
+    (project / "terraform").mkdir()
+    (project / "terraform" / "terraform.tfstate").write_text("source-state")
+    (project / "config_inter_cloud.json").write_text("{}")
+
+    workspace = create_ephemeral_workspace(
+        _context(project),
+        workspace_root=tmp_path / "workspaces",
+        mode="link",
+    )
+
+    try:
+        scene = workspace.workspace_path / "scene_assets" / "scene.glb"
+        state = workspace.state_path
+        assert scene.read_bytes() == b"glb" * 1024
+        assert scene.stat().st_ino == (project / "scene_assets" / "scene.glb").stat().st_ino
+        assert state.stat().st_ino != (project / "terraform" / "terraform.tfstate").stat().st_ino
+        assert (workspace.workspace_path / "config_inter_cloud.json").stat().st_ino != (
+            project / "config_inter_cloud.json"
+        ).stat().st_ino
+
+        state.write_text("workspace-state")
+        (workspace.workspace_path / "config_inter_cloud.json").write_text('{"connections": {}}')
+        assert (project / "terraform" / "terraform.tfstate").read_text() == "source-state"
+        assert (project / "config_inter_cloud.json").read_text() == "{}"
+
+        materialization = workspace.materialization
+        assert materialization.mode == "link"
+        assert materialization.linked == 2
+        assert materialization.reflinked + materialization.copied == 2
+    finally:
+        workspace.cleanup()
+
+    assert (project / "scene_assets" / "scene.glb").read_bytes() == b"glb" * 1024
+
+
+def test_copy_mode_and_cross_device_links_fall_back_to_copies(tmp_path, monkeypatch):
+    project = tmp_path / "upload" / "factory"
+    project.mkdir(parents=True)
+    (project / "config.json").write_text("{}")
+    (project / "config_events.json").write_text("[]")
+
+    monkeypatch.setenv("DEPLOYER_WORKSPACE_MODE", "copy")
+    copied = create_ephemeral_workspace(_context(project), workspace_root=tmp_path / "workspaces")
+    try:
+        assert copied.materialization.copied == 2
+        assert (copied.workspace_path / "config.json").stat().st_ino != (
+            project / "config.json"
+        ).stat().st_ino
+    finally:
+        copied.cleanup()
+
+    monkeypatch.setenv("DEPLOYER_WORKSPACE_MODE", "link")
+
+    def cross_device(*_args, **_kwargs):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr("src.core.workspace.os.link", cross_device)
+    monkeypatch.setattr("src.core.workspace._reflink", lambda *_args: False)
+    fallback = create_ephemeral_workspace(_context(project), workspace_root=tmp_path / "workspaces")
+    try:
+        assert fallback.materialization.linked == 0
+        assert fallback.materialization.copied == 2
+        assert not fallback.materialization.links_supported
+        assert (fallback.workspace_path / "config_events.json").read_text() == "[]"
+    finally:
+        fallback.cleanup()
+
+    monkeypatch.setenv("DEPLOYER_WORKSPACE_MODE", "hardlink")
+    with pytest.raises(ValueError, match="Unsupported workspace mode"):
+        create_ephemeral_workspace(_context(project), workspace_root=tmp_path / "workspaces")
+
+
+def test_create_ephemeral_workspace_rejects_symlinked_directories(tmp_path):
+    project = tmp_path / "upload" / "factory"
+    project.mkdir(parents=True)
+    (project / "config.json").write_text("{}")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret")
+    (project / "lambda_functions").symlink_to(outside, target_is_directory=True)
+    workspace_root = tmp_path / "workspaces"
+
+    with pytest.raises(ValueError, match="project contains symlinks"):
+        create_ephemeral_workspace(_context(project), workspace_root=workspace_root)
+
+    assert list(workspace_root.iterdir()) == []
@@ -1,30 +1,49 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import os
+from pathlib import Path
 from types import SimpleNamespace
 
 import boto3
+import pytest
 from google.cloud import logging as cloud_logging
 
 from src.log_tracing import fetchers
 
 
+class _InsightsClient:
+    """Logs Insights fake answering each query with the next batch of rows."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.queries = []
+
+    def start_query(self, **kwargs):
+        self.queries.append(kwargs)
+        return {"queryId": f"query-{len(self.queries)}"}
+
+    def get_query_results(self, queryId):
+        rows = self.batches.pop(0) if self.batches else []
+        return {"status": "Complete", "results": rows}
+
+
+def _insights_row(pointer, log_group, second, message="TRACE-1234ABCD seen"):
+    return [
+        {"field": "@timestamp", "value": f"2026-01-01 00:00:0{second}.000"},
+        {"field": "@message", "value": message},
+        {"field": "@log", "value": f"123456789012:{log_group}"},
+        {"field": "@ptr", "value": pointer},
+    ]
+
+
 def test_aws_fetch_uses_session_token_and_redacts_log_message(monkeypatch):
     captured = {}
-
-    class Client:
-        def filter_log_events(self, **kwargs):
-            return {
-                "events": [
-                    {
-                        "timestamp": 1_700_000_000_000,
-                        "message": "api_key=must-not-leak",
-                    }
-                ]
-            }
+    insights = _InsightsClient(
+        [_insights_row("a", "/aws/lambda/factory-l1-dispatcher", 1, "api_key=must-not-leak")]
+    )
 
     def client(service, **kwargs):
         captured.update(service=service, kwargs=kwargs)
-        return Client()
+        return insights
 
     monkeypatch.setattr(boto3, "client", client)
 
@@ -155,3 +174,144 @@ def test_azure_partial_results_are_retained(monkeypatch):
     assert result.error == "query partially completed"
     assert "isfuzzy=true" in captured["query"]
     assert captured["kwargs"]["timespan"][0] == started_at
+
+
+def test_azure_session_pages_past_rows_sharing_one_ingestion_time(monkeypatch):
+    monkeypatch.setattr(fetchers, "AZURE_ROWS_PER_QUERY", 2)
+    ingested = datetime(2026, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+    generated = datetime(2026, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    rows = [
+        [generated, f"TRACE-1234ABCD row {item}", "factory-l2-persister", ingested, generated, item]
+        for item in ("a", "b", "c")
+    ]
+    queries = []
+
+    class Client:
+        def query_workspace(self, workspace_id, query, **kwargs):
+            queries.append(query)
+            page = rows[:2] if len(queries) == 1 else rows[2:]
+            return SimpleNamespace(tables=[SimpleNamespace(rows=page)])
+
+    session = fetchers.AzureLogSession("workspace", "TRACE-1234ABCD", {}, generated)
+    session._client = Client()
+
+    first = session.fetch()
+    second = session.fetch()
+
+    assert [entry.message for entry in first.entries + second.entries] == [
+        "TRACE-1234ABCD row a",
+        "TRACE-1234ABCD row b",
+        "TRACE-1234ABCD row c",
+    ]
+    assert "order by IngestedAt asc, Generated asc, ItemId asc | take 2" in queries[0]
+    assert 'IngestedAt == datetime(2026-01-01T00:00:05+00:00)' in queries[1]
+    assert 'strcmp(ItemId, "b") > 0' in queries[1]
+
+
+def test_aws_session_queries_all_log_groups_once_per_poll(monkeypatch):
+    created = []
+    insights = _InsightsClient(
+        [
+            _insights_row("a", "/aws/lambda/factory-l1-dispatcher", 1),
+            _insights_row("b", "/aws/lambda/factory-l2-persister", 2),
+        ],
+        # The next poll re-reads the overlap window; only "c" is new.
+        [
+            _insights_row("b", "/aws/lambda/factory-l2-persister", 2),
+            _insights_row("c", "/aws/lambda/factory-l1-dispatcher", 3),
+        ],
+    )
+
+    def client(service, **kwargs):
+        created.append(service)
+        return insights
+
+    monkeypatch.setattr(boto3, "client", client)
+    session = fetchers.AwsLogSession(
+        {
+            "L1": "/aws/lambda/factory-l1-dispatcher",
+            "L2": "/aws/lambda/factory-l2-persister",
+        },
+        "TRACE-1234ABCD",
+        1_767_225_600_000,
+        {},
+    )
+
+    first = session.fetch()
+    second = session.fetch()
+
+    assert created == ["logs"]
+    assert [(entry.layer, entry.function) for entry in first.entries] == [
+        ("L1", "factory-l1-dispatcher"),
+        ("L2", "factory-l2-persister"),
+    ]
+    assert [entry.timestamp for entry in second.entries] == ["2026-01-01T00:00:03+00:00"]
+    assert len(insights.queries) == 2
+    assert insights.queries[0]["logGroupNames"] == [
+        "/aws/lambda/factory-l1-dispatcher",
+        "/aws/lambda/factory-l2-persister",
+    ]
+    assert 'filter @message like "TRACE-1234ABCD"' in insights.queries[0]["queryString"]
+    assert insights.queries[1]["startTime"] == 1_767_225_600
+
+
+def test_event_cursor_only_remembers_events_inside_the_overlap():
+    cursor = fetchers._EventCursor(0, overlap_seconds=1.0)
+
+    assert cursor.accept("a", 10.0)
+    assert cursor.accept("b", 12.0)
+    assert not cursor.accept("a", 10.0)
+    cursor.advance()
+
+    assert cursor.start == 11.0
+    assert cursor.accept("a", 10.0)
+    assert not cursor.accept("b", 12.0)
+
+
+def test_gcp_session_resumes_from_the_newest_entry(monkeypatch):
+    queries = []
+    first_seen = datetime(2026, 1, 1, 0, 1, tzinfo=timezone.utc)
+
+    def entry(insert_id, timestamp):
+        return SimpleNamespace(
+            insert_id=insert_id,
+            payload="trace observed",
+            timestamp=timestamp,
+            resource=SimpleNamespace(labels={"function_name": "factory-l2-processor"}),
+        )
+
+    class Client:
+        def __init__(self, **kwargs):
+            pass
+
+        def list_entries(self, **kwargs):
+            queries.append(kwargs)
+            return [entry("one", first_seen)] + (
+                [entry("two", first_seen + timedelta(seconds=5))] if len(queries) > 1 else []
+            )
+
+    monkeypatch.setattr(fetchers, "parse_gcp_service_account", lambda value: ({}, {}, None))
+    monkeypatch.setattr(cloud_logging, "Client", Client)
+    session = fetchers.GcpLogSession(
+        "factory-project",
+        "TRACE-1234ABCD",
+        {"gcp_credentials_file": "{}"},
+        Path("/tmp/factory"),
+        datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    assert len(session.fetch().entries) == 1
+    assert len(session.fetch().entries) == 1
+
+    assert queries[0]["order_by"] == cloud_logging.ASCENDING
+    assert queries[0]["max_results"] == fetchers.GCP_MAX_ENTRIES_PER_POLL
+    assert 'timestamp >= "2025-12-31T23:59:30+00:00"' in queries[0]["filter_"]
+    assert 'timestamp >= "2026-01-01T00:00:30+00:00"' in queries[1]["filter_"]
+
+
+def test_log_sessions_must_implement_poll():
+    class Incomplete(fetchers.LogSession):
+        provider = "aws"
+
+    with pytest.raises(TypeError, match="_poll"):
+        Incomplete()
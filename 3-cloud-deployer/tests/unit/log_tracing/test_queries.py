@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.log_tracing import queries
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+END = datetime(2026, 1, 1, 0, 5, 0, 500_000, tzinfo=timezone.utc)
+
+
+class _Insights:
+    def __init__(self, status="Complete"):
+        self.status = status
+        self.started = []
+        self.stopped = []
+
+    def start_query(self, **kwargs):
+        self.started.append(kwargs)
+        return {"queryId": f"query-{len(self.started)}"}
+
+    def get_query_results(self, queryId):
+        group = self.started[int(queryId.split("-")[1]) - 1]["logGroupNames"][0]
+        return {
+            "status": self.status,
+            "results": [
+                [
+                    {"field": "@timestamp", "value": "2026-01-01 00:00:01.250"},
+                    {"field": "@message", "value": "trace"},
+                    {"field": "@log", "value": f"123456789012:{group}"},
+                    {"field": "@ptr", "value": queryId},
+                ]
+            ],
+        }
+
+    def stop_query(self, queryId):
+        self.stopped.append(queryId)
+
+
+def test_cloudwatch_groups_share_one_insights_query_per_fifty_groups():
+    client = _Insights()
+    groups = [f"/aws/lambda/function-{index:02d}" for index in range(60)]
+
+    records = queries.query_cloudwatch(client, groups, 'say "hi"', START, END)
+
+    assert [len(query["logGroupNames"]) for query in client.started] == [50, 10]
+    assert client.started[0]["startTime"] == 1_767_225_600
+    assert client.started[0]["endTime"] == 1_767_225_901
+    assert 'like "say \\"hi\\""' in client.started[0]["queryString"]
+    assert [record.source for record in records] == [
+        "/aws/lambda/function-00",
+        "/aws/lambda/function-50",
+    ]
+    assert records[0].timestamp == datetime(2026, 1, 1, 0, 0, 1, 250_000, tzinfo=timezone.utc)
+
+
+def test_cloudwatch_query_is_stopped_when_it_times_out():
+    client = _Insights(status="Running")
+
+    with pytest.raises(TimeoutError):
+        queries.query_cloudwatch(client, ["/aws/lambda/a"], "trace", START, END, timeout=0)
+
+    assert client.stopped == ["query-1"]
+
+
+def test_failed_insights_query_is_an_error():
+    with pytest.raises(RuntimeError, match="failed"):
+        queries.query_cloudwatch(_Insights(status="Failed"), ["/aws/lambda/a"], "t", START, END)
+
+
+def test_log_analytics_partial_results_keep_their_rows():
+    class Client:
+        def query_workspace(self, workspace_id, query, **kwargs):
+            return SimpleNamespace(
+                partial_data=[SimpleNamespace(rows=[[1]]), SimpleNamespace(rows=[[2]])],
+                partial_error="throttled",
+            )
+
+    rows, error = queries.query_log_analytics(Client(), "workspace", "AppTraces", None)
+
+    assert rows == [[1], [2]]
+    assert error == "throttled"
+
+
+def test_cloud_logging_filter_covers_all_function_resources():
+    value = queries.cloud_logging_filter('marker "x"', START)
+
+    assert 'resource.type="cloud_function" OR resource.type="cloud_run_revision"' in value
+    assert 'textPayload:"marker \\"x\\"" OR jsonPayload.message:"marker \\"x\\""' in value
+    assert 'timestamp >= "2026-01-01T00:00:00+00:00"' in value
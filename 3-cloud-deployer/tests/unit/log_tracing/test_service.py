@@ -7,7 +7,7 @@ from types import SimpleNamespace
 import pytest
 
 from src.log_tracing.registry import TraceNotFound, TraceRegistry
-from src.log_tracing.fetchers import ProviderFetchResult
+from src.log_tracing.fetchers import ProviderFetchResult, UnavailableLogSession
 from src.log_tracing.service import LogTraceService
 
 
@@ -106,11 +106,7 @@ def test_provider_query_has_hard_timeout(monkeypatch):
     async def exercise():
         return await service._fetch_with_timeout(
             "aws",
-            "TRACE-1234ABCD",
-            datetime.now(timezone.utc),
-            {},
-            {},
-            Path("/tmp/factory"),
+            UnavailableLogSession("aws", "not queried"),
             timeout=0.001,
         )
 
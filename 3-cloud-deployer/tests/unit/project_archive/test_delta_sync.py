@@ -0,0 +1,108 @@
+import hashlib
+import io
+import zipfile
+
+import pytest
+
+from src.core import deterministic_zip
+from src.core.version_store import ProjectVersionStore
+from src.project_archive.delta_sync import (
+    MissingProjectBlobs,
+    assemble_project_archive,
+    missing_digests,
+    parse_manifest,
+)
+
+
+SCENE = bytes(range(256)) * 64
+
+
+def _manifest(files):
+    return parse_manifest(
+        {
+            "path": path,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+        }
+        for path, content in files.items()
+    )
+
+
+def _zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, content in files.items():
+            archive.writestr(path, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProjectVersionStore(tmp_path / "versions")
+    staged = tmp_path / "scene.glb"
+    staged.write_bytes(SCENE)
+    store.add_version(
+        [("scene_assets/scene.glb", hashlib.sha256(SCENE).hexdigest(), staged)],
+        version="2026-01-01_00-00-00.000000",
+    )
+    return store
+
+
+def test_only_unknown_content_is_requested_and_uploaded(store):
+    files = {
+        "config.json": b'{"digital_twin_name": "plant"}',
+        "config_credentials.json": b'{"aws": {}}',
+        "scene_assets/scene.glb": SCENE,
+    }
+    manifest = _manifest(files)
+
+    missing = missing_digests(store, manifest)
+    assert missing == [
+        hashlib.sha256(files["config.json"]).hexdigest(),
+        hashlib.sha256(files["config_credentials.json"]).hexdigest(),
+    ]
+
+    delta = _zip({path: files[path] for path in ("config.json", "config_credentials.json")})
+    assembled = assemble_project_archive(store, manifest, delta)
+
+    with zipfile.ZipFile(io.BytesIO(assembled)) as archive:
+        assert archive.namelist() == list(files)
+        assert {name: archive.read(name) for name in files} == files
+    uploaded = hashlib.sha256(files["config_credentials.json"]).digest()
+    assert uploaded not in deterministic_zip._compressed_payloads
+
+
+def test_content_gone_since_planning_is_reported_as_missing(store):
+    manifest = _manifest({"config.json": b"{}", "scene_assets/scene.glb": SCENE})
+    for manifest_path in store.versions_dir.glob("*.json"):
+        manifest_path.unlink()
+    store.collect_garbage()
+
+    with pytest.raises(MissingProjectBlobs) as excinfo:
+        assemble_project_archive(store, manifest, _zip({"config.json": b"{}"}))
+
+    assert excinfo.value.digests == [hashlib.sha256(SCENE).hexdigest()]
+    assert excinfo.value.error_code == "PACKAGE_CONTENT_MISSING"
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        {"config.json": b"tampered"},
+        {"other.json": b"{}"},
+    ],
+)
+def test_delta_must_match_the_manifest(store, delta):
+    manifest = _manifest({"config.json": b"{}"})
+
+    with pytest.raises(ValueError):
+        assemble_project_archive(store, manifest, _zip(delta))
+
+
+def test_manifest_rejects_duplicates_and_bad_digests():
+    entry = {"path": "config.json", "sha256": "0" * 64, "size": 2}
+
+    with pytest.raises(ValueError, match="Duplicate path"):
+        parse_manifest([entry, entry])
+    with pytest.raises(ValueError, match="invalid digest"):
+        parse_manifest([{**entry, "sha256": "abc"}])
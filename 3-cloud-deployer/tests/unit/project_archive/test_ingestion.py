@@ -0,0 +1,118 @@
+import hashlib
+import io
+import zipfile
+
+import pytest
+
+import file_manager
+from src.project_archive import ingestion
+from src.project_archive.ingestion import ingest_archive
+from src.project_archive.policy import ArchivePolicyError
+
+
+def _zip_bytes(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in entries:
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_members_are_indexed_hashed_and_staged(tmp_path):
+    content = _zip_bytes(
+        [
+            ("project/", ""),
+            ("project/config.json", '{"digital_twin_name": "plant"}'),
+            ("project/lambda_functions/processor/lambda_function.py", "print(1)\n"),
+        ]
+    )
+
+    with ingest_archive(content, work_dir=tmp_path) as archive:
+        staged_root = archive.staged_path("project/config.json").parents[1]
+        assert archive.get_project_root() == "project/"
+        assert archive.list_files() == [
+            "project/",
+            "project/config.json",
+            "project/lambda_functions/processor/lambda_function.py",
+        ]
+        assert archive.read_text("project/config.json") == '{"digital_twin_name": "plant"}'
+        assert archive.digest("project/lambda_functions/processor/lambda_function.py") == (
+            hashlib.sha256(b"print(1)\n").hexdigest()
+        )
+        assert [name for name, _member in archive.project_members()] == [
+            "config.json",
+            "lambda_functions/processor/lambda_function.py",
+        ]
+        assert staged_root.parent.parent == tmp_path
+        with pytest.raises(FileNotFoundError):
+            archive.read_binary("project/missing.json")
+
+    assert not staged_root.exists()
+
+
+def test_each_member_is_decompressed_exactly_once(tmp_path, monkeypatch):
+    opened = []
+    original_open = zipfile.ZipFile.open
+
+    def counting_open(self, name, mode="r", *args, **kwargs):
+        if mode == "r":
+            opened.append(getattr(name, "filename", name))
+        return original_open(self, name, mode, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", counting_open)
+    monkeypatch.setattr(file_manager.validator, "validate_project_zip", lambda *_a, **_k: [])
+    monkeypatch.setattr(file_manager.validator, "check_duplicate_project", lambda *_a, **_k: None)
+    content = _zip_bytes(
+        [
+            ("config.json", '{"digital_twin_name": "plant"}'),
+            ("config_credentials.json", '{"aws": {"aws_secret_access_key": "secret"}}'),
+            ("scene_assets/scene.glb", bytes(range(256)) * 16),
+        ]
+    )
+
+    file_manager.create_project_from_zip("plant", content, project_path=str(tmp_path))
+
+    assert sorted(opened) == [
+        "config.json",
+        "config_credentials.json",
+        "scene_assets/scene.glb",
+    ]
+    project = tmp_path / "upload" / "plant"
+    assert (project / "scene_assets" / "scene.glb").read_bytes() == bytes(range(256)) * 16
+    assert not (project / "config_credentials.json").exists()
+    assert not any(path.name.startswith(".archive-ingest-") for path in project.parent.iterdir())
+
+
+def test_policy_violations_leave_no_staging_behind(tmp_path):
+    content = _zip_bytes([("config.json", "{}"), ("../escape.txt", "x")])
+
+    with pytest.raises(ArchivePolicyError):
+        ingest_archive(content, work_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_actual_member_size_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingestion, "MAX_MEMBER_BYTES", 8)
+    monkeypatch.setattr(ingestion, "UPLOAD_READ_CHUNK_BYTES", 4)
+
+    with pytest.raises(ValueError, match="per-file read limit"):
+        ingest_archive(_zip_bytes([("config.json", "0123456789")]), work_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spooled_uploads_are_read_in_place_and_rewound(tmp_path):
+    spooled = tmp_path / "upload.zip"
+    spooled.write_bytes(_zip_bytes([("config.json", "{}")]))
+
+    with spooled.open("rb") as upload:
+        upload.seek(5)
+        with ingest_archive(upload, work_dir=tmp_path / "work") as archive:
+            assert archive.read_text("config.json") == "{}"
+        assert upload.tell() == 0
+
+
+def test_invalid_zip_is_a_validation_error(tmp_path):
+    with pytest.raises(ValueError, match="Invalid ZIP archive"):
+        ingest_archive(b"not a zip", work_dir=tmp_path)
@@ -72,3 +72,16 @@ def test_member_count_is_bounded(monkeypatch):
         monkeypatch.setattr(policy, "MAX_MEMBERS", 0)
         with pytest.raises(policy.ArchiveLimitExceeded, match="too many"):
             policy.validate_archive(zf)
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        [("project/a", "file"), ("project/a/b", "nested")],
+        [("project/a/b", "nested"), ("project/a", "file")],
+    ],
+)
+def test_path_used_as_file_and_directory_is_rejected(entries):
+    with _archive(entries) as zf:
+        with pytest.raises(policy.ArchivePolicyError, match="both as a file"):
+            policy.validate_archive(zf)
@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from src.status import engine
+from src.status.engine import (
+    ProbeBatch,
+    ProviderClientPool,
+    StatusCache,
+    default_status_cache_ttl,
+    run_probes,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_probes_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def probe(name):
+        return lambda: (barrier.wait(), name)[1]
+
+    results = run_probes(
+        {name: probe(name) for name in ("l1", "l4", "l5")},
+        lambda name: "timeout",
+        timeout=5,
+    )
+
+    assert results == {"l1": "l1", "l4": "l4", "l5": "l5"}
+
+
+def test_slow_probe_times_out_without_blocking_the_others():
+    release = threading.Event()
+    batch = ProbeBatch(
+        {"slow": lambda: release.wait(5) and "late", "fast": lambda: "ok"},
+        timeout=0.05,
+    )
+
+    try:
+        results = batch.results(lambda name: f"{name} timed out")
+    finally:
+        release.set()
+
+    assert results == {"slow": "slow timed out", "fast": "ok"}
+
+
+def test_status_cache_expires_after_ttl():
+    clock = _Clock()
+    cache = StatusCache(ttl=10, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"status": "deployed", "call": len(calls)}
+
+    first = cache.get_or_compute("factory", "sdk", compute)
+    first["status"] = "mutated by caller"
+    assert cache.get_or_compute("factory", "sdk", compute) == {"status": "deployed", "call": 1}
+    clock.now += 11
+    assert cache.get_or_compute("factory", "sdk", compute)["call"] == 2
+
+
+def test_concurrent_pollers_share_one_probe():
+    cache = StatusCache(ttl=10)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "deployed"
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(cache.get_or_compute("factory", "sdk", compute))
+    )
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(
+        target=lambda: results.append(cache.get_or_compute("factory", "sdk", compute))
+    )
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == ["deployed", "deployed"]
+    assert len(calls) == 1
+
+
+def test_invalidation_discards_results_of_probes_already_running():
+    cache = StatusCache(ttl=10)
+
+    def compute_and_invalidate():
+        cache.invalidate("factory")
+        return "before deploy"
+
+    assert cache.get_or_compute("factory", "sdk", compute_and_invalidate) == "before deploy"
+    assert cache.get_or_compute("factory", "sdk", lambda: "after deploy") == "after deploy"
+    assert cache.get_or_compute("other", "sdk", lambda: "other") == "other"
+
+
+def test_provider_clients_are_reused_per_project_and_credentials():
+    clock = _Clock()
+    pool = ProviderClientPool(idle_seconds=60, clock=clock)
+    created = []
+
+    def create():
+        created.append(object())
+        return created[-1]
+
+    first = pool.get("factory", "aws", "creds-a", create)
+    assert pool.get("factory", "aws", "creds-a", create) is first
+    assert pool.get("factory", "aws", "creds-b", create) is not first
+    pool.invalidate("factory")
+    assert pool.get("factory", "aws", "creds-a", create) is not first
+    clock.now += 61
+    pool.get("factory", "aws", "creds-a", create)
+
+    assert len(created) == 4
+
+
+def test_ttl_must_not_be_negative(monkeypatch):
+    monkeypatch.setenv("DEPLOYER_STATUS_CACHE_TTL_SECONDS", "-1")
+
+    with pytest.raises(ValueError, match="must not be negative"):
+        default_status_cache_ttl()
+
+
+def test_invalidate_project_status_resets_results_and_clients(monkeypatch):
+    monkeypatch.setattr(engine, "_status_cache", StatusCache(ttl=10))
+    monkeypatch.setattr(engine, "_client_pool", ProviderClientPool(idle_seconds=60))
+    engine.get_status_cache().get_or_compute("factory", "sdk", lambda: "stale")
+    client = engine.get_provider_client_pool().get("factory", "aws", "creds", object)
+
+    engine.invalidate_project_status("factory")
+
+    assert engine.get_status_cache().get_or_compute("factory", "sdk", lambda: "fresh") == "fresh"
+    assert engine.get_provider_client_pool().get("factory", "aws", "creds", object) is not client
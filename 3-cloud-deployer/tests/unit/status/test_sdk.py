@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from src.status import sdk
+from src.status import engine, sdk
 
 
 class _Provider:
@@ -91,3 +91,26 @@ def test_sdk_details_redact_structured_secret_fields(monkeypatch):
 
     details = result["iot_devices"]["details"]
     assert details["api_key"] == "<redacted>"
+
+
+def test_polling_reuses_cached_probes_and_clients_until_invalidated(monkeypatch):
+    monkeypatch.setattr(engine, "_status_cache", engine.StatusCache(ttl=10))
+    monkeypatch.setattr(engine, "_client_pool", engine.ProviderClientPool(idle_seconds=60))
+    monkeypatch.setattr(sdk, "create_context", lambda project_name: _context())
+    created = []
+
+    def provider(name):
+        created.append(name)
+        return _Provider(name)
+
+    monkeypatch.setattr(sdk.ProviderRegistry, "get", provider)
+
+    first = sdk.check_sdk_managed("factory")
+    second = sdk.check_sdk_managed("factory")
+    assert first == second
+    assert sorted(created) == ["aws", "azure"]
+
+    engine.invalidate_project_status("factory")
+    sdk.check_sdk_managed("factory")
+
+    assert sorted(created) == ["aws", "aws", "azure", "azure"]
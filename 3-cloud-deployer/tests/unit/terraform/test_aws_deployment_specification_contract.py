@@ -123,5 +123,5 @@ def test_account_scoped_and_invariant_aws_values_are_not_tfvars():
     assert "aws_twinmaker" not in variables.lower()
     assert "aws_grafana" not in variables.lower()
 
-    grafana = _normalized_source("aws_grafana.tf")
+    grafana = _normalized_source("stacks/aws_l5/aws_grafana.tf")
     assert 'grafana_version = "10.4"' in grafana
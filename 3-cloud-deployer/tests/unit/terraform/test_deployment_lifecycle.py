@@ -47,7 +47,7 @@ def _strategy(tmp_path, events):
     strategy._runner = _StreamingRunner(events)
     strategy._validate_credentials = MagicMock(side_effect=lambda: events.append("validate"))
     strategy._initialize_providers = MagicMock(side_effect=lambda context: events.append("providers"))
-    strategy._build_packages = MagicMock(side_effect=lambda: events.append("build"))
+    strategy._build_packages = MagicMock(side_effect=lambda **_: events.append("build"))
     strategy._validate_project = MagicMock()
     strategy._generate_tfvars = MagicMock(side_effect=lambda: events.append("tfvars"))
     strategy._run_post_deployment = MagicMock(side_effect=lambda context: events.append("post"))
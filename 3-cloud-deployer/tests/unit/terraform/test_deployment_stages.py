@@ -0,0 +1,115 @@
+"""Unit tests for running blocking deployment stages off the event loop."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+from src.providers.terraform.deployment_stages import BlockingStage, blocking_stage
+from src.providers.terraform.package_builders.scheduler import PackageBuildRecord
+
+
+def test_stage_streams_progress_before_it_finishes_and_keeps_result():
+    release = threading.Event()
+
+    def work(report):
+        report("first")
+        release.wait(timeout=5)
+        report("second")
+        return 42
+
+    async def collect():
+        stage = BlockingStage(work)
+        lines = []
+        async for line in stage.run():
+            lines.append(line)
+            release.set()
+        return stage, lines
+
+    stage, lines = asyncio.run(collect())
+
+    assert lines == ["first", "second"]
+    assert stage.result == 42
+    assert stage.duration_ms >= 0
+
+
+def test_stage_failures_propagate():
+    def fail():
+        raise RuntimeError("validation failed")
+
+    async def collect():
+        return [line async for line in blocking_stage(fail).run()]
+
+    with pytest.raises(RuntimeError, match="validation failed"):
+        asyncio.run(collect())
+
+
+def _record(name):
+    return PackageBuildRecord(
+        name=name,
+        path=Path(f"/tmp/{name}.zip"),
+        size_bytes=4096,
+        duration_ms=200,
+        cache_hit=False,
+    )
+
+
+def test_event_loop_serves_requests_during_a_large_build(tmp_path):
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    strategy = TerraformDeployerStrategy(str(terraform_dir), str(project_path))
+
+    def slow_build(on_package_built=None):
+        records = []
+        for name in ("aws_dispatcher", "aws_persister", "aws_processor"):
+            threading.Event().wait(0.2)  # zipping holds this worker, not the loop
+            records.append(_record(name))
+            on_package_built(records[-1])
+        return records
+
+    strategy._validate_project = MagicMock()
+    strategy._initialize_providers = MagicMock()
+    strategy._build_packages = slow_build
+    strategy._generate_tfvars = MagicMock(side_effect=RuntimeError("stop"))
+
+    async def status_request():
+        return {"status": "deployed"}
+
+    async def main():
+        lines = []
+        latencies = []
+
+        async def deploy():
+            with pytest.raises(RuntimeError, match="stop"):
+                async for line in strategy.deploy_all_async(
+                    SimpleNamespace(),
+                    skip_credential_check=True,
+                ):
+                    lines.append(line)
+
+        async def poll_status():
+            while not any(line.startswith("  Packages ready") for line in lines):
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                assert await status_request() == {"status": "deployed"}
+                latencies.append(time.perf_counter() - started - 0.01)
+
+        await asyncio.gather(deploy(), poll_status())
+        return lines, latencies
+
+    lines, latencies = asyncio.run(main())
+
+    assert len(latencies) > 20
+    assert max(latencies) < 0.05
+    package_lines = [line for line in lines if line.startswith("  Package ")]
+    assert package_lines == [
+        f"  Package {_record(name).describe()}"
+        for name in ("aws_dispatcher", "aws_persister", "aws_processor")
+    ]
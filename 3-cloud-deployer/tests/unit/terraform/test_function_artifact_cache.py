@@ -0,0 +1,168 @@
+"""Unit tests for the content-addressed function package cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.providers.terraform.package_builders import aws as aws_builder
+from src.providers.terraform.package_builders.artifact_cache import (
+    FunctionArtifactCache,
+    get_function_artifact_cache,
+    track_artifact_cache_lookups,
+)
+from src.providers.terraform.package_builders.gcp import _create_gcp_function_zip
+
+
+@pytest.fixture
+def function_sources(tmp_path):
+    func_dir = tmp_path / "src" / "dispatcher"
+    func_dir.mkdir(parents=True)
+    (func_dir / "lambda_function.py").write_text("def lambda_handler(e, c):\n    return 1\n")
+    shared_dir = tmp_path / "src" / "_shared"
+    shared_dir.mkdir()
+    (shared_dir / "env.py").write_text("VALUE = 1\n")
+    return func_dir, shared_dir
+
+
+def _build_twice(func_dir, shared_dir, first: Path, second: Path):
+    with patch.object(
+        aws_builder,
+        "_write_lambda_zip",
+        wraps=aws_builder._write_lambda_zip,
+    ) as writer:
+        aws_builder._create_lambda_zip(func_dir, shared_dir, first)
+        aws_builder._create_lambda_zip(func_dir, shared_dir, second)
+    return writer
+
+
+def test_second_project_reuses_cached_package(tmp_path, function_sources):
+    func_dir, shared_dir = function_sources
+    first = tmp_path / "project-a" / ".build" / "aws" / "dispatcher.zip"
+    second = tmp_path / "project-b" / ".build" / "aws" / "dispatcher.zip"
+    first.parent.mkdir(parents=True)
+
+    writer = _build_twice(func_dir, shared_dir, first, second)
+
+    assert writer.call_count == 1
+    assert first.read_bytes() == second.read_bytes()
+    assert zipfile.ZipFile(second).namelist() == [
+        "lambda_function.py",
+        "_shared/env.py",
+    ]
+    stats = get_function_artifact_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hitRate"] == 0.5
+    assert stats["entries"] == 1
+
+
+def test_build_lookups_exclude_earlier_builds(tmp_path, function_sources):
+    func_dir, shared_dir = function_sources
+    _build_twice(func_dir, shared_dir, tmp_path / "a.zip", tmp_path / "b.zip")
+
+    with track_artifact_cache_lookups() as lookups:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                contextvars.copy_context().run,
+                aws_builder._create_lambda_zip,
+                func_dir,
+                shared_dir,
+                tmp_path / "c.zip",
+            ).result()
+
+    assert (lookups.hits, lookups.misses, lookups.hit_rate) == (1, 0, 1.0)
+    stats = get_function_artifact_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_source_and_shared_changes_invalidate_entries(tmp_path, function_sources):
+    func_dir, shared_dir = function_sources
+    target = tmp_path / "dispatcher.zip"
+    aws_builder._create_lambda_zip(func_dir, shared_dir, target)
+
+    (shared_dir / "env.py").write_text("VALUE = 2\n")
+    aws_builder._create_lambda_zip(func_dir, shared_dir, target)
+    with zipfile.ZipFile(target) as archive:
+        assert archive.read("_shared/env.py") == b"VALUE = 2\n"
+
+    (func_dir / "__pycache__").mkdir()
+    (func_dir / "__pycache__" / "x.pyc").write_bytes(b"ignored")
+    aws_builder._create_lambda_zip(func_dir, shared_dir, target)
+
+    stats = get_function_artifact_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_rename_parameters_are_part_of_the_key(tmp_path, function_sources):
+    func_dir, shared_dir = function_sources
+    (func_dir / "main.py").write_text("def main(request):\n    return 'ok'\n")
+
+    _create_gcp_function_zip(
+        func_dir, shared_dir, tmp_path / "a.zip", digital_twin_name="twin", device_id="d1"
+    )
+    _create_gcp_function_zip(
+        func_dir, shared_dir, tmp_path / "b.zip", digital_twin_name="twin", device_id="d2"
+    )
+    _create_gcp_function_zip(
+        func_dir, shared_dir, tmp_path / "c.zip", digital_twin_name="twin", device_id="d1"
+    )
+
+    stats = get_function_artifact_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_hits_are_read_only_links_that_survive_rebuilds(tmp_path, function_sources):
+    func_dir, shared_dir = function_sources
+    cache = get_function_artifact_cache()
+    first = tmp_path / "first.zip"
+    second = tmp_path / "second.zip"
+    _build_twice(func_dir, shared_dir, first, second)
+
+    (entry,) = (cache.root / "objects").glob("*/*.zip")
+    assert os.stat(entry).st_mode & 0o222 == 0
+    assert os.stat(entry).st_ino == os.stat(second).st_ino
+
+    second.unlink()
+    aws_builder._create_lambda_zip(func_dir, shared_dir, second)
+    assert second.read_bytes() == entry.read_bytes()
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = FunctionArtifactCache(root=tmp_path / "cache", max_bytes=150)
+    keys = [f"{index:064x}" for index in range(3)]
+
+    def writer(size):
+        return lambda target: target.write_bytes(b"x" * size)
+
+    cache.materialize(keys[0], tmp_path / "0.zip", writer(60))
+    cache.materialize(keys[1], tmp_path / "1.zip", writer(60))
+    os.utime(cache._entry_path(keys[0]), ns=(1, 1))
+    os.utime(cache._entry_path(keys[1]), ns=(2, 2))
+    assert cache.materialize(keys[0], tmp_path / "0b.zip", writer(60)) is True
+    cache.materialize(keys[2], tmp_path / "2.zip", writer(60))
+
+    assert cache._entry_path(keys[0]).exists()
+    assert not cache._entry_path(keys[1]).exists()
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= 150
+
+
+def test_zero_size_limit_disables_the_cache(tmp_path):
+    cache = FunctionArtifactCache(root=tmp_path / "cache", max_bytes=0)
+    calls = []
+
+    def build(target):
+        calls.append(target)
+        target.write_bytes(b"zip")
+
+    assert cache.materialize("a" * 64, tmp_path / "one.zip", build) is False
+    assert cache.materialize("a" * 64, tmp_path / "two.zip", build) is False
+    assert len(calls) == 2
+    assert not (tmp_path / "cache").exists()
+    with pytest.raises(ValueError):
+        FunctionArtifactCache(root=tmp_path / "cache", max_bytes=-1)
@@ -0,0 +1,308 @@
+"""Unit tests for change detection and targeted incremental deploys."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+from src.providers.terraform.incremental_deploy import (
+    TerraformReferenceGraph,
+    capture_applied_inputs,
+    load_applied_inputs,
+    plan_incremental_deploy,
+    save_applied_inputs,
+)
+from src.terraform_runner import TerraformError, TerraformRunner
+
+MODULE = """
+provider "aws" {
+  region = var.aws_region
+}
+
+locals {
+  l2_build_dir = "${var.project_path}/.build/aws"
+  persister_name = "${var.digital_twin_name}-persister"
+  tags = {
+    twin = var.digital_twin_name
+  }
+}
+
+resource "aws_lambda_function" "persister" {
+  function_name = local.persister_name
+  filename      = "${local.l2_build_dir}/persister.zip"
+  timeout       = var.persister_timeout
+}
+
+resource "aws_lambda_function" "user" {
+  for_each = { for f in var.user_functions : f.name => f }
+  filename = each.value.zip_path
+}
+
+resource "aws_iam_role_policy" "invoke" {
+  policy = aws_lambda_function.persister.arn
+}
+
+resource "aws_s3_bucket" "cold" {
+  bucket = "cold"
+}
+
+resource "aws_s3_bucket" "archive" {
+  bucket = "archive"
+}
+
+resource "aws_dynamodb_table" "hot" {
+  name = "hot"
+}
+
+output "persister_arn" {
+  value = aws_lambda_function.persister.arn
+}
+
+output "twin_name" {
+  value = var.digital_twin_name
+}
+
+output "archive_label" {
+  value = "${var.archive_label}-${aws_s3_bucket.archive.arn}"
+}
+"""
+
+
+@pytest.fixture
+def layout(tmp_path):
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    (terraform_dir / "main.tf").write_text(MODULE)
+    project = tmp_path / "workspace-1" / "project"
+    (project / ".build" / "aws" / "user").mkdir(parents=True)
+    (project / "terraform").mkdir()
+    (project / ".build" / "aws" / "persister.zip").write_bytes(b"persister-v1")
+    (project / ".build" / "aws" / "user" / "fn.zip").write_bytes(b"fn-v1")
+    tfvars = project / "terraform" / "generated.tfvars.json"
+    state = project / "terraform" / "terraform.tfstate"
+    state.write_text(json.dumps({"resources": [{"type": "aws_s3_bucket"}]}))
+    return SimpleNamespace(terraform_dir=terraform_dir, project=project, tfvars=tfvars, state=state)
+
+
+def _write_tfvars(layout, **overrides):
+    values = {
+        "aws_region": "eu-central-1",
+        "project_path": str(layout.project),
+        "digital_twin_name": "plant",
+        "persister_timeout": 30,
+        "archive_label": "archive",
+        "user_functions": [
+            {"name": "fn", "zip_path": f"{layout.project}/.build/aws/user/fn.zip"}
+        ],
+        "aws_secret_access_key": "super-secret",
+    }
+    values.update(overrides)
+    layout.tfvars.write_text(json.dumps(values))
+
+
+def _plan(layout, previous):
+    current = capture_applied_inputs(layout.project, layout.tfvars, layout.terraform_dir)
+    return plan_incremental_deploy(
+        TerraformReferenceGraph.from_directory(layout.terraform_dir),
+        previous,
+        current,
+        project_path=layout.project,
+        tfvars_path=layout.tfvars,
+        state_path=layout.state,
+    )
+
+
+def _baseline(layout):
+    _write_tfvars(layout)
+    return capture_applied_inputs(layout.project, layout.tfvars, layout.terraform_dir)
+
+
+def test_changed_variable_targets_its_readers_and_their_dependents(layout):
+    previous = _baseline(layout)
+    _write_tfvars(layout, persister_timeout=60)
+
+    plan = _plan(layout, previous)
+
+    assert plan.targets == (
+        "aws_iam_role_policy.invoke",
+        "aws_lambda_function.persister",
+    )
+    assert plan.changed_variables == ("persister_timeout",)
+    assert plan.skipped_resources == 4
+    assert "2 targeted resources, 4 unchanged resources skipped" in plan.describe()[0]
+
+
+def test_changed_packages_map_to_resources_by_file_and_by_variable(layout):
+    previous = _baseline(layout)
+    (layout.project / ".build" / "aws" / "user" / "fn.zip").write_bytes(b"fn-v2")
+    assert _plan(layout, previous).targets == ("aws_lambda_function.user",)
+
+    previous = capture_applied_inputs(layout.project, layout.tfvars, layout.terraform_dir)
+    (layout.project / ".build" / "aws" / "persister.zip").write_bytes(b"persister-v2")
+    plan = _plan(layout, previous)
+    assert plan.targets == ("aws_iam_role_policy.invoke", "aws_lambda_function.persister")
+    assert plan.changed_packages == (".build/aws/persister.zip",)
+
+
+def test_unchanged_inputs_skip_apply_even_from_a_new_workspace(layout, tmp_path):
+    previous = _baseline(layout)
+    moved = tmp_path / "workspace-2" / "project"
+    layout.project.rename(tmp_path / "moved")
+    moved.parent.mkdir()
+    (tmp_path / "moved").rename(moved)
+    layout.project = moved
+    layout.tfvars = moved / "terraform" / "generated.tfvars.json"
+    layout.state = moved / "terraform" / "terraform.tfstate"
+    _write_tfvars(layout)
+
+    plan = _plan(layout, previous)
+
+    assert plan.unchanged
+    assert plan.skipped_resources == 6
+    assert "skipping terraform apply" in plan.describe()[0]
+
+
+@pytest.mark.parametrize(
+    ("change", "reason"),
+    [
+        (lambda layout: None, "no record of a previous apply"),
+        (lambda layout: layout.state.write_text('{"resources": []}'), "state is empty"),
+        (
+            lambda layout: (layout.terraform_dir / "extra.tf").write_text("# new\n"),
+            "configuration changed",
+        ),
+        (lambda layout: _write_tfvars(layout, aws_region="us-east-1"), "provider configuration"),
+        (lambda layout: _write_tfvars(layout, digital_twin_name="other"), "output.twin_name"),
+        (lambda layout: _write_tfvars(layout, archive_label="cold"), "affect only outputs"),
+        (
+            lambda layout: _write_tfvars(layout, aws_secret_access_key="rotated"),
+            "affect only outputs",
+        ),
+        (
+            lambda layout: (layout.project / ".build" / "aws" / "orphan.zip").write_bytes(b"x"),
+            "cannot map package .build/aws/orphan.zip",
+        ),
+    ],
+)
+def test_unsafe_changes_fall_back_to_full_apply(layout, change, reason):
+    previous = _baseline(layout)
+    if reason.startswith("no record"):
+        previous = None
+    change(layout)
+
+    plan = _plan(layout, previous)
+
+    assert plan.full_apply
+    assert reason in plan.full_apply_reason
+
+
+def test_too_many_targets_fall_back_to_full_apply(layout):
+    previous = _baseline(layout)
+    _write_tfvars(layout, persister_timeout=60)
+    current = capture_applied_inputs(layout.project, layout.tfvars, layout.terraform_dir)
+
+    plan = plan_incremental_deploy(
+        TerraformReferenceGraph.from_directory(layout.terraform_dir),
+        previous,
+        current,
+        project_path=layout.project,
+        tfvars_path=layout.tfvars,
+        state_path=layout.state,
+        max_target_fraction=0.25,
+    )
+
+    assert plan.full_apply_reason == "2 of 6 resources affected"
+
+
+def test_record_holds_digests_only(layout):
+    record_path = layout.project / "terraform" / "applied-inputs.json"
+    save_applied_inputs(record_path, _baseline(layout), targeted=False)
+
+    text = record_path.read_text()
+    assert "super-secret" not in text
+    assert str(layout.project) not in text
+    assert load_applied_inputs(record_path)["targeted"] is False
+    assert record_path.stat().st_mode & 0o077 == 0
+
+
+def test_runner_validates_target_addresses(tmp_path, monkeypatch):
+    runner = TerraformRunner(terraform_dir=str(tmp_path))
+    calls = []
+    monkeypatch.setattr(runner, "_run_command", lambda args, **_: calls.append(args))
+
+    runner.apply(var_file="vars.json", targets=["aws_s3_bucket.cold", 'aws_lambda_function.user["fn"]'])
+
+    assert calls[0][-2:] == ["-target=aws_s3_bucket.cold", '-target=aws_lambda_function.user["fn"]']
+    with pytest.raises(ValueError, match="Invalid Terraform target"):
+        runner.apply(var_file="vars.json", targets=["-destroy"])
+
+
+def _strategy(layout, *, incremental=True):
+    strategy = TerraformDeployerStrategy(
+        str(layout.terraform_dir),
+        str(layout.project),
+        incremental=incremental,
+    )
+    strategy._prepare_deployment = MagicMock()
+    strategy._run_post_deployment = MagicMock()
+    strategy._record_applied_packages = MagicMock(return_value=0)
+    strategy._runner = MagicMock()
+    strategy._runner.output.return_value = {}
+    return strategy
+
+
+def test_deploy_records_inputs_and_targets_the_next_deploy(layout):
+    _write_tfvars(layout)
+    first = _strategy(layout)
+    first.deploy_all(SimpleNamespace())
+    first.runner.apply.assert_called_once_with(var_file=str(layout.tfvars))
+
+    _write_tfvars(layout, persister_timeout=60)
+    second = _strategy(layout)
+    second.runner.apply.side_effect = [TerraformError("apply", 1, "boom"), None]
+    second.deploy_all(SimpleNamespace())
+
+    assert second.runner.apply.call_args_list[0].kwargs["targets"] == (
+        "aws_iam_role_policy.invoke",
+        "aws_lambda_function.persister",
+    )
+    assert "targets" not in second.runner.apply.call_args_list[1].kwargs
+    assert load_applied_inputs(second.applied_inputs_path)["targeted"] is False
+
+
+def test_streaming_deploy_reports_skipped_apply(layout):
+    _write_tfvars(layout)
+    save_applied_inputs(
+        layout.project / "terraform" / "applied-inputs.json",
+        capture_applied_inputs(layout.project, layout.tfvars, layout.terraform_dir),
+        targeted=False,
+    )
+    strategy = _strategy(layout)
+    strategy._validate_project = MagicMock()
+    strategy._initialize_providers = MagicMock()
+    strategy._build_packages = MagicMock(return_value=[])
+    strategy._generate_tfvars = MagicMock()
+
+    async def empty(*_args, **_kwargs):
+        if False:
+            yield ""
+
+    strategy.runner.init_async = empty
+    strategy.runner.apply_async = MagicMock(side_effect=AssertionError("apply must be skipped"))
+
+    async def collect():
+        return [
+            line
+            async for line in strategy.deploy_all_async(
+                SimpleNamespace(),
+                skip_credential_check=True,
+            )
+        ]
+
+    lines = asyncio.run(collect())
+
+    assert "No Terraform inputs changed since the last apply; skipping terraform apply" in lines
+    assert lines[-1] == "Terraform deployment complete"
@@ -0,0 +1,173 @@
+"""Unit tests for parallel function package building."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.providers.terraform.package_builder import build_all_packages
+from src.providers.terraform.package_builders.scheduler import (
+    PackageBuild,
+    PackageBuildRecord,
+    PackageBuildScheduler,
+    run_package_builds,
+)
+
+
+PROVIDERS = {
+    "layer_1_provider": "aws",
+    "layer_2_provider": "aws",
+    "layer_3_hot_provider": "google",
+    "layer_3_cold_provider": "google",
+    "layer_3_archive_provider": "google",
+    "layer_4_provider": "aws",
+    "layer_5_provider": "aws",
+}
+
+
+def _write_project(project_path: Path) -> None:
+    project_path.mkdir(parents=True)
+    payloads = {
+        "config.json": {"digital_twin_name": "parallel-test"},
+        "config_events.json": [],
+        "config_iot_devices.json": [],
+        "config_optimization.json": {"inputParamsUsed": {}},
+    }
+    for name, payload in payloads.items():
+        (project_path / name).write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _writer(path: Path, content: bytes, release=None):
+    def build():
+        path.write_bytes(content)
+        if release is not None:
+            release.set()
+        return False
+
+    return build
+
+
+def test_builds_run_concurrently_and_report_size_and_time(tmp_path):
+    barrier = threading.Barrier(2)
+    reported = []
+
+    def waiting_build(path):
+        def build():
+            barrier.wait(timeout=5)
+            path.write_bytes(b"zip-bytes")
+            return True
+
+        return build
+
+    builds = [
+        PackageBuild(name, tmp_path / f"{name}.zip", waiting_build(tmp_path / f"{name}.zip"))
+        for name in ("first", "second")
+    ]
+    with PackageBuildScheduler(max_workers=2, on_package_built=reported.append) as scheduler:
+        scheduler.run(builds)
+
+    assert sorted(record.name for record in reported) == ["first", "second"]
+    assert all(isinstance(record, PackageBuildRecord) for record in reported)
+    assert {record.size_bytes for record in reported} == {len(b"zip-bytes")}
+    assert all(record.cache_hit for record in reported)
+    assert all(record.duration_ms >= 0 for record in reported)
+    assert "KiB" in reported[0].describe()
+
+
+def test_first_failure_propagates_after_other_builds_finish(tmp_path):
+    done = threading.Event()
+
+    def failing():
+        raise RuntimeError("zip failed")
+
+    builds = [
+        PackageBuild("broken", tmp_path / "broken.zip", failing),
+        PackageBuild("ok", tmp_path / "ok.zip", _writer(tmp_path / "ok.zip", b"ok", release=done)),
+    ]
+    with PackageBuildScheduler(max_workers=2) as scheduler:
+        with pytest.raises(RuntimeError, match="zip failed"):
+            scheduler.run(builds)
+
+    assert done.is_set()
+    assert (tmp_path / "ok.zip").read_bytes() == b"ok"
+
+
+def test_builds_run_inline_without_an_active_scheduler(tmp_path):
+    target = tmp_path / "inline.zip"
+
+    run_package_builds([PackageBuild("inline", target, _writer(target, b"inline"))])
+
+    assert target.read_bytes() == b"inline"
+
+
+def test_worker_count_is_validated(monkeypatch):
+    monkeypatch.setenv("DEPLOYER_PACKAGE_BUILD_WORKERS", "0")
+    with pytest.raises(ValueError, match="DEPLOYER_PACKAGE_BUILD_WORKERS"):
+        PackageBuildScheduler()
+    with pytest.raises(ValueError):
+        PackageBuildScheduler(max_workers=-1)
+
+
+def test_parallel_build_output_matches_serial_build(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEPLOYER_ARTIFACT_CACHE_MAX_BYTES", "0")
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    serial_project = tmp_path / "serial"
+    parallel_project = tmp_path / "parallel"
+    _write_project(serial_project)
+    _write_project(parallel_project)
+    reported = []
+
+    serial = build_all_packages(terraform_dir, serial_project, PROVIDERS, max_workers=1)
+    parallel = build_all_packages(
+        terraform_dir,
+        parallel_project,
+        PROVIDERS,
+        max_workers=4,
+        on_package_built=reported.append,
+    )
+
+    assert list(serial) == list(parallel)
+    assert serial, "expected core packages for the configured providers"
+    for name, path in serial.items():
+        assert path.read_bytes() == parallel[name].read_bytes()
+    assert {record.name for record in reported} == set(parallel)
+
+
+def test_streaming_deployment_reports_built_packages(tmp_path):
+    from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    strategy = TerraformDeployerStrategy(str(terraform_dir), str(project_path))
+    record = PackageBuildRecord(
+        name="aws_dispatcher",
+        path=project_path / "dispatcher.zip",
+        size_bytes=2048,
+        duration_ms=12,
+        cache_hit=False,
+    )
+    strategy._validate_project = MagicMock()
+    strategy._initialize_providers = MagicMock()
+    strategy._build_packages = MagicMock(return_value=[record])
+    strategy._generate_tfvars = MagicMock(side_effect=RuntimeError("stop"))
+
+    async def collect():
+        lines = []
+        with pytest.raises(RuntimeError, match="stop"):
+            async for line in strategy.deploy_all_async(
+                SimpleNamespace(),
+                skip_credential_check=True,
+            ):
+                lines.append(line)
+        return lines
+
+    lines = asyncio.run(collect())
+
+    assert "  Package aws_dispatcher: 2.0 KiB in 12 ms (built)" in lines
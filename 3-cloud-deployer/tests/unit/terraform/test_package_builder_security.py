@@ -1,11 +1,23 @@
 """Security invariants shared by provider package builders."""
 
+import io
 import json
 import os
+import sys
+import zipfile
+from unittest.mock import patch
 
 import pytest
 
-from src.core.deterministic_zip import atomic_zip_archive, write_zip_bytes
+from src.core import deterministic_zip
+from src.core.deterministic_zip import (
+    atomic_zip_archive,
+    precompress_zip_member,
+    precompressed_tree_members,
+    raw_append_supported,
+    write_precompressed_members,
+    write_zip_bytes,
+)
 from src.providers.terraform.package_builder import (
     _create_lambda_zip,
     _reconcile_user_hash_metadata,
@@ -159,3 +171,96 @@ def test_metadata_reconciliation_removes_stale_and_previous_provider_entries(tmp
     assert (metadata_dir / "active.aws.json").exists()
     assert not (metadata_dir / "stale.aws.json").exists()
     assert not (metadata_dir / "other.azure.json").exists()
+
+
+def _archive_bytes(write) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        write(archive)
+    return buffer.getvalue()
+
+
+def test_precompressed_members_are_byte_identical_to_regular_writes():
+    payloads = {
+        "handler.py": b"def handler(event, context):\n    return event\n" * 20,
+        "_shared/env_utils.py": b"import os\n" * 50,
+        "_shared/empty.py": b"",
+    }
+
+    def regular(archive):
+        for name, content in payloads.items():
+            write_zip_bytes(archive, name, content)
+
+    def precompressed(archive):
+        write_zip_bytes(archive, "handler.py", payloads["handler.py"])
+        write_precompressed_members(
+            archive,
+            [
+                precompress_zip_member(name, content)
+                for name, content in payloads.items()
+                if name != "handler.py"
+            ],
+        )
+
+    expected = _archive_bytes(regular)
+    assert _archive_bytes(precompressed) == expected
+    with zipfile.ZipFile(io.BytesIO(expected)) as archive:
+        assert archive.testzip() is None
+
+
+def test_raw_append_relies_on_zipfile_internals_of_supported_pythons():
+    oldest, newest = deterministic_zip._RAW_APPEND_PYTHON_VERSIONS
+    if not oldest <= sys.version_info[:2] <= newest:
+        pytest.skip("raw appends are disabled outside the verified Python versions")
+    with zipfile.ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED) as archive:
+        missing = [
+            name
+            for name in deterministic_zip._RAW_APPEND_ARCHIVE_ATTRIBUTES
+            + deterministic_zip._RAW_APPEND_ARCHIVE_METHODS
+            if not hasattr(archive, name)
+        ]
+        assert missing == [], f"zipfile no longer provides {missing}"
+        assert raw_append_supported(archive)
+
+
+def test_precompressed_members_fall_back_to_regular_writes(monkeypatch):
+    payloads = {"_shared/env_utils.py": b"import os\n" * 50, "_shared/empty.py": b""}
+    members = [precompress_zip_member(name, content) for name, content in payloads.items()]
+
+    def regular(archive):
+        for name, content in payloads.items():
+            write_zip_bytes(archive, name, content)
+
+    expected = _archive_bytes(regular)
+    monkeypatch.setattr(deterministic_zip, "_RAW_APPEND_PYTHON_VERSIONS", ((0, 0), (0, 0)))
+
+    with zipfile.ZipFile(io.BytesIO(), "w") as archive:
+        assert not raw_append_supported(archive)
+    assert _archive_bytes(lambda archive: write_precompressed_members(archive, members)) == expected
+
+
+def test_shared_members_are_compressed_once_per_digest(tmp_path):
+    shared = tmp_path / "_shared"
+    shared.mkdir()
+    (shared / "inter_cloud.py").write_text("UNIQUE_MARKER_FOR_DIGEST_TEST = 1\n")
+    files = [shared / "inter_cloud.py"]
+
+    with patch.object(
+        deterministic_zip.zlib,
+        "compressobj",
+        wraps=deterministic_zip.zlib.compressobj,
+    ) as compressobj:
+        first = precompressed_tree_members(shared, "_shared", files)
+        second = precompressed_tree_members(shared, "_shared", files)
+
+    assert compressobj.call_count == 1
+    assert first == second
+    assert first[0].name == "_shared/inter_cloud.py"
+
+
+def test_precompressed_members_reject_duplicates_and_unsafe_paths():
+    member = precompress_zip_member("_shared/env.py", b"VALUE = 1\n")
+    with pytest.raises(ValueError, match="Duplicate"):
+        _archive_bytes(lambda archive: write_precompressed_members(archive, [member, member]))
+    with pytest.raises(ValueError, match="Unsafe"):
+        precompress_zip_member("../escape.py", b"")
@@ -227,6 +227,9 @@ def test_azure_twin_failures_are_aggregated_after_relationship_attempt(monkeypat
     calls = []
 
     class Client:
+        def list_models(self):
+            return []
+
         def create_models(self, models):
             return models
 
@@ -260,9 +263,6 @@ def test_azure_twin_failures_are_aggregated_after_relationship_attempt(monkeypat
     with pytest.raises(ProviderRuntimeError) as exc_info:
         layer_4_adt.upload_dtdl_models(object(), config, "unused")
 
-    assert calls == [
-        ("twin", "broken"),
-        ("twin", "healthy"),
-        ("relationship", "healthy", "contains"),
-    ]
+    assert sorted(calls[:2]) == [("twin", "broken"), ("twin", "healthy")]
+    assert calls[2:] == [("relationship", "healthy", "contains")]
     assert "must-not-leak" not in str(exc_info.value)
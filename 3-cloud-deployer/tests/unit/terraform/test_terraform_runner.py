@@ -1,5 +1,8 @@
 """Tests for TerraformRunner workspace path behavior."""
 
+import asyncio
+import sys
+
 from src.terraform_runner import TerraformRunner
 
 
@@ -80,3 +83,35 @@ def test_plan_accepts_explicit_out_file(tmp_path, monkeypatch):
     assert result == str(explicit_plan)
     assert explicit_plan.parent.exists()
     assert calls[0][-1] == f"-out={explicit_plan}"
+
+
+def test_closing_an_async_stream_interrupts_terraform(tmp_path, monkeypatch):
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    runner = TerraformRunner(terraform_dir=str(terraform_dir))
+    script = (
+        "import signal, sys, time\n"
+        "signal.signal(signal.SIGINT, lambda *_: sys.exit(130))\n"
+        "print('Still creating...', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    monkeypatch.setattr(
+        runner, "_build_command", lambda *_args, **_kwargs: [sys.executable, "-c", script]
+    )
+    processes = []
+    create_process = asyncio.create_subprocess_exec
+
+    async def tracked_create_process(*args, **kwargs):
+        processes.append(await create_process(*args, **kwargs))
+        return processes[-1]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", tracked_create_process)
+
+    async def consume_one_line_then_stop():
+        lines = runner._run_command_async(["apply"])
+        first = await anext(lines)
+        await lines.aclose()
+        return first
+
+    assert asyncio.run(consume_one_line_then_stop()) == "Still creating..."
+    assert processes[0].returncode == 130
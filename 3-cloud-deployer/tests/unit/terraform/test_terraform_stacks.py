@@ -0,0 +1,365 @@
+"""Unit tests for layered Terraform stacks and their concurrent execution."""
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+from src.providers.terraform.stacks import StackExecutor, load_stack_layout
+
+
+def _write_layout(terraform_dir, stacks, variables=None):
+    for stack in stacks:
+        module = terraform_dir / stack["module"]
+        module.mkdir(parents=True, exist_ok=True)
+        declared = (variables or {}).get(stack["name"], ())
+        (module / "main.tf").write_text(
+            "".join(f'variable "{name}" {{}}\n' for name in declared)
+        )
+    (terraform_dir / "stacks.json").write_text(json.dumps({"stacks": stacks}))
+
+
+@pytest.fixture
+def three_stacks(tmp_path):
+    terraform_dir = tmp_path / "terraform"
+    _write_layout(
+        terraform_dir,
+        [
+            {
+                "name": "cross_cloud",
+                "module": "stacks/cross_cloud",
+                "depends_on": ["aws", "azure"],
+                "inputs": {"ingestion_url": "aws.ingestion_url"},
+            },
+            {"name": "aws", "module": "stacks/aws"},
+            {"name": "azure", "module": "stacks/azure"},
+        ],
+        variables={"aws": ["aws_region"], "cross_cloud": ["ingestion_url", "digital_twin_name"]},
+    )
+    return terraform_dir
+
+
+class FakeStackRunner:
+    def __init__(self, name, events, gate=None, outputs=None, fail=False):
+        self.name = name
+        self.events = events
+        self.gate = gate
+        self.outputs = outputs or {}
+        self.fail = fail
+        self.var_files = []
+
+    async def init_async(self):
+        yield "init"
+
+    async def apply_async(self, var_file, targets=None):
+        self.var_files.append(var_file)
+        self.events.append(f"{self.name}:start")
+        if self.gate is not None:
+            await self.gate(self.name)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        yield "applied"
+        self.events.append(f"{self.name}:end")
+
+    async def destroy_async(self, var_file):
+        self.events.append(f"{self.name}:destroy")
+        yield "destroyed"
+
+    def output(self):
+        return dict(self.outputs)
+
+
+def _executor(terraform_dir, tmp_path, runners):
+    project = tmp_path / "project"
+    (project / "terraform").mkdir(parents=True, exist_ok=True)
+    base_tfvars = project / "terraform" / "generated.tfvars.json"
+    base_tfvars.write_text(
+        json.dumps({"aws_region": "eu-central-1", "digital_twin_name": "plant", "secret": "x"})
+    )
+    executor = StackExecutor(
+        load_stack_layout(terraform_dir),
+        project_path=project,
+        terraform_root_dir=tmp_path / "root",
+        base_tfvars_path=base_tfvars,
+    )
+    executor._runners.update(runners)
+    return executor
+
+
+async def _collect(lines):
+    return [line async for line in lines]
+
+
+def test_layout_orders_stacks_and_groups_independent_ones(three_stacks):
+    layout = load_stack_layout(three_stacks)
+
+    assert [stack.name for stack in layout.stacks] == ["aws", "azure", "cross_cloud"]
+    assert layout.waves() == [["aws", "azure"], ["cross_cloud"]]
+    assert layout.describe() == "aws, azure -> cross_cloud"
+    assert load_stack_layout(three_stacks / "stacks" / "aws") is None
+
+
+@pytest.mark.parametrize(
+    ("stacks", "message"),
+    [
+        (
+            [
+                {"name": "a", "module": "stacks/a", "depends_on": ["b"]},
+                {"name": "b", "module": "stacks/b", "depends_on": ["a"]},
+            ],
+            "cyclic",
+        ),
+        ([{"name": "a", "module": "stacks/a", "depends_on": ["missing"]}], "unknown stacks"),
+        (
+            [
+                {"name": "a", "module": "stacks/a"},
+                {"name": "b", "module": "stacks/b", "inputs": {"url": "a.url"}},
+            ],
+            "must reference",
+        ),
+        ([{"name": "a", "module": "../outside"}], "subdirectory"),
+        ([{"name": "A b", "module": "stacks/a"}], "Invalid stack name"),
+    ],
+)
+def test_layout_rejects_invalid_manifests(tmp_path, stacks, message):
+    terraform_dir = tmp_path / "terraform"
+    terraform_dir.mkdir()
+    (tmp_path / "outside").mkdir()
+    for name in ("a", "b"):
+        (terraform_dir / "stacks" / name).mkdir(parents=True)
+    (terraform_dir / "stacks.json").write_text(json.dumps({"stacks": stacks}))
+
+    with pytest.raises(ValueError, match=message):
+        load_stack_layout(terraform_dir)
+
+
+def test_independent_stacks_apply_concurrently_and_pass_outputs(three_stacks, tmp_path):
+    events = []
+    started = {}
+
+    async def both_started(name):
+        started.setdefault(name, asyncio.Event()).set()
+        other = "azure" if name == "aws" else "aws"
+        await asyncio.wait_for(started.setdefault(other, asyncio.Event()).wait(), timeout=5)
+
+    runners = {
+        "aws": FakeStackRunner(
+            "aws", events, gate=both_started, outputs={"ingestion_url": "https://aws"}
+        ),
+        "azure": FakeStackRunner("azure", events, gate=both_started, outputs={"hub": "azure"}),
+        "cross_cloud": FakeStackRunner("cross_cloud", events, outputs={"hub": "cross"}),
+    }
+    executor = _executor(three_stacks, tmp_path, runners)
+
+    lines = asyncio.run(_collect(executor.apply_async()))
+
+    assert events.index("cross_cloud:start") > max(events.index("aws:end"), events.index("azure:end"))
+    assert "[aws] applied" in lines and "[cross_cloud] ✓ Stack complete" in lines
+    cross_vars = json.loads(
+        (executor.stack_dir("cross_cloud") / "generated.tfvars.json").read_text()
+    )
+    assert cross_vars == {"digital_twin_name": "plant", "ingestion_url": "https://aws"}
+    assert json.loads((executor.stack_dir("aws") / "generated.tfvars.json").read_text()) == {
+        "aws_region": "eu-central-1"
+    }
+    assert executor.merged_outputs() == {"ingestion_url": "https://aws", "hub": "cross"}
+
+
+def test_failed_stack_skips_dependents_but_finishes_siblings(three_stacks, tmp_path):
+    events = []
+    runners = {
+        "aws": FakeStackRunner("aws", events, fail=True),
+        "azure": FakeStackRunner("azure", events),
+        "cross_cloud": FakeStackRunner("cross_cloud", events),
+    }
+    executor = _executor(three_stacks, tmp_path, runners)
+    lines = []
+
+    async def collect():
+        async for line in executor.apply_async():
+            lines.append(line)
+
+    with pytest.raises(RuntimeError, match="aws failed"):
+        asyncio.run(collect())
+
+    assert "azure:end" in events
+    assert "cross_cloud:start" not in events
+    assert "[cross_cloud] Skipped: aws did not complete" in lines
+
+
+def test_destroy_runs_dependents_first(three_stacks, tmp_path):
+    events = []
+    runners = {
+        name: FakeStackRunner(name, events, outputs={"ingestion_url": "https://aws"})
+        for name in ("aws", "azure", "cross_cloud")
+    }
+    executor = _executor(three_stacks, tmp_path, runners)
+
+    executor.destroy()
+
+    assert events[0] == "cross_cloud:destroy"
+    assert sorted(events[1:]) == ["aws:destroy", "azure:destroy"]
+
+
+def test_streaming_deploy_uses_stacks_when_declared(three_stacks, tmp_path):
+    events = []
+    project = tmp_path / "project"
+    (project / "terraform").mkdir(parents=True)
+    strategy = TerraformDeployerStrategy(str(three_stacks), str(project))
+    strategy._validate_project = MagicMock()
+    strategy._initialize_providers = MagicMock()
+    strategy._build_packages = MagicMock(return_value=[])
+    strategy._generate_tfvars = MagicMock(
+        side_effect=lambda: strategy.tfvars_path.write_text('{"aws_region": "eu-central-1"}')
+    )
+    strategy._record_applied_packages = MagicMock(return_value=0)
+    strategy._run_post_deployment = MagicMock()
+    strategy.stacks._runners.update(
+        {
+            name: FakeStackRunner(name, events, outputs={"ingestion_url": "https://aws"})
+            for name in ("aws", "azure", "cross_cloud")
+        }
+    )
+
+    lines = asyncio.run(
+        _collect(strategy.deploy_all_async(SimpleNamespace(), skip_credential_check=True))
+    )
+
+    assert "[4/7] Terraform stacks: aws, azure -> cross_cloud" in lines
+    assert "[cross_cloud] applied" in lines
+    assert strategy.get_outputs() == {"ingestion_url": "https://aws"}
+    assert strategy._runner is None
+
+
+def test_sync_destroy_drains_from_inside_a_running_loop(three_stacks, tmp_path):
+    events = []
+    runners = {
+        name: FakeStackRunner(name, events, outputs={"ingestion_url": "https://aws"})
+        for name in ("aws", "azure", "cross_cloud")
+    }
+    executor = _executor(three_stacks, tmp_path, runners)
+
+    async def handler():
+        executor.destroy()
+
+    asyncio.run(handler())
+
+    assert events[0] == "cross_cloud:destroy"
+    assert len(events) == 3
+
+
+def test_bundled_configuration_applies_l5_next_to_the_core_stack():
+    terraform_dir = Path(__file__).resolve().parents[3] / "src" / "terraform"
+
+    layout = load_stack_layout(terraform_dir)
+
+    assert layout.waves() == [["core", "aws_l5"]]
+    assert layout.root.name == "core"
+    assert layout.root.module_dir == terraform_dir.resolve()
+
+
+def _write_state(path, resources):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "version": 4,
+                "serial": 1,
+                "lineage": "lineage",
+                "outputs": {},
+                "resources": [
+                    {
+                        "mode": "data" if address.startswith("data.") else "managed",
+                        "type": address.removeprefix("data.").split(".")[0],
+                        "name": address.split(".")[-1],
+                        "instances": [{"index_key": 0}],
+                    }
+                    for address in resources
+                ],
+            }
+        )
+    )
+
+
+@pytest.fixture
+def split_root(tmp_path):
+    terraform_dir = tmp_path / "terraform"
+    (terraform_dir / "stacks" / "l5").mkdir(parents=True)
+    (terraform_dir / "main.tf").write_text(
+        'resource "aws_s3_bucket" "data" {}\ndata "aws_caller_identity" "current" {}\n'
+    )
+    (terraform_dir / "stacks" / "l5" / "main.tf").write_text(
+        'resource "aws_grafana_workspace" "main" {}\ndata "aws_caller_identity" "current" {}\n'
+    )
+    (terraform_dir / "stacks.json").write_text(
+        json.dumps(
+            {"stacks": [{"name": "core", "module": "."}, {"name": "l5", "module": "stacks/l5"}]}
+        )
+    )
+    return terraform_dir
+
+
+def test_root_stack_keeps_the_project_state(split_root, tmp_path):
+    executor = _executor(split_root, tmp_path, {})
+
+    assert executor.state_path("core") == tmp_path / "project" / "terraform" / "terraform.tfstate"
+    assert executor.runner("core").terraform_dir == tmp_path / "root"
+    assert executor.state_path("l5") == executor.stack_dir("l5") / "terraform.tfstate"
+
+
+def test_only_one_stack_may_use_the_directory_itself(split_root):
+    (split_root / "stacks.json").write_text(
+        json.dumps({"stacks": [{"name": "a", "module": "."}, {"name": "b", "module": "."}]})
+    )
+
+    with pytest.raises(ValueError, match="Only one stack"):
+        load_stack_layout(split_root)
+
+
+def test_split_out_resources_move_out_of_the_root_state_once(split_root, tmp_path):
+    executor = _executor(split_root, tmp_path, {})
+    _write_state(
+        executor.state_path("core"),
+        ["aws_s3_bucket.data", "aws_grafana_workspace.main", "data.aws_caller_identity.current"],
+    )
+    root_runner = MagicMock()
+    executor._runners["core"] = root_runner
+
+    lines = executor.migrate_root_state()
+
+    assert lines == ["[l5] Moved 1 resources out of the core state"]
+    root_runner.init.assert_called_once_with()
+    root_runner.state_move.assert_called_once_with(
+        "aws_grafana_workspace.main", str(executor.state_path("l5"))
+    )
+    _write_state(executor.state_path("l5"), ["aws_grafana_workspace.main"])
+    assert executor.migrate_root_state() == []
+
+
+def test_root_stack_is_applied_by_the_deployer_hook(split_root, tmp_path):
+    events = []
+    applied = []
+
+    async def apply_root():
+        applied.append("core")
+        yield "incremental apply"
+
+    executor = _executor(split_root, tmp_path, {})
+    executor.apply_root = apply_root
+    executor._runners.update(
+        {
+            "core": FakeStackRunner("core", events, outputs={"bucket": "data"}),
+            "l5": FakeStackRunner("l5", events, outputs={"grafana": "url"}),
+        }
+    )
+
+    lines = asyncio.run(_collect(executor.apply_async()))
+
+    assert applied == ["core"]
+    assert events == ["l5:start", "l5:end"]
+    assert "[core] incremental apply" in lines
+    assert executor.merged_outputs() == {"bucket": "data", "grafana": "url"}
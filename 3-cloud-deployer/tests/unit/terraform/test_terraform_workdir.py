@@ -0,0 +1,235 @@
+"""Unit tests for per-project Terraform roots and the shared plugin cache."""
+
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.providers import deployer
+from src.providers.terraform.deployer_strategy import TerraformDeployerStrategy
+from src.runtime_state import DEFAULT_RUNTIME_STATE_ROOT
+from src.terraform_runner import TerraformRunner
+from src.terraform_workdir import (
+    DEFAULT_TERRAFORM_ROOTS_DIR,
+    TERRAFORM_LOCK_FILE_NAME,
+    TERRAFORM_ROOT_DIR_NAME,
+    init_fingerprint,
+    init_lock,
+    prepare_terraform_root,
+    terraform_environment,
+    terraform_root_path,
+)
+
+
+@pytest.fixture
+def module_dir(tmp_path):
+    module = tmp_path / "src" / "terraform"
+    module.mkdir(parents=True)
+    (module / "main.tf").write_text('terraform {}\n')
+    (module / "outputs.tf.json").write_text("{}\n")
+    (module / TERRAFORM_LOCK_FILE_NAME).write_text("# lock\n")
+    (module / "tests").mkdir()
+    (module / "tests" / "plan.tftest.hcl").write_text("run {}\n")
+    return module
+
+
+def test_root_links_module_sources_and_owns_its_lock_file(tmp_path, module_dir):
+    root = tmp_path / "project" / "terraform" / TERRAFORM_ROOT_DIR_NAME
+
+    prepare_terraform_root(module_dir, root)
+
+    assert sorted(
+        path.name for path in root.iterdir() if not path.name.startswith(".deployer-")
+    ) == [
+        TERRAFORM_LOCK_FILE_NAME,
+        "main.tf",
+        "outputs.tf.json",
+    ]
+    assert os.path.samefile(root / "main.tf", module_dir / "main.tf")
+    assert not os.path.samefile(
+        root / TERRAFORM_LOCK_FILE_NAME,
+        module_dir / TERRAFORM_LOCK_FILE_NAME,
+    )
+
+
+def test_root_sources_are_swapped_under_the_init_lock(tmp_path, module_dir):
+    root = tmp_path / "root"
+    prepare_terraform_root(module_dir, root)
+    (module_dir / "variables.tf").write_text('variable "x" {}\n')
+    prepared = threading.Event()
+
+    with init_lock(root):
+        worker = threading.Thread(
+            target=lambda: (prepare_terraform_root(module_dir, root), prepared.set())
+        )
+        worker.start()
+        assert not prepared.wait(0.2)
+        assert not (root / "variables.tf").exists()
+    worker.join(timeout=5)
+
+    assert prepared.is_set()
+    assert (root / "variables.tf").exists()
+
+
+def test_root_refresh_drops_stale_sources_and_keeps_provider_installs(tmp_path, module_dir):
+    root = tmp_path / "root"
+    prepare_terraform_root(module_dir, root)
+    (root / ".terraform" / "providers").mkdir(parents=True)
+    (root / TERRAFORM_LOCK_FILE_NAME).write_text("# rewritten by init\n")
+
+    (module_dir / "outputs.tf.json").unlink()
+    (module_dir / "variables.tf").write_text("variable \"x\" {}\n")
+    prepare_terraform_root(module_dir, root)
+
+    assert not (root / "outputs.tf.json").exists()
+    assert (root / "variables.tf").read_text() == "variable \"x\" {}\n"
+    assert (root / ".terraform" / "providers").is_dir()
+    assert (root / TERRAFORM_LOCK_FILE_NAME).read_text() == "# rewritten by init\n"
+
+    (module_dir / TERRAFORM_LOCK_FILE_NAME).write_text("# upgraded lock\n")
+    prepare_terraform_root(module_dir, root)
+    assert (root / TERRAFORM_LOCK_FILE_NAME).read_text() == "# upgraded lock\n"
+
+
+def test_root_rejects_missing_module_and_symlinked_root(tmp_path, module_dir):
+    with pytest.raises(ValueError, match="does not exist"):
+        prepare_terraform_root(tmp_path / "missing", tmp_path / "root")
+
+    (tmp_path / "linked-root").symlink_to(tmp_path, target_is_directory=True)
+    with pytest.raises(ValueError, match="symlink"):
+        prepare_terraform_root(module_dir, tmp_path / "linked-root")
+
+
+def test_plugin_cache_is_exported_only_when_configured(tmp_path, monkeypatch):
+    cache = tmp_path / "plugin-cache"
+    monkeypatch.delenv("TF_PLUGIN_CACHE_DIR", raising=False)
+    monkeypatch.delenv("DEPLOYER_TERRAFORM_PLUGIN_CACHE_DIR", raising=False)
+    assert terraform_environment() is None
+
+    monkeypatch.setenv("DEPLOYER_TERRAFORM_PLUGIN_CACHE_DIR", str(cache))
+    assert terraform_environment() is None
+
+    cache.mkdir()
+    assert terraform_environment()["TF_PLUGIN_CACHE_DIR"] == str(cache)
+
+    monkeypatch.setenv("TF_PLUGIN_CACHE_DIR", str(tmp_path / "operator"))
+    assert terraform_environment() is None
+
+
+def test_each_project_runs_terraform_in_its_own_root(tmp_path, module_dir):
+    runners = []
+    for name in ("plant-a", "plant-b"):
+        project = tmp_path / "upload" / name
+        project.mkdir(parents=True)
+        runners.append(TerraformDeployerStrategy(str(module_dir), str(project)).runner)
+
+    roots = [runner.terraform_dir for runner in runners]
+    assert roots == [
+        tmp_path / "upload" / name / "terraform" / TERRAFORM_ROOT_DIR_NAME
+        for name in ("plant-a", "plant-b")
+    ]
+    command = runners[0]._build_command(["init"])
+    assert command[:3] == ["terraform", f"-chdir={roots[0]}", "init"]
+    assert (roots[1] / "main.tf").exists()
+
+
+def _counting_runner(root, monkeypatch, **kwargs):
+    runner = TerraformRunner(terraform_dir=str(root), **kwargs)
+    calls = []
+
+    def fake_run_command(args, *_, **__):
+        calls.append(args)
+        (root / ".terraform" / "providers").mkdir(parents=True, exist_ok=True)
+
+    async def fake_run_command_async(args):
+        calls.append(args)
+        yield "Terraform has been successfully initialized!"
+
+    monkeypatch.setattr(runner, "_run_command", fake_run_command)
+    monkeypatch.setattr(runner, "_run_command_async", fake_run_command_async)
+    return runner, calls
+
+
+def test_init_is_skipped_while_the_fingerprint_matches(tmp_path, module_dir, monkeypatch):
+    root = prepare_terraform_root(module_dir, tmp_path / "root")
+    runner, calls = _counting_runner(root, monkeypatch)
+
+    assert runner.init() is True
+    assert runner.init() is False
+    assert runner.init(force=True) is True
+    assert runner.init(upgrade=True) is True
+    assert runner.init(backend=False) is True
+    assert len(calls) == 4
+
+    (module_dir / "main.tf").write_text(
+        'terraform {\n  required_providers {\n    random = { source = "hashicorp/random" }\n  }\n}\n'
+    )
+    prepare_terraform_root(module_dir, root)
+    assert runner.init() is True
+    assert runner.init() is False
+    assert len(calls) == 5
+
+
+def test_streaming_init_skips_and_forced_runner_always_inits(tmp_path, module_dir, monkeypatch):
+    root = prepare_terraform_root(module_dir, tmp_path / "root")
+    runner, calls = _counting_runner(root, monkeypatch)
+
+    async def collect(target):
+        return [line async for line in target.init_async()]
+
+    first = asyncio.run(collect(runner))
+    second = asyncio.run(collect(runner))
+    assert first[-1] == "✓ Terraform initialized"
+    assert second == ["✓ Terraform init skipped: providers and backend unchanged"]
+
+    forced, forced_calls = _counting_runner(root, monkeypatch, force_init=True)
+    asyncio.run(collect(forced))
+    assert len(calls) == 1
+    assert len(forced_calls) == 1
+
+
+def test_fingerprint_ignores_resources_but_tracks_new_provider_types(tmp_path, module_dir):
+    root = prepare_terraform_root(module_dir, tmp_path / "root")
+    (module_dir / "storage.tf").write_text('resource "aws_s3_bucket" "a" {\n  bucket = "a"\n}\n')
+    prepare_terraform_root(module_dir, root)
+    baseline = init_fingerprint(root)
+
+    (module_dir / "storage.tf").write_text(
+        '# renamed bucket\nresource "aws_s3_bucket" "a" {\n  bucket = "b"\n}\n'
+    )
+    prepare_terraform_root(module_dir, root)
+    assert init_fingerprint(root) == baseline
+
+    (module_dir / "storage.tf").write_text('resource "random_id" "a" {\n  byte_length = 4\n}\n')
+    prepare_terraform_root(module_dir, root)
+    assert init_fingerprint(root) != baseline
+
+    (root / ".terraform").mkdir(exist_ok=True)
+    assert init_fingerprint(root) != init_fingerprint(root, backend=False)
+
+
+def test_deployments_keep_a_persistent_root_per_project(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEPLOYER_TERRAFORM_ROOTS_DIR", str(tmp_path / "roots"))
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    context = SimpleNamespace(project_name="plant/a", project_path=workspace)
+
+    strategy = deployer.create_terraform_strategy(context)
+
+    assert strategy.terraform_root_dir == terraform_root_path("plant/a")
+    assert strategy.terraform_root_dir.parent == (tmp_path / "roots").resolve()
+    assert strategy.terraform_root_dir.name.startswith("plant-a-")
+    assert terraform_root_path("plant/a") != terraform_root_path("plant-a")
+    assert strategy.force_init is False
+
+    monkeypatch.setenv("DEPLOYER_TERRAFORM_FORCE_INIT", "true")
+    assert deployer.create_terraform_strategy(context).force_init is True
+
+
+def test_roots_default_to_the_deployer_data_directory(monkeypatch):
+    monkeypatch.delenv("DEPLOYER_TERRAFORM_ROOTS_DIR")
+
+    assert terraform_root_path("plant").parent == DEFAULT_TERRAFORM_ROOTS_DIR.resolve()
+    assert DEFAULT_TERRAFORM_ROOTS_DIR.parent == DEFAULT_RUNTIME_STATE_ROOT.parent
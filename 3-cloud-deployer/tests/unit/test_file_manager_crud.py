@@ -393,7 +393,7 @@ class TestProjectArchiveTransactions:
             (project_dir / CONSTANTS.PROJECT_INFO_FILE).read_text(encoding="utf-8")
         )
         versions = list(
-            (project_dir / CONSTANTS.PROJECT_VERSIONS_DIR_NAME).glob("*.zip")
+            (project_dir / CONSTANTS.PROJECT_VERSIONS_DIR_NAME).glob("*.json")
         )
         assert not (project_dir / "stale.txt").exists()
         assert not (project_dir / ".build").exists()
@@ -518,7 +518,7 @@ class TestProjectArchiveTransactions:
 
         assert not (project_dir / ".build").exists()
         assert not (project_dir / "terraform").exists()
-        assert len(list((project_dir / "versions").glob("*.zip"))) == 1
+        assert len(list((project_dir / "versions").glob("*.json"))) == 1
         info = json.loads(
             (project_dir / CONSTANTS.PROJECT_INFO_FILE).read_text(encoding="utf-8")
         )
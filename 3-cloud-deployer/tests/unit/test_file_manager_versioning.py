@@ -14,6 +14,7 @@ from unittest.mock import patch
 
 import file_manager
 import constants as CONSTANTS
+from src.core.version_store import ProjectVersionStore
 
 
 # ==========================================
@@ -67,8 +68,8 @@ def valid_zip_bytes():
 # ==========================================
 # Test: _archive_zip_version
 # ==========================================
-class TestArchiveZipVersion:
-    """Tests for the _archive_zip_version helper function."""
+class TestArchiveProjectVersion:
+    """Tests for the _archive_project_version helper function."""
 
     def test_archive_creates_versions_directory(self, temp_project_path, valid_zip_bytes):
         """Verify versions directory is created if it doesn't exist."""
@@ -81,13 +82,13 @@ class TestArchiveZipVersion:
         os.makedirs(target_dir)
         
         zip_source = io.BytesIO(valid_zip_bytes)
-        file_manager._archive_zip_version(zip_source, target_dir)
+        file_manager._archive_project_version(zip_source, target_dir)
         
         versions_dir = os.path.join(target_dir, CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
         assert os.path.exists(versions_dir)
 
-    def test_archive_creates_timestamped_zip(self, temp_project_path, valid_zip_bytes):
-        """Verify zip is saved with timestamp filename."""
+    def test_archive_creates_timestamped_manifest(self, temp_project_path, valid_zip_bytes):
+        """Verify the version manifest is saved with timestamp filename."""
         project_name = "test_project"
         target_dir = os.path.join(
             temp_project_path, 
@@ -97,18 +98,18 @@ class TestArchiveZipVersion:
         os.makedirs(target_dir)
         
         zip_source = io.BytesIO(valid_zip_bytes)
-        file_manager._archive_zip_version(zip_source, target_dir)
+        file_manager._archive_project_version(zip_source, target_dir)
         
         versions_dir = os.path.join(target_dir, CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
-        zip_files = [f for f in os.listdir(versions_dir) if f.endswith('.zip')]
+        manifests = [f for f in os.listdir(versions_dir) if f.endswith('.json')]
         
-        assert len(zip_files) == 1
-        # Verify collision-safe timestamp format: YYYY-MM-DD_HH-MM-SS.ffffff.zip
-        filename = zip_files[0]
-        assert len(filename) == 30
+        assert len(manifests) == 1
+        # Verify collision-safe timestamp format: YYYY-MM-DD_HH-MM-SS.ffffff.json
+        filename = manifests[0]
+        assert len(filename) == 31
 
-    def test_multiple_archives_create_multiple_files(self, temp_project_path, valid_zip_bytes):
-        """Verify multiple uploads create multiple version files."""
+    def test_multiple_archives_share_unchanged_blobs(self, temp_project_path, valid_zip_bytes):
+        """Verify multiple uploads create versions without duplicating content."""
         project_name = "test_project"
         target_dir = os.path.join(
             temp_project_path, 
@@ -121,19 +122,29 @@ class TestArchiveZipVersion:
         with patch('file_manager.datetime') as mock_datetime:
             mock_datetime.now.return_value = datetime(2025, 12, 9, 22, 0, 0)
             zip_source1 = io.BytesIO(valid_zip_bytes)
-            file_manager._archive_zip_version(zip_source1, target_dir)
+            file_manager._archive_project_version(zip_source1, target_dir)
             
             mock_datetime.now.return_value = datetime(2025, 12, 9, 22, 0, 1)
             zip_source2 = io.BytesIO(valid_zip_bytes)
-            file_manager._archive_zip_version(zip_source2, target_dir)
+            file_manager._archive_project_version(zip_source2, target_dir)
         
-        versions_dir = os.path.join(target_dir, CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
-        zip_files = [f for f in os.listdir(versions_dir) if f.endswith('.zip')]
+        store = ProjectVersionStore(
+            Path(target_dir) / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
+        )
+        versions = store.list_versions()
+        blobs = [path for path in store.blobs_dir.rglob("*") if path.is_file()]
         
-        assert len(zip_files) == 2
+        assert [summary.version for summary in versions] == [
+            "2025-12-09_22-00-00.000000",
+            "2025-12-09_22-00-01.000000",
+        ]
+        first_digests = {
+            file.sha256 for file in store.read_manifest(versions[0].version)
+        }
+        assert sorted(blob.name for blob in blobs) == sorted(first_digests)
 
-    def test_archive_content_is_valid_zip(self, temp_project_path, valid_zip_bytes):
-        """Verify archived content is a valid zip file."""
+    def test_archived_version_exports_as_redacted_zip(self, temp_project_path, valid_zip_bytes):
+        """Verify an archived version is assembled into a valid zip file."""
         project_name = "test_project"
         target_dir = os.path.join(
             temp_project_path, 
@@ -143,14 +154,15 @@ class TestArchiveZipVersion:
         os.makedirs(target_dir)
         
         zip_source = io.BytesIO(valid_zip_bytes)
-        file_manager._archive_zip_version(zip_source, target_dir)
+        file_manager._archive_project_version(zip_source, target_dir)
         
-        versions_dir = os.path.join(target_dir, CONSTANTS.PROJECT_VERSIONS_DIR_NAME)
-        zip_files = os.listdir(versions_dir)
-        archived_path = os.path.join(versions_dir, zip_files[0])
+        store = ProjectVersionStore(
+            Path(target_dir) / CONSTANTS.PROJECT_VERSIONS_DIR_NAME
+        )
+        version = store.list_versions()[0].version
         
         # Should be extractable
-        with zipfile.ZipFile(archived_path, 'r') as zf:
+        with zipfile.ZipFile(store.export(version), 'r') as zf:
             assert CONSTANTS.CONFIG_FILE in zf.namelist()
             assert CONSTANTS.CONFIG_CREDENTIALS_FILE not in zf.namelist()
 
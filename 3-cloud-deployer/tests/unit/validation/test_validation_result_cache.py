@@ -0,0 +1,154 @@
+"""
+Unit tests for the digest-keyed validation result cache.
+
+Checks with declared input files are skipped when the same content was
+already validated; aggregated runs report cache hits and per-check timings.
+"""
+import pytest
+
+import src.validation.core as core
+from src.validation.core import (
+    ValidationContext,
+    check_processor_syntax,
+    run_all_checks_aggregated,
+)
+from src.validation.result_cache import CheckRecorder, ValidationResultCache
+
+
+PROCESSOR = "lambda_functions/processors/device-1/lambda_function.py"
+
+
+class MockAccessor:
+    def __init__(self, files):
+        self._files = files
+
+    def list_files(self):
+        return list(self._files)
+
+    def file_exists(self, path):
+        return path in self._files
+
+    def read_text(self, path):
+        if path not in self._files:
+            raise FileNotFoundError(path)
+        return self._files[path]
+
+    def get_project_root(self):
+        return ""
+
+
+@pytest.fixture(autouse=True)
+def validation_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEPLOYER_VALIDATION_CACHE_ROOT", str(tmp_path / "cache"))
+    monkeypatch.delenv("DEPLOYER_VALIDATION_CACHE_MAX_ENTRIES")
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    calls = []
+    original = core._check_user_code
+
+    def counting(content, filepath, provider):
+        calls.append(filepath)
+        return original(content, filepath, provider)
+
+    monkeypatch.setattr(core, "_check_user_code", counting)
+    return calls
+
+
+def _check(code):
+    accessor = MockAccessor({PROCESSOR: code})
+    ctx = ValidationContext(all_files=accessor.list_files())
+    check_processor_syntax(accessor, ctx, l2_provider="aws")
+    return ctx.recorder
+
+
+def test_unchanged_files_skip_revalidation(parsed):
+    code = "def lambda_handler(event, context):\n    return event\n"
+
+    first = _check(code)
+    second = _check(code)
+    _check(code + "\n# edited\n")
+
+    assert (first.cache_hits, first.cache_misses) == (0, 1)
+    assert (second.cache_hits, second.cache_misses) == (1, 0)
+    assert parsed == [PROCESSOR, PROCESSOR]
+
+
+def test_cached_failures_replay_the_original_message(parsed):
+    code = "def handler(event):\n    return event\n"
+
+    with pytest.raises(ValueError) as first:
+        _check(code)
+    with pytest.raises(ValueError) as second:
+        _check(code)
+
+    assert str(second.value) == str(first.value)
+    assert "Missing required lambda_handler()" in str(second.value)
+    assert len(parsed) == 1
+
+
+def test_disabled_cache_always_runs_the_check(parsed, tmp_path):
+    cache = ValidationResultCache(root=tmp_path, max_entries=0)
+    recorder = CheckRecorder(cache)
+
+    for _ in range(2):
+        recorder.run_cached("processor_syntax", ["a" * 64], lambda: parsed.append("run"))
+
+    assert parsed == ["run", "run"]
+    assert not any(tmp_path.iterdir())
+
+
+def test_entries_are_bounded(tmp_path):
+    cache = ValidationResultCache(root=tmp_path, max_entries=4)
+
+    for index in range(12):
+        cache.store(cache.key("config_schema", [f"{index:064x}"]), None)
+
+    assert len(list(tmp_path.glob("*/*.json"))) <= 4
+
+
+def test_aggregated_run_reports_hits_and_timings():
+    accessor = MockAccessor(
+        {
+            "config_providers.json": '{"layer_2_provider": "aws"}',
+            PROCESSOR: "def lambda_handler(event, context):\n    return event\n",
+        }
+    )
+
+    first = run_all_checks_aggregated(accessor)
+    second = run_all_checks_aggregated(accessor)
+
+    assert first.cache_hits == 0 and first.cache_misses > 0
+    assert second.cache_hits == first.cache_misses and second.cache_misses == 0
+    assert second.errors == first.errors
+    assert {"check_config_schemas", "check_processor_syntax"} <= set(second.check_timings)
+    assert all(seconds >= 0 for seconds in second.check_timings.values())
+
+
+def test_code_digest_covers_modules_the_validators_import():
+    from src.validation import result_cache
+
+    sources = {
+        path.relative_to(result_cache._SRC_ROOT).as_posix()
+        for path in result_cache._validation_sources()
+    }
+
+    assert {"core/executable_topology.py", "deployment_specification/models.py"} <= sources
+
+
+def test_changing_an_imported_validator_module_changes_the_code_digest(tmp_path):
+    from src.validation import result_cache
+
+    (tmp_path / "core").mkdir()
+    (tmp_path / "validator.py").write_text(
+        "def validate():\n    from src.core.topology import ensure\n    return ensure()\n"
+    )
+    topology = tmp_path / "core" / "topology.py"
+    topology.write_text("def ensure():\n    return True\n")
+    entry = [tmp_path / "validator.py"]
+    before = result_cache._validation_code_digest(entry, tmp_path)
+
+    topology.write_text("def ensure():\n    return False\n")
+
+    assert result_cache._validation_code_digest(entry, tmp_path) != before
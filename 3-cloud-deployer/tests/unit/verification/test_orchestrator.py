@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 from pathlib import Path
 
 from src.verification import orchestrator as orchestrator_module
@@ -79,14 +80,10 @@ def test_phase_four_result_is_independent_from_phase_three_failure(monkeypatch):
         terraform_outputs=outputs,
         optimization={"useEventChecking": True},
     )
-    monkeypatch.setattr(
-        orchestrator_module.probes,
-        "poll_hot_reader",
-        lambda *args, **kwargs: ProbeResult(
-            success=True,
-            evidence={"record_count": 1},
-        ),
-    )
+    async def poll_hot_reader(*args, **kwargs):
+        return ProbeResult(success=True, evidence={"record_count": 1})
+
+    monkeypatch.setattr(orchestrator_module.probes, "poll_hot_reader", poll_hot_reader)
     monkeypatch.setattr(
         orchestrator_module.probes,
         "check_twinmaker_entity",
@@ -108,6 +105,54 @@ def test_phase_four_result_is_independent_from_phase_three_failure(monkeypatch):
     assert (4, "pass") in terminal
     assert done["pass_count"] == 3
     assert done["fail_count"] == 1
+    # Phases stay integers after JSON serialization, like the phase events.
+    assert [entry["phase"] for entry in done["time_to_verdict"]] == [1, 2, 3, 4]
+    assert all(
+        set(entry) == {"phase", "seconds"} and isinstance(entry["seconds"], float)
+        for entry in done["time_to_verdict"]
+    )
+
+
+def test_digital_twin_and_event_flow_phases_overlap(monkeypatch):
+    both_started = threading.Barrier(2, timeout=5)
+    context = _context(
+        providers={
+            "layer_1_provider": "aws",
+            "layer_2_provider": "aws",
+            "layer_3_hot_provider": "aws",
+            "layer_4_provider": "aws",
+        },
+        terraform_outputs={
+            "aws_l3_hot_reader_url": "https://example.test/hot-reader",
+            "aws_twinmaker_workspace_id": "workspace",
+        },
+        optimization={"useEventChecking": True},
+    )
+
+    async def poll_hot_reader(*args, **kwargs):
+        return ProbeResult(success=True, evidence={"record_count": 1})
+
+    def wait_for_other_phase(*args, **kwargs):
+        both_started.wait()
+        return ProbeResult(success=True, evidence={"kind": "entity_presence"})
+
+    monkeypatch.setattr(orchestrator_module.probes, "poll_hot_reader", poll_hot_reader)
+    monkeypatch.setattr(
+        orchestrator_module.probes, "check_twinmaker_entity", wait_for_other_phase
+    )
+    monkeypatch.setattr(
+        orchestrator_module.probes, "check_cloud_logs", wait_for_other_phase
+    )
+    subject = DataFlowVerificationOrchestrator(context, lambda *args, **kwargs: True)
+
+    events = asyncio.run(_collect(subject))
+
+    phases = [
+        (phase["phase"], phase["status"])
+        for phase in (_payload(event) for event in events if _event_name(event) == "phase")
+    ]
+    assert phases[-4:] == [(3, "running"), (3, "pass"), (4, "running"), (4, "pass")]
+    assert _payload(events[-1])["pass_count"] == 4
 
 
 def test_phase_run_forwards_event_before_phase_completes():
@@ -119,7 +164,7 @@ def test_phase_run_forwards_event_before_phase_completes():
         yield PhaseEmission(outcome=PhaseOutcome(status="pass", passed=1))
 
     async def exercise():
-        run = orchestrator_module._PhaseRun(source())
+        run = orchestrator_module._PhaseRun(1, source())
         events = run.events()
         first = await anext(events)
         assert run.outcome is None
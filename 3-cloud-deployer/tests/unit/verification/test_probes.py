@@ -1,58 +1,89 @@
+import asyncio
+from itertools import islice
 from pathlib import Path
 
 from src.verification import probes
 
 
 class _Response:
-    status_code = 200
+    def __init__(self, status, body=None):
+        self.status = status
+        self._body = body
 
-    @staticmethod
-    def json():
-        return {
-            "items": [
-                {"trace_id": "VERIFY-OTHER"},
-                {"trace_id": "VERIFY-TARGET"},
-            ]
-        }
+    async def __aenter__(self):
+        return self
 
+    async def __aexit__(self, *exc_info):
+        return False
 
-def test_hot_reader_rejects_non_https_endpoint(monkeypatch):
-    called = False
+    async def json(self, content_type=None):
+        return self._body
 
-    def get(*args, **kwargs):
-        nonlocal called
-        called = True
 
-    monkeypatch.setattr(probes.requests, "get", get)
+class _Session:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
 
-    result = probes.poll_hot_reader(
-        "http://example.test/reader",
-        "device-1",
-        None,
-        1,
-        0,
-        trace_id="VERIFY-TARGET",
+    def get(self, url, **kwargs):
+        self.requests.append(url)
+        return self.responses.pop(0)
+
+
+def test_hot_reader_rejects_non_https_endpoint():
+    session = _Session()
+
+    result = asyncio.run(
+        probes.poll_hot_reader(
+            "http://example.test/reader",
+            "device-1",
+            None,
+            1,
+            0,
+            trace_id="VERIFY-TARGET",
+            session=session,
+        )
     )
 
     assert result.success is False
     assert "HTTPS" in result.error
-    assert called is False
+    assert session.requests == []
 
 
-def test_hot_reader_only_accepts_current_trace(monkeypatch):
-    monkeypatch.setattr(probes.requests, "get", lambda *args, **kwargs: _Response())
+def test_hot_reader_only_accepts_current_trace_on_one_session():
+    session = _Session(
+        _Response(404),
+        _Response(200, {"items": [{"trace_id": "VERIFY-OTHER"}]}),
+        _Response(
+            200,
+            {"items": [{"trace_id": "VERIFY-OTHER"}, {"trace_id": "VERIFY-TARGET"}]},
+        ),
+    )
 
-    result = probes.poll_hot_reader(
-        "https://example.test/reader",
-        "device-1",
-        "token",
-        1,
-        0,
-        trace_id="VERIFY-TARGET",
+    result = asyncio.run(
+        probes.poll_hot_reader(
+            "https://example.test/reader",
+            "device-1",
+            "token",
+            5,
+            0,
+            trace_id="VERIFY-TARGET",
+            session=session,
+        )
     )
 
     assert result.success is True
     assert result.evidence == {"record_count": 1}
+    assert len(session.requests) == 3
+
+
+def test_backoff_starts_fast_and_is_capped_at_the_poll_interval():
+    delays = list(islice(probes.backoff_delays(2), 6))
+
+    assert delays[0] <= probes.POLL_INITIAL_DELAY * (1 + probes.POLL_JITTER)
+    assert delays[1] > delays[0]
+    assert all(delay <= 2 * (1 + probes.POLL_JITTER) for delay in delays)
+    assert delays[-1] >= 2 * (1 - probes.POLL_JITTER)
 
 
 def test_unknown_log_provider_fails_without_cloud_access():
@@ -69,3 +100,46 @@ def test_unknown_log_provider_fails_without_cloud_access():
 
     assert result.success is False
     assert result.error == "Unsupported provider: unsupported"
+
+
+def test_event_checker_logs_are_found_with_one_insights_query(monkeypatch):
+    import boto3
+
+    queries = []
+
+    class Client:
+        def start_query(self, **kwargs):
+            queries.append(kwargs)
+            return {"queryId": "query-1"}
+
+        def get_query_results(self, queryId):
+            return {
+                "status": "Complete",
+                "results": [
+                    [
+                        {"field": "@timestamp", "value": "2026-01-01 00:00:01.000"},
+                        {"field": "@message", "value": "T2MC_EVENT_CHECKER_RECEIVED"},
+                        {"field": "@log", "value": "1:/aws/lambda/factory-event-checker"},
+                        {"field": "@ptr", "value": "pointer"},
+                    ]
+                ],
+            }
+
+    monkeypatch.setattr(boto3, "client", lambda service, **kwargs: Client())
+
+    result = probes.check_cloud_logs(
+        "aws",
+        "T2MC_EVENT_CHECKER_RECEIVED trace_id=VERIFY-1",
+        "event_checker",
+        {"aws_l2_event_checker_function_name": "factory-event-checker"},
+        {"aws": {}},
+        Path("/tmp/project"),
+        5,
+        0,
+    )
+
+    assert result.success is True
+    assert result.evidence == {"log_count": 1}
+    assert len(queries) == 1
+    assert queries[0]["logGroupNames"] == ["/aws/lambda/factory-event-checker"]
+    assert queries[0]["limit"] == 5
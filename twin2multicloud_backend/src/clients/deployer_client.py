@@ -226,6 +226,43 @@ class DeployerClient(ExternalServiceClient):
             expected_project_name=project_name,
         )
 
+    async def plan_operation_package_sync(
+        self,
+        project_name: str,
+        manifest: list[dict[str, Any]],
+    ) -> list[str]:
+        """Return the package digests the Deployer does not store yet."""
+        payload = await self._request_json(
+            "POST",
+            f"/projects/{project_name}/operation-package/plan",
+            json={"files": manifest},
+            timeout=30.0,
+        )
+        return _validate_sync_plan_response(
+            payload,
+            expected_project_name=project_name,
+            manifest=manifest,
+        )
+
+    async def stage_operation_package_delta(
+        self,
+        project_name: str,
+        manifest: list[dict[str, Any]],
+        delta: bytes,
+    ) -> dict[str, Any]:
+        """Stage a package the Deployer rebuilds from stored content plus ``delta``."""
+        payload = await self._request_json(
+            "POST",
+            f"/projects/{project_name}/operation-package/delta",
+            data={"manifest": _json_dumps_compact({"files": manifest})},
+            files={"file": (f"{project_name}-delta.zip", delta, "application/zip")},
+            timeout=httpx.Timeout(connect=30.0, read=60.0, write=60.0, pool=30.0),
+        )
+        return _validate_operation_package_response(
+            payload,
+            expected_project_name=project_name,
+        )
+
     async def extract_project_zip(
         self,
         content: bytes,
@@ -298,6 +335,30 @@ def _validate_operation_package_response(
     return payload
 
 
+def _validate_sync_plan_response(
+    payload: dict[str, Any],
+    *,
+    expected_project_name: str,
+    manifest: list[dict[str, Any]],
+) -> list[str]:
+    """Only accept missing digests that the manifest actually contains."""
+    missing = payload.get("missing")
+    if payload.get("project_name") != expected_project_name:
+        raise ExternalServiceError(
+            "Deployer API sync plan project mismatch",
+            public_detail="Deployer returned an invalid package sync plan.",
+        )
+    known_digests = {entry["sha256"] for entry in manifest}
+    if not isinstance(missing, list) or not all(
+        isinstance(digest, str) and digest in known_digests for digest in missing
+    ):
+        raise ExternalServiceError(
+            "Deployer API returned invalid missing digests",
+            public_detail="Deployer returned an invalid package sync plan.",
+        )
+    return missing
+
+
 def _parse_simulator_archive(
     response: httpx.Response,
     *,
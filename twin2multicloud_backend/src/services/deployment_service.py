@@ -12,6 +12,7 @@ These functions were previously embedded in twins.py but are now
 centralized for reusability and maintainability.
 """
 
+import hashlib
 import io
 import json
 import logging
@@ -54,6 +55,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PACKAGE_HASH_CHUNK_BYTES = 1024 * 1024
+# Deployers without the delta endpoints answer 404/405. Other 409s (an active
+# operation) are reported to the caller.
+DELTA_SYNC_FALLBACK_STATUSES = {404, 405}
+# The Deployer's 409 when stored content vanished between planning and staging.
+DELTA_SYNC_CONTENT_MISSING = "PACKAGE_CONTENT_MISSING"
 DEPLOYMENT_MANIFEST_FILE = "deployment_manifest.json"
 DEPLOYMENT_MANIFEST_VERSION = "2.0"
 REQUIRED_DEPLOYER_CONFIG_FILES = [
@@ -647,14 +654,57 @@ def build_project_zip(twin, user_id: str) -> io.BytesIO:
     Returns:
         BytesIO containing the ZIP file
     """
-    package = build_deployment_package(twin, user_id)
+    return _write_package_zip(build_deployment_package(twin, user_id))
+
+
+def build_package_sync_manifest(package: DeploymentPackage) -> list[dict[str, Any]]:
+    """
+    Describe every package file by path, SHA-256, and size.
+
+    Digests are taken over the exact bytes ``build_project_zip`` would store,
+    so the Deployer can match them against content it already holds.
+    """
+    manifest = []
+    for file in package.files:
+        content = file.content.encode("utf-8")
+        manifest.append(
+            {
+                "path": file.path,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "size": len(content),
+            }
+        )
+    for binary_file in package.binary_files:
+        digest = hashlib.sha256()
+        size = 0
+        with binary_file.source_path.open("rb") as source:
+            while chunk := source.read(PACKAGE_HASH_CHUNK_BYTES):
+                digest.update(chunk)
+                size += len(chunk)
+        manifest.append(
+            {
+                "path": binary_file.archive_path,
+                "sha256": digest.hexdigest(),
+                "size": size,
+            }
+        )
+    return manifest
+
+
+def _write_package_zip(
+    package: DeploymentPackage,
+    paths: set[str] | None = None,
+) -> io.BytesIO:
+    """Write the package, or only the files in ``paths``, to an in-memory ZIP."""
     zip_buffer = io.BytesIO()
 
     with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
         for file in package.files:
-            zf.writestr(file.path, file.content)
+            if paths is None or file.path in paths:
+                zf.writestr(file.path, file.content)
         for binary_file in package.binary_files:
-            zf.write(str(binary_file.source_path), binary_file.archive_path)
+            if paths is None or binary_file.archive_path in paths:
+                zf.write(str(binary_file.source_path), binary_file.archive_path)
 
     zip_buffer.seek(0)
     return zip_buffer
@@ -1316,25 +1366,95 @@ async def upload_project_to_deployer(
         zip_data.seek(0)
         content = zip_data.read()
         return await client.stage_operation_package(project_name, content)
-    except ExternalServiceUnavailable as exc:
-        raise DownstreamServiceError(
+    except (ExternalServiceUnavailable, ExternalServiceError) as exc:
+        raise _project_setup_error(exc) from exc
+
+
+async def sync_project_to_deployer(
+    project_name: str,
+    package: DeploymentPackage,
+    deployer_client: DeployerClient | None = None,
+) -> dict:
+    """
+    Stage a package by sending only the files the Deployer does not hold.
+
+    The Deployer compares the package manifest with its version store and
+    lists the digests it lacks; only those files are uploaded. Unchanged
+    scene assets and function code therefore never cross the wire again.
+    Deployers without the sync endpoints receive the full package instead.
+    If stored content vanishes between planning and staging, the sync is
+    planned once more before falling back to the full package.
+
+    Raises:
+        DownstreamServiceError when the Deployer cannot stage the package
+    """
+    client = deployer_client or DeployerClient()
+    manifest = build_package_sync_manifest(package)
+    for attempt in range(2):
+        try:
+            missing = set(await client.plan_operation_package_sync(project_name, manifest))
+            delta_paths = {entry["path"] for entry in manifest if entry["sha256"] in missing}
+            delta = _write_package_zip(package, delta_paths).getvalue()
+            return await client.stage_operation_package_delta(
+                project_name,
+                manifest,
+                delta,
+            )
+        except ExternalServiceError as exc:
+            if _deployer_error_code(exc) == DELTA_SYNC_CONTENT_MISSING:
+                logger.info(
+                    "Stored package content for %s vanished since planning (attempt %s)",
+                    project_name,
+                    attempt + 1,
+                )
+                continue
+            if exc.upstream_status_code not in DELTA_SYNC_FALLBACK_STATUSES:
+                raise _project_setup_error(exc) from exc
+            logger.info(
+                "Delta package sync unavailable for %s (HTTP %s); uploading full package",
+                project_name,
+                exc.upstream_status_code,
+            )
+            break
+        except ExternalServiceUnavailable as exc:
+            raise _project_setup_error(exc) from exc
+    return await upload_project_to_deployer(
+        project_name,
+        _write_package_zip(package),
+        deployer_client=client,
+    )
+
+
+def _deployer_error_code(exc: ExternalServiceError) -> str | None:
+    """Return the ``error_code`` of a structured Deployer error response."""
+    if exc.upstream_status_code != 409:
+        return None
+    try:
+        detail = json.loads(exc.public_detail).get("detail")
+    except (ValueError, AttributeError):
+        return None
+    return detail.get("error_code") if isinstance(detail, dict) else None
+
+
+def _project_setup_error(exc: Exception) -> DownstreamServiceError:
+    if isinstance(exc, ExternalServiceUnavailable):
+        return DownstreamServiceError(
             status_code=503,
             public_detail="Deployer API unavailable during project setup",
-        ) from exc
-    except ExternalServiceError as exc:
-        upstream_status = exc.upstream_status_code
-        status_code = (
-            upstream_status
-            if upstream_status in {400, 409, 413, 422}
-            else 502
         )
-        raise DownstreamServiceError(
-            status_code=status_code,
-            public_detail=(
-                "Deployer project setup failed: "
-                f"{_redact_deployment_message(exc.public_detail)}"
-            ),
-        ) from exc
+    upstream_status = exc.upstream_status_code
+    status_code = (
+        upstream_status
+        if upstream_status in {400, 409, 413, 422}
+        else 502
+    )
+    return DownstreamServiceError(
+        status_code=status_code,
+        public_detail=(
+            "Deployer project setup failed: "
+            f"{_redact_deployment_message(exc.public_detail)}"
+        ),
+    )
 
 
 async def prepare_project_for_deployment(
@@ -1352,11 +1472,9 @@ async def prepare_project_for_deployment(
     """
     resource_name = get_resource_name(twin)  # DRY: reuse helper
 
-    # Build ZIP
-    zip_data = build_project_zip(twin, user_id)
-
-    # Upload to Deployer
-    result = await upload_project_to_deployer(resource_name, zip_data)
+    # Build the package and send the files the Deployer does not hold yet
+    package = build_deployment_package(twin, user_id)
+    result = await sync_project_to_deployer(resource_name, package)
     operation_token = result.get("operation_token")
     if not isinstance(operation_token, str) or not operation_token:
         raise DeploymentPackageBuildFailed(
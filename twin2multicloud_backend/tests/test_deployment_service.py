@@ -9,6 +9,7 @@ Tests:
 - Resource name extraction
 """
 
+import hashlib
 import io
 import json
 import zipfile
@@ -36,6 +37,10 @@ from src.services.deployment_service import (
     run_real_deploy_stream,
     run_real_destroy_stream,
     upload_project_to_deployer,
+    sync_project_to_deployer,
+    DeploymentPackage,
+    DeploymentPackageBinaryFile,
+    DeploymentPackageFile,
     _build_main_config,
     _build_providers_config,
     _build_credentials_config,
@@ -240,6 +245,162 @@ async def test_upload_project_maps_downstream_failures_to_safe_service_errors(
     assert exc_info.value.public_detail == detail
 
 
+class _FakeSyncClient(_FakeOperationPackageClient):
+    def __init__(self, *, known_paths=(), plan_exc=None, **kwargs):
+        super().__init__(**kwargs)
+        self.known_paths = set(known_paths)
+        self.plan_exc = plan_exc
+        self.deltas = []
+
+    async def plan_operation_package_sync(self, project_name, manifest):
+        if self.plan_exc:
+            raise self.plan_exc
+        return [
+            entry["sha256"] for entry in manifest if entry["path"] not in self.known_paths
+        ]
+
+    async def stage_operation_package_delta(self, project_name, manifest, delta):
+        with zipfile.ZipFile(io.BytesIO(delta)) as archive:
+            self.deltas.append(([entry["path"] for entry in manifest], archive.namelist()))
+        return self.result
+
+
+def _sync_package(tmp_path):
+    scene = tmp_path / "scene.glb"
+    scene.write_bytes(b"glb" * 1000)
+    return DeploymentPackage(
+        files=(DeploymentPackageFile("config.json", '{"name": "plant"}'),),
+        binary_files=(DeploymentPackageBinaryFile(scene, "scene_assets/scene.glb"),),
+        manifest={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_uploads_only_files_the_deployer_lacks(tmp_path):
+    client = _FakeSyncClient(known_paths={"scene_assets/scene.glb"})
+
+    result = await sync_project_to_deployer(
+        "factory", _sync_package(tmp_path), deployer_client=client
+    )
+
+    assert result == {"operation_token": "opaque-token"}
+    assert client.deltas == [
+        (["config.json", "scene_assets/scene.glb"], ["config.json"])
+    ]
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_sync_manifest_digests_match_the_zipped_bytes(tmp_path):
+    manifests = []
+
+    class RecordingClient(_FakeSyncClient):
+        async def plan_operation_package_sync(self, project_name, manifest):
+            manifests.append(manifest)
+            return []
+
+    await sync_project_to_deployer(
+        "factory", _sync_package(tmp_path), deployer_client=RecordingClient()
+    )
+
+    assert manifests[0] == [
+        {
+            "path": "config.json",
+            "sha256": hashlib.sha256(b'{"name": "plant"}').hexdigest(),
+            "size": 17,
+        },
+        {
+            "path": "scene_assets/scene.glb",
+            "sha256": hashlib.sha256(b"glb" * 1000).hexdigest(),
+            "size": 3000,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("upstream_status", [404, 405])
+async def test_sync_falls_back_to_the_full_package(tmp_path, upstream_status):
+    client = _FakeSyncClient(
+        plan_exc=ExternalServiceError(
+            "not available", upstream_status_code=upstream_status
+        )
+    )
+
+    await sync_project_to_deployer(
+        "factory", _sync_package(tmp_path), deployer_client=client
+    )
+
+    (project_name, content), = client.calls
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.namelist() == ["config.json", "scene_assets/scene.glb"]
+
+
+@pytest.mark.asyncio
+async def test_sync_conflicts_are_reported_instead_of_uploading_the_full_package(tmp_path):
+    client = _FakeSyncClient(
+        plan_exc=ExternalServiceError(
+            "operation active",
+            upstream_status_code=409,
+            public_detail="operation active",
+        )
+    )
+
+    with pytest.raises(DownstreamServiceError) as exc_info:
+        await sync_project_to_deployer(
+            "factory", _sync_package(tmp_path), deployer_client=client
+        )
+
+    assert exc_info.value.status_code == 409
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_sync_plans_again_when_stored_content_vanished(tmp_path):
+    content_missing = ExternalServiceError(
+        "content missing",
+        upstream_status_code=409,
+        public_detail=json.dumps(
+            {"detail": {"error_code": "PACKAGE_CONTENT_MISSING", "message": "gone"}}
+        ),
+    )
+
+    class VanishingContentClient(_FakeSyncClient):
+        def __init__(self, failures, **kwargs):
+            super().__init__(known_paths={"scene_assets/scene.glb"}, **kwargs)
+            self.failures = failures
+            self.plans = 0
+
+        async def plan_operation_package_sync(self, project_name, manifest):
+            self.plans += 1
+            return await super().plan_operation_package_sync(project_name, manifest)
+
+        async def stage_operation_package_delta(self, project_name, manifest, delta):
+            if self.failures:
+                self.failures -= 1
+                self.known_paths.clear()
+                raise content_missing
+            return await super().stage_operation_package_delta(project_name, manifest, delta)
+
+    recovered = VanishingContentClient(failures=1)
+    await sync_project_to_deployer(
+        "factory", _sync_package(tmp_path), deployer_client=recovered
+    )
+    assert recovered.plans == 2
+    assert recovered.deltas == [
+        (["config.json", "scene_assets/scene.glb"], ["config.json", "scene_assets/scene.glb"])
+    ]
+    assert recovered.calls == []
+
+    exhausted = VanishingContentClient(failures=2)
+    await sync_project_to_deployer(
+        "factory", _sync_package(tmp_path), deployer_client=exhausted
+    )
+    assert exhausted.plans == 2
+    (project_name, content), = exhausted.calls
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.namelist() == ["config.json", "scene_assets/scene.glb"]
+
+
 def _create_stream_twin(db, state=TwinState.DEPLOYING):
     user = User(email="stream-user@example.test")
     db.add(user)
@@ -191,7 +191,9 @@ def test_downstream_client_contract_surface_is_explicit():
         "download_simulator",
         "extract_project_zip",
         "get_provider_capabilities",
+        "plan_operation_package_sync",
         "stage_operation_package",
+        "stage_operation_package_delta",
         "start_log_trace",
         "stream_log_trace",
         "validate_config_file",